@@ -3,12 +3,13 @@ FRED data tools for the economist agent.
 """
 
 import json
-from datetime import datetime, timedelta
 from urllib.request import urlopen, Request
 from urllib.parse import urlencode
 from typing import Optional
 import os
 
+from core.observation_store import read_through
+
 FRED_API_KEY = os.environ.get('FRED_API_KEY', 'c43c82548c611ec46800c51f898026d6')
 FRED_BASE = 'https://api.stlouisfed.org/fred'
 
@@ -59,28 +60,31 @@ def fetch_series(series_id: str, years: int = 10) -> dict:
     Returns:
         Dict with dates, values, and metadata
     """
-    params = {
-        'series_id': series_id,
-        'limit': 10000,
-        'sort_order': 'asc'
-    }
-    if years:
-        start_date = (datetime.now() - timedelta(days=years * 365)).strftime('%Y-%m-%d')
-        params['observation_start'] = start_date
-
-    data = fred_request('series/observations', params)
-    if 'error' in data:
-        return {'error': data['error'], 'series_id': series_id}
-
-    observations = data.get('observations', [])
-    dates, values = [], []
-    for obs in observations:
-        try:
-            val = float(obs['value'])
-            dates.append(obs['date'])
-            values.append(val)
-        except (ValueError, KeyError):
-            continue
+    def download_full_history():
+        data = fred_request('series/observations', {
+            'series_id': series_id,
+            'limit': 100000,
+            'sort_order': 'asc'
+        })
+        if 'error' in data:
+            return [], [], {'error': data['error']}
+
+        observations = data.get('observations', [])
+        dates, values = [], []
+        for obs in observations:
+            try:
+                val = float(obs['value'])
+                dates.append(obs['date'])
+                values.append(val)
+            except (ValueError, KeyError):
+                continue
+
+        info = fred_request('series', {'series_id': series_id})
+        return dates, values, (info.get('seriess') or [{}])[0]
+
+    dates, values, info = read_through(series_id, download_full_history, years=years)
+    if 'error' in info:
+        return {'error': info['error'], 'series_id': series_id}
 
     if not values:
         return {'error': 'No data returned', 'series_id': series_id}
@@ -11,13 +11,17 @@ This approach leverages the strengths of each model to produce
 higher-quality query plans than any single model alone.
 """
 
+import bisect
 import json
 import os
+import threading
 import time
 import concurrent.futures
 from pathlib import Path
 from urllib.request import urlopen, Request
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Callable, Tuple
+
+from core.llm_cache import data_fingerprint, get_llm_cache, template_id
 
 # Load environment variables from .env file
 try:
@@ -34,13 +38,14 @@ GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
 
 
-def call_claude(prompt: str, retries: int = 3) -> Optional[Dict]:
+def call_claude(prompt: str, retries: int = 3, timeout: float = 60) -> Optional[Dict]:
     """
     Call Claude Sonnet to generate a query plan.
 
     Args:
         prompt: The full prompt including expert context and user query
         retries: Number of retry attempts on failure
+        timeout: HTTP timeout per attempt, in seconds
 
     Returns:
         Parsed JSON query plan or None on failure
@@ -61,7 +66,7 @@ def call_claude(prompt: str, retries: int = 3) -> Optional[Dict]:
         try:
             req = Request(url, data=json.dumps(payload).encode('utf-8'),
                          headers=headers, method='POST')
-            with urlopen(req, timeout=60) as response:
+            with urlopen(req, timeout=timeout) as response:
                 result = json.loads(response.read().decode('utf-8'))
                 content = result['content'][0]['text']
                 return _extract_json(content)
@@ -74,13 +79,14 @@ def call_claude(prompt: str, retries: int = 3) -> Optional[Dict]:
     return None
 
 
-def call_gemini(prompt: str, retries: int = 3) -> Optional[Dict]:
+def call_gemini(prompt: str, retries: int = 3, timeout: float = 60) -> Optional[Dict]:
     """
     Call Google Gemini to generate a query plan.
 
     Args:
         prompt: The full prompt including expert context and user query
         retries: Number of retry attempts on failure
+        timeout: HTTP timeout per attempt, in seconds
 
     Returns:
         Parsed JSON query plan or None on failure
@@ -101,7 +107,7 @@ def call_gemini(prompt: str, retries: int = 3) -> Optional[Dict]:
         try:
             req = Request(url, data=json.dumps(payload).encode('utf-8'),
                          headers=headers, method='POST')
-            with urlopen(req, timeout=60) as response:
+            with urlopen(req, timeout=timeout) as response:
                 result = json.loads(response.read().decode('utf-8'))
                 content = result['candidates'][0]['content']['parts'][0]['text']
                 return _extract_json(content)
@@ -114,13 +120,14 @@ def call_gemini(prompt: str, retries: int = 3) -> Optional[Dict]:
     return None
 
 
-def call_gpt(prompt: str, retries: int = 3) -> Optional[str]:
+def call_gpt(prompt: str, retries: int = 3, timeout: float = 60) -> Optional[str]:
     """
     Call GPT-4 to judge and merge query plans.
 
     Args:
         prompt: The judging prompt with both plans
         retries: Number of retry attempts on failure
+        timeout: HTTP timeout per attempt, in seconds
 
     Returns:
         GPT's response text or None on failure
@@ -141,7 +148,7 @@ def call_gpt(prompt: str, retries: int = 3) -> Optional[str]:
         try:
             req = Request(url, data=json.dumps(payload).encode('utf-8'),
                          headers=headers, method='POST')
-            with urlopen(req, timeout=60) as response:
+            with urlopen(req, timeout=timeout) as response:
                 result = json.loads(response.read().decode('utf-8'))
                 return result['choices'][0]['message']['content']
         except Exception as e:
@@ -178,6 +185,235 @@ def _extract_json(content: str) -> Optional[Dict]:
             return None
 
 
+# ============================================================================
+# LATENCY BUDGET: deadline-bounded, hedged provider calls
+# ============================================================================
+#
+# The app-facing ensemble functions (call_ensemble_for_app,
+# generate_ensemble_description, suggest_missing_dimensions,
+# augment_query_plan) ask Claude and Gemini the same thing and used to wait
+# up to 45s for both - inside a `with ThreadPoolExecutor` that waits for the
+# slower call on exit anyway, retries included. Their latency was whichever
+# model was slowest that day. Now each call gets a budget (seconds for the
+# whole function, GPT judging included), and _race() runs the providers
+# against it:
+#
+# - Every call is timed into a per-provider latency histogram.
+# - A provider still silent past its own p90 is hedged: the same request is
+#   sent again and whichever copy answers first is used (once per provider,
+#   and only while the budget has room for it). This replaces the retries.
+# - Once one provider has a valid answer, the others are waited for only if
+#   their p90 (plus the judge's, when one follows) still fits the budget;
+#   otherwise the first answer is returned straight away.
+# - At the deadline, whatever has arrived is used. Calls still running are
+#   abandoned on a shared pool, so they never hold up the request.
+
+# Whole-call budget when the caller doesn't pass one
+ENSEMBLE_BUDGET_SECONDS = 20.0
+
+# Never hedge sooner than this, however fast a provider usually is
+HEDGE_MIN_DELAY = 2.0
+
+# Latency assumed for a provider until it has enough samples
+DEFAULT_LATENCY_SECONDS = 8.0
+MIN_SAMPLES = 5
+
+# Histogram bucket upper bounds, in seconds
+LATENCY_BUCKETS = (0.5, 1, 2, 3, 5, 8, 13, 20, 30, 45, 60, float('inf'))
+
+_race_executor = None
+_race_executor_lock = threading.Lock()
+
+
+def _get_race_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _race_executor
+    if _race_executor is None:
+        with _race_executor_lock:
+            if _race_executor is None:
+                _race_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=16, thread_name_prefix='ensemble')
+    return _race_executor
+
+
+class LatencyHistogram:
+    """Call latencies of one provider, bucketed (see LATENCY_BUCKETS)."""
+
+    def __init__(self):
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.samples = 0
+        self.errors = 0
+        self.abandoned = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            self.samples += 1
+
+    def percentile(self, p: float) -> float:
+        """Upper bound of the bucket holding the p-th percentile (a prior until MIN_SAMPLES)."""
+        if self.samples < MIN_SAMPLES:
+            return DEFAULT_LATENCY_SECONDS
+        rank = p / 100 * self.samples
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound if bound != float('inf') else LATENCY_BUCKETS[-2]
+        return LATENCY_BUCKETS[-2]
+
+    def as_dict(self) -> dict:
+        return {
+            'samples': self.samples,
+            'errors': self.errors,
+            'abandoned': self.abandoned,
+            'hedges': self.hedges,
+            'hedge_wins': self.hedge_wins,
+            'p50_s': self.percentile(50) if self.samples >= MIN_SAMPLES else None,
+            'p90_s': self.percentile(90) if self.samples >= MIN_SAMPLES else None,
+            'p99_s': self.percentile(99) if self.samples >= MIN_SAMPLES else None,
+            'buckets': {('inf' if b == float('inf') else b): c for b, c in zip(LATENCY_BUCKETS, self.counts)},
+        }
+
+
+_latency: Dict[str, LatencyHistogram] = {}
+
+
+def _histogram(provider: str) -> LatencyHistogram:
+    histogram = _latency.get(provider)
+    if histogram is None:
+        histogram = _latency.setdefault(provider, LatencyHistogram())
+    return histogram
+
+
+def get_provider_latency_stats() -> Dict[str, dict]:
+    """Per-provider latency histograms and hedge/abandon counters."""
+    return {name: histogram.as_dict() for name, histogram in _latency.items()}
+
+
+def _timed(provider: str, fn: Callable[[float], Any], timeout: float, valid: Callable[[Any], bool]) -> Any:
+    """Run fn(timeout), recording its latency if it gave a valid answer (an error otherwise)."""
+    begin = time.monotonic()
+    try:
+        result = fn(timeout)
+    except Exception:
+        _histogram(provider).errors += 1
+        raise
+    if valid(result):
+        _histogram(provider).record(time.monotonic() - begin)
+    else:
+        _histogram(provider).errors += 1
+    return result
+
+
+def _race(
+    calls: Dict[str, Callable[[float], Any]],
+    budget: float,
+    valid: Callable[[Any], bool] = bool,
+    then: Optional[str] = None,
+    verbose: bool = False
+) -> Dict[str, Any]:
+    """
+    Run provider calls against a budget; {provider: result} for the valid answers.
+
+    Each call is fn(timeout) -> result, given the seconds left in the budget.
+    `then` names the provider that will be called after this one (the GPT
+    judge) so its expected latency is kept free when deciding whether to wait
+    for a second answer.
+    """
+    begin = time.monotonic()
+    deadline = begin + budget
+    executor = _get_race_executor()
+
+    def submit(name: str) -> concurrent.futures.Future:
+        timeout = max(deadline - time.monotonic(), 0.1)
+        return executor.submit(_timed, name, calls[name], timeout, valid)
+
+    owners = {}
+    for name in calls:
+        owners[submit(name)] = name
+    hedges = {}  # provider -> its hedge future (at most one each)
+    settled = set()  # providers whose hedge was sent or declined - never reconsidered
+    results: Dict[str, Any] = {}
+    failed = set()
+    reserve = _histogram(then).percentile(50) if then else 0.0
+
+    def hedge(name: str, reason: str) -> bool:
+        """Send a provider's request again, if it hasn't been and the budget has room."""
+        if name in settled:
+            return False
+        settled.add(name)
+        remaining = deadline - time.monotonic()
+        if remaining <= _histogram(name).percentile(50):
+            return False
+        if verbose:
+            print(f"    {name} {reason} after {time.monotonic() - begin:.1f}s - sending again")
+        _histogram(name).hedges += 1
+        future = submit(name)
+        hedges[name] = future
+        owners[future] = name
+        return True
+
+    while True:
+        open_names = [n for n in calls if n not in results and n not in failed]
+        now = time.monotonic()
+        if not open_names or now >= deadline:
+            break
+        if results:
+            # Wait for the rest only if they (and whatever follows) should fit the budget
+            expected = max([now] + [begin + _histogram(n).percentile(90) for n in open_names])
+            if expected + reserve >= deadline:
+                if verbose:
+                    print(f"    Budget: using {', '.join(results)} without waiting for {', '.join(open_names)}")
+                break
+
+        # Hedge the providers past their hedge time; wake for the next one due
+        hedge_at = {n: begin + max(_histogram(n).percentile(90), HEDGE_MIN_DELAY)
+                    for n in open_names if n not in settled}
+        for name, at in hedge_at.items():
+            if now >= at:
+                hedge(name, 'slow')
+        upcoming = [at for name, at in hedge_at.items() if name not in settled and at > now]
+        wake = min([deadline - reserve if results else deadline] + upcoming)
+        done, _ = concurrent.futures.wait(
+            list(owners), timeout=max(wake - now, 0), return_when=concurrent.futures.FIRST_COMPLETED)
+
+        for future in done:
+            name = owners.pop(future)
+            if name in results or name in failed:
+                continue
+            try:
+                result = future.result()
+            except Exception as e:
+                result = None
+                if verbose:
+                    print(f"    {name} failed: {e}")
+            if valid(result):
+                results[name] = result
+                if hedges.get(name) is future:
+                    _histogram(name).hedge_wins += 1
+                for other in [f for f, n in owners.items() if n == name]:
+                    del owners[other]
+            elif name not in owners.values() and not hedge(name, 'failed'):
+                failed.add(name)
+
+    for name in set(owners.values()):
+        _histogram(name).abandoned += 1
+    return results
+
+
+def _judge_within(judge: Callable[[float], Any], started: float, budget: float, verbose: bool = False) -> Any:
+    """Run a GPT judging call in what's left of the budget; None if it won't fit or misses it."""
+    remaining = started + budget - time.monotonic()
+    if remaining < _histogram('gpt').percentile(50):
+        if verbose:
+            print(f"    Budget: {max(remaining, 0):.1f}s left - skipping GPT judging")
+        return None
+    return _race({'gpt': judge}, remaining, verbose=verbose).get('gpt')
+
+
 def generate_ensemble_plan(
     user_query: str,
     expert_prompt: str,
@@ -253,10 +489,18 @@ def generate_ensemble_plan(
     return judgment.get('final_plan', claude_plan), judgment
 
 
+def _call_judge(prompt: str, timeout: Optional[float]) -> Optional[str]:
+    """call_gpt() with the usual retries, or a single attempt bounded by a budget's timeout."""
+    if timeout is None:
+        return call_gpt(prompt)
+    return call_gpt(prompt, retries=1, timeout=timeout)
+
+
 def judge_plans(
     user_query: str,
     plan_a: Dict,
-    plan_b: Dict
+    plan_b: Dict,
+    timeout: Optional[float] = None
 ) -> Optional[Dict]:
     """
     Have GPT-4 judge two query plans and merge the best aspects.
@@ -269,6 +513,7 @@ def judge_plans(
         user_query: Original user query for context
         plan_a: First query plan (Claude)
         plan_b: Second query plan (Gemini)
+        timeout: Seconds left in the caller's budget (one attempt); None retries as usual
 
     Returns:
         Dict with winner, reasoning, and final merged plan
@@ -322,7 +567,7 @@ Respond with JSON in this exact format:
 
 The final_plan should combine the best aspects of both plans. If one plan is clearly superior, use it as the base. If both have unique strengths, merge them intelligently."""
 
-    response = call_gpt(judge_prompt)
+    response = _call_judge(judge_prompt, timeout)
     if not response:
         return None
 
@@ -532,7 +777,8 @@ def call_ensemble_for_app(
     economist_prompt: str,
     previous_context: Optional[Dict] = None,
     use_few_shot: bool = True,
-    verbose: bool = False
+    verbose: bool = False,
+    budget: Optional[float] = None
 ) -> Dict:
     """
     Ensemble query plan generation for the main EconStats app.
@@ -546,6 +792,7 @@ def call_ensemble_for_app(
         previous_context: Optional context from previous queries
         use_few_shot: Whether to include few-shot examples
         verbose: Whether to print progress
+        budget: Seconds for the whole call, judging included (default ENSEMBLE_BUDGET_SECONDS)
 
     Returns:
         Dict in the format expected by app.py:
@@ -601,25 +848,15 @@ Consider whether this is a follow-up question that should modify or add to the p
     if verbose:
         print(f"Generating ensemble plan for: {query}")
 
-    # Generate plans in parallel (with timeout to prevent hanging)
-    LLM_TIMEOUT = 45  # seconds
-    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-        claude_future = executor.submit(call_claude, full_prompt)
-        gemini_future = executor.submit(call_gemini, full_prompt)
-
-        try:
-            claude_plan = claude_future.result(timeout=LLM_TIMEOUT)
-        except (concurrent.futures.TimeoutError, Exception) as e:
-            claude_plan = None
-            if verbose:
-                print(f"  Claude timed out or failed: {e}")
-
-        try:
-            gemini_plan = gemini_future.result(timeout=LLM_TIMEOUT)
-        except (concurrent.futures.TimeoutError, Exception) as e:
-            gemini_plan = None
-            if verbose:
-                print(f"  Gemini timed out or failed: {e}")
+    # Generate plans in parallel within the latency budget
+    budget = ENSEMBLE_BUDGET_SECONDS if budget is None else budget
+    started = time.monotonic()
+    plans = _race({
+        'claude': lambda timeout: call_claude(full_prompt, retries=1, timeout=timeout),
+        'gemini': lambda timeout: call_gemini(full_prompt, retries=1, timeout=timeout),
+    }, budget, then='gpt', verbose=verbose)
+    claude_plan = plans.get('claude')
+    gemini_plan = plans.get('gemini')
 
     if verbose:
         print(f"  Claude: {claude_plan.get('series', []) if claude_plan else 'FAILED'}")
@@ -639,7 +876,9 @@ Consider whether this is a follow-up question that should modify or add to the p
     if verbose:
         print(f"  GPT judging plans...")
 
-    judgment = judge_plans(query, claude_plan, gemini_plan)
+    judgment = _judge_within(
+        lambda timeout: judge_plans(query, claude_plan, gemini_plan, timeout=timeout),
+        started, budget, verbose=verbose)
 
     if not judgment or not judgment.get('final_plan'):
         # Fallback to Claude if judging fails
@@ -703,7 +942,8 @@ def generate_ensemble_description(
     query: str,
     data_summary: list,
     original_explanation: str = "",
-    verbose: bool = False
+    verbose: bool = False,
+    budget: Optional[float] = None
 ) -> str:
     """
     Generate an improved description/narrative using the ensemble approach.
@@ -718,6 +958,7 @@ def generate_ensemble_description(
         data_summary: List of dicts with series data (name, latest_value, yoy_change, etc.)
         original_explanation: Initial explanation to improve upon
         verbose: Whether to print progress
+        budget: Seconds for the whole call, judging included (default ENSEMBLE_BUDGET_SECONDS)
 
     Returns:
         Improved explanation string
@@ -725,6 +966,16 @@ def generate_ensemble_description(
     if not data_summary:
         return original_explanation
 
+    # Same question on the same data (and starting explanation) - reuse the
+    # merged description instead of three more LLM calls
+    cache_template = template_id('ensemble_description', original_explanation)
+    fingerprint = data_fingerprint(data_summary)
+    cached = get_llm_cache().get(cache_template, query, fingerprint)
+    if cached:
+        if verbose:
+            print("  Ensemble description: cache hit")
+        return cached
+
     # Build the prompt for generating descriptions
     description_prompt = f"""You are an expert economist writing a clear, insightful summary for a user.
 
@@ -769,25 +1020,15 @@ Keep it to 4-6 concise sentences. Return only the explanation text, nothing else
     if verbose:
         print(f"  Generating ensemble description...")
 
-    # Generate descriptions in parallel (with timeout to prevent hanging)
-    LLM_TIMEOUT = 45  # seconds
-    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-        claude_future = executor.submit(_generate_description_claude, description_prompt)
-        gemini_future = executor.submit(_generate_description_gemini, description_prompt)
-
-        try:
-            claude_desc = claude_future.result(timeout=LLM_TIMEOUT)
-        except (concurrent.futures.TimeoutError, Exception) as e:
-            claude_desc = None
-            if verbose:
-                print(f"    Claude desc timed out or failed: {e}")
-
-        try:
-            gemini_desc = gemini_future.result(timeout=LLM_TIMEOUT)
-        except (concurrent.futures.TimeoutError, Exception) as e:
-            gemini_desc = None
-            if verbose:
-                print(f"    Gemini desc timed out or failed: {e}")
+    # Generate descriptions in parallel within the latency budget
+    budget = ENSEMBLE_BUDGET_SECONDS if budget is None else budget
+    started = time.monotonic()
+    descriptions = _race({
+        'claude': lambda timeout: _generate_description_claude(description_prompt, timeout=timeout),
+        'gemini': lambda timeout: _generate_description_gemini(description_prompt, timeout=timeout),
+    }, budget, then='gpt', verbose=verbose)
+    claude_desc = descriptions.get('claude')
+    gemini_desc = descriptions.get('gemini')
 
     if verbose:
         print(f"    Claude: {'OK' if claude_desc else 'FAILED'}")
@@ -796,24 +1037,27 @@ Keep it to 4-6 concise sentences. Return only the explanation text, nothing else
     # Handle failures
     if not claude_desc and not gemini_desc:
         return original_explanation
-    if not claude_desc:
-        return gemini_desc
-    if not gemini_desc:
-        return claude_desc
+    if not claude_desc or not gemini_desc:
+        # Only one model answered - use it, but don't cache a single-model result
+        return claude_desc or gemini_desc
 
     # Both succeeded - have GPT judge and merge
     if verbose:
         print(f"  GPT judging descriptions...")
 
-    final_desc = _judge_descriptions(query, data_summary, claude_desc, gemini_desc)
+    final_desc = _judge_within(
+        lambda timeout: _judge_descriptions(query, data_summary, claude_desc, gemini_desc, timeout=timeout),
+        started, budget, verbose=verbose)
 
     if verbose:
         print(f"    Final: {'OK' if final_desc else 'FAILED'}")
 
+    if final_desc:
+        get_llm_cache().put(cache_template, query, fingerprint, final_desc)
     return final_desc if final_desc else claude_desc
 
 
-def _generate_description_claude(prompt: str) -> Optional[str]:
+def _generate_description_claude(prompt: str, timeout: float = 15) -> Optional[str]:
     """Generate description using Claude."""
     url = 'https://api.anthropic.com/v1/messages'
     payload = {
@@ -830,7 +1074,7 @@ def _generate_description_claude(prompt: str) -> Optional[str]:
     try:
         req = Request(url, data=json.dumps(payload).encode('utf-8'),
                      headers=headers, method='POST')
-        with urlopen(req, timeout=15) as response:
+        with urlopen(req, timeout=min(timeout, 15)) as response:
             result = json.loads(response.read().decode('utf-8'))
             text = result['content'][0]['text'].strip().strip('"\'')
             # Strip any HTML tags LLM might have generated
@@ -841,7 +1085,7 @@ def _generate_description_claude(prompt: str) -> Optional[str]:
         return None
 
 
-def _generate_description_gemini(prompt: str) -> Optional[str]:
+def _generate_description_gemini(prompt: str, timeout: float = 15) -> Optional[str]:
     """Generate description using Gemini."""
     url = f'https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key={GEMINI_API_KEY}'
     payload = {
@@ -858,7 +1102,7 @@ def _generate_description_gemini(prompt: str) -> Optional[str]:
     try:
         req = Request(url, data=json.dumps(payload).encode('utf-8'),
                      headers=headers, method='POST')
-        with urlopen(req, timeout=15) as response:
+        with urlopen(req, timeout=min(timeout, 15)) as response:
             result = json.loads(response.read().decode('utf-8'))
             text = result['candidates'][0]['content']['parts'][0]['text'].strip().strip('"\'')
             # Strip any HTML tags LLM might have generated
@@ -873,7 +1117,8 @@ def _judge_descriptions(
     query: str,
     data_summary: list,
     desc_a: str,
-    desc_b: str
+    desc_b: str,
+    timeout: Optional[float] = None
 ) -> Optional[str]:
     """Have GPT-4 judge two descriptions and produce the best merged version."""
     judge_prompt = f"""You are an expert economist and editor evaluating two explanations of economic data.
@@ -904,7 +1149,7 @@ Write the BEST possible explanation by:
 
 Return ONLY the final improved explanation text. No commentary or meta-discussion."""
 
-    response = call_gpt(judge_prompt)
+    response = _call_judge(judge_prompt, timeout)
     if response:
         text = response.strip().strip('"\'')
         # Strip any HTML tags LLM might have generated
@@ -921,7 +1166,8 @@ Return ONLY the final improved explanation text. No commentary or meta-discussio
 def suggest_missing_dimensions(
     query: str,
     existing_series_names: list,
-    verbose: bool = False
+    verbose: bool = False,
+    budget: Optional[float] = None
 ) -> Dict:
     """
     Ask LLMs what DIMENSIONS/TOPICS are missing to fully answer a query.
@@ -934,6 +1180,7 @@ def suggest_missing_dimensions(
         query: The user's original question
         existing_series_names: Names of series already in the plan (not IDs)
         verbose: Whether to print progress
+        budget: Seconds for the whole call (default ENSEMBLE_BUDGET_SECONDS)
 
     Returns:
         Dict with:
@@ -982,25 +1229,13 @@ Example for "How are restaurants doing?" with existing price data:
 
 If the existing data already covers the question well, return empty lists."""
 
-    # Generate suggestions in parallel from Claude and Gemini (with timeout)
-    LLM_TIMEOUT = 45  # seconds
-    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-        claude_future = executor.submit(call_claude, dimension_prompt)
-        gemini_future = executor.submit(call_gemini, dimension_prompt)
-
-        try:
-            claude_result = claude_future.result(timeout=LLM_TIMEOUT)
-        except (concurrent.futures.TimeoutError, Exception) as e:
-            claude_result = None
-            if verbose:
-                print(f"    Claude dimension timed out or failed: {e}")
-
-        try:
-            gemini_result = gemini_future.result(timeout=LLM_TIMEOUT)
-        except (concurrent.futures.TimeoutError, Exception) as e:
-            gemini_result = None
-            if verbose:
-                print(f"    Gemini dimension timed out or failed: {e}")
+    # Generate suggestions in parallel from Claude and Gemini within the latency budget
+    suggestions = _race({
+        'claude': lambda timeout: call_claude(dimension_prompt, retries=1, timeout=timeout),
+        'gemini': lambda timeout: call_gemini(dimension_prompt, retries=1, timeout=timeout),
+    }, ENSEMBLE_BUDGET_SECONDS if budget is None else budget, verbose=verbose)
+    claude_result = suggestions.get('claude')
+    gemini_result = suggestions.get('gemini')
 
     if verbose:
         print(f"    Claude: {claude_result.get('search_terms', []) if claude_result else 'FAILED'}")
@@ -1168,7 +1403,8 @@ def augment_query_plan(
     query: str,
     existing_series: list,
     existing_explanation: str = "",
-    verbose: bool = False
+    verbose: bool = False,
+    budget: Optional[float] = None
 ) -> Dict:
     """
     Augment a pre-computed query plan with missing dimensions.
@@ -1181,6 +1417,7 @@ def augment_query_plan(
         existing_series: Series IDs already in the pre-computed plan
         existing_explanation: Explanation from pre-computed plan
         verbose: Whether to print progress
+        budget: Seconds for the whole call, judging included (default ENSEMBLE_BUDGET_SECONDS)
 
     Returns:
         Dict with:
@@ -1284,25 +1521,15 @@ Return JSON:
 If the plan is already comprehensive, return empty additional_series.
 Only suggest series you're confident exist in FRED."""
 
-    # Generate suggestions in parallel (with timeout to prevent hanging)
-    LLM_TIMEOUT = 45  # seconds
-    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-        claude_future = executor.submit(call_claude, augment_prompt)
-        gemini_future = executor.submit(call_gemini, augment_prompt)
-
-        try:
-            claude_result = claude_future.result(timeout=LLM_TIMEOUT)
-        except (concurrent.futures.TimeoutError, Exception) as e:
-            claude_result = None
-            if verbose:
-                print(f"    Claude augment timed out or failed: {e}")
-
-        try:
-            gemini_result = gemini_future.result(timeout=LLM_TIMEOUT)
-        except (concurrent.futures.TimeoutError, Exception) as e:
-            gemini_result = None
-            if verbose:
-                print(f"    Gemini augment timed out or failed: {e}")
+    # Generate suggestions in parallel within the latency budget
+    budget = ENSEMBLE_BUDGET_SECONDS if budget is None else budget
+    started = time.monotonic()
+    suggestions = _race({
+        'claude': lambda timeout: call_claude(augment_prompt, retries=1, timeout=timeout),
+        'gemini': lambda timeout: call_gemini(augment_prompt, retries=1, timeout=timeout),
+    }, budget, then='gpt', verbose=verbose)
+    claude_result = suggestions.get('claude')
+    gemini_result = suggestions.get('gemini')
 
     if verbose:
         print(f"    Claude suggests: {claude_result.get('additional_series', []) if claude_result else 'FAILED'}")
@@ -1327,7 +1554,9 @@ Only suggest series you're confident exist in FRED."""
     if verbose:
         print(f"  GPT judging augmentation suggestions...")
 
-    judgment = _judge_augmentations(query, existing_series, claude_result, gemini_result)
+    judgment = _judge_within(
+        lambda timeout: _judge_augmentations(query, existing_series, claude_result, gemini_result, timeout=timeout),
+        started, budget, verbose=verbose)
 
     if not judgment:
         # Fallback to Claude's suggestions
@@ -1348,7 +1577,8 @@ def _judge_augmentations(
     query: str,
     existing_series: list,
     suggestion_a: Dict,
-    suggestion_b: Dict
+    suggestion_b: Dict,
+    timeout: Optional[float] = None
 ) -> Optional[Dict]:
     """Have GPT judge two augmentation suggestions and merge the best."""
     judge_prompt = f"""You are an expert economist evaluating two suggestions for augmenting a FRED data query plan.
@@ -1387,7 +1617,7 @@ Return JSON:
 
 Combine the best suggestions from both. Remove any series you're unsure about."""
 
-    response = call_gpt(judge_prompt)
+    response = _call_judge(judge_prompt, timeout)
     if not response:
         return None
 
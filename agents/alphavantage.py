@@ -14,11 +14,14 @@ Free API Key: https://www.alphavantage.co/support/#api-key
 
 import json
 import os
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional
-from urllib.request import urlopen, Request
 from urllib.error import URLError
 
+from core.cache import TTLCache
+from core.singleflight import SingleFlight
+from core.http_client import get_json
+
 # API Key from environment
 ALPHAVANTAGE_API_KEY = os.environ.get("ALPHAVANTAGE_API_KEY", "")
 
@@ -918,8 +921,9 @@ ALPHAVANTAGE_SERIES = {
 }
 
 # Cache
-_cache = {}
-_cache_ttl = timedelta(hours=1)
+_cache = TTLCache('alphavantage', max_entries=256, ttl=3600)
+# Concurrent identical requests share one upstream call
+_flight = SingleFlight('alphavantage')
 
 
 def _fetch_alphavantage(params: dict) -> dict:
@@ -944,27 +948,23 @@ def _fetch_alphavantage(params: dict) -> dict:
 
     # Check cache
     cache_key = url
-    now = datetime.now()
-    if cache_key in _cache:
-        cached_data, cached_time = _cache[cache_key]
-        if now - cached_time < _cache_ttl:
-            return cached_data
+    cached_data = _cache.get(cache_key)
+    if cached_data is not None:
+        return cached_data
 
     try:
-        req = Request(url, headers={'User-Agent': 'EconStats/1.0'})
-        with urlopen(req, timeout=30) as response:
-            data = json.loads(response.read().decode('utf-8'))
-
-            # Check for API error messages
-            if 'Error Message' in data:
-                return {'error': data['Error Message']}
-            if 'Note' in data:  # Rate limit message
-                return {'error': data['Note']}
-            if 'Information' in data:  # API key issue
-                return {'error': data['Information']}
-
-            _cache[cache_key] = (data, now)
-            return data
+        data = _flight.do(cache_key, get_json, url, timeout=30)
+
+        # Check for API error messages
+        if 'Error Message' in data:
+            return {'error': data['Error Message']}
+        if 'Note' in data:  # Rate limit message
+            return {'error': data['Note']}
+        if 'Information' in data:  # API key issue
+            return {'error': data['Information']}
+
+        _cache.set(cache_key, data)
+        return data
     except URLError as e:
         print(f"[AlphaVantage] Error: {e}")
         return {'error': str(e)}
@@ -7,15 +7,18 @@ This adds international coverage that FRED doesn't have.
 API: https://api.db.nomics.world/v22/
 """
 
-import json
-from urllib.request import urlopen, Request
 from urllib.error import HTTPError, URLError
-from datetime import datetime, timedelta
 from typing import Optional
 
+from core.cache import TTLCache
+from core.singleflight import SingleFlight
+from core.http_client import get_json
+from core.query_classifier import classify, register_keywords
+
 # Cache to avoid excessive API calls
-_cache: dict = {}
-_cache_ttl = timedelta(minutes=30)
+_cache = TTLCache('dbnomics', max_entries=256, ttl=1800)
+# Concurrent identical requests share one upstream call
+_flight = SingleFlight('dbnomics')
 
 DBNOMICS_API = "https://api.db.nomics.world/v22"
 
@@ -1500,16 +1503,12 @@ INTERNATIONAL_QUERY_PLANS = {
 
 def _get_cached(key: str) -> Optional[dict]:
     """Get cached result if still valid."""
-    if key in _cache:
-        data, timestamp = _cache[key]
-        if datetime.now() - timestamp < _cache_ttl:
-            return data
-    return None
+    return _cache.get(key)
 
 
 def _set_cache(key: str, data: dict) -> None:
-    """Cache result with timestamp."""
-    _cache[key] = (data, datetime.now())
+    """Cache result (expires after the cache TTL)."""
+    _cache.set(key, data)
 
 
 def fetch_series(series_key: str) -> Optional[dict]:
@@ -1535,9 +1534,7 @@ def fetch_series(series_key: str) -> Optional[dict]:
 
     try:
         url = f"{DBNOMICS_API}/series/{series_id}?observations=1"
-        req = Request(url, headers={"Accept": "application/json"})
-        resp = urlopen(req, timeout=10)
-        data = json.loads(resp.read())
+        data = _flight.do(url, get_json, url, headers={"Accept": "application/json"}, timeout=10)
 
         docs = data.get("series", {}).get("docs", [])
         if not docs:
@@ -1675,79 +1672,82 @@ def find_international_plan(query: str) -> Optional[dict]:
     return None
 
 
-def is_international_query(query: str) -> bool:
-    """
-    Check if query asks about international/non-US data.
+INTERNATIONAL_KEYWORDS = [
+    # Regional aggregates
+    "eurozone", "euro area", "europe", "european", "eu",
+    "oecd", "g7", "g20", "brics",
+    "global", "world",
+    "emerging market", "emerging economies", "advanced economies",
+    "asia pacific", "latin america", "asean",
 
-    Returns True if the query contains keywords for:
-    - Specific countries (UK, Japan, China, Germany, France, Italy, etc.)
-    - Regional aggregates (Eurozone, OECD, G7, BRICS, emerging markets)
-    - Central banks (ECB, BOE, BOJ, RBA, BOC, Banxico, RBI, BCB)
-    - Global/world economy queries
-    """
-    query_lower = query.lower()
-    intl_keywords = [
-        # Regional aggregates
-        "eurozone", "euro area", "europe", "european", "eu",
-        "oecd", "g7", "g20", "brics",
-        "global", "world",
-        "emerging market", "emerging economies", "advanced economies",
-        "asia pacific", "latin america", "asean",
+    # UK
+    "uk", "britain", "british", "england", "united kingdom",
 
-        # UK
-        "uk", "britain", "british", "england", "united kingdom",
+    # Japan
+    "japan", "japanese",
 
-        # Japan
-        "japan", "japanese",
+    # China
+    "china", "chinese",
 
-        # China
-        "china", "chinese",
+    # Germany
+    "germany", "german",
 
-        # Germany
-        "germany", "german",
+    # France
+    "france", "french",
 
-        # France
-        "france", "french",
+    # Italy
+    "italy", "italian",
 
-        # Italy
-        "italy", "italian",
+    # South Korea
+    "south korea", "korea", "korean",
 
-        # South Korea
-        "south korea", "korea", "korean",
+    # Australia
+    "australia", "australian",
 
-        # Australia
-        "australia", "australian",
+    # Canada
+    "canada", "canadian",
 
-        # Canada
-        "canada", "canadian",
+    # Mexico
+    "mexico", "mexican",
 
-        # Mexico
-        "mexico", "mexican",
+    # India
+    "india", "indian",
 
-        # India
-        "india", "indian",
+    # Brazil
+    "brazil", "brazilian",
 
-        # Brazil
-        "brazil", "brazilian",
+    # Indonesia
+    "indonesia", "indonesian",
 
-        # Indonesia
-        "indonesia", "indonesian",
+    # Turkey
+    "turkey", "turkish",
 
-        # Turkey
-        "turkey", "turkish",
+    # South Africa
+    "south africa", "african",
 
-        # South Africa
-        "south africa", "african",
+    # Russia
+    "russia", "russian",
 
-        # Russia
-        "russia", "russian",
+    # Central banks
+    "ecb", "boe", "boj", "rba", "boc", "banxico", "rbi", "bcb",
+    "bank of england", "bank of japan", "bank of canada",
+    "reserve bank of australia", "reserve bank of india",
+]
 
-        # Central banks
-        "ecb", "boe", "boj", "rba", "boc", "banxico", "rbi", "bcb",
-        "bank of england", "bank of japan", "bank of canada",
-        "reserve bank of australia", "reserve bank of india",
-    ]
-    return any(kw in query_lower for kw in intl_keywords)
+register_keywords('international', INTERNATIONAL_KEYWORDS)
+
+
+def is_international_query(query: str) -> bool:
+    """
+    Check if query asks about international/non-US data.
+
+    Returns True if the query contains keywords for:
+    - Specific countries (UK, Japan, China, Germany, France, Italy, etc.)
+    - Regional aggregates (Eurozone, OECD, G7, BRICS, emerging markets)
+    - Central banks (ECB, BOE, BOJ, RBA, BOC, Banxico, RBI, BCB)
+    - Global/world economy queries
+    """
+    return classify(query).has('international')
 
 
 # Quick test
@@ -14,11 +14,13 @@ Registration (free): https://www.eia.gov/opendata/register.php
 
 import json
 import os
-from datetime import datetime, timedelta
 from typing import Optional
-from urllib.request import urlopen, Request
 from urllib.error import URLError
 
+from core.cache import TTLCache
+from core.singleflight import SingleFlight
+from core.http_client import get_json
+
 # API Key from environment
 EIA_API_KEY = os.environ.get("EIA_API_KEY", "")
 
@@ -648,8 +650,9 @@ EIA_SERIES = {
 }
 
 # Cache
-_cache = {}
-_cache_ttl = timedelta(hours=1)
+_cache = TTLCache('eia', max_entries=256, ttl=3600)
+# Concurrent identical requests share one upstream call
+_flight = SingleFlight('eia')
 
 
 def _fetch_eia_v2(route: str, params: dict = None) -> dict:
@@ -686,18 +689,14 @@ def _fetch_eia_v2(route: str, params: dict = None) -> dict:
 
     # Check cache
     cache_key = url
-    now = datetime.now()
-    if cache_key in _cache:
-        cached_data, cached_time = _cache[cache_key]
-        if now - cached_time < _cache_ttl:
-            return cached_data
+    cached_data = _cache.get(cache_key)
+    if cached_data is not None:
+        return cached_data
 
     try:
-        req = Request(url, headers={'User-Agent': 'EconStats/1.0'})
-        with urlopen(req, timeout=30) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            _cache[cache_key] = (data, now)
-            return data
+        data = _flight.do(cache_key, get_json, url, timeout=30)
+        _cache.set(cache_key, data)
+        return data
     except URLError as e:
         print(f"[EIA] Error fetching {route}: {e}")
         return {'error': str(e)}
@@ -720,18 +719,14 @@ def _fetch_eia_legacy(series_id: str) -> dict:
 
     # Check cache
     cache_key = url
-    now = datetime.now()
-    if cache_key in _cache:
-        cached_data, cached_time = _cache[cache_key]
-        if now - cached_time < _cache_ttl:
-            return cached_data
+    cached_data = _cache.get(cache_key)
+    if cached_data is not None:
+        return cached_data
 
     try:
-        req = Request(url, headers={'User-Agent': 'EconStats/1.0'})
-        with urlopen(req, timeout=30) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            _cache[cache_key] = (data, now)
-            return data
+        data = _flight.do(cache_key, get_json, url, timeout=30)
+        _cache.set(cache_key, data)
+        return data
     except URLError as e:
         print(f"[EIA] Error fetching series {series_id}: {e}")
         return {'error': str(e)}
@@ -21,6 +21,8 @@ from urllib.request import urlopen, Request
 from urllib.error import HTTPError, URLError
 from html.parser import HTMLParser
 
+from core.query_classifier import classify, register_keywords
+
 # =============================================================================
 # SEP MEETING DATES (updated quarterly)
 # =============================================================================
@@ -415,6 +417,37 @@ def is_sep_query(query: str) -> bool:
     return any(kw in query_lower for kw in sep_keywords)
 
 
+# Core Fed-related terms
+FED_CORE_KEYWORDS = [
+    'fed', 'fomc', 'federal reserve', 'powell', 'jerome powell',
+]
+
+# Rate-related terms
+RATE_KEYWORDS = [
+    'rate cut', 'rate hike', 'rate increase', 'rate decrease',
+    'cutting rates', 'raising rates', 'hiking rates',
+    'rate decision', 'rate announcement',
+    'fed funds', 'federal funds rate', 'policy rate',
+    'interest rate', 'benchmark rate',
+]
+
+# Monetary policy terms
+POLICY_KEYWORDS = [
+    'monetary policy', 'policy stance', 'tightening', 'easing',
+    'hawkish', 'dovish', 'pivot',
+    'quantitative tightening', 'qt', 'balance sheet',
+]
+
+# Forward guidance terms (also triggers SEP)
+GUIDANCE_KEYWORDS = [
+    'dot plot', 'rate path', 'terminal rate', 'neutral rate',
+    'rate outlook', 'where rates are going', 'future rates',
+    'how many cuts', 'how many hikes',
+]
+
+register_keywords('fed', FED_CORE_KEYWORDS + RATE_KEYWORDS + POLICY_KEYWORDS + GUIDANCE_KEYWORDS)
+
+
 def is_fed_related_query(query: str) -> bool:
     """
     Check if query is related to the Fed, interest rates, or monetary policy.
@@ -430,39 +463,7 @@ def is_fed_related_query(query: str) -> bool:
     Returns:
         True if the query is Fed-related and should display Fed guidance
     """
-    query_lower = query.lower()
-
-    # Core Fed-related terms
-    fed_core_keywords = [
-        'fed', 'fomc', 'federal reserve', 'powell', 'jerome powell',
-    ]
-
-    # Rate-related terms
-    rate_keywords = [
-        'rate cut', 'rate hike', 'rate increase', 'rate decrease',
-        'cutting rates', 'raising rates', 'hiking rates',
-        'rate decision', 'rate announcement',
-        'fed funds', 'federal funds rate', 'policy rate',
-        'interest rate', 'benchmark rate',
-    ]
-
-    # Monetary policy terms
-    policy_keywords = [
-        'monetary policy', 'policy stance', 'tightening', 'easing',
-        'hawkish', 'dovish', 'pivot',
-        'quantitative tightening', 'qt', 'balance sheet',
-    ]
-
-    # Forward guidance terms (also triggers SEP)
-    guidance_keywords = [
-        'dot plot', 'rate path', 'terminal rate', 'neutral rate',
-        'rate outlook', 'where rates are going', 'future rates',
-        'how many cuts', 'how many hikes',
-    ]
-
-    all_keywords = fed_core_keywords + rate_keywords + policy_keywords + guidance_keywords
-
-    return any(kw in query_lower for kw in all_keywords)
+    return classify(query).has('fed')
 
 
 def get_fed_guidance_for_query(query: str) -> Optional[Dict]:
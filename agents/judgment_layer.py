@@ -13,17 +13,23 @@ import os
 import re
 import json
 import concurrent.futures
-from datetime import datetime, timedelta
 from typing import Optional, Tuple
 from urllib.request import Request, urlopen
 
+from core.llm_cache import data_fingerprint, get_llm_cache
+from core.query_classifier import classify, register_patterns
+from core.singleflight import SingleFlight
+
 # API Keys
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY') or os.getenv('GOOGLE_API_KEY')
 ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
 
-# Cache for judgment query results (avoids repeated expensive LLM calls)
-_judgment_cache: dict = {}
-_judgment_cache_ttl = timedelta(minutes=30)
+# Judgment results are cached per query and data (core/llm_cache.py). They
+# also cite web commentary, so they're refreshed after a few hours even if
+# the data hasn't changed.
+JUDGMENT_CACHE_TEMPLATE = 'judgment'
+JUDGMENT_CACHE_MAX_AGE = 6 * 60 * 60
+_judgment_flight = SingleFlight('judgment')
 
 # Judgment query patterns - these need interpretation, not just facts
 JUDGMENT_PATTERNS = [
@@ -69,6 +75,8 @@ JUDGMENT_PATTERNS = [
     r'\b(rally|run-up|surge).*(sustainable|justified|warranted)',  # "is the rally sustainable?"
 ]
 
+register_patterns('judgment', JUDGMENT_PATTERNS)
+
 # Pre-curated thresholds with economist quotes
 ECONOMIST_THRESHOLDS = {
     'UNRATE': {
@@ -163,14 +171,7 @@ def is_judgment_query(query: str) -> bool:
     Returns:
         True if the query needs interpretation, False for pure factual queries
     """
-    query_lower = query.lower().strip()
-
-    # Check against judgment patterns
-    for pattern in JUDGMENT_PATTERNS:
-        if re.search(pattern, query_lower):
-            return True
-
-    return False
+    return classify(query).has('judgment')
 
 
 def get_threshold_context(series_id: str, current_value: float) -> Optional[dict]:
@@ -432,29 +433,71 @@ def _get_judgment_cache_key(query: str, series_ids: list) -> str:
     return f"judgment:{query.lower().strip()}:{series_str}"
 
 
-def _get_cached_judgment(cache_key: str) -> Optional[str]:
-    """Get cached judgment result if still valid."""
-    if cache_key in _judgment_cache:
-        result, timestamp = _judgment_cache[cache_key]
-        if datetime.now() - timestamp < _judgment_cache_ttl:
-            return result
-        else:
-            del _judgment_cache[cache_key]
-    return None
+def _get_cached_judgment(query: str, fingerprint: str) -> Optional[str]:
+    """Cached judgment for this query (or a paraphrase of it) on this data."""
+    return get_llm_cache().get(JUDGMENT_CACHE_TEMPLATE, query, fingerprint, max_age=JUDGMENT_CACHE_MAX_AGE)
+
+
+def _set_judgment_cache(query: str, fingerprint: str, result: str) -> None:
+    """Cache a judgment result until the data changes."""
+    get_llm_cache().put(JUDGMENT_CACHE_TEMPLATE, query, fingerprint, result)
+
+
+def _synthesize_judgment(query: str, data_summary: list, threshold_contexts: list) -> Optional[str]:
+    """Run the Gemini search and Claude synthesis for a judgment query. None on failure."""
+    # PARALLEL EXECUTION: Run Gemini search and Claude synthesis concurrently
+    # Claude can work with or without Gemini results - thresholds are the primary source
+    print(f"[JudgmentLayer] Running Gemini search + Claude synthesis in PARALLEL...")
+
+    gemini_results = None
+    synthesis = None
 
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        # Start Gemini search
+        gemini_future = executor.submit(gemini_web_search, query)
+
+        # Start Claude synthesis with threshold context only (no Gemini results yet)
+        # This gives us a baseline synthesis while we wait for Gemini
+        claude_future = executor.submit(
+            claude_synthesize,
+            query,
+            data_summary,
+            None,  # No Gemini results yet
+            threshold_contexts
+        )
+
+        # Wait for both with timeout
+        try:
+            gemini_results = gemini_future.result(timeout=20)
+            if gemini_results:
+                print(f"[JudgmentLayer] Gemini search returned results")
+            else:
+                print(f"[JudgmentLayer] Gemini search returned no results")
+        except (concurrent.futures.TimeoutError, Exception) as e:
+            print(f"[JudgmentLayer] Gemini search failed/timed out: {e}")
+            gemini_results = None
+
+        try:
+            synthesis = claude_future.result(timeout=20)
+        except (concurrent.futures.TimeoutError, Exception) as e:
+            print(f"[JudgmentLayer] Initial Claude synthesis failed: {e}")
+            synthesis = None
+
+    # If we got Gemini results AND the initial synthesis was generic, re-synthesize with Gemini context
+    if gemini_results and synthesis:
+        # Check if synthesis would benefit from Gemini context
+        # (e.g., if synthesis just uses thresholds, Gemini might add recent commentary)
+        if "recent commentary" not in synthesis.lower() and "experts" not in synthesis.lower():
+            print(f"[JudgmentLayer] Enhancing synthesis with Gemini context...")
+            enhanced = claude_synthesize(query, data_summary, gemini_results, threshold_contexts)
+            if enhanced and len(enhanced) > len(synthesis):
+                synthesis = enhanced
+    elif gemini_results and not synthesis:
+        # Initial synthesis failed, try again with Gemini results
+        print(f"[JudgmentLayer] Retrying synthesis with Gemini context...")
+        synthesis = claude_synthesize(query, data_summary, gemini_results, threshold_contexts)
 
-def _set_judgment_cache(cache_key: str, result: str) -> None:
-    """Cache a judgment result."""
-    _judgment_cache[cache_key] = (result, datetime.now())
-    # Limit cache size
-    if len(_judgment_cache) > 100:
-        # Remove oldest entries
-        oldest_keys = sorted(
-            _judgment_cache.keys(),
-            key=lambda k: _judgment_cache[k][1]
-        )[:20]
-        for k in oldest_keys:
-            del _judgment_cache[k]
+    return synthesis
 
 
 def process_judgment_query(
@@ -486,7 +529,8 @@ def process_judgment_query(
     # Check cache first
     series_ids = [sid for sid, _, _, _ in series_data if sid]
     cache_key = _get_judgment_cache_key(query, series_ids)
-    cached_result = _get_cached_judgment(cache_key)
+    fingerprint = data_fingerprint(series_data)
+    cached_result = _get_cached_judgment(query, fingerprint)
     if cached_result:
         print(f"[JudgmentLayer] Cache hit! Returning cached result")
         return cached_result, True
@@ -535,62 +579,13 @@ def process_judgment_query(
     if not data_summary:
         return original_explanation, True
 
-    # PARALLEL EXECUTION: Run Gemini search and Claude synthesis concurrently
-    # Claude can work with or without Gemini results - thresholds are the primary source
-    print(f"[JudgmentLayer] Running Gemini search + Claude synthesis in PARALLEL...")
-
-    gemini_results = None
-    synthesis = None
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-        # Start Gemini search
-        gemini_future = executor.submit(gemini_web_search, query)
-
-        # Start Claude synthesis with threshold context only (no Gemini results yet)
-        # This gives us a baseline synthesis while we wait for Gemini
-        claude_future = executor.submit(
-            claude_synthesize,
-            query,
-            data_summary,
-            None,  # No Gemini results yet
-            threshold_contexts
-        )
-
-        # Wait for both with timeout
-        try:
-            gemini_results = gemini_future.result(timeout=20)
-            if gemini_results:
-                print(f"[JudgmentLayer] Gemini search returned results")
-            else:
-                print(f"[JudgmentLayer] Gemini search returned no results")
-        except (concurrent.futures.TimeoutError, Exception) as e:
-            print(f"[JudgmentLayer] Gemini search failed/timed out: {e}")
-            gemini_results = None
-
-        try:
-            synthesis = claude_future.result(timeout=20)
-        except (concurrent.futures.TimeoutError, Exception) as e:
-            print(f"[JudgmentLayer] Initial Claude synthesis failed: {e}")
-            synthesis = None
-
-    # If we got Gemini results AND the initial synthesis was generic, re-synthesize with Gemini context
-    if gemini_results and synthesis:
-        # Check if synthesis would benefit from Gemini context
-        # (e.g., if synthesis just uses thresholds, Gemini might add recent commentary)
-        if "recent commentary" not in synthesis.lower() and "experts" not in synthesis.lower():
-            print(f"[JudgmentLayer] Enhancing synthesis with Gemini context...")
-            enhanced = claude_synthesize(query, data_summary, gemini_results, threshold_contexts)
-            if enhanced and len(enhanced) > len(synthesis):
-                synthesis = enhanced
-    elif gemini_results and not synthesis:
-        # Initial synthesis failed, try again with Gemini results
-        print(f"[JudgmentLayer] Retrying synthesis with Gemini context...")
-        synthesis = claude_synthesize(query, data_summary, gemini_results, threshold_contexts)
+    # Identical judgment queries already in flight share one set of LLM calls
+    synthesis = _judgment_flight.do(cache_key, _synthesize_judgment, query, data_summary, threshold_contexts)
 
     if synthesis:
         print(f"[JudgmentLayer] Synthesis complete")
         # Cache the result
-        _set_judgment_cache(cache_key, synthesis)
+        _set_judgment_cache(query, fingerprint, synthesis)
         return synthesis, True
     else:
         print(f"[JudgmentLayer] Synthesis failed, falling back to original")
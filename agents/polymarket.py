@@ -5,14 +5,14 @@ Fetches economic prediction market data (recession odds, Fed rate expectations,
 to complement FRED historical data with forward-looking market sentiment.
 """
 
-import requests
-from datetime import datetime, timedelta
 from typing import Optional
 import json
 
+from core.cache import TTLCache
+from core.http_client import get_json
+
 # Cache to avoid excessive API calls
-_cache: dict = {}
-_cache_ttl = timedelta(minutes=15)
+_cache = TTLCache('polymarket', max_entries=256, ttl=900)
 
 GAMMA_API_BASE = "https://gamma-api.polymarket.com"
 
@@ -176,16 +176,12 @@ ECONOMIC_EVENTS = {
 
 def _get_cached(key: str) -> Optional[dict]:
     """Get cached result if still valid."""
-    if key in _cache:
-        data, timestamp = _cache[key]
-        if datetime.now() - timestamp < _cache_ttl:
-            return data
-    return None
+    return _cache.get(key)
 
 
 def _set_cache(key: str, data: dict) -> None:
-    """Cache result with timestamp."""
-    _cache[key] = (data, datetime.now())
+    """Cache result (expires after the cache TTL)."""
+    _cache.set(key, data)
 
 
 def fetch_event(slug: str) -> Optional[dict]:
@@ -201,13 +197,11 @@ def fetch_event(slug: str) -> Optional[dict]:
 
     try:
         # Get events list and find by slug
-        resp = requests.get(
+        events = get_json(
             f"{GAMMA_API_BASE}/events",
             params={"closed": "false", "limit": 500},
             timeout=10
         )
-        resp.raise_for_status()
-        events = resp.json()
 
         for event in events:
             if event.get("slug") == slug:
@@ -235,13 +229,11 @@ def fetch_all_economic_events() -> list[dict]:
 
     try:
         # Fetch all events in one call
-        resp = requests.get(
+        all_events = get_json(
             f"{GAMMA_API_BASE}/events",
             params={"closed": "false", "limit": 500},
             timeout=10
         )
-        resp.raise_for_status()
-        all_events = resp.json()
 
         # Index by slug
         events_by_slug = {e.get("slug"): e for e in all_events}
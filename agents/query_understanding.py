@@ -18,17 +18,25 @@ This prevents issues like:
 
 import json
 import os
-from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any
 from urllib.request import urlopen, Request
 
+from core.cache import TTLCache
+from core.llm_cache import get_llm_cache
+from core.singleflight import SingleFlight
+
 # API Key - check both GEMINI_API_KEY and GOOGLE_API_KEY for compatibility
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "") or os.environ.get("GOOGLE_API_KEY", "")
 
-# Cache for query understanding results (1-hour TTL)
-# This avoids repeated expensive Gemini calls for similar queries
-_understanding_cache: dict = {}
-_understanding_cache_ttl = timedelta(hours=1)
+# Gemini understanding and series selection results are kept in the
+# persistent LLM cache (core/llm_cache.py), matched on paraphrases too. They
+# don't depend on data, so the bar for "same question" is set higher than
+# for narratives. Rule-based fallbacks only go in the in-memory cache (1-hour
+# TTL), so Gemini is retried once it's reachable again.
+_understanding_cache = TTLCache('query_understanding', max_entries=200, ttl=3600)
+UNDERSTANDING_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+UNDERSTANDING_SIMILARITY = 0.97
+_understanding_flight = SingleFlight('query_understanding')
 
 # =============================================================================
 # QUERY UNDERSTANDING PROMPT
@@ -233,35 +241,30 @@ def _get_understanding_cache_key(query: str) -> str:
 
 def _get_cached_understanding(cache_key: str) -> Optional[Dict]:
     """Get cached understanding result if still valid."""
-    if cache_key in _understanding_cache:
-        result, timestamp = _understanding_cache[cache_key]
-        if datetime.now() - timestamp < _understanding_cache_ttl:
-            return result
-        else:
-            del _understanding_cache[cache_key]
-    return None
+    return _understanding_cache.get(cache_key)
 
 
 def _set_understanding_cache(cache_key: str, result: Dict) -> None:
-    """Cache an understanding result."""
-    _understanding_cache[cache_key] = (result, datetime.now())
-    # Limit cache size to prevent unbounded growth
-    if len(_understanding_cache) > 200:
-        # Remove oldest 50 entries
-        oldest_keys = sorted(
-            _understanding_cache.keys(),
-            key=lambda k: _understanding_cache[k][1]
-        )[:50]
-        for k in oldest_keys:
-            del _understanding_cache[k]
+    """Cache an understanding result (least recently used entries are evicted)."""
+    _understanding_cache.set(cache_key, result)
+
+
+def _get_llm_cached(template: str, query: str) -> Optional[Dict]:
+    """A Gemini result for this query (or a close paraphrase) from the persistent cache."""
+    return get_llm_cache().get(template, query, max_age=UNDERSTANDING_CACHE_MAX_AGE,
+                               similarity=UNDERSTANDING_SIMILARITY)
+
+
+def _set_llm_cached(template: str, query: str, result: Dict) -> None:
+    get_llm_cache().put(template, query, '', result)
 
 
 def understand_query(query: str, verbose: bool = False) -> Dict[str, Any]:
     """
     Deeply understand a query before any routing or data fetching.
 
-    OPTIMIZED: Results are cached for 1 hour to avoid repeated Gemini calls.
-    Cache hit rate expected: 50-70% in typical sessions.
+    OPTIMIZED: Results are cached for a week (core/llm_cache.py), including
+    for close paraphrases, to avoid repeated Gemini calls.
 
     This is the "thinking first" step that should run before:
     - Checking pre-computed plans
@@ -282,7 +285,7 @@ def understand_query(query: str, verbose: bool = False) -> Dict[str, Any]:
     """
     # Check cache first (saves 5-8s per cache hit)
     cache_key = _get_understanding_cache_key(query)
-    cached_result = _get_cached_understanding(cache_key)
+    cached_result = _get_cached_understanding(cache_key) or _get_llm_cached('understanding', query)
     if cached_result:
         if verbose:
             print(f"  [QueryUnderstanding] Cache hit for: {query}")
@@ -291,8 +294,8 @@ def understand_query(query: str, verbose: bool = False) -> Dict[str, Any]:
     if verbose:
         print(f"  [QueryUnderstanding] Analyzing: {query}")
 
-    # Call Gemini for deep understanding
-    result = _call_gemini_understanding(query)
+    # Call Gemini for deep understanding (concurrent identical queries share one call)
+    result = _understanding_flight.do(cache_key, _call_gemini_understanding, query)
 
     if not result:
         # Fallback to rule-based understanding
@@ -316,7 +319,7 @@ def understand_query(query: str, verbose: bool = False) -> Dict[str, Any]:
             print(f"  [QueryUnderstanding] Demographics: {result['entities']['demographics']}")
 
     # Cache the result before returning
-    _set_understanding_cache(cache_key, result)
+    _set_llm_cached('understanding', query, result)
     return result
 
 
@@ -1202,8 +1205,7 @@ def get_dynamic_series(query: str, verbose: bool = False) -> Dict:
         return {'series': [], 'reasoning': None, 'explanation': None, 'success': False}
 
     # Check cache first
-    cache_key = f"dynamic_{query.lower().strip()}"
-    cached = _get_understanding_cache(cache_key)
+    cached = _get_llm_cached('dynamic_series', query)
     if cached:
         if verbose:
             print("  [DynamicSeries] Using cached result")
@@ -1253,7 +1255,7 @@ def get_dynamic_series(query: str, verbose: bool = False) -> Dict:
                     print(f"  [DynamicSeries] Reasoning: {parsed.get('reasoning', '')[:100]}...")
 
                 # Cache the result
-                _set_understanding_cache(cache_key, result)
+                _set_llm_cached('dynamic_series', query, result)
                 return result
 
     except Exception as e:
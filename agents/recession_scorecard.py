@@ -19,6 +19,8 @@ Indicators tracked:
 from typing import Optional
 from datetime import datetime, timedelta
 
+from core.query_classifier import classify, register_keywords
+
 
 # Status thresholds for each indicator
 INDICATOR_CONFIG = {
@@ -474,52 +476,48 @@ def format_scorecard_for_display(scorecard: dict) -> str:
     return html
 
 
+# Recession-related keywords
+RECESSION_KEYWORDS = [
+    'recession',
+    'are we in a recession',
+    'is a recession coming',
+    'recession risk',
+    'recession odds',
+    'recession probability',
+    'economic downturn',
+    'downturn coming',
+    'hard landing',
+    'soft landing',
+    'sahm rule',
+    'yield curve inversion',
+    'inverted yield curve',
+    'recession indicator',
+    'recession warning',
+    'recession signal',
+]
+
+# Economic outlook keywords (also show dashboard)
+OUTLOOK_KEYWORDS = [
+    'economic outlook',
+    'leading indicators',
+    'economic forecast',
+    'where is the economy headed',
+    'economic health',
+    'economy dashboard',
+    'lei ',
+    'leading index',
+]
+
+register_keywords('recession', RECESSION_KEYWORDS + OUTLOOK_KEYWORDS)
+
+
 def is_recession_query(query: str) -> bool:
     """
     Detect if a query is asking about recession risk or economic outlook.
 
     Returns True if the query should trigger the leading indicators dashboard.
     """
-    query_lower = query.lower()
-
-    # Recession-related keywords
-    recession_keywords = [
-        'recession',
-        'are we in a recession',
-        'is a recession coming',
-        'recession risk',
-        'recession odds',
-        'recession probability',
-        'economic downturn',
-        'downturn coming',
-        'hard landing',
-        'soft landing',
-        'sahm rule',
-        'yield curve inversion',
-        'inverted yield curve',
-        'recession indicator',
-        'recession warning',
-        'recession signal',
-    ]
-
-    # Economic outlook keywords (also show dashboard)
-    outlook_keywords = [
-        'economic outlook',
-        'leading indicators',
-        'economic forecast',
-        'where is the economy headed',
-        'economic health',
-        'economy dashboard',
-        'lei ',
-        'leading index',
-    ]
-
-    all_keywords = recession_keywords + outlook_keywords
-    for keyword in all_keywords:
-        if keyword in query_lower:
-            return True
-
-    return False
+    return classify(query).has('recession')
 
 
 def is_leading_indicators_query(query: str) -> bool:
@@ -18,6 +18,8 @@ from pathlib import Path
 from urllib.request import urlopen, Request
 from typing import List, Dict, Optional, Tuple
 
+from core.cache import TTLCache
+
 # Load environment variables
 try:
     from dotenv import load_dotenv
@@ -861,13 +863,16 @@ FRED_SERIES_CATALOG = [
 # EMBEDDING FUNCTIONS
 # =============================================================================
 
-_embeddings_cache = {}
+# Query embeddings are deterministic, so entries never expire - only LRU-evicted
+_embeddings_cache = TTLCache('embeddings', max_entries=2048)
 _catalog_embeddings = None
+_catalog_row_map = None
 
 def get_embedding(text: str) -> np.ndarray:
     """Get embedding for a text string. Tries Gemini first, then OpenAI."""
-    if text in _embeddings_cache:
-        return _embeddings_cache[text]
+    cached = _embeddings_cache.get(text)
+    if cached is not None:
+        return cached
 
     # Try Gemini embeddings first
     if GEMINI_API_KEY:
@@ -879,7 +884,7 @@ def get_embedding(text: str) -> np.ndarray:
                 content=text
             )
             embedding = np.array(result['embedding'])
-            _embeddings_cache[text] = embedding
+            _embeddings_cache.set(text, embedding)
             return embedding
         except Exception as e:
             print(f"Gemini embedding error: {e}")
@@ -902,7 +907,7 @@ def get_embedding(text: str) -> np.ndarray:
             with urlopen(req, timeout=30) as response:
                 result = json.loads(response.read().decode('utf-8'))
                 embedding = np.array(result['data'][0]['embedding'])
-                _embeddings_cache[text] = embedding
+                _embeddings_cache.set(text, embedding)
                 return embedding
         except Exception as e:
             print(f"OpenAI embedding error: {e}")
@@ -954,23 +959,45 @@ def get_batch_embeddings(texts: List[str]) -> List[np.ndarray]:
     return None
 
 
-def build_catalog_embeddings():
-    """Build embeddings for all series in the catalog."""
+# Catalog embeddings are stored as one L2-normalized float32 matrix (one row
+# per series) plus a parallel array of series IDs, and memory-mapped on load
+EMBEDDINGS_PATH = Path(__file__).parent / 'series_embeddings.npy'
+EMBEDDING_IDS_PATH = Path(__file__).parent / 'series_embedding_ids.npy'
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row so a dot product is the cosine similarity."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32)
+
+
+def save_catalog_embeddings(ids: List[str], embeddings: List[np.ndarray]) -> None:
+    """Write catalog embeddings in the matrix format read by build_catalog_embeddings()."""
+    matrix = _normalize_rows(np.asarray(embeddings, dtype=np.float64))
+    np.save(EMBEDDINGS_PATH, matrix)
+    np.save(EMBEDDING_IDS_PATH, np.asarray(ids, dtype=str))
+
+
+def build_catalog_embeddings() -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Load (or build) embeddings for all series in the catalog.
+
+    Returns:
+        (ids, matrix) - ids[i] is the series ID for row i of the normalized
+        float32 matrix - or None if embeddings are unavailable.
+    """
     global _catalog_embeddings
 
     if _catalog_embeddings is not None:
         return _catalog_embeddings
 
     # Check if cached embeddings exist
-    cache_path = Path(__file__).parent / 'series_embeddings.json'
-    if cache_path.exists():
-        with open(cache_path) as f:
-            cached = json.load(f)
-            _catalog_embeddings = {
-                item['id']: np.array(item['embedding'])
-                for item in cached
-            }
-            return _catalog_embeddings
+    if EMBEDDINGS_PATH.exists() and EMBEDDING_IDS_PATH.exists():
+        matrix = np.load(EMBEDDINGS_PATH, mmap_mode='r')
+        ids = np.load(EMBEDDING_IDS_PATH)
+        _catalog_embeddings = (ids, matrix)
+        return _catalog_embeddings
 
     print("Building embeddings for FRED series catalog...")
 
@@ -984,24 +1011,26 @@ def build_catalog_embeddings():
     embeddings = get_batch_embeddings(texts)
 
     if embeddings:
-        _catalog_embeddings = {}
-        cache_data = []
-        for series, embedding in zip(FRED_SERIES_CATALOG, embeddings):
-            _catalog_embeddings[series['id']] = embedding
-            cache_data.append({
-                'id': series['id'],
-                'embedding': embedding.tolist()
-            })
-
+        ids = [series['id'] for series in FRED_SERIES_CATALOG]
         # Cache to file
-        with open(cache_path, 'w') as f:
-            json.dump(cache_data, f)
-
-        print(f"Built embeddings for {len(_catalog_embeddings)} series")
+        save_catalog_embeddings(ids, embeddings)
+        _catalog_embeddings = (np.asarray(ids, dtype=str), _normalize_rows(np.asarray(embeddings)))
+        print(f"Built embeddings for {len(ids)} series")
 
     return _catalog_embeddings
 
 
+def _catalog_rows(ids: np.ndarray) -> Tuple[List[Dict], np.ndarray]:
+    """Catalog entries that have an embedding, with their matrix row numbers."""
+    global _catalog_row_map
+    if _catalog_row_map is None or _catalog_row_map[0] is not ids:
+        row_of = {series_id: i for i, series_id in enumerate(ids.tolist())}
+        entries = [s for s in FRED_SERIES_CATALOG if s['id'] in row_of]
+        rows = np.array([row_of[s['id']] for s in entries], dtype=np.int64)
+        _catalog_row_map = (ids, entries, rows)
+    return _catalog_row_map[1], _catalog_row_map[2]
+
+
 def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
     """Compute cosine similarity between two vectors."""
     return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
@@ -1065,20 +1094,27 @@ def retrieve_relevant_series(query: str, top_k: int = 15) -> List[Dict]:
     query_embedding = get_embedding(query) if catalog_embeddings else None
 
     if query_embedding is not None and catalog_embeddings:
-        # Use semantic search with embeddings
-        similarities = []
-        for series in FRED_SERIES_CATALOG:
-            series_embedding = catalog_embeddings.get(series['id'])
-            if series_embedding is not None:
-                sim = cosine_similarity(query_embedding, series_embedding)
-                similarities.append({
-                    **series,
-                    'similarity': sim
-                })
+        # Embeddings from a different model (e.g. Gemini vs the OpenAI-built
+        # catalog) can't be compared - use keyword matching instead
+        ids, matrix = catalog_embeddings
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+        query_norm = np.linalg.norm(query_vector)
+        if query_vector.shape != matrix.shape[1:] or not query_norm:
+            print(f"Query embedding dimension {query_vector.shape} doesn't match catalog {matrix.shape[1:]}")
+            query_embedding = None
 
-        # Sort by similarity and return top-k
-        similarities.sort(key=lambda x: x['similarity'], reverse=True)
-        return similarities[:top_k]
+    if query_embedding is not None and catalog_embeddings:
+        # Use semantic search: one matrix-vector product over the normalized
+        # catalog, then partial sort for the top-k rows
+        entries, rows = _catalog_rows(ids)
+        similarities = (matrix @ (query_vector / query_norm))[rows]
+
+        k = min(top_k, len(entries))
+        if k <= 0:
+            return []
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top], kind='stable')]
+        return [{**entries[i], 'similarity': float(similarities[i])} for i in top]
 
     else:
         # Fallback to keyword matching
@@ -14,12 +14,16 @@ Historical context:
 - Current (2025): ~38-40
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import logging
 
+# Valuation keywords live in core.query_classifier so the check doesn't import
+# this module (and pandas); re-exported for app.py
+from core.query_classifier import VALUATION_KEYWORDS, is_valuation_query  # noqa: F401
+
 logger = logging.getLogger(__name__)
 
 # Path to the Shiller data file
@@ -38,17 +42,32 @@ CAPE_BENCHMARKS = {
 }
 
 
-def load_shiller_data() -> pd.DataFrame:
+# Binary cache of the parsed XLS (rebuilt when the XLS modification time changes)
+SHILLER_CACHE_PATH = SHILLER_DATA_PATH.with_suffix(".npz")
+
+_COLUMNS = ['sp_price', 'earnings', 'cape', 'real_price']
+
+# In-process copy: (xls mtime, full frame, CAPE-only frame, sorted CAPE values)
+_loaded: Optional[Tuple[float, pd.DataFrame, pd.DataFrame, np.ndarray]] = None
+
+
+def _parse_shiller_dates(date_raw: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Load and parse the Shiller CAPE dataset.
+    Vectorized parse of Shiller's date format (1871.01 = January 1871, 1871.1 = October).
 
-    Returns:
-        DataFrame with columns: date, sp_price, earnings, cape, real_price
+    Returns (dates as datetime64[M], mask of rows with a valid month).
     """
-    if not SHILLER_DATA_PATH.exists():
-        logger.error(f"Shiller data file not found at {SHILLER_DATA_PATH}")
-        raise FileNotFoundError(f"Shiller data not found. Expected at: {SHILLER_DATA_PATH}")
+    year = np.floor(date_raw)
+    month = np.round((date_raw - year) * 100)
+    month[month == 0] = 1
+    valid = (month >= 1) & (month <= 12)
+    months_since_epoch = (year - 1970) * 12 + (month - 1)
+    dates = np.where(valid, months_since_epoch, 0).astype('int64').astype('datetime64[M]')
+    return dates, valid
+
 
+def _read_shiller_xls() -> dict:
+    """Parse the XLS into plain column arrays (date + the numeric columns we use)."""
     # Read Excel, skip header rows
     df = pd.read_excel(SHILLER_DATA_PATH, sheet_name='Data', header=None, skiprows=8)
 
@@ -60,27 +79,70 @@ def load_shiller_data() -> pd.DataFrame:
                   'ann_bond_return', 'excess_ann_return']
 
     # Filter to valid rows (date is numeric)
-    df = df[pd.to_numeric(df['date_raw'], errors='coerce').notna()].copy()
+    date_raw = pd.to_numeric(df['date_raw'], errors='coerce').to_numpy(dtype=np.float64)
+    numeric = ~np.isnan(date_raw)
+    dates, valid = _parse_shiller_dates(np.where(numeric, date_raw, 0.0))
+    keep = numeric & valid
+
+    columns = {'date': dates[keep]}
+    for col in _COLUMNS:
+        columns[col] = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64)[keep]
+    return columns
+
+
+def _load_columns(mtime: float) -> dict:
+    """Column arrays from the npz cache if it matches the XLS, else parse and refresh it."""
+    try:
+        with np.load(SHILLER_CACHE_PATH) as cached:
+            if float(cached['source_mtime']) == mtime:
+                return {name: cached[name] for name in ['date'] + _COLUMNS}
+    except (OSError, KeyError, ValueError):
+        pass
+
+    columns = _read_shiller_xls()
+    try:
+        np.savez(SHILLER_CACHE_PATH, source_mtime=np.float64(mtime), **columns)
+    except OSError as e:
+        logger.warning(f"Could not write Shiller cache {SHILLER_CACHE_PATH}: {e}")
+    return columns
+
+
+def _shiller_frames() -> Tuple[pd.DataFrame, pd.DataFrame, np.ndarray]:
+    """Shared (full frame, CAPE-only frame, sorted CAPE values), loaded once per XLS version."""
+    global _loaded
+
+    if not SHILLER_DATA_PATH.exists():
+        logger.error(f"Shiller data file not found at {SHILLER_DATA_PATH}")
+        raise FileNotFoundError(f"Shiller data not found. Expected at: {SHILLER_DATA_PATH}")
 
-    # Convert date format (1871.01 = January 1871)
-    def parse_shiller_date(date_val):
-        try:
-            year = int(date_val)
-            month = int(round((date_val - year) * 100))
-            if month == 0:
-                month = 1
-            return datetime(year, month, 1)
-        except:
-            return None
+    mtime = SHILLER_DATA_PATH.stat().st_mtime
+    if _loaded is None or _loaded[0] != mtime:
+        columns = _load_columns(mtime)
+        df = pd.DataFrame({'date': columns['date'].astype('datetime64[ns]'),
+                           **{col: columns[col] for col in _COLUMNS}})
+        df = df.sort_values('date', kind='stable').reset_index(drop=True)
+        cape_df = df[df['cape'].notna()].reset_index(drop=True)
+        _loaded = (mtime, df, cape_df, np.sort(cape_df['cape'].to_numpy()))
+    return _loaded[1], _loaded[2], _loaded[3]
 
-    df['date'] = df['date_raw'].apply(parse_shiller_date)
-    df = df[df['date'].notna()]
 
-    # Select and clean columns
-    result = df[['date', 'sp_price', 'earnings', 'cape', 'real_price']].copy()
-    result = result.sort_values('date').reset_index(drop=True)
+def load_shiller_data() -> pd.DataFrame:
+    """
+    Load and parse the Shiller CAPE dataset.
+
+    The XLS is parsed once and cached as a binary .npz next to it (rebuilt
+    when the XLS changes); repeated calls are served from memory.
+
+    Returns:
+        DataFrame with columns: date, sp_price, earnings, cape, real_price
+    """
+    return _shiller_frames()[0].copy()
+
 
-    return result
+def cape_percentile(value: float) -> float:
+    """Percent of historical CAPE readings strictly below `value` (binary search)."""
+    sorted_cape = _shiller_frames()[2]
+    return float(np.searchsorted(sorted_cape, value, side='left')) / len(sorted_cape) * 100
 
 
 def get_cape_series() -> Dict:
@@ -90,8 +152,7 @@ def get_cape_series() -> Dict:
     Returns:
         Dict with 'dates', 'values', 'info' keys matching FRED format
     """
-    df = load_shiller_data()
-    df = df[df['cape'].notna()]
+    df = _shiller_frames()[1]
 
     return {
         'dates': df['date'].dt.strftime('%Y-%m-%d').tolist(),
@@ -114,15 +175,14 @@ def get_current_cape() -> Dict:
     Returns:
         Dict with current value, percentile, and historical comparisons
     """
-    df = load_shiller_data()
-    df = df[df['cape'].notna()]
+    df = _shiller_frames()[1]
 
     current = df.iloc[-1]
     current_cape = current['cape']
     current_date = current['date']
 
     # Calculate percentile (what % of historical readings are below current)
-    percentile = (df['cape'] < current_cape).mean() * 100
+    percentile = cape_percentile(current_cape)
 
     # Find historical comparisons
     avg = df['cape'].mean()
@@ -189,8 +249,7 @@ def get_cape_for_period(start_year: int = None, end_year: int = None) -> Dict:
     Returns:
         Dict with filtered series data
     """
-    df = load_shiller_data()
-    df = df[df['cape'].notna()]
+    df = _shiller_frames()[1]
 
     if start_year:
         df = df[df['date'].dt.year >= start_year]
@@ -217,8 +276,7 @@ def get_bubble_comparison_data() -> Dict:
     Returns:
         Dict with current CAPE, dot-com comparison, and key statistics
     """
-    df = load_shiller_data()
-    df = df[df['cape'].notna()]
+    df = _shiller_frames()[1]
 
     current = get_current_cape()
 
@@ -231,12 +289,8 @@ def get_bubble_comparison_data() -> Dict:
 
     # Calculate how long we've been above various thresholds
     above_30 = df[df['cape'] > 30]
-    current_streak_above_30 = 0
-    for _, row in df.iloc[::-1].iterrows():
-        if row['cape'] > 30:
-            current_streak_above_30 += 1
-        else:
-            break
+    below = np.flatnonzero(df['cape'].to_numpy()[::-1] <= 30)
+    current_streak_above_30 = int(below[0]) if len(below) else len(df)
 
     return {
         'current': current,
@@ -279,20 +333,6 @@ def _generate_bubble_summary(current: Dict, dot_com_peak: float) -> str:
         return f"CAPE at {cape} is near or below historical average. Valuations reasonable."
 
 
-# Convenience function for app.py integration
-def is_valuation_query(query: str) -> bool:
-    """
-    Check if a query is about market valuation / CAPE / bubbles.
-    """
-    valuation_keywords = [
-        'cape', 'shiller', 'p/e', 'pe ratio', 'price to earnings',
-        'valuation', 'overvalued', 'undervalued', 'bubble',
-        'expensive', 'cheap', 'fairly valued', 'stretched'
-    ]
-    query_lower = query.lower()
-    return any(kw in query_lower for kw in valuation_keywords)
-
-
 if __name__ == "__main__":
     # Test the module
     print("Loading Shiller data...")
@@ -8,6 +8,8 @@ This module provides helper functions and curated market series.
 from datetime import datetime, timedelta
 from typing import Optional
 
+from core.query_classifier import classify, register_keywords
+
 # Stock market series available in FRED
 MARKET_SERIES = {
     # Major Indices
@@ -183,15 +185,18 @@ def get_market_series_info(series_id: str) -> Optional[dict]:
     return MARKET_SERIES.get(series_id)
 
 
+MARKET_QUERY_KEYWORDS = [
+    "stock", "market", "s&p", "sp500", "dow", "nasdaq", "vix",
+    "volatility", "equities", "wall street", "trading", "index",
+    "yield curve", "treasury", "gold", "oil price", "crude",
+]
+
+register_keywords('market', MARKET_QUERY_KEYWORDS)
+
+
 def is_market_query(query: str) -> bool:
     """Check if query is about stock markets."""
-    query_lower = query.lower()
-    market_indicators = [
-        "stock", "market", "s&p", "sp500", "dow", "nasdaq", "vix",
-        "volatility", "equities", "wall street", "trading", "index",
-        "yield curve", "treasury", "gold", "oil price", "crude",
-    ]
-    return any(indicator in query_lower for indicator in market_indicators)
+    return classify(query).has('market')
 
 
 # Quick test
@@ -12,11 +12,18 @@ CSV URLs: https://www.zillow.com/research/data/
 
 import csv
 import io
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional
-from urllib.request import urlopen, Request
 from urllib.error import URLError
 
+import numpy as np
+
+from core.cache import TTLCache
+from core.singleflight import SingleFlight
+from core.http_client import get_text
+from core.timeseries import TimeSeries
+from core.transforms import yoy
+
 # =============================================================================
 # ZILLOW SERIES CATALOG
 # =============================================================================
@@ -496,48 +503,66 @@ ZILLOW_SERIES = {
     },
 }
 
-# Cache for fetched data (avoid repeated downloads)
-_cache = {}
-_cache_ttl = timedelta(hours=1)
-
-
-def _fetch_csv(url: str) -> list:
-    """Fetch and parse a CSV from Zillow."""
-    cache_key = url
-    now = datetime.now()
-
-    # Check cache
-    if cache_key in _cache:
-        cached_data, cached_time = _cache[cache_key]
-        if now - cached_time < _cache_ttl:
-            return cached_data
-
-    try:
-        req = Request(url, headers={'User-Agent': 'EconStats/1.0'})
-        with urlopen(req, timeout=30) as response:
-            content = response.read().decode('utf-8')
-            reader = csv.reader(io.StringIO(content))
-            rows = list(reader)
-            _cache[cache_key] = (rows, now)
-            return rows
-    except URLError as e:
-        print(f"[Zillow] Error fetching {url}: {e}")
-        return []
+# Parsed CSVs, one per distinct URL (many ZILLOW_SERIES share a file). Each is
+# held as a compact ZillowTable rather than raw rows; the byte limit uses
+# ZillowTable.nbytes
+_cache = TTLCache('zillow', max_entries=16, ttl=3600, max_bytes=128 * 1024 * 1024)
+_csv_flight = SingleFlight('zillow')
 
 
-def _parse_zillow_metro_csv(rows: list, target_region: str = "United States") -> tuple:
+class ZillowTable:
     """
-    Parse Zillow metro-level CSV and extract national data.
+    Columnar view of one Zillow research CSV.
 
     Zillow CSVs have format:
     RegionID, SizeRank, RegionName, RegionType, StateName, 2015-01-31, 2015-02-28, ...
 
-    Returns: (dates, values) where dates are datetime objects
+    Stored as the date header (YYYY-MM-DD strings), the RegionName of each
+    row, and one float matrix (regions x dates, NaN where Zillow has no value).
     """
-    if not rows:
-        return [], []
 
-    header = rows[0]
+    def __init__(self, dates: list, region_names: list, values: np.ndarray):
+        self.dates = np.array(dates)
+        self.region_names = region_names
+        self.values = values
+        self._region_rows: dict = {}
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes + self.dates.nbytes + sum(len(n) + 49 for n in self.region_names)
+
+    def find_region(self, target_region: str) -> Optional[int]:
+        """Row of the first region whose name contains target_region (case-insensitive)."""
+        key = target_region.lower()
+        if key not in self._region_rows:
+            self._region_rows[key] = next(
+                (i for i, name in enumerate(self.region_names) if key in name.lower()), None
+            )
+        return self._region_rows[key]
+
+    def series(self, target_region: str) -> tuple:
+        """(dates, values) for a region, skipping missing months. ([], []) if not found."""
+        row = self.find_region(target_region)
+        if row is None:
+            return [], []
+        values = self.values[row]
+        present = ~np.isnan(values)
+        return self.dates[present].tolist(), values[present].tolist()
+
+
+def _parse_float(cell: str) -> float:
+    try:
+        return float(cell) if cell.strip() else np.nan
+    except ValueError:
+        return np.nan
+
+
+def _parse_zillow_csv(content: str) -> Optional[ZillowTable]:
+    """Parse a Zillow CSV into a ZillowTable. None if it has no date columns."""
+    reader = csv.reader(io.StringIO(content))
+    header = next(reader, None)
+    if not header:
+        return None
 
     # Find date columns (format: YYYY-MM-DD)
     date_cols = []
@@ -551,61 +576,56 @@ def _parse_zillow_metro_csv(rows: list, target_region: str = "United States") ->
 
     if not date_cols:
         print("[Zillow] No date columns found in CSV")
-        return [], []
+        return None
 
-    # Find the target region row (United States for national)
-    target_row = None
-    for row in rows[1:]:
-        if len(row) > 2:
-            region_name = row[2] if len(row) > 2 else ""
-            if target_region.lower() in region_name.lower():
-                target_row = row
-                break
-
-    if not target_row:
-        print(f"[Zillow] Region '{target_region}' not found in CSV")
-        return [], []
+    region_names = []
+    matrix = []
+    for row in reader:
+        if len(row) <= 2:
+            continue
+        region_names.append(row[2])
+        matrix.append([
+            _parse_float(row[i]) if i < len(row) else np.nan
+            for i, _ in date_cols
+        ])
 
-    # Extract dates and values
-    dates = []
-    values = []
-    for col_idx, date_str in date_cols:
-        if col_idx < len(target_row):
-            val_str = target_row[col_idx]
-            if val_str and val_str.strip():
-                try:
-                    val = float(val_str)
-                    dates.append(datetime.strptime(date_str, '%Y-%m-%d'))
-                    values.append(val)
-                except ValueError:
-                    continue
+    values = np.array(matrix, dtype=np.float64).reshape(len(region_names), len(date_cols))
+    return ZillowTable([col for _, col in date_cols], region_names, values)
 
-    return dates, values
 
+def _fetch_table(url: str) -> Optional[ZillowTable]:
+    """Fetch a Zillow CSV as a parsed ZillowTable (downloaded and parsed once per TTL)."""
+    cache_key = url
 
-def _calculate_yoy(dates: list, values: list) -> tuple:
-    """Calculate year-over-year percent change."""
-    if len(dates) < 13:
-        return [], []
+    # Check cache
+    table = _cache.get(cache_key)
+    if table is not None:
+        return table
 
-    # Create lookup by (year, month)
-    by_month = {}
-    for d, v in zip(dates, values):
-        by_month[(d.year, d.month)] = v
+    # Concurrent requests for the same CSV share one download
+    table = _csv_flight.do(cache_key, _download_table, url)
+    if table is not None:
+        _cache.set(cache_key, table)
+    return table
 
-    yoy_dates = []
-    yoy_values = []
 
-    for d, v in zip(dates, values):
-        prev_key = (d.year - 1, d.month)
-        if prev_key in by_month:
-            prev_v = by_month[prev_key]
-            if prev_v and prev_v != 0:
-                pct_change = ((v - prev_v) / prev_v) * 100
-                yoy_dates.append(d)
-                yoy_values.append(round(pct_change, 2))
+def _download_table(url: str) -> Optional[ZillowTable]:
+    """Download and parse a Zillow CSV. None on network errors."""
+    try:
+        content = get_text(url, timeout=30)
+    except URLError as e:
+        print(f"[Zillow] Error fetching {url}: {e}")
+        return None
+    return _parse_zillow_csv(content)
 
-    return yoy_dates, yoy_values
+
+def _calculate_yoy(dates: list, values: list) -> tuple:
+    """Calculate year-over-year percent change, matching on calendar month."""
+    if len(dates) < 13:
+        return [], []
+
+    change = yoy(TimeSeries.from_lists(dates, values), by_month=True)
+    return change.date_strings(), [round(v, 2) for v in change.values.tolist()]
 
 
 def get_zillow_series(series_key: str) -> tuple:
@@ -634,9 +654,6 @@ def get_zillow_series(series_key: str) -> tuple:
         if not base_dates:
             return [], [], {'error': f"Could not fetch base series {base_key}"}
 
-        # Convert string dates back to datetime for calculation
-        dt_dates = [datetime.strptime(d, '%Y-%m-%d') for d in base_dates]
-
         # Handle price-to-rent ratio specially
         if series_key == 'zillow_price_to_rent':
             # Fetch rent data too
@@ -644,27 +661,20 @@ def get_zillow_series(series_key: str) -> tuple:
             if not rent_dates:
                 return [], [], {'error': 'Could not fetch rent data for price-to-rent calculation'}
 
-            # Convert rent dates to datetime
-            rent_dt_dates = [datetime.strptime(d, '%Y-%m-%d') for d in rent_dates]
-
-            # Create lookup by (year, month) for rent
-            rent_by_month = {}
-            for d, v in zip(rent_dt_dates, rent_values):
-                rent_by_month[(d.year, d.month)] = v
+            # Create lookup by 'YYYY-MM' for rent
+            rent_by_month = dict(zip((d[:7] for d in rent_dates), rent_values))
 
             # Calculate price-to-rent ratio (home value / annual rent)
-            ptr_dates = []
+            date_strings = []
             ptr_values = []
-            for d, home_val in zip(dt_dates, base_values):
-                key = (d.year, d.month)
-                if key in rent_by_month and rent_by_month[key] > 0:
-                    annual_rent = rent_by_month[key] * 12
+            for d, home_val in zip(base_dates, base_values):
+                rent = rent_by_month.get(d[:7])
+                if rent is not None and rent > 0:
+                    annual_rent = rent * 12
                     ratio = home_val / annual_rent
-                    ptr_dates.append(d)
+                    date_strings.append(d)
                     ptr_values.append(round(ratio, 2))
 
-            date_strings = [d.strftime('%Y-%m-%d') for d in ptr_dates]
-
             info = {
                 'id': series_key,
                 'title': series_info['name'],
@@ -679,10 +689,7 @@ def get_zillow_series(series_key: str) -> tuple:
             return date_strings, ptr_values, info
 
         # Standard YoY calculation for other derived series
-        yoy_dates, yoy_values = _calculate_yoy(dt_dates, base_values)
-
-        # Convert back to strings
-        date_strings = [d.strftime('%Y-%m-%d') for d in yoy_dates]
+        date_strings, yoy_values = _calculate_yoy(base_dates, base_values)
 
         info = {
             'id': series_key,
@@ -702,8 +709,8 @@ def get_zillow_series(series_key: str) -> tuple:
     if not url:
         return [], [], {'error': f"No URL for series {series_key}"}
 
-    rows = _fetch_csv(url)
-    if not rows:
+    table = _fetch_table(url)
+    if table is None:
         return [], [], {'error': f"Could not fetch data from Zillow"}
 
     # Determine target region - use region_filter for metro-level data, "United States" for national
@@ -713,14 +720,12 @@ def get_zillow_series(series_key: str) -> tuple:
     else:
         target_region = "United States"
 
-    dates, values = _parse_zillow_metro_csv(rows, target_region=target_region)
+    date_strings, values = table.series(target_region)
 
-    if not dates:
+    if not date_strings:
+        print(f"[Zillow] No data for region '{target_region}' in CSV")
         return [], [], {'error': f"Could not parse Zillow data for region: {target_region}"}
 
-    # Convert dates to strings
-    date_strings = [d.strftime('%Y-%m-%d') for d in dates]
-
     info = {
         'id': series_key,
         'title': series_info['name'],
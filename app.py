@@ -10,11 +10,14 @@ from __future__ import annotations
 import json
 import os
 import re
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import Callable, Optional
 from urllib.request import urlopen, Request
 from urllib.parse import urlencode, quote
 from urllib.error import HTTPError, URLError
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 
 import streamlit as st
 import plotly.graph_objects as go
@@ -29,9 +32,22 @@ try:
 except ImportError:
     pass
 
+from core.batch_fetch import fetch_batch, submit_batch
+from core.cache import TTLCache
+from core.singleflight import SingleFlight
+from core.http_client import get_json
+from core.llm_cache import data_fingerprint, get_llm_cache, template_id
+from core.observation_store import read_through
+from core.prewarm import start_prewarm
+from core.timeseries import as_timeseries
+from core.transforms import calculate_yoy, calculate_mom, calculate_avg_annual
+from core.startup import LazyModule, import_timer, print_startup_report, start_warming
+from core.task_graph import TaskGraph
+
 # Import ensemble query plan generator (optional, graceful fallback)
 try:
-    from agents.agent_ensemble import call_ensemble_for_app, generate_ensemble_description, suggest_missing_dimensions, validate_series_relevance, validate_presentation
+    with import_timer('agents.agent_ensemble'):
+        from agents.agent_ensemble import call_ensemble_for_app, generate_ensemble_description, suggest_missing_dimensions, validate_series_relevance, validate_presentation
     ENSEMBLE_AVAILABLE = True
 except Exception:
     # Catch all exceptions (including KeyError on some Python versions)
@@ -39,7 +55,8 @@ except Exception:
 
 # Import RAG-based series retrieval (recommended approach)
 try:
-    from agents.series_rag import rag_query_plan
+    with import_timer('agents.series_rag'):
+        from agents.series_rag import rag_query_plan
     RAG_AVAILABLE = True
 except Exception:
     # Catch all exceptions (including KeyError on some Python versions)
@@ -47,123 +64,145 @@ except Exception:
 
 # Import Polymarket prediction markets (forward-looking sentiment)
 try:
-    from agents.polymarket import (
-        find_relevant_predictions,
-        format_prediction_for_display,
-        synthesize_prediction_narrative,
-        format_predictions_box,
-        get_predictions_for_query,
-    )
+    with import_timer('agents.polymarket'):
+        from agents.polymarket import (
+            find_relevant_predictions,
+            format_prediction_for_display,
+            synthesize_prediction_narrative,
+            format_predictions_box,
+            get_predictions_for_query,
+        )
     POLYMARKET_AVAILABLE = True
 except Exception:
     POLYMARKET_AVAILABLE = False
 
 # Import judgment layer for interpretive queries (Gemini search + Claude synthesis)
 try:
-    from agents.judgment_layer import (
-        is_judgment_query,
-        process_judgment_query,
-    )
+    with import_timer('agents.judgment_layer'):
+        from agents.judgment_layer import (
+            is_judgment_query,
+            process_judgment_query,
+        )
     JUDGMENT_LAYER_AVAILABLE = True
 except Exception:
     JUDGMENT_LAYER_AVAILABLE = False
 
 # Import stock market query plans
 try:
-    from agents.stocks import find_market_plan, is_market_query, MARKET_SERIES
+    with import_timer('agents.stocks'):
+        from agents.stocks import find_market_plan, is_market_query, MARKET_SERIES
     STOCKS_AVAILABLE = True
 except Exception:
     STOCKS_AVAILABLE = False
 
 # Import economist reasoning (AI-first approach)
 try:
-    from core.economist_reasoning import reason_about_query
+    with import_timer('core.economist_reasoning'):
+        from core.economist_reasoning import reason_about_query
     REASONING_AVAILABLE = True
 except Exception:
     REASONING_AVAILABLE = False
 
+# Direct query -> series mappings (first routing check)
+try:
+    with import_timer('core.economist_reasoning'):
+        from core.economist_reasoning import check_direct_mapping
+    DIRECT_MAPPING_AVAILABLE = True
+except Exception:
+    DIRECT_MAPPING_AVAILABLE = False
+
 # Import query logger for learning from searches
 try:
-    from core.query_logger import log_query as log_query_detailed
+    with import_timer('core.query_logger'):
+        from core.query_logger import log_query as log_query_detailed
     QUERY_LOGGING = True
 except Exception:
     QUERY_LOGGING = False
 
 # Import news context for dynamic explanations
 try:
-    from core.news_context import get_economic_context
+    with import_timer('core.news_context'):
+        from core.news_context import get_economic_context
     NEWS_CONTEXT_AVAILABLE = True
 except Exception:
     NEWS_CONTEXT_AVAILABLE = False
 
 # Import indicator context for rich economic interpretation
 try:
-    from core.indicator_context import (
-        get_indicator_context,
-        interpret_indicator,
-        get_related_indicators,
-        INDICATOR_CONTEXT,
-    )
+    with import_timer('core.indicator_context'):
+        from core.indicator_context import (
+            get_indicator_context,
+            interpret_indicator,
+            get_related_indicators,
+            INDICATOR_CONTEXT,
+        )
     INDICATOR_CONTEXT_AVAILABLE = True
 except Exception:
     INDICATOR_CONTEXT_AVAILABLE = False
 
 # Import DBnomics for international data (IMF, Eurostat, ECB, etc.)
 try:
-    from agents.dbnomics import find_international_plan, is_international_query, get_observations_dbnomics
+    with import_timer('agents.dbnomics'):
+        from agents.dbnomics import find_international_plan, is_international_query, get_observations_dbnomics
     DBNOMICS_AVAILABLE = True
 except Exception:
     DBNOMICS_AVAILABLE = False
 
 # Import smart query router for comparison queries
 try:
-    from agents.query_router import smart_route_query, is_comparison_query
+    with import_timer('agents.query_router'):
+        from agents.query_router import smart_route_query, is_comparison_query
     QUERY_ROUTER_AVAILABLE = True
 except Exception:
     QUERY_ROUTER_AVAILABLE = False
 
 # Import Zillow for housing/rent market data
 try:
-    from agents.zillow import get_zillow_series, search_zillow_series, ZILLOW_SERIES, synthesize_housing_narrative
+    with import_timer('agents.zillow'):
+        from agents.zillow import get_zillow_series, search_zillow_series, ZILLOW_SERIES, synthesize_housing_narrative
     ZILLOW_AVAILABLE = True
 except Exception:
     ZILLOW_AVAILABLE = False
 
 # Import EIA for energy data
 try:
-    from agents.eia import get_eia_series, search_eia_series, EIA_SERIES, synthesize_energy_narrative
+    with import_timer('agents.eia'):
+        from agents.eia import get_eia_series, search_eia_series, EIA_SERIES, synthesize_energy_narrative
     EIA_AVAILABLE = True
 except Exception:
     EIA_AVAILABLE = False
 
 # Import Alpha Vantage for stocks and economic data
 try:
-    from agents.alphavantage import get_alphavantage_series, search_alphavantage_series, ALPHAVANTAGE_SERIES, synthesize_market_narrative, get_company_fundamentals, get_market_pe_summary
+    with import_timer('agents.alphavantage'):
+        from agents.alphavantage import get_alphavantage_series, search_alphavantage_series, ALPHAVANTAGE_SERIES, synthesize_market_narrative, get_company_fundamentals, get_market_pe_summary
     ALPHAVANTAGE_AVAILABLE = True
 except Exception:
     ALPHAVANTAGE_AVAILABLE = False
 
 # Import Fed SEP (Summary of Economic Projections) for FOMC forecasts and guidance
 try:
-    from agents.fed_sep import (
-        is_sep_query,
-        is_fed_related_query,
-        get_sep_for_query,
-        get_fed_guidance_for_query,
-        format_sep_for_display,
-        get_sep_series_data,
-        get_current_fed_funds_rate,
-        get_recent_fomc_summary,
-        SEP_SERIES,
-        FOMC_STATEMENT_SUMMARIES,
-    )
+    with import_timer('agents.fed_sep'):
+        from agents.fed_sep import (
+            is_sep_query,
+            is_fed_related_query,
+            get_sep_for_query,
+            get_fed_guidance_for_query,
+            format_sep_for_display,
+            get_sep_series_data,
+            get_current_fed_funds_rate,
+            get_recent_fomc_summary,
+            SEP_SERIES,
+            FOMC_STATEMENT_SUMMARIES,
+        )
     SEP_AVAILABLE = True
 except Exception:
     SEP_AVAILABLE = False
 
 # Import historical analogues for context (1994 soft landing, 2008 crisis, etc.)
 try:
-    from core.historical_analogues import get_analogue_summary, find_analogues
+    with import_timer('core.historical_analogues'):
+        from core.historical_analogues import get_analogue_summary, find_analogues
     ANALOGUES_AVAILABLE = True
 except Exception:
     ANALOGUES_AVAILABLE = False
@@ -172,85 +211,87 @@ except Exception:
 # This provides curated multi-dimensional indicator sets for entities like
 # megacap firms, labor market, consumers, housing, etc.
 try:
-    from core.health_check_indicators import (
-        route_health_check_query,
-        is_health_check_query,
-        detect_health_check_entity,
-        get_health_check_series,
-        HEALTH_CHECK_ENTITIES,
-    )
+    with import_timer('core.health_check_indicators'):
+        from core.health_check_indicators import (
+            route_health_check_query,
+            is_health_check_query,
+            detect_health_check_entity,
+            get_health_check_series,
+            HEALTH_CHECK_ENTITIES,
+        )
     HEALTH_CHECK_AVAILABLE = True
 except Exception:
     HEALTH_CHECK_AVAILABLE = False
 
 # Import unified catalog for coverage checking
 # This tells us if we have data for a query or need to show a proxy
-try:
-    from core.unified_catalog import (
-        check_query_coverage,
-        get_coverage_disclaimer,
-        search_catalog,
-        UNIFIED_CATALOG,
-    )
-    COVERAGE_CHECK_AVAILABLE = True
-except Exception:
-    COVERAGE_CHECK_AVAILABLE = False
+# Imported on first use - building the catalog indexes every series at import
+UNIFIED_CATALOG_MODULE = LazyModule('core.unified_catalog')
+COVERAGE_CHECK_AVAILABLE = UNIFIED_CATALOG_MODULE.available
+check_query_coverage = UNIFIED_CATALOG_MODULE.function('check_query_coverage')
+get_coverage_disclaimer = UNIFIED_CATALOG_MODULE.function('get_coverage_disclaimer')
+search_catalog = UNIFIED_CATALOG_MODULE.function('search_catalog')
 
 # Import premium economist analysis for deeper insights
 try:
-    from core.economist_analysis import (
-        get_premium_analysis,
-        EconomistAnalysis,
-        format_analysis_as_html,
-    )
+    with import_timer('core.economist_analysis'):
+        from core.economist_analysis import (
+            get_premium_analysis,
+            EconomistAnalysis,
+            format_analysis_as_html,
+        )
     PREMIUM_ANALYSIS_AVAILABLE = True
 except Exception:
     PREMIUM_ANALYSIS_AVAILABLE = False
 
 # Import recession scorecard for recession-related queries
 try:
-    from agents.recession_scorecard import (
-        is_recession_query,
-        build_recession_scorecard,
-        format_scorecard_for_display,
-    )
+    with import_timer('agents.recession_scorecard'):
+        from agents.recession_scorecard import (
+            is_recession_query,
+            build_recession_scorecard,
+            format_scorecard_for_display,
+            INDICATOR_CONFIG as RECESSION_INDICATOR_CONFIG,
+        )
     RECESSION_SCORECARD_AVAILABLE = True
 except Exception:
     RECESSION_SCORECARD_AVAILABLE = False
 
 # Import Shiller CAPE for valuation/bubble queries
 try:
-    from agents.shiller import (
-        is_valuation_query,
-        get_cape_series,
-        get_current_cape,
-        get_bubble_comparison_data,
-        CAPE_BENCHMARKS,
-    )
+    with import_timer('agents.shiller'):
+        from agents.shiller import (
+            is_valuation_query,
+            get_cape_series,
+            get_current_cape,
+            get_bubble_comparison_data,
+            CAPE_BENCHMARKS,
+        )
     SHILLER_AVAILABLE = True
 except Exception:
     SHILLER_AVAILABLE = False
 
 # Import temporal intent detection for COMPARE vs FILTER vs CURRENT handling
 try:
-    from core.temporal_intent import (
-        detect_temporal_intent,
-        TemporalIntent,
-        NAMED_PERIODS,
-    )
-    from core.multi_period_fetcher import (
-        fetch_multi_period_data,
-        compute_comparison_metrics,
-        MultiPeriodData,
-    )
-    from core.comparison_narrative import (
-        generate_comparison_narrative,
-        format_comparison_insight,
-    )
-    from core.intent_validator import (
-        validate_data_matches_intent,
-        self_correct_if_needed,
-    )
+    with import_timer('core.temporal_intent'):
+        from core.temporal_intent import (
+            detect_temporal_intent,
+            TemporalIntent,
+            NAMED_PERIODS,
+        )
+        from core.multi_period_fetcher import (
+            fetch_multi_period_data,
+            compute_comparison_metrics,
+            MultiPeriodData,
+        )
+        from core.comparison_narrative import (
+            generate_comparison_narrative,
+            format_comparison_insight,
+        )
+        from core.intent_validator import (
+            validate_data_matches_intent,
+            self_correct_if_needed,
+        )
     TEMPORAL_INTENT_AVAILABLE = True
 except Exception as e:
     TEMPORAL_INTENT_AVAILABLE = False
@@ -258,7 +299,8 @@ except Exception as e:
 # Import Query Understanding - "Thinking First" layer
 # This deeply analyzes query intent BEFORE any routing decisions
 try:
-    from agents.query_understanding import understand_query, get_routing_recommendation, validate_series_for_query, get_series_for_query
+    with import_timer('agents.query_understanding'):
+        from agents.query_understanding import understand_query, get_routing_recommendation, validate_series_for_query, get_series_for_query
     QUERY_UNDERSTANDING_AVAILABLE = True
 except Exception:
     QUERY_UNDERSTANDING_AVAILABLE = False
@@ -267,11 +309,11 @@ except Exception:
 # =============================================================================
 # CACHING LAYER
 # =============================================================================
-# Simple in-memory cache with TTL to avoid re-fetching the same data repeatedly.
+# Bounded in-memory cache with TTL to avoid re-fetching the same data repeatedly.
 # Economic data doesn't change frequently, so a 15-minute TTL is reasonable.
 
-_api_cache = {}
 _cache_ttl_seconds = 900  # 15 minutes
+_api_cache = TTLCache('app.api', max_entries=512, ttl=_cache_ttl_seconds, max_bytes=64 * 1024 * 1024)
 
 
 def _get_cache_key(func_name: str, *args, **kwargs) -> str:
@@ -302,40 +344,27 @@ def _get_from_cache(cache_key: str):
     Returns:
         Cached data if valid, None otherwise
     """
-    if cache_key in _api_cache:
-        cached_data, cached_time = _api_cache[cache_key]
-        age_seconds = (datetime.now() - cached_time).total_seconds()
-        if age_seconds < _cache_ttl_seconds:
-            return cached_data
-        else:
-            # Expired - remove from cache
-            del _api_cache[cache_key]
-    return None
+    return _api_cache.get(cache_key)
 
 
 def _set_cache(cache_key: str, data):
     """
-    Store data in cache with current timestamp.
+    Store data in cache (expires after _cache_ttl_seconds).
 
     Args:
-        cache_key: Cache key to store under
+        cache_key: Cache key to store under (None = don't cache)
         data: Data to cache
     """
-    _api_cache[cache_key] = (data, datetime.now())
+    if cache_key is not None:
+        _api_cache.set(cache_key, data)
 
 
 def _clear_expired_cache():
     """
-    Remove expired entries from cache to prevent unbounded memory growth.
-    Called periodically to clean up old entries.
+    Remove expired entries from cache.
+    Size is already bounded by LRU eviction; this just frees memory early.
     """
-    now = datetime.now()
-    expired_keys = [
-        key for key, (_, cached_time) in _api_cache.items()
-        if (now - cached_time).total_seconds() >= _cache_ttl_seconds
-    ]
-    for key in expired_keys:
-        del _api_cache[key]
+    _api_cache.purge_expired()
 
 
 def get_cache_stats() -> dict:
@@ -343,30 +372,16 @@ def get_cache_stats() -> dict:
     Get statistics about the current cache state.
 
     Returns:
-        Dictionary with cache statistics including total entries, expired entries, etc.
+        Dictionary with entry count, hit/miss/eviction counters and limits
     """
-    now = datetime.now()
-    total_entries = len(_api_cache)
-    expired_entries = sum(
-        1 for _, (_, cached_time) in _api_cache.items()
-        if (now - cached_time).total_seconds() >= _cache_ttl_seconds
-    )
-    valid_entries = total_entries - expired_entries
-
-    return {
-        'total_entries': total_entries,
-        'valid_entries': valid_entries,
-        'expired_entries': expired_entries,
-        'ttl_seconds': _cache_ttl_seconds,
-    }
+    return _api_cache.stats()
 
 
 def clear_all_cache():
     """
     Clear all cache entries. Useful for debugging or forcing fresh data.
     """
-    global _api_cache
-    _api_cache = {}
+    _api_cache.clear()
 
 
 def parse_followup_command(query: str, previous_series: list = None) -> dict:
@@ -831,6 +846,7 @@ QUERY_PLANS = load_query_plans()
 
 # Smart query matching with normalization and fuzzy matching
 import difflib
+from core.plan_index import PlanIndex
 
 def normalize_query(query: str) -> str:
     """Normalize a query for better matching."""
@@ -1316,6 +1332,47 @@ def calculate_word_overlap_score(query_words: set, plan_key: str) -> float:
     return 0.6 * plan_coverage + 0.4 * query_coverage
 
 
+# Keyword boosts for find_query_plan(): if the query contains the keyword,
+# prefer plans whose key contains one of the boost terms
+PLAN_KEYWORD_BOOSTS = {
+    # Inflation-related keywords
+    'inflation': ['inflation', 'cpi', 'pce', 'prices', 'price index'],
+    'prices': ['inflation', 'cpi', 'pce', 'prices', 'price index', 'shelter inflation', 'food inflation', 'energy inflation'],
+    'cost of living': ['inflation', 'cpi', 'real wages'],
+    'expensive': ['inflation', 'cpi', 'prices'],
+    'costly': ['inflation', 'cpi', 'prices'],
+    # Job market keywords
+    'job market': ['labor market', 'jobs', 'employment', 'unemployment', 'payrolls'],
+    'tight labor': ['labor market', 'unemployment', 'job openings'],
+    'hiring': ['jobs', 'payrolls', 'job openings', 'employment'],
+    'layoffs': ['unemployment', 'initial claims', 'jobs'],
+    'workers': ['employment', 'labor market', 'wages'],
+    # Housing keywords
+    'housing': ['housing', 'home prices', 'housing starts', 'mortgage rates'],
+    'home': ['housing', 'home prices', 'housing starts', 'mortgage rates'],
+    'rent': ['rent inflation', 'shelter inflation', 'housing'],
+    'mortgage': ['mortgage rates', 'housing'],
+    # Fed/rates keywords
+    'fed': ['fed funds rate', 'fed', 'interest rates', 'monetary policy'],
+    'interest': ['rates', 'fed funds rate', 'treasury yields', 'mortgage rates'],
+    'rates': ['rates', 'fed funds rate', 'treasury yields', 'mortgage rates'],
+}
+
+# Phrases that map a longer query onto a shorter plan ("tight job market" -> "job market")
+PLAN_KEY_PHRASES = ['job market', 'labor market', 'job openings', 'wage growth', 'price growth',
+                    'gdp growth', 'economic growth', 'housing market', 'stock market',
+                    'interest rates', 'mortgage rates', 'treasury yields', 'initial claims',
+                    'consumer spending', 'retail sales', 'home prices', 'housing prices']
+
+# Last-resort economic terms for longer queries
+PLAN_KEY_TERMS = ['inflation', 'unemployment', 'gdp', 'jobs', 'rates', 'housing',
+                  'wages', 'recession', 'fed', 'cpi', 'pce', 'payrolls']
+
+# Precompiled lookup structures over QUERY_PLANS (demographic tags, word and
+# trigram indexes) so find_query_plan() doesn't rescan every key per query
+PLAN_INDEX = PlanIndex(QUERY_PLANS, extract_demographic_group)
+
+
 def find_query_plan(query: str, threshold: float = 0.65) -> dict | None:
     """
     Find the best matching query plan using normalization and fuzzy matching.
@@ -1368,8 +1425,7 @@ def find_query_plan(query: str, threshold: float = 0.65) -> dict | None:
         return QUERY_PLANS[synonym_mapped_stripped]
 
     # 3. Check synonyms - some plans have a "synonyms" list for alternate names
-    for plan_key, plan in QUERY_PLANS.items():
-        synonyms = plan.get('synonyms', [])
+    for plan, synonyms in PLAN_INDEX.synonym_plans:
         if original_lower in synonyms or normalized in synonyms or question_stripped in synonyms:
             return plan
         # Also check if query is a fuzzy match to any synonym
@@ -1380,94 +1436,57 @@ def find_query_plan(query: str, threshold: float = 0.65) -> dict | None:
     # 3.5 Demographic-aware matching - CRITICAL to prevent cross-demographic confusion
     # e.g., "Black workers" should NOT match "women doing in economy"
     query_demographic = extract_demographic_group(query)
-    all_queries = list(QUERY_PLANS.keys())
 
     if query_demographic:
         # Filter plans to only those with the SAME demographic group
-        demographic_queries = [q for q in all_queries if extract_demographic_group(q) == query_demographic]
+        demographic_queries = PLAN_INDEX.keys_by_demographic.get(query_demographic)
         if demographic_queries:
             # Try fuzzy match within demographic-specific plans only
-            matches = difflib.get_close_matches(normalized, demographic_queries, n=1, cutoff=0.5)
-            if matches:
-                return QUERY_PLANS[matches[0]]
+            match = PLAN_INDEX.close_match(normalized, demographic_queries, cutoff=0.5)
+            if match:
+                return QUERY_PLANS[match]
             # If no fuzzy match, return shortest matching plan (most specific)
-            demographic_queries.sort(key=len)
-            return QUERY_PLANS[demographic_queries[0]]
+            return QUERY_PLANS[min(demographic_queries, key=len)]
 
     # === SMART MATCHING STRATEGIES ===
 
     # 4. Keyword extraction and boosting
     # If query contains specific keywords, boost related plans
-    keyword_boosts = {
-        # Inflation-related keywords
-        'inflation': ['inflation', 'cpi', 'pce', 'prices', 'price index'],
-        'prices': ['inflation', 'cpi', 'pce', 'prices', 'price index', 'shelter inflation', 'food inflation', 'energy inflation'],
-        'cost of living': ['inflation', 'cpi', 'real wages'],
-        'expensive': ['inflation', 'cpi', 'prices'],
-        'costly': ['inflation', 'cpi', 'prices'],
-        # Job market keywords
-        'job market': ['labor market', 'jobs', 'employment', 'unemployment', 'payrolls'],
-        'tight labor': ['labor market', 'unemployment', 'job openings'],
-        'hiring': ['jobs', 'payrolls', 'job openings', 'employment'],
-        'layoffs': ['unemployment', 'initial claims', 'jobs'],
-        'workers': ['employment', 'labor market', 'wages'],
-        # Housing keywords
-        'housing': ['housing', 'home prices', 'housing starts', 'mortgage rates'],
-        'home': ['housing', 'home prices', 'housing starts', 'mortgage rates'],
-        'rent': ['rent inflation', 'shelter inflation', 'housing'],
-        'mortgage': ['mortgage rates', 'housing'],
-        # Fed/rates keywords
-        'fed': ['fed funds rate', 'fed', 'interest rates', 'monetary policy'],
-        'interest': ['rates', 'fed funds rate', 'treasury yields', 'mortgage rates'],
-        'rates': ['rates', 'fed funds rate', 'treasury yields', 'mortgage rates'],
-    }
-
-    query_words_set = set(normalized.split())
     query_stripped_words = set(question_stripped.split())
 
     # Check for keyword boosts
-    for keyword, boost_terms in keyword_boosts.items():
+    for keyword, boost_terms in PLAN_KEYWORD_BOOSTS.items():
         if keyword in normalized or keyword in question_stripped:
             # Find plans that match any of the boost terms
-            boosted_plans = []
-            for plan_key in all_queries:
-                plan_lower = plan_key.lower()
-                for boost_term in boost_terms:
-                    if boost_term in plan_lower:
-                        boosted_plans.append(plan_key)
-                        break
+            boosted_plans = set()
+            for boost_term in boost_terms:
+                boosted_plans.update(PLAN_INDEX.keys_containing(boost_term, lowercase=True))
             if boosted_plans:
                 # Filter out demographic mismatches
                 if not query_demographic:
-                    boosted_plans = [p for p in boosted_plans if not extract_demographic_group(p)]
+                    boosted_plans = [p for p in boosted_plans if not PLAN_INDEX.demographic[p]]
                 if boosted_plans:
                     # Find best fuzzy match among boosted plans
-                    best = difflib.get_close_matches(normalized, boosted_plans, n=1, cutoff=0.4)
+                    best = PLAN_INDEX.close_match(normalized, boosted_plans, cutoff=0.4)
                     if best:
-                        return QUERY_PLANS[best[0]]
+                        return QUERY_PLANS[best]
 
     # 5. Partial phrase matching
     # "tight job market" should match "job market", "current labor market" should match "labor market"
-    key_phrases = ['job market', 'labor market', 'job openings', 'wage growth', 'price growth',
-                   'gdp growth', 'economic growth', 'housing market', 'stock market',
-                   'interest rates', 'mortgage rates', 'treasury yields', 'initial claims',
-                   'consumer spending', 'retail sales', 'home prices', 'housing prices']
-
-    for phrase in key_phrases:
+    for phrase in PLAN_KEY_PHRASES:
         if phrase in normalized or phrase in question_stripped:
             # Direct match to plan with this phrase
             if phrase in QUERY_PLANS:
                 return QUERY_PLANS[phrase]
             # Find plans containing this phrase
-            phrase_matches = [q for q in all_queries if phrase in q]
+            phrase_matches = PLAN_INDEX.keys_containing(phrase)
             if phrase_matches:
                 # Filter out demographic mismatches
                 if not query_demographic:
-                    phrase_matches = [p for p in phrase_matches if not extract_demographic_group(p)]
+                    phrase_matches = [p for p in phrase_matches if not PLAN_INDEX.demographic[p]]
                 if phrase_matches:
                     # Return the most specific (shortest) match
-                    phrase_matches.sort(key=len)
-                    return QUERY_PLANS[phrase_matches[0]]
+                    return QUERY_PLANS[min(phrase_matches, key=len)]
 
     # 6. Dynamic threshold based on query length
     # Short queries need less strict matching since there's less text to compare
@@ -1481,15 +1500,10 @@ def find_query_plan(query: str, threshold: float = 0.65) -> dict | None:
 
     # 7. Word overlap scoring - find plans with best word overlap
     # This helps match "current unemployment rate data" to "unemployment"
-    overlap_scores = []
-    for plan_key in all_queries:
-        # Skip demographic plans if query has no demographic
-        plan_demographic = extract_demographic_group(plan_key)
-        if not query_demographic and plan_demographic:
-            continue
-        score = calculate_word_overlap_score(query_stripped_words, plan_key)
-        if score > 0.3:  # Minimum threshold for word overlap
-            overlap_scores.append((plan_key, score))
+    # Skip demographic plans if query has no demographic
+    overlap_scores = PLAN_INDEX.word_overlap_scores(
+        query_stripped_words, min_score=0.3, include_demographic=bool(query_demographic)
+    )
 
     if overlap_scores:
         # Sort by score descending
@@ -1499,260 +1513,193 @@ def find_query_plan(query: str, threshold: float = 0.65) -> dict | None:
             return QUERY_PLANS[overlap_scores[0][0]]
         # Otherwise, use fuzzy matching among top candidates
         top_candidates = [p[0] for p in overlap_scores[:5]]
-        best = difflib.get_close_matches(normalized, top_candidates, n=1, cutoff=0.4)
+        best = PLAN_INDEX.close_match(normalized, top_candidates, cutoff=0.4)
         if best:
-            return QUERY_PLANS[best[0]]
+            return QUERY_PLANS[best]
 
     # 8. Fuzzy match - find closest query in plans (for non-demographic queries)
-    # Try matching against synonym-mapped query first
-    matches = difflib.get_close_matches(synonym_mapped, all_queries, n=1, cutoff=dynamic_threshold)
-    if matches:
-        # Double-check: don't return a demographic plan for a non-demographic query
-        match_demographic = extract_demographic_group(matches[0])
-        if not query_demographic and match_demographic:
-            pass  # Skip this match, it's a demographic plan for non-demographic query
-        else:
-            return QUERY_PLANS[matches[0]]
-
-    # Try matching against normalized query
-    matches = difflib.get_close_matches(normalized, all_queries, n=1, cutoff=dynamic_threshold)
-    if matches:
-        match_demographic = extract_demographic_group(matches[0])
-        if not query_demographic and match_demographic:
-            pass  # Skip demographic mismatch
-        else:
-            return QUERY_PLANS[matches[0]]
-
-    # Try matching against original (for cases like typos)
-    matches = difflib.get_close_matches(original_lower, all_queries, n=1, cutoff=dynamic_threshold)
-    if matches:
-        match_demographic = extract_demographic_group(matches[0])
-        if not query_demographic and match_demographic:
-            pass  # Skip demographic mismatch
-        else:
-            return QUERY_PLANS[matches[0]]
-
-    # Try matching against question-stripped version
-    matches = difflib.get_close_matches(question_stripped, all_queries, n=1, cutoff=dynamic_threshold)
-    if matches:
-        match_demographic = extract_demographic_group(matches[0])
-        if not query_demographic and match_demographic:
-            pass  # Skip demographic mismatch
-        else:
-            return QUERY_PLANS[matches[0]]
+    # Try the synonym-mapped, normalized, original (for typos) and
+    # question-stripped forms in turn
+    for candidate in (synonym_mapped, normalized, original_lower, question_stripped):
+        match = PLAN_INDEX.close_match(candidate, cutoff=dynamic_threshold)
+        if match:
+            # Double-check: don't return a demographic plan for a non-demographic query
+            if not query_demographic and PLAN_INDEX.demographic[match]:
+                continue  # Skip demographic mismatch
+            return QUERY_PLANS[match]
 
     # 9. Word-based matching for longer queries (fallback)
     # If query contains key economic terms, try to match those
-    key_terms = ['inflation', 'unemployment', 'gdp', 'jobs', 'rates', 'housing',
-                 'wages', 'recession', 'fed', 'cpi', 'pce', 'payrolls']
-    for term in key_terms:
+    for term in PLAN_KEY_TERMS:
         if term in normalized:
             # Find all plans containing this term
-            term_matches = [q for q in all_queries if term in q]
+            term_matches = PLAN_INDEX.keys_containing(term)
             if term_matches:
                 # Filter out demographic mismatches
                 if not query_demographic:
-                    term_matches = [q for q in term_matches if not extract_demographic_group(q)]
+                    term_matches = [q for q in term_matches if not PLAN_INDEX.demographic[q]]
                 if term_matches:
                     # Find best match among these
-                    best = difflib.get_close_matches(normalized, term_matches, n=1, cutoff=0.4)
+                    best = PLAN_INDEX.close_match(normalized, term_matches, cutoff=0.4)
                     if best:
-                        return QUERY_PLANS[best[0]]
+                        return QUERY_PLANS[best]
                     # If still no fuzzy match, return the simplest one (shortest)
-                    term_matches.sort(key=len)
-                    return QUERY_PLANS[term_matches[0]]
+                    return QUERY_PLANS[min(term_matches, key=len)]
 
     return None
 
 
 # =============================================================================
-# OPTIMIZATION 4: Parallel Routing
+# OPTIMIZATION 4: Priority Routing
 # =============================================================================
-# Instead of checking routing options sequentially (11 steps), run all the
-# fast checks in parallel and pick the best result. This reduces routing
-# latency by ~60% for queries that don't hit direct mappings.
+# Routing checks run in priority order and the first decisive hit wins, so a
+# direct-mapping query never waits on the fuzzy plan matcher. The checks are
+# all in-memory pattern and plan lookups (pure Python, GIL-bound), so they run
+# inline: a thread pool per query cost more to spin up than the checks
+# themselves.
 # =============================================================================
 
-def parallel_route_query(query: str, skip_understanding: bool = False) -> dict:
-    """
-    Run all fast routing checks in parallel and return the best match.
+@dataclass(frozen=True)
+class RouteCheck:
+    """One routing check: fn(query) -> plan dict or None."""
+    route_type: str
+    fn: Callable[[str], Optional[dict]]
 
-    Priority order (first match wins):
-    1. Direct mapping (instant, most precise)
-    2. Comparison router (handles "X vs Y" queries)
-    3. Health check routing (curated multi-dimensional sets)
-    4. Precomputed plans (fuzzy matching)
-    5. Stock market plans
-    6. International/DBnomics plans
 
-    Returns dict with:
-    - route_type: str - which route matched ('direct', 'comparison', 'health_check', 'precomputed', 'stocks', 'international', None)
-    - plan: dict - the matched plan (or None)
-    - timing_ms: float - how long routing took
+def _route_direct(query: str) -> Optional[dict]:
+    """Direct mappings (fastest, most precise)."""
+    series = check_direct_mapping(query)
+    if not series:
+        return None
+    return {
+        'series': series[:4],
+        'explanation': '',
+        'used_direct_mapping': True,
+        'combine_chart': len(series) > 1 and len(series) <= 3,
+    }
 
-    This runs in parallel using ThreadPoolExecutor, so all checks happen
-    simultaneously instead of one after another.
-    """
-    import time
-    start_time = time.time()
 
-    # Define all the routing checks as functions
-    def check_direct_mapping_route():
-        """Check direct mappings (fastest, most precise)."""
-        try:
-            from core.economist_reasoning import check_direct_mapping
-            series = check_direct_mapping(query)
-            if series:
-                return {
-                    'route_type': 'direct',
-                    'plan': {
-                        'series': series[:4],
-                        'explanation': '',
-                        'used_direct_mapping': True,
-                        'combine_chart': len(series) > 1 and len(series) <= 3,
-                    }
-                }
-        except Exception:
-            pass
+def _route_comparison(query: str) -> Optional[dict]:
+    """Comparison router (X vs Y queries)."""
+    comparison_route = smart_route_query(query)
+    if not comparison_route.get('is_comparison'):
         return None
+    fred_series = comparison_route.get('series_to_fetch', {}).get('fred', [])
+    dbnomics_series = comparison_route.get('series_to_fetch', {}).get('dbnomics', [])
+    is_domestic = comparison_route.get('is_domestic_comparison', False)
 
-    def check_comparison_route():
-        """Check comparison router (X vs Y queries)."""
-        if not QUERY_ROUTER_AVAILABLE:
-            return None
-        try:
-            comparison_route = smart_route_query(query)
-            if comparison_route.get('is_comparison'):
-                fred_series = comparison_route.get('series_to_fetch', {}).get('fred', [])
-                dbnomics_series = comparison_route.get('series_to_fetch', {}).get('dbnomics', [])
-                is_domestic = comparison_route.get('is_domestic_comparison', False)
-
-                # For international comparisons, need DBnomics available
-                if is_domestic or (dbnomics_series and DBNOMICS_AVAILABLE) or (fred_series and not dbnomics_series):
-                    return {
-                        'route_type': 'comparison',
-                        'plan': {
-                            'series': fred_series,
-                            'dbnomics_series': dbnomics_series,
-                            'explanation': comparison_route.get('explanation', ''),
-                            'source': 'comparison',
-                            'is_comparison': True,
-                            'is_domestic_comparison': is_domestic,
-                            'combine_chart': comparison_route.get('combine_chart', True),
-                            'show_yoy': comparison_route.get('show_yoy', False),
-                            'units_compatible': comparison_route.get('units_compatible', True),
-                        }
-                    }
-        except Exception:
-            pass
+    # For international comparisons, need DBnomics available
+    if not (is_domestic or (dbnomics_series and DBNOMICS_AVAILABLE) or (fred_series and not dbnomics_series)):
         return None
+    return {
+        'series': fred_series,
+        'dbnomics_series': dbnomics_series,
+        'explanation': comparison_route.get('explanation', ''),
+        'source': 'comparison',
+        'is_comparison': True,
+        'is_domestic_comparison': is_domestic,
+        'combine_chart': comparison_route.get('combine_chart', True),
+        'show_yoy': comparison_route.get('show_yoy', False),
+        'units_compatible': comparison_route.get('units_compatible', True),
+    }
 
-    def check_health_check_route():
-        """Check health check routing (curated multi-dimensional sets)."""
-        if not HEALTH_CHECK_AVAILABLE:
-            return None
-        try:
-            health_route = route_health_check_query(query)
-            if health_route and health_route.get('is_health_check'):
-                return {
-                    'route_type': 'health_check',
-                    'plan': {
-                        'series': health_route['series'],
-                        'show_yoy_series': [
-                            sid for sid, show_yoy in zip(health_route['series'], health_route['show_yoy'])
-                            if show_yoy
-                        ],
-                        'explanation': health_route['explanation'],
-                        'entity_name': health_route['entity_name'],
-                        'source': 'health_check',
-                    }
-                }
-        except Exception:
-            pass
-        return None
 
-    def check_precomputed_route():
-        """Check precomputed query plans (fuzzy matching)."""
-        try:
-            plan = find_query_plan(query)
-            if plan:
-                return {
-                    'route_type': 'precomputed',
-                    'plan': plan
-                }
-        except Exception:
-            pass
+def _route_health_check(query: str) -> Optional[dict]:
+    """Health check routing (curated multi-dimensional sets)."""
+    health_route = route_health_check_query(query)
+    if not (health_route and health_route.get('is_health_check')):
         return None
+    return {
+        'series': health_route['series'],
+        'show_yoy_series': [
+            sid for sid, show_yoy in zip(health_route['series'], health_route['show_yoy'])
+            if show_yoy
+        ],
+        'explanation': health_route['explanation'],
+        'entity_name': health_route['entity_name'],
+        'source': 'health_check',
+    }
 
-    def check_stocks_route():
-        """Check stock market plans."""
-        if not STOCKS_AVAILABLE:
-            return None
-        try:
-            market_plan = find_market_plan(query)
-            if market_plan:
-                market_plan['source'] = 'stocks'
-                return {
-                    'route_type': 'stocks',
-                    'plan': market_plan
-                }
-        except Exception:
-            pass
-        return None
 
-    def check_international_route():
-        """Check international/DBnomics plans."""
-        if not DBNOMICS_AVAILABLE:
-            return None
-        try:
-            intl_plan = find_international_plan(query)
-            if intl_plan:
-                intl_plan['source'] = 'dbnomics'
-                return {
-                    'route_type': 'international',
-                    'plan': intl_plan
-                }
-        except Exception:
-            pass
+def _route_precomputed(query: str) -> Optional[dict]:
+    """Precomputed query plans (fuzzy matching)."""
+    return find_query_plan(query)
+
+
+def _route_stocks(query: str) -> Optional[dict]:
+    """Stock market plans."""
+    market_plan = find_market_plan(query)
+    # Copy - the matched plan is the shared MARKET_QUERY_PLANS entry
+    return {**market_plan, 'source': 'stocks'} if market_plan else None
+
+
+def _route_international(query: str) -> Optional[dict]:
+    """International/DBnomics plans."""
+    intl_plan = find_international_plan(query)
+    return {**intl_plan, 'source': 'dbnomics'} if intl_plan else None
+
+
+def _build_route_checks() -> list:
+    """Routing checks in priority order, resolved once against the available modules."""
+    candidates = [
+        (DIRECT_MAPPING_AVAILABLE, RouteCheck('direct', _route_direct)),
+        (QUERY_ROUTER_AVAILABLE, RouteCheck('comparison', _route_comparison)),
+        (HEALTH_CHECK_AVAILABLE, RouteCheck('health_check', _route_health_check)),
+        (True, RouteCheck('precomputed', _route_precomputed)),
+        (STOCKS_AVAILABLE, RouteCheck('stocks', _route_stocks)),
+        (DBNOMICS_AVAILABLE, RouteCheck('international', _route_international)),
+    ]
+    return [check for available, check in candidates if available]
+
+
+ROUTE_CHECKS = _build_route_checks()
+
+
+def _run_route_check(check: RouteCheck, query: str) -> Optional[dict]:
+    """Run a check inline, logging (not raising) failures."""
+    try:
+        return check.fn(query)
+    except Exception as e:
+        print(f"[ROUTING ERROR] {check.route_type} route failed: {type(e).__name__}: {e}")
         return None
 
-    # Run all checks in parallel
-    results = {}
-    with ThreadPoolExecutor(max_workers=6) as executor:
-        futures = {
-            executor.submit(check_direct_mapping_route): 'direct',
-            executor.submit(check_comparison_route): 'comparison',
-            executor.submit(check_health_check_route): 'health_check',
-            executor.submit(check_precomputed_route): 'precomputed',
-            executor.submit(check_stocks_route): 'stocks',
-            executor.submit(check_international_route): 'international',
-        }
 
-        for future in as_completed(futures, timeout=5.0):
-            route_name = futures[future]
-            try:
-                result = future.result(timeout=1.0)
-                if result:
-                    results[route_name] = result
-            except Exception as e:
-                # Log routing errors instead of silently swallowing them
-                print(f"[ROUTING ERROR] {route_name} route failed: {type(e).__name__}: {e}")
-
-    # Pick best result based on priority
-    priority_order = ['direct', 'comparison', 'health_check', 'precomputed', 'stocks', 'international']
-    for route_type in priority_order:
-        if route_type in results:
-            elapsed_ms = (time.time() - start_time) * 1000
-            result = results[route_type]
-            result['timing_ms'] = elapsed_ms
-            return result
+def parallel_route_query(query: str, skip_understanding: bool = False, checks: list = None) -> dict:
+    """
+    Route a query through the routing checks in priority order; first match wins.
+
+    Priority order:
+    1. Direct mapping (instant, most precise)
+    2. Comparison router (handles "X vs Y" queries)
+    3. Health check routing (curated multi-dimensional sets)
+    4. Precomputed plans (fuzzy matching)
+    5. Stock market plans
+    6. International/DBnomics plans
+
+    Lower-priority checks never run once a higher one matches.
+
+    Returns dict with:
+    - route_type: str - which route matched ('direct', 'comparison', 'health_check', 'precomputed', 'stocks', 'international', None)
+    - plan: dict - the matched plan (or None)
+    - timing_ms: float - how long routing took
+    """
+    start_time = time.perf_counter()
+    checks = ROUTE_CHECKS if checks is None else checks
+
+    for check in checks:
+        plan = _run_route_check(check, query)
+        if plan:
+            return {
+                'route_type': check.route_type,
+                'plan': plan,
+                'timing_ms': (time.perf_counter() - start_time) * 1000,
+            }
 
     # No route found
-    elapsed_ms = (time.time() - start_time) * 1000
     return {
         'route_type': None,
         'plan': None,
-        'timing_ms': elapsed_ms
+        'timing_ms': (time.perf_counter() - start_time) * 1000,
     }
 
 
@@ -4769,6 +4716,10 @@ def log_query_resolution(query: str, source: str, series: list, validation: dict
     print(f"[QUERY] {query} | Method: {source} | Series: {series}")
 
 
+# How long a reviewer briefing is reused for unchanged data (it includes news context)
+REVIEWER_CACHE_MAX_AGE = 6 * 60 * 60
+
+
 def call_economist_reviewer(query: str, series_data: list, original_explanation: str) -> str:
     """Call a second Claude agent to review and improve the explanation.
 
@@ -4786,6 +4737,14 @@ def call_economist_reviewer(query: str, series_data: list, original_explanation:
     if not ANTHROPIC_API_KEY or not series_data:
         return original_explanation
 
+    # Same question on the same data (and background text) - reuse the briefing.
+    # It cites news, so it's refreshed after a few hours regardless.
+    cache_template = template_id('economist_briefing', original_explanation)
+    fingerprint = data_fingerprint(series_data)
+    cached = get_llm_cache().get(cache_template, query, fingerprint, max_age=REVIEWER_CACHE_MAX_AGE)
+    if cached:
+        return cached
+
     # Fetch recent news context for dynamic explanations
     news_context = ""
     if NEWS_CONTEXT_AVAILABLE:
@@ -5107,6 +5066,8 @@ CRITICAL RULES:
             # Strip any HTML tags that LLM might have generated
             import re
             improved = re.sub(r'<[^>]+>', '', improved)
+            if improved:
+                get_llm_cache().put(cache_template, query, fingerprint, improved)
             return improved if improved else original_explanation
     except Exception as e:
         return original_explanation
@@ -5481,7 +5442,8 @@ Format: Return ONLY the bullets as a JSON array of strings, like:
 
 
 # Session state for caching dynamic bullets
-_dynamic_bullet_cache = {}
+_dynamic_bullet_cache = TTLCache('app.dynamic_bullets', max_entries=100)
+_bullet_flight = SingleFlight('app.dynamic_bullets')
 
 def get_dynamic_bullets(series_id: str, dates: list, values: list, info: dict, user_query: str = None, use_ai: bool = True) -> list:
     """Get bullets for a chart, using AI if enabled or falling back to static.
@@ -5495,18 +5457,12 @@ def get_dynamic_bullets(series_id: str, dates: list, values: list, info: dict, u
     # Create cache key from series and latest value
     cache_key = f"{series_id}_{values[-1] if values else 'empty'}_{user_query or ''}"
 
-    if cache_key in _dynamic_bullet_cache:
-        return _dynamic_bullet_cache[cache_key]
+    cached = _dynamic_bullet_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    bullets = generate_dynamic_ai_bullets(series_id, dates, values, info, user_query)
-    _dynamic_bullet_cache[cache_key] = bullets
-
-    # Limit cache size
-    if len(_dynamic_bullet_cache) > 100:
-        # Remove oldest entries
-        keys = list(_dynamic_bullet_cache.keys())
-        for k in keys[:50]:
-            del _dynamic_bullet_cache[k]
+    bullets = _bullet_flight.do(cache_key, generate_dynamic_ai_bullets, series_id, dates, values, info, user_query)
+    _dynamic_bullet_cache.set(cache_key, bullets)
 
     return bullets
 
@@ -5699,32 +5655,44 @@ def generate_chart_title(series_id: str, info: dict) -> str:
     return name
 
 
-def fred_request(endpoint: str, params: dict) -> dict:
+_fred_flight = SingleFlight('app.fred_request')
+
+
+def fred_request(endpoint: str, params: dict, use_cache: bool = True) -> dict:
     """
     Make a request to the FRED API with detailed error handling and caching.
 
-    Caches responses for 15 minutes to reduce API calls.
+    Caches responses for 15 minutes to reduce API calls. Observation
+    downloads pass use_cache=False: the observation store already keeps one
+    full history per series, and their `observation_start` varies per call,
+    so caching them here would only hold duplicate copies.
 
     Returns dict with response data or {'error': message, 'error_type': type}
     """
     # Check cache first (exclude api_key from cache key for security)
     cache_params = {k: v for k, v in params.items() if k != 'api_key'}
     cache_key = _get_cache_key('fred_request', endpoint, **cache_params)
-    cached_result = _get_from_cache(cache_key)
-    if cached_result is not None:
-        return cached_result
+    if use_cache:
+        cached_result = _get_from_cache(cache_key)
+        if cached_result is not None:
+            return cached_result
 
+    # Concurrent identical requests wait on one upstream call
+    return _fred_flight.do(cache_key, _fred_request_uncached, endpoint, params,
+                           cache_key if use_cache else None)
+
+
+def _fred_request_uncached(endpoint: str, params: dict, cache_key: str = None) -> dict:
+    """Call the FRED API and cache the outcome under `cache_key` if given (see fred_request)."""
     # Make the API request
     params['api_key'] = FRED_API_KEY
     params['file_type'] = 'json'
     url = f"{FRED_BASE}/{endpoint}?{urlencode(params)}"
     try:
-        req = Request(url, headers={'User-Agent': 'EconStats/1.0'})
-        with urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            # Cache successful responses
-            _set_cache(cache_key, result)
-            return result
+        result = get_json(url, timeout=30)
+        # Cache successful responses
+        _set_cache(cache_key, result)
+        return result
     except HTTPError as e:
         # Distinguish between different HTTP errors for better user messaging
         if e.code == 429:
@@ -6310,22 +6278,50 @@ def get_series_info(series_id: str) -> dict:
     return series_list[0] if series_list else {}
 
 
-@st.cache_data(ttl=1800, show_spinner=False)  # Cache for 30 minutes
-def _fetch_observations_cached(series_id: str, start_date: str = None) -> dict:
-    """Cached FRED API call for observations. Returns raw API response."""
-    params = {'series_id': series_id, 'limit': 10000, 'sort_order': 'asc'}
-    if start_date:
-        params['observation_start'] = start_date
-    return fred_request('series/observations', params)
+def _fetch_observations_since(series_id: str, start: str = None) -> tuple:
+    """Fetch FRED observations from `start` (full history if None) as (dates, values, info)."""
+    params = {'series_id': series_id, 'limit': 100000, 'sort_order': 'asc'}
+    if start:
+        params['observation_start'] = start
+    data = fred_request('series/observations', params, use_cache=False)
+    if 'error' in data:
+        return [], [], {'error': data['error']}
+
+    observations = data.get('observations', [])
+    dates, values = [], []
+    for obs in observations:
+        try:
+            val = float(obs['value'])
+            dates.append(obs['date'])
+            values.append(val)
+        except (ValueError, KeyError):
+            continue
+
+    return dates, values, {}
+
+
+def _fetch_series_info_uncached(series_id: str) -> dict:
+    """Current FRED series info (incl. last_updated), bypassing the 1-hour Streamlit cache."""
+    data = fred_request('series', {'series_id': series_id})
+    series_list = data.get('seriess', [])
+    return series_list[0] if series_list else {}
+
+
+def _download_observations(series_id: str) -> tuple:
+    """Download the full observation history for a FRED series as (dates, values, info)."""
+    dates, values, fetch_info = _fetch_observations_since(series_id)
+    if 'error' in fetch_info:
+        return [], [], fetch_info
+    return dates, values, get_series_info(series_id)
 
 
 def get_observations(series_id: str, years: int = None) -> tuple:
-    """Get observations for a series. Uses caching to reduce API calls."""
-    # Calculate start date for cache key
-    start_date = None
-    if years:
-        start_date = (datetime.now() - timedelta(days=years * 365)).strftime('%Y-%m-%d')
+    """Get observations for a series.
 
+    Reads through the shared on-disk observation store, so the full history is
+    downloaded once and every `years` window is a local slice. Stale series
+    are refreshed incrementally from their last stored date.
+    """
     # Get info from our database first, then FRED API
     info = dict(SERIES_DB.get(series_id, {}))
     if not info:
@@ -6345,20 +6341,15 @@ def get_observations(series_id: str, years: int = None) -> tuple:
     if not info:
         return [], [], {'error': f'Series {series_id} not found'}
 
-    # Use cached API call
-    data = _fetch_observations_cached(series_id, start_date)
-    if 'error' in data:
-        return [], [], {'error': data['error']}
-
-    observations = data.get('observations', [])
-    dates, values = [], []
-    for obs in observations:
-        try:
-            val = float(obs['value'])
-            dates.append(obs['date'])
-            values.append(val)
-        except (ValueError, KeyError):
-            continue
+    dates, values, fetch_info = read_through(
+        series_id,
+        lambda: _download_observations(series_id),
+        years=years,
+        fetch_info=lambda: _fetch_series_info_uncached(series_id),
+        fetch_since=lambda since: _fetch_observations_since(series_id, since),
+    )
+    if 'error' in fetch_info:
+        return [], [], {'error': fetch_info['error']}
 
     return dates, values, info
 
@@ -6398,6 +6389,50 @@ def fetch_series_data(series_id: str, years: int = None) -> tuple:
     return get_observations(series_id, years)
 
 
+def presentation_info_for(series_id: str) -> dict:
+    """
+    The {id, title, units} entry validate_presentation() will get for a FRED
+    series once it is fetched, from metadata alone (same lookup as
+    get_observations). None for other sources - their info comes with the data.
+    """
+    if series_id.startswith(('zillow_', 'eia_', 'av_')):
+        return None
+    if DBNOMICS_AVAILABLE:
+        from agents.dbnomics import INTERNATIONAL_SERIES
+        if series_id in INTERNATIONAL_SERIES:
+            return None
+    info = SERIES_DB.get(series_id)
+    if info:
+        title, units = info.get('name', info.get('title', series_id)), info.get('unit', info.get('units', 'unknown'))
+    else:
+        fred_info = get_series_info(series_id)
+        if not fred_info:
+            return None
+        title, units = fred_info.get('title', series_id), fred_info.get('units', '')
+    return {'id': series_id, 'title': title, 'units': units}
+
+
+def speculative_presentation(query: str, series_ids: list) -> tuple:
+    """Run validate_presentation before the data arrives; (inputs, config), or (None, {}) if inputs are unknown."""
+    infos = [presentation_info_for(sid) for sid in series_ids]
+    if not infos or None in infos:
+        return None, {}
+    return infos, validate_presentation(query, infos, verbose=False)
+
+
+def news_context_or_empty(query: str) -> str:
+    """News context for premium analysis ("" if unavailable)."""
+    try:
+        return get_economic_context(query)
+    except Exception:
+        return ""
+
+
+def run_premium_analysis(news_context: str, query: str, series_data: list) -> tuple:
+    """get_premium_analysis() with the news context first, so it can take a task graph dependency."""
+    return get_premium_analysis(query=query, series_data=series_data, news_context=news_context)
+
+
 def fetch_single_series(series_id: str, years: int) -> dict:
     """
     Fetch a single series and return structured result for parallel processing.
@@ -6430,118 +6465,6 @@ def fetch_single_series(series_id: str, years: int) -> dict:
         }
 
 
-def calculate_yoy(dates: list, values: list) -> tuple:
-    """Calculate year-over-year percent change.
-
-    Uses proper month-based comparison (Dec 2025 vs Dec 2024) rather than
-    day-based (365 days back), which is how FRED calculates YoY.
-    """
-    if len(dates) < 2:
-        return dates, values
-
-    # Detect frequency by looking at date gaps
-    date_objs = [datetime.strptime(d, '%Y-%m-%d') for d in dates[:min(5, len(dates))]]
-    avg_gap = 30  # Default to monthly
-    if len(date_objs) >= 2:
-        avg_gap = sum((date_objs[i+1] - date_objs[i]).days for i in range(len(date_objs)-1)) / (len(date_objs)-1)
-        if avg_gap > 60:  # Quarterly
-            min_obs = 4
-        elif avg_gap > 20:  # Monthly
-            min_obs = 12
-        else:  # Weekly
-            min_obs = 52
-    else:
-        min_obs = 12
-
-    if len(dates) < min_obs + 1:
-        return dates, values
-
-    date_to_value = dict(zip(dates, values))
-    yoy_dates, yoy_values = [], []
-
-    for i, date_str in enumerate(dates[min_obs:], min_obs):
-        date = datetime.strptime(date_str, '%Y-%m-%d')
-
-        # Calculate exactly 12 months ago (same month, previous year)
-        # This matches FRED's YoY calculation method
-        try:
-            year_ago = date.replace(year=date.year - 1)
-            year_ago_str = year_ago.strftime('%Y-%m-%d')
-        except ValueError:
-            # Handle Feb 29 -> Feb 28 for non-leap years
-            year_ago = date.replace(year=date.year - 1, day=28)
-            year_ago_str = year_ago.strftime('%Y-%m-%d')
-
-        # Look for exact match first, then try nearby dates (for weekly data)
-        found = False
-        for check_str in [year_ago_str]:
-            if check_str in date_to_value and date_to_value[check_str] != 0:
-                base_value = date_to_value[check_str]
-                yoy = ((values[i] - base_value) / base_value) * 100
-                yoy_dates.append(date_str)
-                yoy_values.append(yoy)
-                found = True
-                break
-
-        # Fallback for weekly data: try nearby dates within 7 days
-        if not found and avg_gap < 20:
-            for offset in range(1, 8):
-                for direction in [1, -1]:
-                    check = (year_ago + timedelta(days=offset * direction)).strftime('%Y-%m-%d')
-                    if check in date_to_value and date_to_value[check] != 0:
-                        base_value = date_to_value[check]
-                        yoy = ((values[i] - base_value) / base_value) * 100
-                        yoy_dates.append(date_str)
-                        yoy_values.append(yoy)
-                        found = True
-                        break
-                if found:
-                    break
-
-    return yoy_dates, yoy_values
-
-
-def calculate_mom(dates: list, values: list) -> tuple:
-    """Calculate month-over-month percent change."""
-    if len(dates) < 2:
-        return dates, values
-
-    mom_dates, mom_values = [], []
-
-    for i in range(1, len(dates)):
-        if values[i - 1] != 0:
-            mom = ((values[i] - values[i - 1]) / abs(values[i - 1])) * 100
-            mom_dates.append(dates[i])
-            mom_values.append(mom)
-
-    return mom_dates, mom_values
-
-
-def calculate_avg_annual(dates: list, values: list) -> tuple:
-    """Calculate average annual values."""
-    if not dates or not values:
-        return dates, values
-
-    # Group by year
-    yearly_data = {}
-    for date_str, value in zip(dates, values):
-        year = date_str[:4]
-        if year not in yearly_data:
-            yearly_data[year] = []
-        yearly_data[year].append(value)
-
-    # Calculate averages
-    avg_dates, avg_values = [], []
-    for year in sorted(yearly_data.keys()):
-        vals = yearly_data[year]
-        avg = sum(vals) / len(vals)
-        # Use mid-year date for plotting
-        avg_dates.append(f"{year}-07-01")
-        avg_values.append(avg)
-
-    return avg_dates, avg_values
-
-
 def find_local_series(query: str) -> dict:
     """Find series from local query map using fuzzy matching."""
     q = query.lower().strip()
@@ -6665,7 +6588,7 @@ def add_comparison_period_shapes(fig, temporal_intent, min_date: str, max_date:
 def add_direct_labels(fig, series_data: list, colors: list):
     """Add direct labels at end of lines (NYT style) instead of legend."""
     for i, (series_id, dates, values, info) in enumerate(series_data):
-        if not dates or not values:
+        if not len(dates) or not len(values):
             continue
         name = info.get('name', info.get('title', series_id))
         # Truncate long names
@@ -6674,8 +6597,8 @@ def add_direct_labels(fig, series_data: list, colors: list):
 
         # Add annotation at the last data point
         fig.add_annotation(
-            x=dates[-1],
-            y=values[-1],
+            x=str(dates[-1]),
+            y=float(values[-1]),
             text=f"  {name}",
             showarrow=False,
             xanchor='left',
@@ -6770,12 +6693,19 @@ def create_chart(series_data: list, combine: bool = False, chart_type: str = 'li
     # Okabe-Ito colorblind-safe palette
     colors = ['#0072B2', '#E69F00', '#009E73', '#CC79A7', '#56B4E9', '#D55E00']
 
-    all_dates = []
-    for _, dates, _, _ in series_data:
-        all_dates.extend(dates)
-    if not all_dates:
+    # Plotly takes the datetime64/float64 arrays directly - no per-point lists
+    series_data = [
+        (series_id, ts.dates, ts.values, info)
+        for series_id, ts, info in (
+            (series_id, as_timeseries(dates, values, series_id), info)
+            for series_id, dates, values, info in series_data
+        )
+    ]
+    spans = [(dates[0], dates[-1]) for _, dates, _, _ in series_data if len(dates)]
+    if not spans:
         return go.Figure()
-    min_date, max_date = min(all_dates), max(all_dates)
+    min_date = str(min(first for first, _ in spans))
+    max_date = str(max(last for _, last in spans))
 
     if combine or len(series_data) == 1:
         fig = go.Figure()
@@ -7034,11 +6964,19 @@ def main():
     print(f"ZILLOW_AVAILABLE: {ZILLOW_AVAILABLE}")
     print(f"EIA_AVAILABLE: {EIA_AVAILABLE}")
     print(f"SEP_AVAILABLE: {SEP_AVAILABLE}")
+    print("-" * 60)
+    print_startup_report()
     print("=" * 60)
 
     # Clean up expired cache entries to prevent memory bloat
     _clear_expired_cache()
 
+    # Background refresh of popular series (started once per process)
+    start_prewarm()
+
+    # Modules deferred at import (unified catalog) load in the background
+    start_warming()
+
     st.set_page_config(page_title="EconStats", page_icon="", layout="wide")
 
     st.markdown("""
@@ -8218,34 +8156,39 @@ def main():
         direct_series_early = check_direct_mapping(query)
         skip_understanding = direct_series_early is not None
 
-        query_understanding = None
-        routing_recommendation = None
+        # =================================================================
+        # OPTIMIZATION 7: TASK GRAPH
+        # =================================================================
+        # The slow stages below (LLM calls, context lookups, data fetches)
+        # are tasks in a graph (core/task_graph.py) that start as soon as
+        # their inputs exist instead of waiting their turn: understanding
+        # runs while routing does, presentation validation while data is
+        # fetched, premium analysis alongside the narrative. Stages that are
+        # likely but not certain to be needed start speculatively and are
+        # cancelled at the end if nothing used them.
+        # =================================================================
+        graph = TaskGraph('query')
         if QUERY_UNDERSTANDING_AVAILABLE and not skip_understanding:
             status_container.update(label="Understanding your question...")
-            query_understanding = understand_query(query, verbose=False)
-            routing_recommendation = get_routing_recommendation(query_understanding)
-
-            # Store understanding in session for debugging/logging
-            st.session_state['query_understanding'] = query_understanding
-            st.session_state['routing_recommendation'] = routing_recommendation
-
-            # Log key insights from understanding
-            if query_understanding:
-                intent = query_understanding.get('intent', {})
-                entities = query_understanding.get('entities', {})
-
-                # Use understanding to enhance subsequent routing
-                # (e.g., if demographic-specific, we'll filter results later)
+            graph.add('understanding', understand_query, query, verbose=False)
+            graph.add('routing_recommendation', get_routing_recommendation, deps=['understanding'])
         elif skip_understanding:
             print(f"[Optimization] Skipping query understanding - direct mapping found for: {query}")
 
+        # Context boxes only need the query
+        if POLYMARKET_AVAILABLE:
+            graph.add('polymarket', lambda q: find_relevant_predictions(q)[:4], query)
+        if SEP_AVAILABLE:
+            graph.add('sep', get_sep_for_query, query)
+        if PREMIUM_ANALYSIS_AVAILABLE and NEWS_CONTEXT_AVAILABLE:
+            graph.add('news_context', news_context_or_empty, query, speculative=True)
+
         # =================================================================
-        # OPTIMIZATION 4: PARALLEL ROUTING
+        # OPTIMIZATION 4: PRIORITY ROUTING
         # =================================================================
-        # Instead of checking routing options sequentially (comparison ->
-        # direct mapping -> health check -> precomputed -> stocks -> intl),
-        # run all fast checks in parallel and pick the best result.
-        # This reduces routing latency by ~60%.
+        # Check routes in priority order (direct mapping -> comparison ->
+        # health check -> precomputed -> stocks -> intl); the first match
+        # wins and the rest never run.
         # =================================================================
         parallel_result = parallel_route_query(query, skip_understanding=skip_understanding)
         route_type = parallel_result.get('route_type')
@@ -8253,7 +8196,7 @@ def main():
         routing_time_ms = parallel_result.get('timing_ms', 0)
 
         if routing_time_ms > 0:
-            print(f"[Parallel Routing] Found {route_type or 'no'} route in {routing_time_ms:.1f}ms")
+            print(f"[Routing] Found {route_type or 'no'} route in {routing_time_ms:.2f}ms")
 
         # Unpack results into the expected variables for downstream compatibility
         comparison_route = None
@@ -8287,6 +8230,27 @@ def main():
         # Check if this is a "how is X doing?" style query that needs multi-dimensional answers
         holistic = is_holistic_query(query)
 
+        # Speculative plan stages - they only need the query, so start them
+        # now and let them overlap query understanding. Unused if the
+        # understanding-based validation below swaps the plan.
+        if not local_parsed:
+            if (precomputed_plan and holistic and RAG_AVAILABLE
+                    and len(precomputed_plan.get('series', [])) < 3):
+                graph.add('hybrid', hybrid_query_plan, query, verbose=False, speculative=True)
+            elif (QUERY_UNDERSTANDING_AVAILABLE and not direct_mapping_plan
+                    and not health_check_plan and not precomputed_plan):
+                graph.add('dynamic_series', get_series_for_query, query, verbose=True, speculative=True)
+
+        query_understanding = None
+        routing_recommendation = None
+        if graph.has('understanding'):
+            query_understanding = graph.result('understanding')
+            routing_recommendation = graph.result('routing_recommendation')
+
+            # Store understanding in session for debugging/logging
+            st.session_state['query_understanding'] = query_understanding
+            st.session_state['routing_recommendation'] = routing_recommendation
+
         # =================================================================
         # QUERY VALIDATION - "Gut Check" Layer
         # =================================================================
@@ -8353,7 +8317,10 @@ def main():
         dynamic_series_result = None
         if QUERY_UNDERSTANDING_AVAILABLE and not direct_mapping_plan and not health_check_plan and not precomputed_plan:
             # No plan found - try dynamic Gemini reasoning
-            dynamic_series_result = get_series_for_query(query, verbose=True)
+            if graph.has('dynamic_series'):
+                dynamic_series_result = graph.result('dynamic_series')
+            else:
+                dynamic_series_result = get_series_for_query(query, verbose=True)
 
             if dynamic_series_result.get('series') and len(dynamic_series_result['series']) >= 2:
                 print(f"[Dynamic Series] Using Gemini-selected series: {dynamic_series_result['series']}")
@@ -8400,7 +8367,11 @@ def main():
 
             # Check coverage and add disclaimer if showing proxy data
             if COVERAGE_CHECK_AVAILABLE:
-                coverage_result = check_query_coverage(query, search_fred=False)
+                try:
+                    coverage_result = check_query_coverage(query, search_fred=False)
+                except ImportError:
+                    # Deferred import failed (already logged) - skip the disclaimer
+                    coverage_result = {}
                 if coverage_result.get('message'):
                     interpretation['coverage_disclaimer'] = coverage_result['message']
                     interpretation['coverage_level'] = coverage_result['coverage']
@@ -8447,7 +8418,10 @@ def main():
             if should_augment:
                 status_container.update(label="Finding relevant indicators...")
                 # Run hybrid search to find complementary series
-                hybrid_result = hybrid_query_plan(query, verbose=False)
+                if graph.has('hybrid'):
+                    hybrid_result = graph.result('hybrid')
+                else:
+                    hybrid_result = hybrid_query_plan(query, verbose=False)
                 hybrid_series = hybrid_result.get('series', [])
                 hybrid_sources['rag'] = hybrid_result.get('hybrid_sources', {}).get('rag', [])
                 hybrid_sources['fred'] = hybrid_result.get('hybrid_sources', {}).get('fred', [])
@@ -8628,6 +8602,7 @@ def main():
             st.warning("No data available for this specific query")
             st.info(ai_explanation)  # Shows guidance about what to try instead
             log_query(query, [], "no_relevant_data")
+            graph.close()
             st.stop()
 
         combine = interpretation.get('combine_chart', False)
@@ -8787,6 +8762,7 @@ def main():
 
             st.info("**Suggestions:**\n" + "\n".join(suggestions))
             log_query(query, [], "no_results")
+            graph.close()
             st.stop()
 
         # Geographic scope detection - search FRED for state-specific series
@@ -8823,6 +8799,11 @@ def main():
                 # No state data found - fall back to national with warning
                 st.info(f"📍 No {state_name.title()}-specific series found. Showing national indicators as context.")
 
+        # Start fetching now so downloads overlap relevance validation (an LLM
+        # call). Series that validation drops are discarded below.
+        for sid in series_to_fetch[:4]:
+            graph.add(f'fetch:{sid}', fetch_single_series, sid, years, speculative=True)
+
         # Validate series relevance - filter out irrelevant/overly broad series
         # ALWAYS validate, including pre-computed plans, to catch:
         # - Stale plans that no longer match the query
@@ -8889,6 +8870,16 @@ def main():
                 all_series_to_fetch.append(sid)
                 series_source_map[sid] = 'dbnomics'
 
+        for sid in [t[len('fetch:'):] for t in graph.names() if t.startswith('fetch:')]:
+            if sid not in all_series_to_fetch[:4]:
+                graph.discard(f'fetch:{sid}')
+
+        # Presentation validation only needs series metadata - start it while
+        # the data is still downloading (used below if the inputs match)
+        user_requested_transform = show_yoy or show_mom or normalize or pct_change_from_start or show_avg_annual
+        if ENSEMBLE_AVAILABLE and not user_requested_transform and all_series_to_fetch:
+            graph.add('presentation', speculative_presentation, query, all_series_to_fetch[:4], speculative=True)
+
         # =================================================================
         # OPTIMIZATION 6: Progressive Display
         # =================================================================
@@ -8901,71 +8892,73 @@ def main():
         early_metrics_placeholder = st.empty()
         early_metrics_shown = []
 
-        # Fetch all series data in parallel using ThreadPoolExecutor
-        # This significantly speeds up queries that return multiple series
+        # Fetch all series in one round (core.batch_fetch): series the
+        # observation store holds fresh are read inline, the rest start
+        # together under the shared FRED budget; prefetched ones are reused
         fetch_results = []
-        total_to_fetch = len(all_series_to_fetch[:4])
+        batch_series = all_series_to_fetch[:4]
+        total_to_fetch = len(batch_series)
         completed_count = 0
 
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            # Submit all fetch tasks
-            future_to_series = {
-                executor.submit(fetch_single_series, series_id, years): series_id
-                for series_id in all_series_to_fetch[:4]
-            }
-
-            # Collect results as they complete with progressive status updates
-            for future in as_completed(future_to_series):
-                completed_count += 1
-                series_id = future_to_series[future]
+        prefetched = {sid: graph.future(f'fetch:{sid}') for sid in batch_series if graph.has(f'fetch:{sid}')}
+        batch_futures = submit_batch(
+            [sid for sid in batch_series if sid not in prefetched],
+            lambda sid: fetch_single_series(sid, years),
+        )
+        future_to_series = {future: sid for sid, future in {**prefetched, **batch_futures}.items()}
 
-                try:
-                    result = future.result()
-                    fetch_results.append(result)
+        # Collect results as they complete with progressive status updates
+        for future in as_completed(future_to_series):
+            completed_count += 1
+            series_id = future_to_series[future]
 
-                    # Progressive status update
-                    if completed_count < total_to_fetch:
-                        status_container.update(
-                            label=f"Fetching data... ({completed_count}/{total_to_fetch})"
-                        )
+            try:
+                result = future.result()
+                fetch_results.append(result)
 
-                    # Show early metric preview for successful fetches
-                    if result['success'] and result['values']:
-                        early_metrics_shown.append({
-                            'series_id': result['series_id'],
-                            'name': result['info'].get('name', result['series_id'])[:20],
-                            'value': result['values'][-1],
-                            'unit': result['info'].get('unit', '')
-                        })
-                        # Update the early metrics display
-                        if len(early_metrics_shown) <= 4:
-                            with early_metrics_placeholder.container():
-                                cols = st.columns(min(len(early_metrics_shown), 4))
-                                for idx, m in enumerate(early_metrics_shown):
-                                    with cols[idx]:
-                                        # Quick format
-                                        val = m['value']
-                                        unit = m['unit'].lower()
-                                        if 'percent' in unit or '%' in m['unit']:
-                                            val_str = f"{val:.1f}%"
-                                        elif val >= 1e6:
-                                            val_str = f"{val/1e6:.1f}M"
-                                        elif val >= 1000:
-                                            val_str = f"{val/1000:.0f}K"
-                                        else:
-                                            val_str = f"{val:.1f}"
-                                        st.metric(m['name'], val_str)
+                # Progressive status update
+                if completed_count < total_to_fetch:
+                    status_container.update(
+                        label=f"Fetching data... ({completed_count}/{total_to_fetch})"
+                    )
 
-                except Exception as e:
-                    # Log error but continue with other series
-                    fetch_results.append({
-                        'series_id': series_id,
-                        'dates': [],
-                        'values': [],
-                        'info': {},
-                        'success': False,
-                        'error': str(e)
+                # Show early metric preview for successful fetches
+                if result['success'] and result['values']:
+                    early_metrics_shown.append({
+                        'series_id': result['series_id'],
+                        'name': result['info'].get('name', result['series_id'])[:20],
+                        'value': result['values'][-1],
+                        'unit': result['info'].get('unit', '')
                     })
+                    # Update the early metrics display
+                    if len(early_metrics_shown) <= 4:
+                        with early_metrics_placeholder.container():
+                            cols = st.columns(min(len(early_metrics_shown), 4))
+                            for idx, m in enumerate(early_metrics_shown):
+                                with cols[idx]:
+                                    # Quick format
+                                    val = m['value']
+                                    unit = m['unit'].lower()
+                                    if 'percent' in unit or '%' in m['unit']:
+                                        val_str = f"{val:.1f}%"
+                                    elif val >= 1e6:
+                                        val_str = f"{val/1e6:.1f}M"
+                                    elif val >= 1000:
+                                        val_str = f"{val/1000:.0f}K"
+                                    else:
+                                        val_str = f"{val:.1f}"
+                                    st.metric(m['name'], val_str)
+
+            except Exception as e:
+                # Log error but continue with other series
+                fetch_results.append({
+                    'series_id': series_id,
+                    'dates': [],
+                    'values': [],
+                    'info': {},
+                    'success': False,
+                    'error': str(e)
+                })
 
         # Track failed series for better user messaging
         failed_series = []
@@ -9209,6 +9202,7 @@ def main():
                 guidance_parts.append("• Try a broader economic query like 'unemployment', 'inflation', or 'GDP growth'.")
 
             st.info("**Suggestions:**\n" + "\n".join(guidance_parts))
+            graph.close()
             st.stop()
 
         # Apply normalization if requested (index all series to 100 at start)
@@ -9250,7 +9244,6 @@ def main():
         # AI-driven presentation validation: determine stock vs flow vs rate for proper display
         # Only apply if user hasn't explicitly requested a transformation (YoY, MoM, normalize, etc.)
         # and if we have ensemble capability
-        user_requested_transform = show_yoy or show_mom or normalize or pct_change_from_start or show_avg_annual
         if ENSEMBLE_AVAILABLE and series_data and not user_requested_transform:
             status_container.update(label="Formatting data...")
             # Build series info for the validator
@@ -9266,7 +9259,18 @@ def main():
                 })
 
             if series_info_for_validation:
-                presentation_config = validate_presentation(query, series_info_for_validation, verbose=False)
+                presentation_config = None
+                if graph.has('presentation'):
+                    # The speculative run covers every series it was given; use it
+                    # if those inputs include exactly the ones we have now
+                    spec_infos, spec_config = graph.result('presentation', default=(None, {}))
+                    if spec_infos is not None:
+                        spec_by_id = {info['id']: info for info in spec_infos}
+                        if all(spec_by_id.get(info['id']) == info for info in series_info_for_validation):
+                            presentation_config = {sid: spec_config[sid] for sid in spec_by_id
+                                                   if sid in spec_config}
+                if presentation_config is None:
+                    presentation_config = validate_presentation(query, series_info_for_validation, verbose=False)
 
                 # Apply transformations based on AI recommendations
                 transformed_data = []
@@ -9335,6 +9339,14 @@ def main():
 
         # Check data freshness - warn if data is more than 45 days old
         # Call economist reviewer agent for ALL queries to ensure quality explanations
+        # Premium analysis only needs the final series data - run it alongside
+        # the narrative. Valuation queries add CAPE to the data further down,
+        # so theirs is generated there as before.
+        if (PREMIUM_ANALYSIS_AVAILABLE and series_data
+                and not (SHILLER_AVAILABLE and is_valuation_query(query))):
+            premium_deps = ['news_context'] if graph.has('news_context') else []
+            graph.add('premium', run_premium_analysis, query, list(series_data), deps=premium_deps)
+
         if series_data:
             status_container.update(label="Generating insights...")
 
@@ -9407,7 +9419,7 @@ def main():
         polymarket_html = None
         if POLYMARKET_AVAILABLE:
             try:
-                polymarket_predictions = find_relevant_predictions(query)[:4]  # Top 4 relevant
+                polymarket_predictions = graph.result('polymarket')  # Top 4 relevant
                 if polymarket_predictions:
                     polymarket_html = format_predictions_box(polymarket_predictions, query)
             except Exception as e:
@@ -9417,7 +9429,7 @@ def main():
         sep_data = None
         if SEP_AVAILABLE:
             try:
-                sep_data = get_sep_for_query(query)
+                sep_data = graph.result('sep')
             except Exception as e:
                 print(f"[SEP] Error fetching projections: {e}")
 
@@ -9534,24 +9546,31 @@ def main():
         recession_scorecard = None
         if RECESSION_SCORECARD_AVAILABLE and is_recession_query(query):
             try:
-                # Fetch recession indicator data from FRED
+                # Fetch all recession indicator data from FRED in one round
+                indicators = fetch_batch(
+                    list(RECESSION_INDICATOR_CONFIG),
+                    lambda sid: get_observations(sid, years=2),
+                    on_error=lambda sid, e: ([], [], {'error': str(e)}),
+                    label='recession scorecard',
+                )
+
                 # SAHMREALTIME - Sahm Rule
-                sahm_dates, sahm_values, _ = get_observations('SAHMREALTIME', years=2)
+                sahm_dates, sahm_values, _ = indicators['SAHMREALTIME']
                 sahm_value = sahm_values[-1] if sahm_values else None
                 sahm_prev = sahm_values[-2] if len(sahm_values) >= 2 else None
 
                 # T10Y2Y - Yield curve spread
-                yc_dates, yc_values, _ = get_observations('T10Y2Y', years=2)
+                yc_dates, yc_values, _ = indicators['T10Y2Y']
                 yield_curve_value = yc_values[-1] if yc_values else None
                 yield_curve_prev = yc_values[-2] if len(yc_values) >= 2 else None
 
                 # UMCSENT - Consumer sentiment
-                sent_dates, sent_values, _ = get_observations('UMCSENT', years=2)
+                sent_dates, sent_values, _ = indicators['UMCSENT']
                 sentiment_value = sent_values[-1] if sent_values else None
                 sentiment_prev = sent_values[-2] if len(sent_values) >= 2 else None
 
                 # ICSA - Initial jobless claims (use 4-week moving average)
-                claims_dates, claims_values, _ = get_observations('ICSA', years=2)
+                claims_dates, claims_values, _ = indicators['ICSA']
                 # Calculate 4-week moving average for claims
                 if claims_values and len(claims_values) >= 4:
                     claims_value = sum(claims_values[-4:]) / 4
@@ -9561,7 +9580,7 @@ def main():
                     claims_prev = None
 
                 # USSLIND - Conference Board Leading Economic Index (MoM % change)
-                lei_dates, lei_values, _ = get_observations('USSLIND', years=2)
+                lei_dates, lei_values, _ = indicators['USSLIND']
                 if lei_values and len(lei_values) >= 2:
                     # LEI is an index, calculate MoM % change
                     lei_value = ((lei_values[-1] - lei_values[-2]) / lei_values[-2]) * 100
@@ -9571,12 +9590,12 @@ def main():
                     lei_prev = None
 
                 # NAPM - ISM Manufacturing PMI
-                pmi_dates, pmi_values, _ = get_observations('NAPM', years=2)
+                pmi_dates, pmi_values, _ = indicators['NAPM']
                 pmi_value = pmi_values[-1] if pmi_values else None
                 pmi_prev = pmi_values[-2] if len(pmi_values) >= 2 else None
 
                 # BAMLH0A0HYM2 - High Yield Credit Spread
-                spread_dates, spread_values, _ = get_observations('BAMLH0A0HYM2', years=2)
+                spread_dates, spread_values, _ = indicators['BAMLH0A0HYM2']
                 credit_spread_value = spread_values[-1] if spread_values else None
                 credit_spread_prev = spread_values[-2] if len(spread_values) >= 2 else None
 
@@ -9712,26 +9731,19 @@ def main():
         premium_analysis_html = None
         if PREMIUM_ANALYSIS_AVAILABLE and series_data:
             try:
-                # Get news context if available
-                news_ctx = ""
-                if NEWS_CONTEXT_AVAILABLE:
-                    try:
-                        news_ctx = get_economic_context(query)
-                    except Exception:
-                        pass
-
-                # Generate premium analysis
-                analysis_obj, _, analysis_html = get_premium_analysis(
-                    query=query,
-                    series_data=series_data,
-                    news_context=news_ctx,
-                )
+                if graph.has('premium'):
+                    analysis_obj, _, analysis_html = graph.result('premium')
+                else:
+                    news_ctx = graph.result('news_context', default="") if graph.has('news_context') else ""
+                    analysis_obj, _, analysis_html = run_premium_analysis(news_ctx, query, series_data)
                 premium_analysis = analysis_obj
                 premium_analysis_html = analysis_html
                 print(f"[PremiumAnalysis] Generated analysis with confidence: {analysis_obj.confidence}")
             except Exception as e:
                 print(f"[PremiumAnalysis] Error generating analysis: {e}")
 
+        graph.close()
+
         # Store ALL context atomically for follow-up queries (prevents race conditions)
         st.session_state.last_query = query
         st.session_state.last_series = series_to_fetch[:4]
@@ -4,6 +4,7 @@
 # - query_parser: Single LLM call for query understanding
 # - series_catalog: Unified series metadata and query plans
 # - data_fetcher: Unified data fetching interface (FRED + DBnomics)
+# - timeseries: Compact datetime64/float64 series representation
 
 from .series_catalog import (
     SERIES_CATALOG,
@@ -26,6 +27,11 @@ from .data_fetcher import (
     get_observations,
 )
 
+from .timeseries import (
+    TimeSeries,
+    as_timeseries,
+)
+
 from .summary_generator import (
     generate_analytical_summary,
     generate_inflation_summary,
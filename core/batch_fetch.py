@@ -0,0 +1,183 @@
+"""
+Batch fetch - a whole set of series in one round of parallel I/O.
+
+Dashboard-style answers need many series at once: a health check's primary
+and secondary series, the recession scorecard's seven indicators. They used to be fetched one after another or
+through small per-call thread pools (4-5 workers), so a wide plan paid for
+several waves of FRED round trips.
+
+fetch_batch(series_ids, fetch_one):
+
+- deduplicates the ids (order kept; results come back in that order);
+- serves series the observation store already holds fresh directly in the
+  calling thread - no pool hop, no upstream request;
+- submits every remaining series at once to a shared pool sized for the
+  widest dashboard. How fast those reach FRED is governed in one place: the
+  per-host concurrency limit and the process-wide FRED rate budget in
+  core.http_client, which every FRED request goes through;
+- returns all results together. A failed series gets on_error(series_id,
+  exception) (None by default); the rest are unaffected.
+
+submit_batch() returns {series_id: Future} instead (cached series as
+already-completed futures), for callers that show progress as results land.
+fetch_batch_async() is the asyncio form for the FastAPI request path.
+
+`fetch_one` is whatever the caller already uses for a single series
+(get_observations, fetch_series_data, DataFetcher.fetch, ...), so return
+shapes and error conventions don't change.
+
+Usage:
+    from core.batch_fetch import fetch_batch
+
+    results = fetch_batch(['UNRATE', 'PAYEMS', 'ICSA'],
+                          lambda sid: get_observations(sid, years=2))
+    dates, values, info = results['UNRATE']
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from .observation_store import get_store
+
+# Worker threads shared by every batch (enough for the widest dashboard;
+# upstream pressure is limited per host in core.http_client)
+MAX_WORKERS = 16
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_batch_executor() -> ThreadPoolExecutor:
+    """Process-wide pool that batch fetches run on (created on first use)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='batch-fetch')
+    return _executor
+
+
+def unique_ids(series_ids: Iterable[str]) -> List[str]:
+    """Series ids without duplicates or blanks, first occurrence kept."""
+    return list(dict.fromkeys(sid for sid in series_ids if sid))
+
+
+def is_stored_fresh(series_id: str) -> bool:
+    """True if the observation store can serve the series without an upstream request."""
+    store = get_store()
+    return store.is_fresh(store.get_meta(series_id))
+
+
+def _split(series_ids: Iterable[str], is_cached: Callable[[str], bool]) -> tuple:
+    ids = unique_ids(series_ids)
+    hits, misses = [], []
+    for sid in ids:
+        try:
+            cached = is_cached(sid)
+        except Exception:
+            cached = False
+        (hits if cached else misses).append(sid)
+    return ids, hits, misses
+
+
+def _log(label: str, ids: list, begin: float, hits: list = None, misses: list = None) -> None:
+    if len(ids) > 1:
+        split = f" ({len(hits)} stored, {len(misses)} fetched)" if hits is not None else ""
+        print(f"[BatchFetch] {label}: {len(ids)} series{split} in {time.monotonic() - begin:.2f}s")
+
+
+def submit_batch(
+    series_ids: Iterable[str],
+    fetch_one: Callable[[str], Any],
+    is_cached: Callable[[str], bool] = is_stored_fresh,
+) -> Dict[str, Future]:
+    """
+    Start fetching every series; returns {series_id: Future} in input order.
+
+    Cached series are fetched inline and returned as completed futures.
+    """
+    ids, hits, misses = _split(series_ids, is_cached)
+    executor = get_batch_executor()
+    futures = {sid: executor.submit(fetch_one, sid) for sid in misses}
+    for sid in hits:
+        future: Future = Future()
+        try:
+            future.set_result(fetch_one(sid))
+        except Exception as e:
+            future.set_exception(e)
+        futures[sid] = future
+    return {sid: futures[sid] for sid in ids}
+
+
+def fetch_batch(
+    series_ids: Iterable[str],
+    fetch_one: Callable[[str], Any],
+    is_cached: Callable[[str], bool] = is_stored_fresh,
+    on_error: Callable[[str, Exception], Any] = lambda sid, e: None,
+    timeout: Optional[float] = None,
+    label: str = 'batch',
+) -> Dict[str, Any]:
+    """
+    Fetch every series in one round; returns {series_id: result} in input order.
+
+    Series still running after `timeout` seconds get on_error(sid, TimeoutError)
+    and are left to finish in the background.
+    """
+    begin = time.monotonic()
+    ids, hits, misses = _split(series_ids, is_cached)
+    executor = get_batch_executor()
+    futures = {sid: executor.submit(fetch_one, sid) for sid in misses}
+
+    results: Dict[str, Any] = {}
+    for sid in hits:
+        try:
+            results[sid] = fetch_one(sid)
+        except Exception as e:
+            print(f"[BatchFetch] {sid} failed: {e}")
+            results[sid] = on_error(sid, e)
+
+    wait(futures.values(), timeout=timeout)
+    for sid, future in futures.items():
+        if not future.done():
+            future.cancel()
+            results[sid] = on_error(sid, TimeoutError(f"{sid} not fetched within {timeout}s"))
+            continue
+        try:
+            results[sid] = future.result()
+        except Exception as e:
+            print(f"[BatchFetch] {sid} failed: {e}")
+            results[sid] = on_error(sid, e)
+
+    _log(label, ids, begin, hits, misses)
+    return {sid: results[sid] for sid in ids}
+
+
+async def fetch_batch_async(
+    series_ids: Iterable[str],
+    fetch_one: Callable[[str], Awaitable[Any]],
+    on_error: Callable[[str, Exception], Any] = lambda sid, e: None,
+    label: str = 'batch',
+) -> Dict[str, Any]:
+    """
+    Async fetch_batch(): duplicates collapse to one call, all in one gather.
+
+    There is no stored/upstream split: every fetch_one coroutine runs
+    concurrently either way, and the async fetchers read the observation
+    store themselves.
+    """
+    begin = time.monotonic()
+    ids = unique_ids(series_ids)
+    outcomes = await asyncio.gather(*(fetch_one(sid) for sid in ids), return_exceptions=True)
+
+    results: Dict[str, Any] = {}
+    for sid, outcome in zip(ids, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"[BatchFetch] {sid} failed: {outcome}")
+            outcome = on_error(sid, outcome)
+        results[sid] = outcome
+
+    _log(label, ids, begin)
+    return results
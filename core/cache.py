@@ -0,0 +1,193 @@
+"""
+Bounded in-memory cache - LRU eviction, per-entry TTL, thread safe.
+
+All module-level caches (API responses, agent data, LLM results, embeddings)
+use TTLCache instead of hand-rolled `{key: (data, timestamp)}` dicts, so
+memory stays bounded over long uptimes and caches are safe to share with
+ThreadPoolExecutor workers.
+
+- Size limits: max_entries and/or max_bytes (approximate payload size)
+- O(1) LRU: OrderedDict with move_to_end on hit, popitem on eviction
+- TTL: cache-wide default, overridable per entry; expired entries are
+  dropped on access
+- Counters: hits, misses, evictions, expirations (see stats())
+
+Usage:
+    from core.cache import TTLCache
+
+    _cache = TTLCache('dbnomics', max_entries=256, ttl=1800)
+
+    cached = _cache.get(key)
+    if cached is None:
+        cached = fetch(...)
+        _cache.set(key, cached)
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+# Every TTLCache registers itself here so stats can be reported together
+_registry: dict = {}
+_registry_lock = threading.Lock()
+
+
+def approx_size(value: Any, _depth: int = 0) -> int:
+    """
+    Rough payload size in bytes for byte-limited caches.
+
+    Follows lists, tuples, sets and dicts a few levels deep and uses
+    .nbytes for NumPy arrays. Good enough to keep memory flat - not exact.
+    """
+    nbytes = getattr(value, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return nbytes
+    size = sys.getsizeof(value)
+    if _depth >= 3:
+        return size
+    if isinstance(value, dict):
+        size += sum(approx_size(k, _depth + 1) + approx_size(v, _depth + 1) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(approx_size(v, _depth + 1) for v in value)
+    return size
+
+
+class TTLCache:
+    """Thread-safe LRU cache with per-entry expiry and optional byte budget."""
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 1024,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = approx_size,
+    ):
+        """
+        Args:
+            name: Label used in stats and the registry
+            max_entries: Entry limit; least recently used entries are evicted
+            ttl: Default time-to-live in seconds (None = never expires)
+            max_bytes: Optional limit on the summed sizeof() of cached values
+            sizeof: Size estimator used when max_bytes is set
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+
+        # key -> (value, expires_at or None, size)
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        with _registry_lock:
+            _registry[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value (marking it recently used), or default."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, expires_at, _ = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value. `ttl` overrides the cache default for this entry."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, expires_at, size)
+            self._bytes += size
+            while self._data and (
+                len(self._data) > self.max_entries
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        """True if key is cached and unexpired (doesn't count as a hit)."""
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and (entry[1] is None or time.monotonic() < entry[1])
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove and return a cached value."""
+        with self._lock:
+            if key not in self._data:
+                return default
+            value = self._data[key][0]
+            self._remove(key)
+            return value
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry now. Returns the number removed."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [k for k, (_, exp, _) in self._data.items() if exp is not None and now >= exp]
+            for key in expired:
+                self._remove(key)
+            self.expirations += len(expired)
+            return len(expired)
+
+    def stats(self) -> dict:
+        """Counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'name': self.name,
+                'entries': len(self._data),
+                'bytes': self._bytes if self.max_bytes is not None else None,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else None,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        """Delete an entry and release its bytes. Caller holds the lock."""
+        _, _, size = self._data.pop(key)
+        self._bytes -= size
+
+
+def all_cache_stats() -> list:
+    """Stats for every TTLCache created in this process."""
+    with _registry_lock:
+        caches = list(_registry.values())
+    return [cache.stats() for cache in caches]
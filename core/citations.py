@@ -61,6 +61,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 
+from .query_classifier import KeywordMatcher
+
 
 # =============================================================================
 # DATA STRUCTURES
@@ -894,6 +896,15 @@ NO_CITATION_KEYWORDS = [
     'the data shows', 'according to BLS', 'according to BEA',
 ]
 
+# Claim types that need citation, in priority order, matched in one scan
+_CLAIM_MATCHER = KeywordMatcher({
+    'forecast': FORECAST_KEYWORDS,
+    'opinion': OPINION_KEYWORDS,
+    'probability': PROBABILITY_KEYWORDS,
+    'comparison': COMPARISON_KEYWORDS,
+})
+_CLAIM_PRIORITY = ('forecast', 'opinion', 'probability', 'comparison')
+
 
 def should_cite(claim_type: str = '', claim_text: str = '') -> bool:
     """
@@ -930,32 +941,12 @@ def should_cite(claim_type: str = '', claim_text: str = '') -> bool:
         False
     """
     # Check claim type
-    claim_type_lower = claim_type.lower()
-    if any(keyword in claim_type_lower for keyword in FORECAST_KEYWORDS):
-        return True
-    if any(keyword in claim_type_lower for keyword in OPINION_KEYWORDS):
+    type_matches = _CLAIM_MATCHER.categorize(claim_type.lower())
+    if 'forecast' in type_matches or 'opinion' in type_matches:
         return True
 
-    # Check claim text
-    claim_text_lower = claim_text.lower()
-
-    # Check for forecast keywords
-    if any(keyword in claim_text_lower for keyword in FORECAST_KEYWORDS):
-        return True
-
-    # Check for opinion keywords
-    if any(keyword in claim_text_lower for keyword in OPINION_KEYWORDS):
-        return True
-
-    # Check for probability keywords
-    if any(keyword in claim_text_lower for keyword in PROBABILITY_KEYWORDS):
-        return True
-
-    # Check for comparison keywords
-    if any(keyword in claim_text_lower for keyword in COMPARISON_KEYWORDS):
-        return True
-
-    return False
+    # Check claim text for forecast, opinion, probability or comparison keywords
+    return bool(_CLAIM_MATCHER.categorize(claim_text.lower()))
 
 
 def detect_claim_type(text: str) -> str:
@@ -969,19 +960,10 @@ def detect_claim_type(text: str) -> str:
         Claim type string: 'forecast', 'opinion', 'probability',
         'comparison', or 'factual'
     """
-    text_lower = text.lower()
-
-    if any(keyword in text_lower for keyword in FORECAST_KEYWORDS):
-        return 'forecast'
-
-    if any(keyword in text_lower for keyword in OPINION_KEYWORDS):
-        return 'opinion'
-
-    if any(keyword in text_lower for keyword in PROBABILITY_KEYWORDS):
-        return 'probability'
-
-    if any(keyword in text_lower for keyword in COMPARISON_KEYWORDS):
-        return 'comparison'
+    matches = _CLAIM_MATCHER.categorize(text.lower())
+    for claim_type in _CLAIM_PRIORITY:
+        if claim_type in matches:
+            return claim_type
 
     return 'factual'
 
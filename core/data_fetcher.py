@@ -4,16 +4,18 @@ Unified Data Fetcher - Single interface for all data sources.
 Routes requests to FRED, DBnomics, or other sources based on series metadata.
 """
 
-import json
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
 from typing import Optional
-from urllib.request import urlopen, Request
 from urllib.error import HTTPError, URLError
 
+from .batch_fetch import fetch_batch
 from .series_catalog import SERIES_CATALOG, get_series_metadata
+from .cache import TTLCache
+from .singleflight import SingleFlight
+from .http_client import get_json
+from .observation_store import get_store, read_through
+from .timeseries import TimeSeries
 
 # FRED API configuration
 FRED_API_KEY = os.environ.get("FRED_API_KEY", "")
@@ -23,8 +25,9 @@ FRED_API_BASE = "https://api.stlouisfed.org/fred"
 DBNOMICS_API = "https://api.db.nomics.world/v22"
 
 # Cache for API responses
-_cache: dict = {}
-_cache_ttl = timedelta(minutes=30)
+_cache = TTLCache('core.data_fetcher', max_entries=256, ttl=1800)
+# Concurrent identical requests share one upstream call
+_flight = SingleFlight('core.data_fetcher')
 
 
 @dataclass
@@ -48,10 +51,25 @@ class SeriesData:
     measure_type: str = ""  # "real", "nominal", "rate", "index"
     change_type: str = ""  # "yoy", "qoq", "mom", "level"
 
+    # Parsed datetime64/float64 form, built on first use of .series
+    _series: Optional[TimeSeries] = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def is_empty(self) -> bool:
         return len(self.dates) == 0 or len(self.values) == 0
 
+    @property
+    def series(self) -> TimeSeries:
+        """Observations as a TimeSeries (parsed once; cached SeriesData keep it)."""
+        if self._series is None:
+            self._series = TimeSeries.from_lists(self.dates, self.values, self.id)
+        return self._series
+
+    def window(self, start: str = None, end: str = None, years: int = None) -> TimeSeries:
+        """A date window of the observations as a TimeSeries view (no copy)."""
+        series = self.series.last_years(years) if years else self.series
+        return series.window(start, end)
+
     @property
     def latest_date(self) -> Optional[str]:
         return self.dates[-1] if self.dates else None
@@ -63,22 +81,80 @@ class SeriesData:
 
 def _get_cached(key: str) -> Optional[dict]:
     """Get cached result if still valid."""
-    if key in _cache:
-        data, timestamp = _cache[key]
-        if datetime.now() - timestamp < _cache_ttl:
-            return data
-    return None
+    return _cache.get(key)
 
 
 def _set_cache(key: str, data: dict) -> None:
-    """Cache result with timestamp."""
-    _cache[key] = (data, datetime.now())
+    """Cache result (expires after the cache TTL)."""
+    _cache.set(key, data)
+
+
+def _fetch_fred_info(series_id: str) -> dict:
+    """Fetch FRED series info (title, units, notes, last_updated). {} on failure."""
+    info_url = f"{FRED_API_BASE}/series?series_id={series_id}&api_key={FRED_API_KEY}&file_type=json"
+    try:
+        info_data = get_json(info_url, headers={"Accept": "application/json"}, timeout=10)
+    except Exception:
+        return {}
+    return info_data.get("seriess", [{}])[0] if info_data else {}
+
+
+def _fetch_fred_observations(series_id: str, start: str = None) -> tuple:
+    """
+    Fetch FRED observations from `start` (full history if None).
+
+    Returns:
+        (dates, values, info) tuple; on failure info carries an "error" message
+    """
+    obs_url = f"{FRED_API_BASE}/series/observations?series_id={series_id}&api_key={FRED_API_KEY}&file_type=json"
+    if start:
+        obs_url += f"&observation_start={start}"
+
+    try:
+        obs_data = get_json(obs_url, headers={"Accept": "application/json"}, timeout=15)
+    except HTTPError as e:
+        return [], [], {"error": f"FRED API error: {e.code}"}
+    except Exception as e:
+        return [], [], {"error": str(e)}
+
+    dates = []
+    values = []
+    for obs in obs_data.get("observations", []):
+        try:
+            val = float(obs["value"])
+            dates.append(obs["date"])
+            values.append(val)
+        except (ValueError, KeyError):
+            continue
+
+    return dates, values, {}
+
+
+def _download_fred_history(series_id: str) -> tuple:
+    """
+    Download the full observation history and series info for a FRED series.
+
+    Returns:
+        (dates, values, info) tuple; on failure dates is empty and
+        info carries an "error" message
+    """
+    series_info = _fetch_fred_info(series_id)
+    dates, values, obs_info = _fetch_fred_observations(series_id)
+    if "error" in obs_info:
+        return [], [], obs_info
+    if not dates:
+        return [], [], {"error": "No observations returned from FRED"}
+    return dates, values, series_info
 
 
 def _fetch_fred(series_id: str, years: int = None) -> SeriesData:
     """
     Fetch data from FRED API.
 
+    Reads through the shared observation store, so repeated calls (from any
+    worker, for any `years` window) are served from one stored full history.
+    Stale series are topped up incrementally rather than re-downloaded.
+
     Args:
         series_id: FRED series ID (e.g., "UNRATE", "GDPC1")
         years: Optional limit to last N years of data
@@ -96,77 +172,46 @@ def _fetch_fred(series_id: str, years: int = None) -> SeriesData:
             error="FRED_API_KEY not set",
         )
 
-    # Build cache key
-    start_date = None
-    if years:
-        start_date = (datetime.now() - timedelta(days=years * 365)).strftime("%Y-%m-%d")
-    cache_key = f"fred_{series_id}_{start_date}"
-
-    # Check cache
-    cached = _get_cached(cache_key)
-    if cached and "observations" in cached:
-        return _parse_fred_response(series_id, cached)
-
-    # Fetch series info
-    info_url = f"{FRED_API_BASE}/series?series_id={series_id}&api_key={FRED_API_KEY}&file_type=json"
-    try:
-        req = Request(info_url, headers={"Accept": "application/json"})
-        with urlopen(req, timeout=10) as resp:
-            info_data = json.loads(resp.read())
-    except Exception as e:
-        info_data = {}
-
-    # Fetch observations
-    obs_url = f"{FRED_API_BASE}/series/observations?series_id={series_id}&api_key={FRED_API_KEY}&file_type=json"
-    if start_date:
-        obs_url += f"&observation_start={start_date}"
-
-    try:
-        req = Request(obs_url, headers={"Accept": "application/json"})
-        with urlopen(req, timeout=15) as resp:
-            obs_data = json.loads(resp.read())
-
-        # Merge info and observations for caching
-        obs_data["series_info"] = info_data.get("seriess", [{}])[0] if info_data else {}
-        _set_cache(cache_key, obs_data)
-
-        return _parse_fred_response(series_id, obs_data)
+    dates, values, series_info = read_through(
+        series_id,
+        lambda: _download_fred_history(series_id),
+        years=years,
+        fetch_info=lambda: _fetch_fred_info(series_id),
+        fetch_since=lambda since: _fetch_fred_observations(series_id, since),
+    )
 
-    except HTTPError as e:
-        return SeriesData(
-            id=series_id,
-            name=series_id,
-            dates=[],
-            values=[],
-            source="fred",
-            error=f"FRED API error: {e.code}",
-        )
-    except Exception as e:
+    if not dates:
         return SeriesData(
             id=series_id,
             name=series_id,
             dates=[],
             values=[],
             source="fred",
-            error=str(e),
+            error=series_info.get("error", "No data returned from FRED"),
         )
 
+    return _build_fred_series(series_id, dates, values, series_info)
 
-def _parse_fred_response(series_id: str, data: dict) -> SeriesData:
-    """Parse FRED API response into SeriesData."""
-    observations = data.get("observations", [])
-    series_info = data.get("series_info", {})
 
-    dates = []
-    values = []
-    for obs in observations:
-        try:
-            val = float(obs["value"])
-            dates.append(obs["date"])
-            values.append(val)
-        except (ValueError, KeyError):
-            continue
+def refresh_fred_series(series_id: str) -> Optional[str]:
+    """
+    Refresh a FRED series in the observation store now (incrementally).
 
+    Returns:
+        The series' `last_updated` stamp after the refresh, or None
+    """
+    if not FRED_API_KEY:
+        return None
+    return get_store().refresh(
+        series_id,
+        lambda: _download_fred_history(series_id),
+        fetch_info=lambda: _fetch_fred_info(series_id),
+        fetch_since=lambda since: _fetch_fred_observations(series_id, since),
+    )
+
+
+def _build_fred_series(series_id: str, dates: list, values: list, series_info: dict) -> SeriesData:
+    """Build SeriesData from FRED observations and series info."""
     # Get metadata from catalog if available
     meta = get_series_metadata(series_id)
 
@@ -226,9 +271,7 @@ def _fetch_dbnomics(series_key: str, dbnomics_id: str = None) -> SeriesData:
 
     try:
         url = f"{DBNOMICS_API}/series/{actual_id}?observations=1"
-        req = Request(url, headers={"Accept": "application/json"})
-        with urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read())
+        data = _flight.do(url, get_json, url, headers={"Accept": "application/json"}, timeout=10)
 
         docs = data.get("series", {}).get("docs", [])
         if not docs:
@@ -340,41 +383,36 @@ class DataFetcher:
         return _fetch_fred(series_id, years or self.default_years)
 
     def fetch_multiple(
-        self, series_ids: list[str], years: int = None, max_workers: int = 5
+        self, series_ids: list[str], years: int = None, max_workers: int = None
     ) -> dict[str, SeriesData]:
         """
-        Fetch multiple series in parallel.
+        Fetch multiple series in one round (see core.batch_fetch).
+
+        Duplicates are fetched once, stored series are served without a
+        request, and the rest start together under the shared FRED budget.
 
         Args:
             series_ids: List of series IDs to fetch
             years: Optional limit to last N years
-            max_workers: Maximum concurrent fetches
+            max_workers: Ignored; concurrency is set by core.batch_fetch and
+                core.http_client (kept for existing callers)
 
         Returns:
             Dict mapping series_id -> SeriesData
         """
-        results = {}
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(self.fetch, sid, years): sid for sid in series_ids
-            }
-
-            for future in as_completed(futures):
-                series_id = futures[future]
-                try:
-                    results[series_id] = future.result()
-                except Exception as e:
-                    results[series_id] = SeriesData(
-                        id=series_id,
-                        name=series_id,
-                        dates=[],
-                        values=[],
-                        source="unknown",
-                        error=str(e),
-                    )
-
-        return results
+        return fetch_batch(
+            series_ids,
+            lambda sid: self.fetch(sid, years),
+            on_error=lambda sid, e: SeriesData(
+                id=sid,
+                name=sid,
+                dates=[],
+                values=[],
+                source="unknown",
+                error=str(e),
+            ),
+            label="DataFetcher",
+        )
 
 
 # Convenience functions for backwards compatibility
@@ -38,6 +38,9 @@ Usage:
 
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
+from datetime import datetime
+
+from .series_stats import get_series_stats, stats_for
 
 
 # =============================================================================
@@ -783,7 +786,8 @@ def narrate_position_in_range(
     min_5yr: float,
     max_5yr: float,
     name: str,
-    unit: str = '%'
+    unit: str = '%',
+    percentile: Optional[float] = None,
 ) -> DataInsight:
     """
     Narrate where the current value sits within its 5-year historical range.
@@ -798,6 +802,10 @@ def narrate_position_in_range(
         max_5yr: Maximum value over past 5 years
         name: Human-readable name
         unit: Unit of measurement
+        percentile: Empirical percentile of value among the past 5 years'
+            readings (core.series_stats). Without it, the position between
+            min and max is used - which is not a percentile when the range
+            includes a spike.
 
     Returns:
         DataInsight describing position in range
@@ -816,8 +824,12 @@ def narrate_position_in_range(
             series_id=series_id,
         )
 
-    # Calculate percentile position
-    percentile = ((value - min_5yr) / (max_5yr - min_5yr)) * 100
+    # Empirical percentile if we have the readings, else position in range
+    if percentile is not None:
+        rank_label = f"{percentile:.0f}{_ordinal_suffix(percentile)} percentile"
+    else:
+        percentile = ((value - min_5yr) / (max_5yr - min_5yr)) * 100
+        rank_label = f"{percentile:.0f}% of the way up the range"
 
     # Format values
     if unit == '%':
@@ -835,22 +847,22 @@ def narrate_position_in_range(
 
     # Generate position description
     if percentile > 90:
-        position_desc = f"near the top of its 5-year range (in the {percentile:.0f}th percentile)"
+        position_desc = f"near the top of its 5-year range ({rank_label})"
         context = "at or near recent highs"
     elif percentile > 75:
-        position_desc = f"in the upper quartile of its 5-year range ({percentile:.0f}th percentile)"
+        position_desc = f"in the upper quartile of its 5-year range ({rank_label})"
         context = "elevated by recent standards"
     elif percentile > 50:
-        position_desc = f"above the midpoint of its 5-year range ({percentile:.0f}th percentile)"
+        position_desc = f"above the midpoint of its 5-year range ({rank_label})"
         context = "moderately elevated"
     elif percentile > 25:
-        position_desc = f"below the midpoint of its 5-year range ({percentile:.0f}th percentile)"
+        position_desc = f"below the midpoint of its 5-year range ({rank_label})"
         context = "moderate by recent standards"
     elif percentile > 10:
-        position_desc = f"in the lower quartile of its 5-year range ({percentile:.0f}th percentile)"
+        position_desc = f"in the lower quartile of its 5-year range ({rank_label})"
         context = "low by recent standards"
     else:
-        position_desc = f"near the bottom of its 5-year range ({percentile:.0f}th percentile)"
+        position_desc = f"near the bottom of its 5-year range ({rank_label})"
         context = "at or near recent lows"
 
     text = f"{name} at {value_str} is {position_desc}. The 5-year range spans {min_str} to {max_str}, making the current reading {context}."
@@ -864,13 +876,20 @@ def narrate_position_in_range(
             f"Current: {value_str}",
             f"5yr min: {min_str}",
             f"5yr max: {max_str}",
-            f"Percentile: {percentile:.0f}%",
+            f"5yr position: {rank_label}",
         ],
         series_id=series_id,
         category=_categorize_series(series_id),
     )
 
 
+def _ordinal_suffix(n: float) -> str:
+    n = int(round(n))
+    if 10 <= n % 100 <= 20:
+        return 'th'
+    return {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+
+
 def narrate_payroll_change(
     value: float,
     avg_3mo: Optional[float] = None,
@@ -1046,14 +1065,26 @@ def build_narrative(
             yoy_insight = narrate_yoy_change(series_id, latest, yoy_value, name, unit, is_payroll)
             insights.append(yoy_insight)
 
-        # Generate position-in-range insight if we have 5-year data
+        # Generate position-in-range insight if we have 5-year data - from
+        # the full stored history when these values are that series as-is
         min_5yr = data.get('min_5yr')
         max_5yr = data.get('max_5yr')
+        percentile_5yr = None
+        dates = data.get('dates')
+        if dates and len(dates) == len(values):
+            stats = stats_for(series_id, dates, values)
+            if stats is not None and stats.covers('5y'):
+                five_year = stats.window('5y')
+                percentile_5yr = five_year.percentile(latest)
+                if min_5yr is None:
+                    min_5yr, max_5yr = five_year.min, five_year.max
         if min_5yr is None and len(values) >= 60:
             min_5yr = min(values[-60:])
             max_5yr = max(values[-60:])
         if min_5yr is not None and max_5yr is not None:
-            range_insight = narrate_position_in_range(series_id, latest, min_5yr, max_5yr, name, unit)
+            range_insight = narrate_position_in_range(
+                series_id, latest, min_5yr, max_5yr, name, unit, percentile=percentile_5yr
+            )
             insights.append(range_insight)
 
     # Handle payroll special case
@@ -1245,13 +1276,34 @@ def get_historical_reference(series_id: str) -> Optional[Dict[str, Tuple[float,
     """
     Get historical reference points for a series.
 
+    Hand-entered points (HISTORICAL_CONTEXT) are combined with points read
+    from the stored history when it has been fetched: record_low/record_high
+    with their dates, long_term_avg, and the 5-year low/high. Data-derived
+    points replace hand-entered ones of the same name.
+
     Args:
         series_id: The FRED series ID
 
     Returns:
         Dictionary of reference points or None
     """
-    return HISTORICAL_CONTEXT.get(series_id)
+    references = dict(HISTORICAL_CONTEXT.get(series_id, {}))
+    stats = get_series_stats(series_id)
+    if stats is not None:
+        history = stats.window('all')
+        references['record_low'] = (round(history.min, 2), _month_year(history.min_date))
+        references['record_high'] = (round(history.max, 2), _month_year(history.max_date))
+        references['long_term_avg'] = (round(history.mean, 2), f"{history.start[:4]}-present")
+        if stats.covers('5y'):
+            five_year = stats.window('5y')
+            references['five_year_low'] = (round(five_year.min, 2), _month_year(five_year.min_date))
+            references['five_year_high'] = (round(five_year.max, 2), _month_year(five_year.max_date))
+    return references or None
+
+
+def _month_year(date: str) -> str:
+    """'2020-04-01' -> 'April 2020'."""
+    return datetime.strptime(date[:10], '%Y-%m-%d').strftime('%B %Y')
 
 
 # =============================================================================
@@ -21,6 +21,8 @@ import re
 from typing import Optional
 from urllib.request import urlopen, Request
 
+from .query_classifier import KeywordMatcher
+
 # API Keys - check both GEMINI_API_KEY and GOOGLE_API_KEY for compatibility
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "") or os.environ.get("GOOGLE_API_KEY", "")
 
@@ -270,6 +272,22 @@ DIRECT_SERIES_MAPPINGS = {
 }
 
 
+_WORD_BOUNDARY = re.compile(r'\b')
+_direct_matcher = None
+_direct_key_rank = {}
+
+
+def _direct_mapping_matcher() -> KeywordMatcher:
+    """All DIRECT_SERIES_MAPPINGS keys in one matcher, built on first use."""
+    global _direct_matcher, _direct_key_rank
+    if _direct_matcher is None:
+        # Longest first; equal lengths keep table order
+        ranked = sorted(DIRECT_SERIES_MAPPINGS.keys(), key=len, reverse=True)
+        _direct_key_rank = {key: i for i, key in enumerate(ranked)}
+        _direct_matcher = KeywordMatcher({'direct': ranked})
+    return _direct_matcher
+
+
 def check_direct_mapping(query: str) -> Optional[list]:
     """
     Check if query is asking for specific data that has a direct answer.
@@ -302,16 +320,17 @@ def check_direct_mapping(query: str) -> Optional[list]:
         return DIRECT_SERIES_MAPPINGS[query_lower]
 
     # Check if query contains any direct mapping key
-    # CRITICAL: Sort by length (longest first) so more specific matches win
+    # CRITICAL: Longest key wins so more specific matches win
     # e.g., "rent inflation" should match before "inflation"
-    sorted_keys = sorted(DIRECT_SERIES_MAPPINGS.keys(), key=len, reverse=True)
-    for key in sorted_keys:
+    best_key = None
+    for start, key in _direct_mapping_matcher().find(query_lower):
         # Use word boundary matching to avoid partial matches
-        pattern = r'\b' + re.escape(key) + r'\b'
-        if re.search(pattern, query_lower):
-            return DIRECT_SERIES_MAPPINGS[key]
+        if not (_WORD_BOUNDARY.match(query_lower, start) and _WORD_BOUNDARY.match(query_lower, start + len(key))):
+            continue
+        if best_key is None or _direct_key_rank[key] < _direct_key_rank[best_key]:
+            best_key = key
 
-    return None
+    return DIRECT_SERIES_MAPPINGS[best_key] if best_key is not None else None
 
 REASONING_PROMPT = """You are a credible economic analyst (think Jason Furman, Claudia Sahm, or a Fed economist).
 
@@ -0,0 +1,236 @@
+"""
+Enrichment fan-out - optional /search extras with per-provider deadlines.
+
+The data boxes around an answer (Fed SEP guidance, recession scorecard,
+Shiller CAPE, Polymarket odds) and the judgment-layer synthesis are nice to
+have, never required. They used to be awaited to completion, so one slow
+upstream (Polymarket, a cold Shiller download) set the latency of the whole
+page. Here every provider starts at once and gets its own deadline,
+measured from when the run started:
+
+- Finished in time: shown as usual.
+- Missed the deadline: dropped from this response. Sync providers run in a
+  worker thread that can't be interrupted, so they are left to finish in
+  the background and their result is kept for DEFERRED_TTL seconds - the
+  next request for the same query gets it instantly (deferred, not lost).
+  Coroutine providers are cancelled.
+- Raised: logged and treated as "nothing to show".
+
+Usage:
+    from core.enrichment import EnrichmentScheduler, Provider
+
+    scheduler = EnrichmentScheduler([
+        Provider('cape', build_cape_html, deadline=2.0),
+        Provider('recession', build_recession_html, deadline=3.0),
+    ])
+
+    run = scheduler.start(query)
+    ...                                  # build the main answer meanwhile
+    boxes = await run.collect()          # {'cape': html or None, ...}
+
+    # A single optional step inside the main pipeline
+    text = await call_with_deadline(Provider('judgment', judge, deadline=8.0), query)
+
+    # Streaming: yield boxes as they land (late ones up to `grace` later)
+    async for name, html in run.as_completed(grace=5.0):
+        ...
+
+    run.cancel()                         # client went away
+"""
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Optional
+
+from .cache import TTLCache
+
+# How long a provider result that missed its deadline is kept for the next
+# identical query
+DEFERRED_TTL = 300
+
+_deferred = TTLCache('enrichment.deferred', max_entries=256, ttl=DEFERRED_TTL)
+
+
+@dataclass
+class Provider:
+    """One optional enrichment: fn(*args) -> result (sync or async), allowed `deadline` seconds."""
+    name: str
+    fn: Callable[..., Any]
+    deadline: float
+
+    @property
+    def is_async(self) -> bool:
+        return inspect.iscoroutinefunction(self.fn)
+
+
+class ProviderStats:
+    """Outcome counters and latency for one provider (see get_enrichment_stats())."""
+
+    __slots__ = ('ok', 'late', 'errors', 'deferred_hits', 'total_seconds', 'max_seconds')
+
+    def __init__(self):
+        self.ok = 0
+        self.late = 0
+        self.errors = 0
+        self.deferred_hits = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def as_dict(self) -> dict:
+        finished = self.ok + self.errors
+        return {
+            'ok': self.ok,
+            'late': self.late,
+            'errors': self.errors,
+            'deferred_hits': self.deferred_hits,
+            'avg_ms': round(self.total_seconds / finished * 1000, 1) if finished else None,
+            'max_ms': round(self.max_seconds * 1000, 1),
+        }
+
+
+_stats: dict = {}
+
+
+def _stats_for(name: str) -> ProviderStats:
+    stats = _stats.get(name)
+    if stats is None:
+        stats = _stats[name] = ProviderStats()
+    return stats
+
+
+def get_enrichment_stats() -> dict:
+    """Per-provider counters: {name: {ok, late, errors, deferred_hits, avg_ms, max_ms}}."""
+    return {name: stats.as_dict() for name, stats in _stats.items()}
+
+
+class EnrichmentRun:
+    """The providers started for one request."""
+
+    def __init__(self, providers: list, args: tuple, key: str):
+        self.started = time.monotonic()
+        self._providers = {p.name: p for p in providers}
+        self._key = key
+        self._results: dict = {}
+        self.tasks: dict = {}
+        for provider in providers:
+            cached = _deferred.get((provider.name, key))
+            if cached is not None:
+                _deferred.pop((provider.name, key))
+                _stats_for(provider.name).deferred_hits += 1
+                self._results[provider.name] = cached
+                continue
+            self.tasks[provider.name] = asyncio.ensure_future(self._run(provider, args))
+
+    async def _run(self, provider: Provider, args: tuple) -> Any:
+        """Run one provider, recording its latency and outcome."""
+        stats = _stats_for(provider.name)
+        begin = time.monotonic()
+        try:
+            if provider.is_async:
+                result = await provider.fn(*args)
+            else:
+                result = await asyncio.to_thread(provider.fn, *args)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            stats.errors += 1
+            stats.record(time.monotonic() - begin)
+            print(f"[Enrichment] {provider.name} failed: {e}")
+            return None
+        stats.ok += 1
+        stats.record(time.monotonic() - begin)
+        return result
+
+    def _remaining(self, name: str, grace: float = 0.0) -> float:
+        deadline = self.started + self._providers[name].deadline + grace
+        return max(deadline - time.monotonic(), 0.0)
+
+    def _give_up(self, name: str) -> None:
+        """Drop a provider that missed its deadline (keeping a thread result for later)."""
+        task = self.tasks.pop(name)
+        _stats_for(name).late += 1
+        print(f"[Enrichment] {name} missed its {self._providers[name].deadline:.1f}s deadline")
+        if self._providers[name].is_async:
+            task.cancel()
+            return
+        key = (name, self._key)
+
+        def keep(done: asyncio.Task) -> None:
+            if not done.cancelled() and done.exception() is None and done.result() is not None:
+                _deferred.set(key, done.result())
+
+        task.add_done_callback(keep)
+
+    def _take(self, name: str) -> Any:
+        """Result of a finished task (None if it failed)."""
+        task = self.tasks.pop(name)
+        result = task.result() if not task.cancelled() else None
+        self._results[name] = result
+        return result
+
+    async def collect(self) -> dict:
+        """Wait for each provider up to its deadline; {name: result or None} for all providers."""
+        for name in list(self.tasks):
+            task = self.tasks[name]
+            if not task.done():
+                await asyncio.wait({task}, timeout=self._remaining(name))
+            if task.done():
+                self._take(name)
+            else:
+                self._give_up(name)
+                self._results[name] = None
+        return {name: self._results.get(name) for name in self._providers}
+
+    async def as_completed(self, grace: float = 0.0) -> AsyncIterator[tuple]:
+        """
+        Yield (name, result) as providers finish, including ones already done.
+
+        Providers get `grace` seconds past their deadline here, for callers
+        that can still show a late box (the streaming endpoint).
+        """
+        for name in list(self._results):
+            yield name, self._results[name]
+        while self.tasks:
+            by_task = {task: name for name, task in self.tasks.items()}
+            timeout = min(self._remaining(name, grace) for name in self.tasks)
+            done, _ = await asyncio.wait(by_task, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = by_task[task]
+                yield name, self._take(name)
+            for name in [n for n in self.tasks if self._remaining(n, grace) <= 0]:
+                self._give_up(name)
+
+    def cancel(self) -> None:
+        """Abandon everything still running (client disconnected, request failed)."""
+        for task in self.tasks.values():
+            task.cancel()
+        self.tasks.clear()
+
+
+class EnrichmentScheduler:
+    """A fixed set of providers started together for each request."""
+
+    def __init__(self, providers: list):
+        self.providers = list(providers)
+
+    def start(self, *args, key: Optional[str] = None) -> EnrichmentRun:
+        """
+        Start every provider with fn(*args). Must be called from a running event loop.
+
+        `key` identifies the request for deferred results (defaults to the
+        first argument, normally the query).
+        """
+        if key is None:
+            key = str(args[0]).lower().strip() if args else ''
+        return EnrichmentRun(self.providers, args, key)
+
+
+async def call_with_deadline(provider: Provider, *args, key: Optional[str] = None) -> Any:
+    """Run a single provider under its deadline (same drop/defer rules); None if it missed."""
+    return (await EnrichmentScheduler([provider]).start(*args, key=key).collect())[provider.name]
@@ -30,7 +30,8 @@ Usage:
 
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
-import re
+
+from .query_classifier import classify, register_keywords, register_patterns
 
 
 @dataclass
@@ -304,6 +305,29 @@ HEALTH_CHECK_ENTITIES: Dict[str, HealthCheckConfig] = {
 # DETECTION FUNCTIONS
 # =============================================================================
 
+HEALTH_CHECK_PATTERNS = [
+    r"^how (is|are) .+ doing\??$",
+    r"^how('s| is) .+ (looking|performing|faring)\??$",
+    r"^what about .+\??$",
+    r"^(state|status|health|condition) of .+",
+    r"^how (is|are) .+ (right now|today|currently|lately)\??$",
+    r"^is .+ (doing )?(good|bad|okay|well|poorly|healthy|struggling)\??$",
+    r"^are .+ (doing )?(good|bad|okay|well|poorly|healthy|struggling)\??$",
+    r".+ outlook\??$",
+    r"^how .+ (holding up|looking)\??$",
+    # Simple "how is/are X?" patterns - catch queries like "how is the economy?" or "how are consumers?"
+    r"^how (is|are) the .+\??$",
+    r"^how (is|are) .+\??$",  # Catch "how are consumers?" without "the"
+    r"^how('s| is) .+\??$",
+]
+
+register_patterns('health_check', HEALTH_CHECK_PATTERNS)
+
+# One keyword category per entity, matched in the same scan
+for _entity_key, _config in HEALTH_CHECK_ENTITIES.items():
+    register_keywords(f'health_entity:{_entity_key}', _config.keywords)
+
+
 def is_health_check_query(query: str) -> bool:
     """
     Detect if a query is asking about the health/status of something.
@@ -321,29 +345,7 @@ def is_health_check_query(query: str) -> bool:
     Returns:
         True if this looks like a health check query
     """
-    query_lower = query.lower().strip()
-
-    health_check_patterns = [
-        r"^how (is|are) .+ doing\??$",
-        r"^how('s| is) .+ (looking|performing|faring)\??$",
-        r"^what about .+\??$",
-        r"^(state|status|health|condition) of .+",
-        r"^how (is|are) .+ (right now|today|currently|lately)\??$",
-        r"^is .+ (doing )?(good|bad|okay|well|poorly|healthy|struggling)\??$",
-        r"^are .+ (doing )?(good|bad|okay|well|poorly|healthy|struggling)\??$",
-        r".+ outlook\??$",
-        r"^how .+ (holding up|looking)\??$",
-        # Simple "how is/are X?" patterns - catch queries like "how is the economy?" or "how are consumers?"
-        r"^how (is|are) the .+\??$",
-        r"^how (is|are) .+\??$",  # Catch "how are consumers?" without "the"
-        r"^how('s| is) .+\??$",
-    ]
-
-    for pattern in health_check_patterns:
-        if re.search(pattern, query_lower):
-            return True
-
-    return False
+    return classify(query).has('health_check')
 
 
 def detect_health_check_entity(query: str) -> Optional[str]:
@@ -356,18 +358,18 @@ def detect_health_check_entity(query: str) -> Optional[str]:
     Returns:
         Entity key (e.g., "megacap_firms", "labor_market") or None if not detected
     """
-    query_lower = query.lower()
+    result = classify(query)
 
     # Score each entity by keyword matches
     best_match = None
     best_score = 0
 
     for entity_key, config in HEALTH_CHECK_ENTITIES.items():
-        score = 0
-        for keyword in config.keywords:
-            if keyword in query_lower:
-                # Longer keywords get higher scores (more specific)
-                score += len(keyword.split())
+        matched = result.matched(f'health_entity:{entity_key}')
+        if not matched:
+            continue
+        # Longer keywords get higher scores (more specific)
+        score = sum(len(keyword.split()) for keyword in config.keywords if keyword in matched)
 
         if score > best_score:
             best_score = score
@@ -378,7 +380,7 @@ def detect_health_check_entity(query: str) -> Optional[str]:
         return best_match
 
     # Default to "economy" for generic health check queries
-    if is_health_check_query(query):
+    if result.has('health_check'):
         return "economy"
 
     return None
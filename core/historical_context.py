@@ -7,7 +7,9 @@ to something: pre-pandemic levels, long-term averages, past recessions.
 
 This module provides:
 1. Pre-computed benchmarks for key economic series (avoiding repeated API calls)
-2. Functions to generate historical context for any data point
+2. Functions to generate historical context for any data point - averages,
+   percentiles and extremes come from the series' stored history
+   (core.series_stats) when it has been fetched, from the benchmarks otherwise
 3. Prose generation for explaining what values mean historically
 4. Similar period matching to find when we've seen similar conditions
 
@@ -38,6 +40,8 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from .series_stats import SeriesStats, get_series_stats
+
 
 # =============================================================================
 # DATA CLASSES
@@ -1170,7 +1174,8 @@ def _estimate_percentile(
     Estimate percentile ranking based on benchmarks.
 
     This is a rough estimate based on known benchmarks, not actual
-    percentile calculation from historical data.
+    percentile calculation from historical data - used only when the
+    series' history isn't stored (see _apply_series_stats).
 
     Args:
         value: Current value
@@ -1178,7 +1183,7 @@ def _estimate_percentile(
         time_horizon: "5yr", "10yr", or "all"
 
     Returns:
-        Estimated percentile (0-100)
+        Estimated percentile (0-100): share of history below value
     """
     # Use appropriate average and extremes for the time horizon
     if time_horizon == "5yr" and benchmark.avg_5yr:
@@ -1201,26 +1206,56 @@ def _estimate_percentile(
     if low == high:
         return 50
 
-    # For series where lower is better (unemployment, inflation)
-    if not benchmark.higher_is_better:
-        # Invert the percentile
-        if value <= low:
-            return 99
-        elif value >= high:
-            return 1
-        else:
-            # Linear interpolation, inverted
-            pct = (high - value) / (high - low) * 100
-            return max(1, min(99, int(pct)))
+    if value >= high:
+        return 99
+    elif value <= low:
+        return 1
     else:
-        # Higher is better
-        if value >= high:
-            return 99
-        elif value <= low:
-            return 1
-        else:
-            pct = (value - low) / (high - low) * 100
-            return max(1, min(99, int(pct)))
+        pct = (value - low) / (high - low) * 100
+        return max(1, min(99, int(pct)))
+
+
+# Benchmarks stated in a transform of the stored series (see core.series_stats)
+STATS_SERIES = {
+    'PAYEMS': 'PAYEMS_CHANGE',  # monthly payroll change, not the level
+}
+
+
+def _month(date: str) -> str:
+    """'2020-04-01' -> '2020-04' (the benchmark date style)."""
+    return date[:7]
+
+
+def _apply_series_stats(context: HistoricalContext, stats: SeriesStats) -> HistoricalContext:
+    """
+    Replace benchmark estimates with statistics of the stored history.
+
+    Averages, percentiles and 5-year extremes come from the data. A
+    benchmark's all-time extreme is kept if it is more extreme than anything
+    in the stored history (which may start later).
+    """
+    value = context.current_value
+    five_year = stats.window('5y')
+    if five_year:
+        context.avg_5yr = five_year.mean
+        context.percentile_5yr = round(five_year.percentile(value))
+        context.min_5yr, context.min_date_5yr = five_year.min, _month(five_year.min_date)
+        context.max_5yr, context.max_date_5yr = five_year.max, _month(five_year.max_date)
+    ten_year = stats.window('10y')
+    if ten_year:
+        context.avg_10yr = ten_year.mean
+        context.percentile_10yr = round(ten_year.percentile(value))
+    long_run = stats.window('since_1970')
+    if long_run:
+        context.avg_since_1970 = long_run.mean
+    history = stats.window('all')
+    if history:
+        context.percentile_all = round(history.percentile(value))
+        if context.historical_low is None or history.min <= context.historical_low:
+            context.historical_low, context.historical_low_date = history.min, _month(history.min_date)
+        if context.historical_high is None or history.max >= context.historical_high:
+            context.historical_high, context.historical_high_date = history.max, _month(history.max_date)
+    return context
 
 
 # =============================================================================
@@ -1231,8 +1266,9 @@ def get_historical_context(series_id: str, current_value: float) -> HistoricalCo
     """
     Get comprehensive historical context for a current data point.
 
-    This function looks up pre-computed benchmarks and generates a
-    HistoricalContext object with comparisons to:
+    This function looks up pre-computed benchmarks and the series' stored
+    history (no API calls) and generates a HistoricalContext object with
+    comparisons to:
     - Pre-pandemic levels (Feb 2020)
     - 5-year, 10-year, and long-run averages
     - Percentile rankings
@@ -1251,15 +1287,17 @@ def get_historical_context(series_id: str, current_value: float) -> HistoricalCo
         >>> print(context.pre_pandemic_change)
         "up 0.6pp"
     """
-    # Look up benchmark
+    # Look up benchmark and stored history
     benchmark = HISTORICAL_BENCHMARKS.get(series_id)
+    stats = get_series_stats(STATS_SERIES.get(series_id, series_id))
 
     if not benchmark:
-        # Return minimal context if no benchmark found
-        return HistoricalContext(
+        # Return minimal context (data-derived only) if no benchmark found
+        context = HistoricalContext(
             current_value=current_value,
             series_id=series_id,
         )
+        return _apply_series_stats(context, stats) if stats else context
 
     # Build change description for pre-pandemic comparison
     pre_pandemic_change = None
@@ -1281,7 +1319,7 @@ def get_historical_context(series_id: str, current_value: float) -> HistoricalCo
     percentile_10yr = _estimate_percentile(current_value, benchmark, "10yr")
     percentile_all = _estimate_percentile(current_value, benchmark, "all")
 
-    return HistoricalContext(
+    context = HistoricalContext(
         current_value=current_value,
         series_id=series_id,
 
@@ -1311,6 +1349,15 @@ def get_historical_context(series_id: str, current_value: float) -> HistoricalCo
         similar_periods=similar_periods,
         threshold_zone=zone_name,
     )
+    return _apply_series_stats(context, stats) if stats else context
+
+
+def _ordinal(n: int) -> str:
+    """1 -> '1st', 22 -> '22nd', 13 -> '13th'."""
+    if 10 <= n % 100 <= 20:
+        return f"{n}th"
+    suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+    return f"{n}{suffix}"
 
 
 def describe_historical_context(context: HistoricalContext, series_name: str) -> str:
@@ -1403,11 +1450,11 @@ def describe_historical_context(context: HistoricalContext, series_name: str) ->
         pct = context.percentile_5yr
         if benchmark and not benchmark.higher_is_better:
             # For series where lower is better (unemployment, inflation)
-            if pct >= 75:
+            if pct <= 25:
                 interpretation = "very favorable relative to recent history"
-            elif pct >= 50:
+            elif pct <= 50:
                 interpretation = "better than the recent average"
-            elif pct >= 25:
+            elif pct <= 75:
                 interpretation = "somewhat elevated compared to recent years"
             else:
                 interpretation = "high compared to the past 5 years"
@@ -1423,7 +1470,7 @@ def describe_historical_context(context: HistoricalContext, series_name: str) ->
                 interpretation = "weak compared to the past 5 years"
 
         sentences.append(
-            f"At the {pct}th percentile of the past 5 years, "
+            f"At the {_ordinal(pct)} percentile of the past 5 years, "
             f"this is {interpretation}."
         )
 
@@ -0,0 +1,366 @@
+"""
+Shared HTTP client - one pooled, keep-alive connection layer for all data agents.
+
+Every data source (FRED, DBnomics, EIA, Alpha Vantage, Zillow, Polymarket,
+SerpAPI) goes through a single process-wide httpx.Client, so TLS handshakes
+to api.stlouisfed.org and friends are paid once per connection instead of
+once per request. HTTP/2 is used when the optional `h2` package is installed.
+
+Requests to hosts with a published rate limit (FRED: 120 requests/minute
+per key) also draw on a process-wide rate budget, so wide fetches queue
+briefly instead of tripping 429s. Retries count against it too.
+
+The helpers raise the same urllib exceptions the agents already handle
+(HTTPError with .code/.reason/.headers for bad status codes, URLError for
+network failures), so call sites keep their existing `except` clauses.
+
+Usage:
+    from core.http_client import get_json, get_text
+
+    data = get_json(url, params={'series_id': 'UNRATE'}, timeout=15)
+    csv_text = get_text(zillow_url)
+
+    # From async code (FastAPI request path)
+    data = await aget_json(url, params={'series_id': 'UNRATE'})
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from typing import Optional
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+
+import httpx
+
+USER_AGENT = 'EconStats/1.0'
+
+# Consistent defaults across agents (individual calls may override timeout)
+DEFAULT_TIMEOUT = 30
+DEFAULT_RETRIES = 2
+RETRY_BACKOFF_SECONDS = 0.5
+
+# Pool sizing for the shared client
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+KEEPALIVE_EXPIRY_SECONDS = 60
+
+# Max in-flight requests per host. FRED allows 120 requests/minute per key,
+# Alpha Vantage's free tier is far stricter, and Zillow CSVs are large.
+HOST_CONCURRENCY = {
+    'api.stlouisfed.org': 8,
+    'api.db.nomics.world': 4,
+    'api.eia.gov': 4,
+    'www.alphavantage.co': 2,
+    'files.zillowstatic.com': 2,
+    'gamma-api.polymarket.com': 4,
+    'serpapi.com': 4,
+}
+DEFAULT_HOST_CONCURRENCY = 6
+
+# Request-rate budgets: host -> (requests per second, burst). FRED allows
+# 120 requests/minute per key; a 30-request burst plus 60 s of refill at
+# 1.5/s stays under it in any one-minute window.
+HOST_RATE_LIMITS = {
+    'api.stlouisfed.org': (1.5, 30),
+}
+
+# Status codes worth retrying (transient server-side failures)
+RETRY_STATUS_CODES = {502, 503, 504}
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+_host_slots: dict = {}
+_host_slots_lock = threading.Lock()
+_rate_budgets: dict = {}
+
+# Async counterparts, one set per event loop: an httpx.AsyncClient and an
+# asyncio.Semaphore are bound to the loop they were first used on. Entries go
+# away with their loop.
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()      # loop -> AsyncClient
+_async_host_slots: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()   # loop -> {host: Semaphore}
+_async_lock = threading.Lock()
+
+
+def get_client() -> httpx.Client:
+    """Return the process-wide pooled client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(**_client_kwargs())
+    return _client
+
+
+def close_client() -> None:
+    """Close the shared client (e.g. on app shutdown)."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def _client_kwargs() -> dict:
+    """Shared configuration for the sync and async clients."""
+    return dict(
+        http2=HTTP2_AVAILABLE,
+        timeout=DEFAULT_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        headers={'User-Agent': USER_AGENT},
+        follow_redirects=True,
+    )
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the pooled async client for the running event loop (must be called from it)."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        with _async_lock:
+            client = _async_clients.get(loop)
+            if client is None:
+                client = httpx.AsyncClient(**_client_kwargs())
+                _async_clients[loop] = client
+    return client
+
+
+async def close_async_client() -> None:
+    """Close the running event loop's async client (e.g. on app shutdown)."""
+    loop = asyncio.get_running_loop()
+    with _async_lock:
+        client = _async_clients.pop(loop, None)
+        _async_host_slots.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    """Per-host semaphore limiting concurrent requests to one upstream."""
+    host = urlsplit(url).hostname or ''
+    slot = _host_slots.get(host)
+    if slot is None:
+        with _host_slots_lock:
+            slot = _host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY))
+                _host_slots[host] = slot
+    return slot
+
+
+def _async_host_slot(url: str) -> asyncio.Semaphore:
+    """Per-host semaphore for the running loop's async client (same limits as the sync one)."""
+    host = urlsplit(url).hostname or ''
+    loop = asyncio.get_running_loop()
+    with _async_lock:
+        slots = _async_host_slots.setdefault(loop, {})
+        slot = slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY))
+            slots[host] = slot
+    return slot
+
+
+class RateBudget:
+    """
+    Token bucket shared by every thread and event loop in the process.
+
+    reserve() takes a token and returns how long the caller must wait before
+    sending: 0 while the burst lasts, then 1/rate per request queued ahead.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.delayed = 0
+        self.waited_seconds = 0.0
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            self.requests += 1
+            if self._tokens >= 0:
+                return 0.0
+            wait = -self._tokens / self.rate
+            self.delayed += 1
+            self.waited_seconds += wait
+            return wait
+
+    def stats(self) -> dict:
+        return {
+            'rate_per_second': self.rate,
+            'burst': self.burst,
+            'requests': self.requests,
+            'delayed': self.delayed,
+            'waited_seconds': round(self.waited_seconds, 2),
+        }
+
+
+def _rate_budget(url: str) -> Optional[RateBudget]:
+    """The host's RateBudget, or None if it has no rate limit."""
+    host = urlsplit(url).hostname or ''
+    budget = _rate_budgets.get(host)
+    if budget is None and host in HOST_RATE_LIMITS:
+        with _host_slots_lock:
+            budget = _rate_budgets.get(host)
+            if budget is None:
+                budget = RateBudget(*HOST_RATE_LIMITS[host])
+                _rate_budgets[host] = budget
+    return budget
+
+
+def get_rate_budget_stats() -> dict:
+    """{host: counters} for every rate-limited host used so far."""
+    return {host: budget.stats() for host, budget in list(_rate_budgets.items())}
+
+
+def _check_status(response: httpx.Response) -> httpx.Response:
+    """Raise urllib's HTTPError for error statuses so agents' handlers keep working."""
+    if response.status_code >= 400:
+        raise HTTPError(str(response.url), response.status_code,
+                        response.reason_phrase, response.headers, None)
+    return response
+
+
+def request(
+    method: str,
+    url: str,
+    params: dict = None,
+    headers: dict = None,
+    json: dict = None,
+    data: bytes = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+) -> httpx.Response:
+    """
+    Send a request through the shared pooled client.
+
+    Connection errors, timeouts and 502/503/504 responses are retried with
+    exponential backoff. Other error statuses are not retried. Rate-limited
+    hosts wait for their budget (HOST_RATE_LIMITS) before each attempt.
+
+    Raises:
+        HTTPError: For responses with status >= 400 (after retries)
+        URLError: For network failures (after retries)
+    """
+    client = get_client()
+    budget = _rate_budget(url)
+    last_error = None
+
+    with _host_slot(url):
+        for attempt in range(retries + 1):
+            if attempt:
+                time.sleep(RETRY_BACKOFF_SECONDS * (2 ** (attempt - 1)))
+            if budget is not None:
+                wait = budget.reserve()
+                if wait:
+                    time.sleep(wait)
+            try:
+                response = client.request(
+                    method, url, params=params, headers=headers,
+                    json=json, content=data, timeout=timeout,
+                )
+            except httpx.TransportError as e:
+                last_error = URLError(e)
+                continue
+
+            if response.status_code in RETRY_STATUS_CODES and attempt < retries:
+                continue
+            return _check_status(response)
+
+    raise last_error
+
+
+async def arequest(
+    method: str,
+    url: str,
+    params: dict = None,
+    headers: dict = None,
+    json: dict = None,
+    data: bytes = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = DEFAULT_RETRIES,
+) -> httpx.Response:
+    """Async version of request() using the pooled AsyncClient. Same retry and error semantics."""
+    client = get_async_client()
+    budget = _rate_budget(url)
+    last_error = None
+
+    async with _async_host_slot(url):
+        for attempt in range(retries + 1):
+            if attempt:
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS * (2 ** (attempt - 1)))
+            if budget is not None:
+                wait = budget.reserve()
+                if wait:
+                    await asyncio.sleep(wait)
+            try:
+                response = await client.request(
+                    method, url, params=params, headers=headers,
+                    json=json, content=data, timeout=timeout,
+                )
+            except httpx.TransportError as e:
+                last_error = URLError(e)
+                continue
+
+            if response.status_code in RETRY_STATUS_CODES and attempt < retries:
+                continue
+            return _check_status(response)
+
+    raise last_error
+
+
+def get(url: str, params: dict = None, headers: dict = None,
+        timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES) -> httpx.Response:
+    """GET through the shared client. See request()."""
+    return request('GET', url, params=params, headers=headers, timeout=timeout, retries=retries)
+
+
+def get_json(url: str, params: dict = None, headers: dict = None,
+             timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES):
+    """GET and decode a JSON body. Raises json.JSONDecodeError on invalid JSON."""
+    return get(url, params=params, headers=headers, timeout=timeout, retries=retries).json()
+
+
+def get_text(url: str, params: dict = None, headers: dict = None,
+             timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES) -> str:
+    """GET and return the decoded text body."""
+    return get(url, params=params, headers=headers, timeout=timeout, retries=retries).text
+
+
+def post_json(url: str, payload: dict, headers: dict = None,
+              timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES):
+    """POST a JSON payload and decode the JSON response."""
+    return request('POST', url, json=payload, headers=headers, timeout=timeout, retries=retries).json()
+
+
+async def aget_json(url: str, params: dict = None, headers: dict = None,
+                    timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES):
+    """Async GET and decode a JSON body."""
+    response = await arequest('GET', url, params=params, headers=headers, timeout=timeout, retries=retries)
+    return response.json()
+
+
+async def aget_text(url: str, params: dict = None, headers: dict = None,
+                    timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES) -> str:
+    """Async GET and return the decoded text body."""
+    response = await arequest('GET', url, params=params, headers=headers, timeout=timeout, retries=retries)
+    return response.text
@@ -0,0 +1,383 @@
+"""
+LLM result cache - narrative and understanding calls reused across paraphrases and restarts.
+
+The judgment synthesis, query understanding, ensemble description and the
+economist reviewer each take seconds of Claude/Gemini time, and used to be
+cached in-process on the exact query string (or not at all). "Is
+unemployment high?" and "is the unemployment rate high" then both pay full
+latency, as does every query after a restart.
+
+A result is stored under three things:
+
+- a template id: which prompt produced it, plus a hash of any other prompt
+  input that changes the answer (template_id('reviewer', original_text));
+- a data fingerprint: each series' id, latest date and latest value
+  (data_fingerprint(series_data)). A new release or revision changes it,
+  so results written before never match again - invalidation is automatic,
+  and the stale row is replaced on the next put();
+- the normalized query (lowercase, collapsed whitespace, no trailing "?").
+
+get() tries the exact normalized query first. On a miss it compares the
+query's embedding (agents.series_rag.get_embedding) with the other queries
+stored under the same template and fingerprint, and serves the closest one
+if it is at least `similarity` cosine-similar and mentions the same numbers
+(years, percentages). The embedding is only computed when there is such a
+candidate, and never without an embedding API key. Candidates stored without
+an embedding are embedded in the same request as the query (at most
+MAX_BACKFILL per lookup), and a miss keeps its query's vector so the put()
+that follows stores it - a lookup costs one embeddings round trip at most.
+
+Results persist in SQLite next to the observation store (shared by every
+worker, kept across restarts), with a small in-memory copy in front; any
+SQLite failure degrades to "not cached".
+
+Usage:
+    from core.llm_cache import data_fingerprint, get_llm_cache, template_id
+
+    cache = get_llm_cache()
+    template = template_id('reviewer', original_explanation)
+    fingerprint = data_fingerprint(series_data)
+    text = cache.get(template, query, fingerprint)
+    if text is None:
+        text = call_llm(...)
+        cache.put(template, query, fingerprint, text)
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence
+
+from .cache import TTLCache
+
+LLM_CACHE_PATH = Path(os.environ.get(
+    "ECONSTATS_LLM_CACHE_PATH",
+    Path(__file__).parent.parent / "data" / "llm_cache.db",
+))
+
+# Results older than this are not served even if the data hasn't changed
+# (prompts, news context and web commentary move on). Callers can pass less.
+DEFAULT_MAX_AGE_SECONDS = 24 * 60 * 60
+
+# Cosine similarity above which two queries count as the same question
+SIMILARITY_THRESHOLD = 0.95
+
+# How many stored queries (most recent first) a near-duplicate lookup compares
+MAX_CANDIDATES = 50
+
+# Candidates without a stored embedding embedded per lookup, in the query's request
+MAX_BACKFILL = 16
+
+# How long a missed query's vector waits for the put() that stores the answer
+QUERY_VECTOR_TTL_SECONDS = 10 * 60
+
+# Rows kept in the database; the oldest are deleted past this
+MAX_ROWS = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_results (
+    template TEXT NOT NULL,
+    query TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    result TEXT NOT NULL,
+    embedding BLOB,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (template, query, fingerprint)
+);
+CREATE INDEX IF NOT EXISTS idx_llm_results_lookup ON llm_results(template, fingerprint, created_at DESC);
+"""
+
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase, collapse whitespace, drop trailing punctuation."""
+    return ' '.join(query.lower().split()).rstrip('?.! ')
+
+
+def template_id(name: str, *inputs: Any) -> str:
+    """A prompt template's id, qualified by a hash of other inputs its answer depends on."""
+    if not inputs:
+        return name
+    digest = hashlib.sha1(json.dumps(inputs, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    return f"{name}:{digest[:12]}"
+
+
+def data_fingerprint(series_data: Sequence) -> str:
+    """
+    "UNRATE@2025-09-01=4.3;PAYEMS@..." for the data an LLM call sees.
+
+    Accepts (series_id, dates, values, info) tuples or data-summary dicts with
+    series_id / latest_date / latest_value. Order is kept - prompts treat the
+    first series as the headline.
+    """
+    parts = []
+    for item in series_data:
+        if isinstance(item, dict):
+            sid, date, value = item.get('series_id'), item.get('latest_date'), item.get('latest_value')
+        else:
+            sid, dates, values = item[0], item[1], item[2]
+            date = dates[-1] if len(dates) else None
+            value = values[-1] if len(values) else None
+        if isinstance(value, float):
+            value = f"{value:.6g}"
+        parts.append(f"{sid}@{date}={value}")
+    return ';'.join(parts)
+
+
+def _default_embed(text: str) -> Optional[Sequence[float]]:
+    try:
+        from agents.series_rag import get_embedding
+    except ImportError:
+        return None
+    return get_embedding(text)
+
+
+def _default_embed_batch(texts: Sequence[str]) -> Optional[Sequence[Sequence[float]]]:
+    try:
+        from agents.series_rag import get_batch_embeddings
+    except ImportError:
+        return None
+    return get_batch_embeddings(list(texts))
+
+
+def _as_array(vector: Optional[Sequence[float]]) -> Optional[array]:
+    if vector is None or len(vector) == 0:
+        return None
+    return array('f', (float(x) for x in vector))
+
+
+def _cosine(a: Sequence[float], b: Sequence[float]) -> float:
+    if len(a) != len(b):
+        return 0.0
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class LLMCache:
+    """
+    SQLite-backed store of LLM results (see module docstring).
+
+    Like the response cache, connections are per-thread and the database
+    runs in WAL mode.
+    """
+
+    def __init__(self, path: Path = LLM_CACHE_PATH,
+                 embed: Callable[[str], Optional[Sequence[float]]] = _default_embed,
+                 embed_batch: Callable[[Sequence[str]], Optional[Sequence[Sequence[float]]]] = _default_embed_batch):
+        self.path = Path(path)
+        self._embed = embed
+        self._embed_batch = embed_batch
+        self._local = threading.local()
+        self._hits = 0
+        self._similar_hits = 0
+        self._misses = 0
+        self._puts = 0
+        # (template, query, fingerprint) -> (created_at, result)
+        self._memory = TTLCache("llm_cache.memory", max_entries=512)
+        # (template, query, fingerprint) -> query vector computed on a miss, for put()
+        self._query_vectors = TTLCache("llm_cache.query_vectors", max_entries=256,
+                                       ttl=QUERY_VECTOR_TTL_SECONDS)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def _embedding(self, text: str) -> Optional[array]:
+        try:
+            vector = self._embed(text)
+        except Exception as e:
+            print(f"[LLMCache] embedding error: {e}")
+            return None
+        return _as_array(vector)
+
+    def _embeddings(self, texts: list) -> list:
+        """Vectors for texts in one embeddings request; only texts[0] is retried alone on failure."""
+        if len(texts) == 1:
+            return [self._embedding(texts[0])]
+        try:
+            vectors = self._embed_batch(texts)
+        except Exception as e:
+            print(f"[LLMCache] batch embedding error: {e}")
+            vectors = None
+        if vectors is None or len(vectors) != len(texts):
+            return [self._embedding(texts[0])] + [None] * (len(texts) - 1)
+        return [_as_array(vector) for vector in vectors]
+
+    def get(self, template: str, query: str, fingerprint: str = '',
+            max_age: float = DEFAULT_MAX_AGE_SECONDS,
+            similarity: float = SIMILARITY_THRESHOLD) -> Any:
+        """The stored result for this query (or a near-duplicate of it), else None."""
+        norm = normalize_query(query)
+        cutoff = time.time() - max_age
+        key = (template, norm, fingerprint)
+
+        cached = self._memory.get(key)
+        if cached is None:
+            try:
+                row = self._connect().execute(
+                    "SELECT created_at, result FROM llm_results "
+                    "WHERE template = ? AND query = ? AND fingerprint = ?", key
+                ).fetchone()
+            except sqlite3.Error as e:
+                print(f"[LLMCache] read error for '{template}': {e}")
+                row = None
+            if row is not None:
+                cached = (row[0], json.loads(row[1]))
+                self._memory.set(key, cached)
+        if cached is not None and cached[0] >= cutoff:
+            self._hits += 1
+            return cached[1]
+
+        result = self._get_similar(template, norm, fingerprint, cutoff, similarity)
+        if result is None:
+            self._misses += 1
+        return result
+
+    def _get_similar(self, template: str, norm: str, fingerprint: str,
+                     cutoff: float, similarity: float) -> Any:
+        """Near-duplicate lookup: the most similar stored query under the same template and data."""
+        try:
+            conn = self._connect()
+            rows = conn.execute(
+                "SELECT query, result, embedding FROM llm_results "
+                "WHERE template = ? AND fingerprint = ? AND query != ? AND created_at >= ? "
+                "ORDER BY created_at DESC LIMIT ?",
+                (template, fingerprint, norm, cutoff, MAX_CANDIDATES),
+            ).fetchall()
+        except sqlite3.Error as e:
+            print(f"[LLMCache] read error for '{template}': {e}")
+            return None
+        numbers = _NUMBER_RE.findall(norm)
+        rows = [row for row in rows if _NUMBER_RE.findall(row[0]) == numbers]
+        if not rows:
+            return None
+
+        # Rows stored before an embedding was ever needed ride along in the query's request
+        missing = [row[0] for row in rows if not row[2]][:MAX_BACKFILL]
+        vectors = self._embeddings([norm] + missing)
+        query_vector = vectors[0]
+        if query_vector is None:
+            return None
+        backfill = {other: vector for other, vector in zip(missing, vectors[1:]) if vector is not None}
+        if backfill:
+            try:
+                with conn:
+                    conn.executemany(
+                        "UPDATE llm_results SET embedding = ? "
+                        "WHERE template = ? AND query = ? AND fingerprint = ?",
+                        [(vector.tobytes(), template, other, fingerprint)
+                         for other, vector in backfill.items()],
+                    )
+            except sqlite3.Error:
+                pass
+
+        best, best_score = None, similarity
+        for other, result, blob in rows:
+            if blob:
+                vector = array('f')
+                vector.frombytes(blob)
+            else:
+                vector = backfill.get(other)
+                if vector is None:
+                    continue
+            score = _cosine(query_vector, vector)
+            if score >= best_score:
+                best, best_score = (other, result), score
+        if best is None:
+            # The caller will put() its own answer next - store it with this vector
+            self._query_vectors.set((template, norm, fingerprint), query_vector)
+            return None
+
+        print(f"[LLMCache] '{norm}' matched '{best[0]}' ({template}, similarity {best_score:.3f})")
+        self._similar_hits += 1
+        value = json.loads(best[1])
+        # Store under this phrasing too, so the next identical query is an exact hit
+        self._write(template, norm, fingerprint, best[1], value, query_vector)
+        return value
+
+    def put(self, template: str, query: str, fingerprint: str, result: Any) -> bool:
+        """
+        Store a result. Rows for the same template and query built from other
+        data are deleted - their fingerprint can't match again.
+        """
+        if result is None:
+            return False
+        try:
+            encoded = json.dumps(result)
+        except (TypeError, ValueError) as e:
+            print(f"[LLMCache] result for '{template}' not serializable: {e}")
+            return False
+        norm = normalize_query(query)
+        embedding = self._query_vectors.pop((template, norm, fingerprint))
+        if self._write(template, norm, fingerprint, encoded, result, embedding):
+            self._puts += 1
+            return True
+        return False
+
+    def _write(self, template: str, norm: str, fingerprint: str, encoded: str,
+               result: Any, embedding: Optional[array]) -> bool:
+        created_at = time.time()
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "DELETE FROM llm_results WHERE template = ? AND query = ? AND fingerprint != ?",
+                    (template, norm, fingerprint),
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_results "
+                    "(template, query, fingerprint, result, embedding, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (template, norm, fingerprint, encoded,
+                     embedding.tobytes() if embedding is not None else None, created_at),
+                )
+                if self._puts % 100 == 0:
+                    conn.execute(
+                        "DELETE FROM llm_results WHERE rowid IN (SELECT rowid FROM llm_results "
+                        "ORDER BY created_at DESC LIMIT -1 OFFSET ?)", (MAX_ROWS,)
+                    )
+        except sqlite3.Error as e:
+            print(f"[LLMCache] write error for '{template}': {e}")
+            return False
+        self._memory.set((template, norm, fingerprint), (created_at, result))
+        return True
+
+    def stats(self) -> dict:
+        """Hit/miss/put counters for this process."""
+        lookups = self._hits + self._similar_hits + self._misses
+        return {
+            "hits": self._hits,
+            "similar_hits": self._similar_hits,
+            "misses": self._misses,
+            "puts": self._puts,
+            "hit_rate": round((self._hits + self._similar_hits) / lookups, 3) if lookups else 0.0,
+        }
+
+
+_cache: Optional[LLMCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMCache:
+    """Process-wide LLMCache (lazily created)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMCache()
+    return _cache
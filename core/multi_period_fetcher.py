@@ -191,17 +191,9 @@ def _extract_period_data(
     Returns:
         List of (date, value) tuples within the period
     """
-    result = []
-
-    for date_str, value in zip(data.dates, data.values):
-        # Check if date is within range
-        if start_date and date_str < start_date:
-            continue
-        if end_date and date_str > end_date:
-            continue
-        result.append((date_str, value))
-
-    return result
+    # Window the full history (a view - nothing is re-fetched or copied)
+    period = data.window(start_date, end_date)
+    return list(zip(period.date_strings(), period.values.tolist()))
 
 
 def _compute_metric(
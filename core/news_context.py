@@ -11,13 +11,13 @@ Source hierarchy (in order of trust):
 Uses SerpAPI for web search with source filtering.
 """
 
-import json
 import os
 from datetime import datetime
 from typing import Optional, List, Dict
-from urllib.request import urlopen, Request
 from urllib.parse import urlencode
 
+from .http_client import get_json
+
 SERPAPI_KEY = os.environ.get("SERPAPI_KEY", "")
 
 # =============================================================================
@@ -183,25 +183,23 @@ def search_news(query: str, num_results: int = 10) -> List[Dict]:
     url = f'https://serpapi.com/search?{urlencode(params)}'
 
     try:
-        req = Request(url, headers={'Accept': 'application/json'})
-        with urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode('utf-8'))
-
-            results = []
-            for item in data.get('news_results', [])[:num_results]:
-                link = item.get('link', '')
-                results.append({
-                    'title': item.get('title', ''),
-                    'link': link,
-                    'snippet': item.get('snippet', ''),
-                    'source': item.get('source', ''),
-                    'date': item.get('date', ''),
-                    'tier': get_source_tier(link),
-                })
-
-            # Sort by tier (most trusted first)
-            results.sort(key=lambda x: x['tier'])
-            return results
+        data = get_json(url, headers={'Accept': 'application/json'}, timeout=10)
+
+        results = []
+        for item in data.get('news_results', [])[:num_results]:
+            link = item.get('link', '')
+            results.append({
+                'title': item.get('title', ''),
+                'link': link,
+                'snippet': item.get('snippet', ''),
+                'source': item.get('source', ''),
+                'date': item.get('date', ''),
+                'tier': get_source_tier(link),
+            })
+
+        # Sort by tier (most trusted first)
+        results.sort(key=lambda x: x['tier'])
+        return results
 
     except Exception as e:
         print(f'[NewsContext] SerpAPI error: {e}')
@@ -225,25 +223,23 @@ def search_general(query: str, num_results: int = 5) -> List[Dict]:
     url = f'https://serpapi.com/search?{urlencode(params)}'
 
     try:
-        req = Request(url, headers={'Accept': 'application/json'})
-        with urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode('utf-8'))
-
-            results = []
-            for item in data.get('organic_results', [])[:num_results]:
-                link = item.get('link', '')
-                tier = get_source_tier(link)
-                # Only include trusted sources
-                if tier <= 5:
-                    results.append({
-                        'title': item.get('title', ''),
-                        'link': link,
-                        'snippet': item.get('snippet', ''),
-                        'tier': tier,
-                    })
-
-            results.sort(key=lambda x: x['tier'])
-            return results
+        data = get_json(url, headers={'Accept': 'application/json'}, timeout=10)
+
+        results = []
+        for item in data.get('organic_results', [])[:num_results]:
+            link = item.get('link', '')
+            tier = get_source_tier(link)
+            # Only include trusted sources
+            if tier <= 5:
+                results.append({
+                    'title': item.get('title', ''),
+                    'link': link,
+                    'snippet': item.get('snippet', ''),
+                    'tier': tier,
+                })
+
+        results.sort(key=lambda x: x['tier'])
+        return results
 
     except Exception as e:
         print(f'[NewsContext] SerpAPI error: {e}')
@@ -0,0 +1,636 @@
+"""
+Observation Store - persistent on-disk cache of full series histories.
+
+Every fetch path (main.py, app.py, DataFetcher, the pilot tools) reads through
+this store instead of keeping its own in-process dict. A series is downloaded
+once with its FULL history, written to a local SQLite file keyed by series_id,
+and any `years=` window is served as a slice of that history. The file is
+shared by every worker process on the host and survives restarts, so cold
+starts and duplicate multi-worker fetches become local reads.
+
+Usage:
+    from core.observation_store import read_through
+
+    dates, values, info = read_through(
+        "PAYEMS",
+        lambda: download_full_history("PAYEMS"),  # returns (dates, values, info)
+        years=5,
+    )
+
+Pass `fetch_info` and `fetch_since` as well to enable incremental refresh
+(see ObservationStore.read_through).
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+from .cache import TTLCache
+from .singleflight import AsyncSingleFlight, SingleFlight
+from .timeseries import TimeSeries
+
+# Store location (override with ECONSTATS_STORE_PATH, e.g. on a mounted disk)
+STORE_PATH = Path(os.environ.get(
+    "ECONSTATS_STORE_PATH",
+    Path(__file__).parent.parent / "data" / "observations.db",
+))
+
+# How long a stored series is served without re-fetching. Most series we
+# chart are monthly or quarterly, so a few hours keeps us current on release
+# days without hammering FRED.
+DEFAULT_MAX_AGE_SECONDS = 6 * 60 * 60
+
+# Incremental refresh: a stale series is topped up with only the observations
+# after its last stored date, re-pulling this many days before it so recent
+# revisions (e.g. the two prior payroll months) are merged in.
+REVISION_WINDOW_DAYS = 120
+
+# Annual benchmark revisions can rewrite years of history, so a full
+# re-download still happens at least this often.
+FULL_REFRESH_SECONDS = 7 * 24 * 60 * 60
+
+# In-process copy of recently read full histories, so repeated windows of
+# the same series skip SQLite entirely
+MEMORY_MAX_BYTES = 64 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS series (
+    series_id TEXT PRIMARY KEY,
+    info TEXT NOT NULL DEFAULT '{}',
+    fetched_at REAL NOT NULL,
+    first_date TEXT,
+    last_date TEXT,
+    n_obs INTEGER NOT NULL DEFAULT 0,
+    last_updated TEXT,
+    full_fetched_at REAL
+);
+CREATE TABLE IF NOT EXISTS observations (
+    series_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (series_id, date)
+) WITHOUT ROWID;
+"""
+
+# Columns added after the first release of the store (name -> definition)
+_SERIES_COLUMNS = {
+    "last_updated": "TEXT",
+    "full_fetched_at": "REAL",
+}
+
+
+def window_start(years: Optional[int]) -> Optional[str]:
+    """Return the 'YYYY-MM-DD' start date for a trailing `years` window (None = full history)."""
+    if not years:
+        return None
+    return (datetime.now() - timedelta(days=years * 365)).strftime("%Y-%m-%d")
+
+
+class ObservationStore:
+    """
+    SQLite-backed store holding one full observation history per series.
+
+    Connections are per-thread (SQLite objects can't cross threads) and the
+    database runs in WAL mode so readers in other workers never block on a
+    writer. Any SQLite failure degrades to "not cached" rather than raising,
+    so a read-only or full disk never breaks a user request.
+    """
+
+    def __init__(self, path: Path = STORE_PATH, max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS):
+        self.path = Path(path)
+        self.max_age_seconds = max_age_seconds
+        self._local = threading.local()
+        self._hits = 0
+        self._misses = 0
+        self._fetches = 0
+        self._incremental = 0
+        self._skipped = 0
+        self._flight = SingleFlight("observation_store")
+        # Full histories of recently read series: (fetched_at, (dates, values, TimeSeries))
+        self._memory = TTLCache("observation_store.memory", max_entries=512, max_bytes=MEMORY_MAX_BYTES)
+        self._async_flight = AsyncSingleFlight("observation_store.async")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(series)")}
+            for column, definition in _SERIES_COLUMNS.items():
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE series ADD COLUMN {column} {definition}")
+            self._local.conn = conn
+        return conn
+
+    def get_meta(self, series_id: str) -> Optional[dict]:
+        """Return stored metadata (info, fetch times, first/last date, n_obs, last_updated) or None."""
+        try:
+            row = self._connect().execute(
+                "SELECT info, fetched_at, first_date, last_date, n_obs, last_updated, full_fetched_at "
+                "FROM series WHERE series_id = ?",
+                (series_id,),
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"[ObservationStore] read error for {series_id}: {e}")
+            return None
+        if row is None:
+            return None
+        return {
+            "info": json.loads(row[0]) if row[0] else {},
+            "fetched_at": row[1],
+            "first_date": row[2],
+            "last_date": row[3],
+            "n_obs": row[4],
+            "last_updated": row[5],
+            "full_fetched_at": row[6] or row[1],
+        }
+
+    def is_fresh(self, meta: Optional[dict], max_age_seconds: float = None) -> bool:
+        """True if a stored series was fetched recently enough to serve as-is."""
+        if not meta:
+            return False
+        max_age = self.max_age_seconds if max_age_seconds is None else max_age_seconds
+        return (time.time() - meta["fetched_at"]) < max_age
+
+    def get(self, series_id: str, start: str = None, end: str = None) -> Optional[tuple]:
+        """
+        Read a slice of a stored series regardless of age.
+
+        The full history is loaded once per stored version and kept in
+        memory; every window of it is then a bisect over the cached lists.
+
+        Args:
+            series_id: Series identifier
+            start: Optional inclusive 'YYYY-MM-DD' lower bound
+            end: Optional inclusive 'YYYY-MM-DD' upper bound
+
+        Returns:
+            (dates, values, info) tuple, or None if the series isn't stored
+        """
+        meta = self.get_meta(series_id)
+        if meta is None:
+            return None
+        full = self._load_full(series_id, meta)
+        if full is None:
+            return None
+        dates, values, _ = full
+        return _slice(dates, values, meta["info"], start, end)
+
+    def get_series(self, series_id: str, start: str = None, end: str = None) -> Optional[TimeSeries]:
+        """Like get(), but as a TimeSeries view over the cached full history."""
+        meta = self.get_meta(series_id)
+        if meta is None:
+            return None
+        full = self._load_full(series_id, meta)
+        if full is None:
+            return None
+        return full[2].window(start, end)
+
+    def _load_full(self, series_id: str, meta: dict) -> Optional[tuple]:
+        """
+        Full stored history as (dates, values, TimeSeries), from memory when current.
+
+        Entries are tagged with the row's fetched_at, which every write
+        (put, merge, touch - from any worker process) bumps, so a stale
+        in-memory copy is never served.
+        """
+        version = meta["fetched_at"]
+        cached = self._memory.get(series_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        try:
+            rows = self._connect().execute(
+                "SELECT date, value FROM observations WHERE series_id = ? ORDER BY date",
+                (series_id,),
+            ).fetchall()
+        except sqlite3.Error as e:
+            print(f"[ObservationStore] read error for {series_id}: {e}")
+            return None
+
+        dates = [r[0] for r in rows]
+        values = [r[1] for r in rows]
+        full = (dates, values, TimeSeries.from_lists(dates, values, series_id))
+        self._memory.set(series_id, (version, full))
+        return full
+
+    def put(self, series_id: str, dates: list, values: list, info: dict = None) -> bool:
+        """
+        Replace the stored history for a series with a full download.
+
+        Returns:
+            True if written, False if the store is unavailable
+        """
+        if not dates:
+            return False
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM observations WHERE series_id = ?", (series_id,))
+                conn.executemany(
+                    "INSERT INTO observations (series_id, date, value) VALUES (?, ?, ?)",
+                    [(series_id, d, float(v)) for d, v in zip(dates, values)],
+                )
+                now = time.time()
+                conn.execute(
+                    "INSERT OR REPLACE INTO series "
+                    "(series_id, info, fetched_at, first_date, last_date, n_obs, last_updated, full_fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (series_id, json.dumps(info or {}, default=str), now,
+                     min(dates), max(dates), len(dates), (info or {}).get("last_updated"), now),
+                )
+            return True
+        except sqlite3.Error as e:
+            print(f"[ObservationStore] write error for {series_id}: {e}")
+            return False
+
+    def merge(self, series_id: str, since: str, dates: list, values: list, info: dict = None) -> bool:
+        """
+        Merge an incremental download into a stored series.
+
+        Every stored observation on or after `since` is replaced by the new
+        batch (so revised and withdrawn points are picked up); older history
+        is left untouched.
+
+        An empty batch is refused: the revision window always holds stored
+        observations, so "nothing returned" means a failed or truncated
+        download, not that the history was withdrawn.
+
+        Returns:
+            True if written, False if the batch is empty or the store is unavailable
+        """
+        if not dates:
+            print(f"[ObservationStore] empty delta for {series_id} since {since} - not merged")
+            return False
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "DELETE FROM observations WHERE series_id = ? AND date >= ?", (series_id, since)
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO observations (series_id, date, value) VALUES (?, ?, ?)",
+                    [(series_id, d, float(v)) for d, v in zip(dates, values)],
+                )
+                first, last, n_obs = conn.execute(
+                    "SELECT MIN(date), MAX(date), COUNT(*) FROM observations WHERE series_id = ?",
+                    (series_id,),
+                ).fetchone()
+                if info:
+                    conn.execute(
+                        "UPDATE series SET info = ?, last_updated = ? WHERE series_id = ?",
+                        (json.dumps(info, default=str), info.get("last_updated"), series_id),
+                    )
+                conn.execute(
+                    "UPDATE series SET fetched_at = ?, first_date = ?, last_date = ?, n_obs = ? "
+                    "WHERE series_id = ?",
+                    (time.time(), first, last, n_obs, series_id),
+                )
+            return True
+        except sqlite3.Error as e:
+            print(f"[ObservationStore] merge error for {series_id}: {e}")
+            return False
+
+    def touch(self, series_id: str) -> None:
+        """Mark a stored series as freshly checked without changing its data."""
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "UPDATE series SET fetched_at = ? WHERE series_id = ?", (time.time(), series_id)
+                )
+        except sqlite3.Error as e:
+            print(f"[ObservationStore] touch error for {series_id}: {e}")
+
+    def invalidate(self, series_id: str = None) -> None:
+        """Drop one series (or everything) from the store."""
+        try:
+            conn = self._connect()
+            with conn:
+                if series_id:
+                    conn.execute("DELETE FROM observations WHERE series_id = ?", (series_id,))
+                    conn.execute("DELETE FROM series WHERE series_id = ?", (series_id,))
+                else:
+                    conn.execute("DELETE FROM observations")
+                    conn.execute("DELETE FROM series")
+        except sqlite3.Error as e:
+            print(f"[ObservationStore] invalidate error: {e}")
+
+    def read_through(
+        self,
+        series_id: str,
+        fetch_full: Callable[[], tuple],
+        years: int = None,
+        start: str = None,
+        end: str = None,
+        fetch_info: Callable[[], dict] = None,
+        fetch_since: Callable[[str], tuple] = None,
+    ) -> tuple:
+        """
+        Serve a window of a series from the store, downloading on a miss.
+
+        A stale series is refreshed incrementally when the caller supplies
+        `fetch_info`/`fetch_since`: if the upstream `last_updated` stamp is
+        unchanged nothing is downloaded, otherwise only observations from
+        (last stored date - REVISION_WINDOW_DAYS) onward are fetched and
+        merged. Series never stored, or not fully re-downloaded within
+        FULL_REFRESH_SECONDS, take the full path. Concurrent misses for the
+        same series (whatever their windows) wait on one fetch and share it.
+
+        Args:
+            series_id: Series identifier (the store key)
+            fetch_full: Zero-arg callable returning (dates, values, info) for the
+                        FULL history. An empty `dates` means the fetch failed.
+            years: Optional trailing window in years
+            start: Optional explicit start date (overrides `years`)
+            end: Optional explicit end date
+            fetch_info: Optional zero-arg callable returning current series info
+                        (must include FRED's `last_updated`); {} on failure
+            fetch_since: Optional callable taking a 'YYYY-MM-DD' start date and
+                         returning (dates, values, info) for observations from
+                         that date. An "error" key in info means it failed.
+
+        Returns:
+            (dates, values, info) tuple. On a failed fetch with nothing stored,
+            the fetcher's own result is returned unchanged so callers keep
+            their existing error handling.
+        """
+        start = start or window_start(years)
+        meta = self.get_meta(series_id)
+
+        if self.is_fresh(meta):
+            cached = self.get(series_id, start, end)
+            if cached is not None:
+                self._hits += 1
+                return cached
+
+        self._misses += 1
+
+        # Concurrent misses for the same series share one upstream fetch
+        result = self._flight.do(series_id, self._fill, series_id, fetch_full, fetch_info, fetch_since)
+        dates, values, info = result
+
+        if dates:
+            return _slice(dates, values, info, start, end)
+
+        # Upstream failed - serve stale data rather than nothing
+        if meta is not None:
+            stale = self.get(series_id, start, end)
+            if stale is not None and stale[0]:
+                print(f"[ObservationStore] serving stale {series_id} (fetch failed)")
+                return stale
+
+        return dates, values, _own(info)
+
+    def refresh(
+        self,
+        series_id: str,
+        fetch_full: Callable[[], tuple],
+        fetch_info: Callable[[], dict] = None,
+        fetch_since: Callable[[str], tuple] = None,
+    ) -> Optional[str]:
+        """
+        Bring a series up to date now, even if the stored copy is still fresh.
+
+        Used by the background pre-warmer right after a release. Takes the
+        same incremental path as read_through() (an unchanged `last_updated`
+        costs one info call) and shares its in-flight fetch.
+
+        Returns:
+            The stored `last_updated` stamp afterwards (None if not stored)
+        """
+        self._flight.do(series_id, self._fill, series_id, fetch_full, fetch_info, fetch_since, True)
+        meta = self.get_meta(series_id)
+        return meta["last_updated"] if meta else None
+
+    def _fill(
+        self,
+        series_id: str,
+        fetch_full: Callable[[], tuple],
+        fetch_info: Optional[Callable[[], dict]],
+        fetch_since: Optional[Callable[[str], tuple]],
+        force: bool = False,
+    ) -> tuple:
+        """Bring a missing/stale series up to date. Returns its full (dates, values, info)."""
+        # Another caller may have refreshed it while this one was queued
+        meta = self.get_meta(series_id)
+        if not force and self.is_fresh(meta):
+            stored = self.get(series_id)
+            if stored is not None:
+                return stored
+
+        if meta is not None and fetch_since is not None and meta["last_date"] \
+                and time.time() - meta["full_fetched_at"] < FULL_REFRESH_SECONDS:
+            if self._refresh_incremental(series_id, meta, fetch_info, fetch_since):
+                stored = self.get(series_id)
+                if stored is not None:
+                    return stored
+
+        self._fetches += 1
+        result = fetch_full()
+        if result[0]:
+            self.put(series_id, *result)
+        return result
+
+    def _refresh_incremental(
+        self,
+        series_id: str,
+        meta: dict,
+        fetch_info: Optional[Callable[[], dict]],
+        fetch_since: Callable[[str], tuple],
+    ) -> bool:
+        """Top up a stale stored series. Returns False if a full download is needed."""
+        info = fetch_info() if fetch_info is not None else {}
+        last_updated = info.get("last_updated") if info else None
+
+        if last_updated and last_updated == meta["last_updated"]:
+            # Nothing published since our copy - just reset the staleness clock
+            self._skipped += 1
+            self.touch(series_id)
+            return True
+
+        since = _revision_start(meta["last_date"])
+        self._fetches += 1
+        dates, values, delta_info = fetch_since(since)
+        if "error" in (delta_info or {}) or not dates:
+            # Empty delta: treat like a failure (full download, else stale copy)
+            return False
+
+        self._incremental += 1
+        return self.merge(series_id, since, dates, values, info or delta_info)
+
+    async def read_through_async(
+        self,
+        series_id: str,
+        fetch_full: Callable[[], Awaitable[tuple]],
+        years: int = None,
+        start: str = None,
+        end: str = None,
+        fetch_info: Callable[[], Awaitable[dict]] = None,
+        fetch_since: Callable[[str], Awaitable[tuple]] = None,
+    ) -> tuple:
+        """
+        Async twin of read_through() for the FastAPI request path.
+
+        The fetchers are coroutine functions; SQLite access runs in worker
+        threads so the event loop never blocks on disk.
+        """
+        start = start or window_start(years)
+        meta = await asyncio.to_thread(self.get_meta, series_id)
+
+        if self.is_fresh(meta):
+            cached = await asyncio.to_thread(self.get, series_id, start, end)
+            if cached is not None:
+                self._hits += 1
+                return cached
+
+        self._misses += 1
+
+        result = await self._async_flight.do(
+            series_id, self._fill_async, series_id, fetch_full, fetch_info, fetch_since
+        )
+        dates, values, info = result
+
+        if dates:
+            return _slice(dates, values, info, start, end)
+
+        if meta is not None:
+            stale = await asyncio.to_thread(self.get, series_id, start, end)
+            if stale is not None and stale[0]:
+                print(f"[ObservationStore] serving stale {series_id} (fetch failed)")
+                return stale
+
+        return dates, values, _own(info)
+
+    async def _fill_async(
+        self,
+        series_id: str,
+        fetch_full: Callable[[], Awaitable[tuple]],
+        fetch_info: Optional[Callable[[], Awaitable[dict]]],
+        fetch_since: Optional[Callable[[str], Awaitable[tuple]]],
+    ) -> tuple:
+        """Async twin of _fill()."""
+        meta = await asyncio.to_thread(self.get_meta, series_id)
+        if self.is_fresh(meta):
+            stored = await asyncio.to_thread(self.get, series_id)
+            if stored is not None:
+                return stored
+
+        if meta is not None and fetch_since is not None and meta["last_date"] \
+                and time.time() - meta["full_fetched_at"] < FULL_REFRESH_SECONDS:
+            info = await fetch_info() if fetch_info is not None else {}
+            last_updated = info.get("last_updated") if info else None
+            refreshed = False
+            if last_updated and last_updated == meta["last_updated"]:
+                self._skipped += 1
+                await asyncio.to_thread(self.touch, series_id)
+                refreshed = True
+            else:
+                since = _revision_start(meta["last_date"])
+                self._fetches += 1
+                dates, values, delta_info = await fetch_since(since)
+                # Empty delta: treat like a failure (full download, else stale copy)
+                if "error" not in (delta_info or {}) and dates:
+                    self._incremental += 1
+                    refreshed = await asyncio.to_thread(
+                        self.merge, series_id, since, dates, values, info or delta_info
+                    )
+            if refreshed:
+                stored = await asyncio.to_thread(self.get, series_id)
+                if stored is not None:
+                    return stored
+
+        self._fetches += 1
+        result = await fetch_full()
+        if result[0]:
+            await asyncio.to_thread(self.put, series_id, *result)
+        return result
+
+    def stats(self) -> dict:
+        """Store statistics for health checks and debugging."""
+        stats = {
+            "path": str(self.path),
+            "hits": self._hits,
+            "misses": self._misses,
+            "fetches": self._fetches,
+            "incremental_refreshes": self._incremental,
+            "unchanged_skips": self._skipped,
+            "coalesced": self._flight.shared + self._async_flight.shared,
+        }
+        try:
+            row = self._connect().execute("SELECT COUNT(*), COALESCE(SUM(n_obs), 0) FROM series").fetchone()
+            stats["series"] = row[0]
+            stats["observations"] = row[1]
+        except sqlite3.Error:
+            pass
+        return stats
+
+
+def _revision_start(last_date: str) -> str:
+    """Start date for an incremental fetch: the last stored date minus the revision window."""
+    return (
+        datetime.strptime(last_date, "%Y-%m-%d") - timedelta(days=REVISION_WINDOW_DAYS)
+    ).strftime("%Y-%m-%d")
+
+
+def _slice(dates: list, values: list, info: dict, start: str = None, end: str = None) -> tuple:
+    """
+    Window parallel date-sorted lists by inclusive 'YYYY-MM-DD' bounds (two bisects).
+
+    The info dict is copied: callers annotate it (name, unit), and waiters
+    on one coalesced fetch must not see each other's changes.
+    """
+    lo = bisect_left(dates, start) if start else 0
+    hi = bisect_right(dates, end) if end else len(dates)
+    return dates[lo:hi], values[lo:hi], _own(info)
+
+
+def _own(info: Optional[dict]) -> Optional[dict]:
+    """A shallow copy of a fetch's info dict for one caller."""
+    return dict(info) if info is not None else None
+
+
+_store: Optional[ObservationStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> ObservationStore:
+    """Return the process-wide observation store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ObservationStore()
+    return _store
+
+
+def read_through(series_id: str, fetch_full: Callable[[], tuple], years: int = None,
+                 start: str = None, end: str = None,
+                 fetch_info: Callable[[], dict] = None,
+                 fetch_since: Callable[[str], tuple] = None) -> tuple:
+    """Convenience wrapper for get_store().read_through(...)."""
+    return get_store().read_through(
+        series_id, fetch_full, years=years, start=start, end=end,
+        fetch_info=fetch_info, fetch_since=fetch_since,
+    )
+
+
+async def read_through_async(series_id: str, fetch_full: Callable[[], Awaitable[tuple]], years: int = None,
+                             start: str = None, end: str = None,
+                             fetch_info: Callable[[], Awaitable[dict]] = None,
+                             fetch_since: Callable[[str], Awaitable[tuple]] = None) -> tuple:
+    """Convenience wrapper for get_store().read_through_async(...)."""
+    return await get_store().read_through_async(
+        series_id, fetch_full, years=years, start=start, end=end,
+        fetch_info=fetch_info, fetch_since=fetch_since,
+    )
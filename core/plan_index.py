@@ -0,0 +1,188 @@
+"""
+Plan Index - precompiled lookup structures for query plan matching.
+
+find_query_plan() used to rescan every plan key on each query: difflib
+sweeps over ~600 keys, extract_demographic_group() on every key several
+times, and substring scans for each boost term. PlanIndex builds all of
+that once when the plans are loaded:
+
+- demographic tag per key (plus per-group key lists)
+- token sets and an inverted word index for word-overlap scoring
+- a character trigram index for substring lookups
+- a character-count matrix that bounds difflib's ratio() for every key in
+  one vectorized step, so only a handful of exact ratios are computed
+
+Lookups return exactly what the equivalent linear scans returned.
+
+Usage:
+    from core.plan_index import PlanIndex
+
+    index = PlanIndex(QUERY_PLANS, extract_demographic_group)
+    key = index.close_match('unemploymnt', cutoff=0.6)
+    keys = index.keys_containing('job market')
+"""
+
+import difflib
+from collections import defaultdict
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+
+
+def _trigrams(text: str) -> set:
+    """Character trigrams of a string (empty for strings shorter than 3)."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class PlanIndex:
+    """Immutable index over a {plan_key: plan} dict, built once at load time."""
+
+    def __init__(self, plans: dict, demographic_of: Callable[[str], Optional[str]]):
+        self.plans = plans
+        self.keys = list(plans.keys())
+        self._position = {key: i for i, key in enumerate(self.keys)}
+
+        # Demographic tags - computed once instead of per query per key
+        self.demographic = {key: demographic_of(key) for key in self.keys}
+        self.non_demographic_keys = [k for k in self.keys if not self.demographic[k]]
+        self.keys_by_demographic = defaultdict(list)
+        for key in self.keys:
+            group = self.demographic[key]
+            if group:
+                self.keys_by_demographic[group].append(key)
+
+        # Plans with alternate names, in plan order
+        self.synonym_plans = [
+            (plan, plan['synonyms']) for plan in plans.values() if plan.get('synonyms')
+        ]
+
+        # Token sets and inverted word index (postings hold key positions)
+        self.word_sets = [frozenset(key.lower().split()) for key in self.keys]
+        self._word_index = defaultdict(list)
+        for i, words in enumerate(self.word_sets):
+            for word in words:
+                self._word_index[word].append(i)
+
+        # Trigram index over raw and lowercased keys (for substring lookups)
+        self._trigram_index = defaultdict(set)
+        self._lower_trigram_index = defaultdict(set)
+        for i, key in enumerate(self.keys):
+            for gram in _trigrams(key):
+                self._trigram_index[gram].add(i)
+            for gram in _trigrams(key.lower()):
+                self._lower_trigram_index[gram].add(i)
+        self._contains_cache = {}
+
+        # Character-count matrix: min(key_counts, query_counts).sum() is the
+        # numerator of SequenceMatcher.quick_ratio(), an upper bound on ratio()
+        alphabet = sorted({ch for key in self.keys for ch in key})
+        self._char_column = {ch: j for j, ch in enumerate(alphabet)}
+        self._char_counts = np.zeros((len(self.keys), len(alphabet)), dtype=np.int32)
+        for i, key in enumerate(self.keys):
+            for ch in key:
+                self._char_counts[i, self._char_column[ch]] += 1
+        self._key_lengths = np.array([len(key) for key in self.keys], dtype=np.int64)
+        self._all_rows = np.arange(len(self.keys))
+        self._non_demographic_rows = np.array(
+            [self._position[k] for k in self.non_demographic_keys], dtype=np.int64
+        )
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def keys_containing(self, term: str, lowercase: bool = False) -> list:
+        """
+        Plan keys containing `term` as a substring, in plan order.
+
+        With lowercase=True, matches against key.lower() (as the keyword
+        boosts do). Results are memoized - callers pass a fixed vocabulary.
+        """
+        cache_key = (term, lowercase)
+        cached = self._contains_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        grams = _trigrams(term)
+        if grams:
+            index = self._lower_trigram_index if lowercase else self._trigram_index
+            postings = sorted((index.get(g, set()) for g in grams), key=len)
+            candidates = sorted(set.intersection(*postings)) if postings[0] else []
+        else:
+            candidates = range(len(self.keys))
+
+        result = []
+        for i in candidates:
+            key = self.keys[i]
+            if term in (key.lower() if lowercase else key):
+                result.append(key)
+        self._contains_cache[cache_key] = result
+        return result
+
+    def word_overlap_scores(self, query_words: set, min_score: float = 0.3,
+                            include_demographic: bool = True) -> list:
+        """
+        (plan_key, score) pairs scoring above `min_score`, in plan order.
+
+        Same weighting as app.calculate_word_overlap_score(): 60% plan
+        coverage, 40% query coverage. Only keys sharing a word are scored.
+        """
+        if not query_words:
+            return []
+        positions = set()
+        for word in query_words:
+            positions.update(self._word_index.get(word, ()))
+
+        scores = []
+        for i in sorted(positions):
+            key = self.keys[i]
+            if not include_demographic and self.demographic[key]:
+                continue
+            plan_words = self.word_sets[i]
+            matching = len(query_words & plan_words)
+            score = 0.6 * (matching / len(plan_words)) + 0.4 * (matching / len(query_words))
+            if score > min_score:
+                scores.append((key, score))
+        return scores
+
+    def close_match(self, word: str, candidates: Iterable[str] = None,
+                    cutoff: float = 0.6, include_demographic: bool = True) -> Optional[str]:
+        """
+        Equivalent to difflib.get_close_matches(word, candidates, n=1, cutoff)[0].
+
+        Candidates default to every plan key (optionally only the
+        non-demographic ones). Keys are visited in decreasing order of their
+        quick_ratio() bound and the scan stops once no remaining key can
+        beat the best exact ratio found so far.
+        """
+        if candidates is None:
+            rows = self._all_rows if include_demographic else self._non_demographic_rows
+        else:
+            rows = np.fromiter((self._position[k] for k in candidates), dtype=np.int64)
+        if not len(rows):
+            return None
+
+        query_counts = np.zeros(self._char_counts.shape[1], dtype=np.int32)
+        for ch in word:
+            j = self._char_column.get(ch)
+            if j is not None:
+                query_counts[j] += 1
+
+        totals = self._key_lengths[rows] + len(word)
+        common = np.minimum(self._char_counts[rows], query_counts).sum(axis=1)
+        bounds = np.where(totals > 0, 2.0 * common / np.maximum(totals, 1), 1.0)
+
+        eligible = np.nonzero(bounds >= cutoff)[0]
+        order = eligible[np.argsort(-bounds[eligible], kind='stable')]
+
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(word)
+        best = None
+        for j in order:
+            if best is not None and bounds[j] < best[0]:
+                break
+            key = self.keys[rows[j]]
+            matcher.set_seq1(key)
+            score = matcher.ratio()
+            if score >= cutoff and (best is None or (score, key) > best):
+                best = (score, key)
+        return best[1] if best else None
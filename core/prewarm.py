@@ -0,0 +1,362 @@
+"""
+Pre-warmer - keeps popular series fresh in the observation store.
+
+Right after a jobs or CPI release the first users asking about it would
+otherwise wait on FRED while the stored copy is refreshed. A background
+thread refreshes the series we actually serve - the static query plans,
+the direct series mappings, the recession scorecard and the health-check
+indicator sets - on two schedules:
+
+- Release days: each series' FRED release calendar (series/release ->
+  release/dates) says when it publishes. From RELEASE_CHECK_START on a
+  release day the series is polled every POLL_SECONDS until its
+  `last_updated` stamp moves (or the day's window closes).
+- Otherwise: a slow refresh every SLOW_REFRESH_SECONDS, just inside the
+  store's max age, so served copies never go stale.
+
+Refreshes go through ObservationStore.refresh(), i.e. the incremental path:
+an unchanged series costs one `series` info call. Only one process per host
+runs the scheduler (a lock file next to the store), since the store itself
+is shared by every worker.
+
+Usage:
+    from core.prewarm import start_prewarm, stop_prewarm
+
+    start_prewarm()   # idempotent; no-op without FRED_API_KEY or when disabled
+    ...
+    stop_prewarm()
+
+Set ECONSTATS_PREWARM=0 to disable.
+"""
+
+import glob
+import json
+import os
+import re
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Callable, Iterable, Optional
+from zoneinfo import ZoneInfo
+
+from .http_client import get_json
+from .observation_store import DEFAULT_MAX_AGE_SECONDS, STORE_PATH
+
+try:
+    import fcntl
+    _HAS_FCNTL = True
+except ImportError:  # Windows - no cross-process lock, every process prewarms
+    _HAS_FCNTL = False
+
+FRED_API_KEY = os.environ.get("FRED_API_KEY", "")
+FRED_API_BASE = "https://api.stlouisfed.org/fred"
+
+PREWARM_ENABLED = os.environ.get("ECONSTATS_PREWARM", "1") != "0"
+
+# FRED release dates are US Eastern calendar dates. Most market-moving
+# releases (Employment Situation, CPI, GDP, claims) publish at 8:30 ET; some
+# (JOLTS, sentiment, H.15 rates) later in the day, so polling stays on until
+# RELEASE_CHECK_END.
+RELEASE_TZ = ZoneInfo("America/New_York")
+RELEASE_CHECK_START = (8, 30)
+RELEASE_CHECK_END = (18, 0)
+POLL_SECONDS = 5 * 60
+
+# Off release days: refresh a little before the store would call it stale
+SLOW_REFRESH_SECONDS = int(DEFAULT_MAX_AGE_SECONDS * 0.9)
+
+# Release calendars change rarely - reload once a day
+CALENDAR_REFRESH_SECONDS = 24 * 60 * 60
+CALENDAR_DAYS_AHEAD = 45
+
+# Scheduler tick and spacing between upstream refreshes
+TICK_SECONDS = 30
+REFRESH_SPACING_SECONDS = 0.5
+
+LOCK_PATH = STORE_PATH.parent / "prewarm.lock"
+
+# FRED series IDs are upper-case; our other sources use prefixed/lower-case keys
+_FRED_ID = re.compile(r"^[A-Z0-9][A-Z0-9_]*$")
+
+
+# =============================================================================
+# SERIES TO KEEP WARM
+# =============================================================================
+
+def collect_prewarm_series() -> list:
+    """
+    FRED series referenced by the static plans and curated mappings.
+
+    Ordered by how many plans/mappings reference them, so the most widely
+    used series are refreshed first after a release.
+    """
+    counts = Counter()
+
+    agents_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "agents")
+    for plan_file in sorted(glob.glob(os.path.join(agents_dir, "plans_*.json"))):
+        try:
+            with open(plan_file) as f:
+                plans = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[Prewarm] Could not read {plan_file}: {e}")
+            continue
+        for plan in plans.values():
+            if isinstance(plan, dict):
+                counts.update(plan.get("series", []))
+
+    try:
+        from .economist_reasoning import DIRECT_SERIES_MAPPINGS
+        for series_ids in DIRECT_SERIES_MAPPINGS.values():
+            counts.update(series_ids)
+    except ImportError:
+        pass
+
+    try:
+        from .health_check_indicators import HEALTH_CHECK_ENTITIES
+        for config in HEALTH_CHECK_ENTITIES.values():
+            counts.update(config.primary_series)
+            counts.update(config.secondary_series)
+    except ImportError:
+        pass
+
+    try:
+        from agents.recession_scorecard import INDICATOR_CONFIG
+        counts.update(INDICATOR_CONFIG.keys())
+    except ImportError:
+        pass
+
+    return [sid for sid, _ in counts.most_common() if _FRED_ID.match(sid)]
+
+
+# =============================================================================
+# RELEASE CALENDAR
+# =============================================================================
+
+class ReleaseCalendar:
+    """Upcoming FRED release dates per series (via the series' release)."""
+
+    def __init__(self):
+        self._release_of: dict = {}    # series_id -> release_id (or None)
+        self._failed_at: dict = {}     # series_id -> time of last failed lookup
+        self._dates: dict = {}         # release_id -> set of 'YYYY-MM-DD'
+        self._loaded_at: dict = {}     # release_id -> time.time()
+
+    def release_id(self, series_id: str) -> Optional[int]:
+        """FRED release a series belongs to (looked up once; failures retried hourly)."""
+        if series_id not in self._release_of:
+            if time.time() - self._failed_at.get(series_id, 0) < 3600:
+                return None
+            url = f"{FRED_API_BASE}/series/release?series_id={series_id}&api_key={FRED_API_KEY}&file_type=json"
+            try:
+                releases = get_json(url, timeout=10).get("releases", [])
+                self._release_of[series_id] = releases[0]["id"] if releases else None
+            except Exception as e:
+                print(f"[Prewarm] release lookup failed for {series_id}: {e}")
+                self._failed_at[series_id] = time.time()
+                return None
+        return self._release_of[series_id]
+
+    def release_dates(self, series_id: str) -> set:
+        """Release dates ('YYYY-MM-DD', US Eastern) from a week ago to CALENDAR_DAYS_AHEAD out."""
+        release_id = self.release_id(series_id)
+        if release_id is None:
+            return set()
+        loaded = self._loaded_at.get(release_id, 0)
+        if time.time() - loaded > CALENDAR_REFRESH_SECONDS:
+            today = datetime.now(RELEASE_TZ).date()
+            url = (
+                f"{FRED_API_BASE}/release/dates?release_id={release_id}"
+                f"&realtime_start={today - timedelta(days=7)}"
+                f"&realtime_end={today + timedelta(days=CALENDAR_DAYS_AHEAD)}"
+                f"&include_release_dates_with_no_data=true&sort_order=asc"
+                f"&api_key={FRED_API_KEY}&file_type=json"
+            )
+            try:
+                data = get_json(url, timeout=10)
+                self._dates[release_id] = {d["date"] for d in data.get("release_dates", [])}
+                self._loaded_at[release_id] = time.time()
+            except Exception as e:
+                print(f"[Prewarm] release calendar failed for release {release_id}: {e}")
+                # Retry in an hour rather than on every tick
+                self._loaded_at[release_id] = time.time() - CALENDAR_REFRESH_SECONDS + 3600
+        return self._dates.get(release_id, set())
+
+    def releases_on(self, series_id: str, day: date) -> bool:
+        return day.isoformat() in self.release_dates(series_id)
+
+
+# =============================================================================
+# SCHEDULER
+# =============================================================================
+
+def _default_refresh(series_id: str) -> Optional[str]:
+    from .data_fetcher import refresh_fred_series
+    return refresh_fred_series(series_id)
+
+
+class PrewarmScheduler:
+    """Background thread refreshing series after releases and on a slow cadence."""
+
+    def __init__(
+        self,
+        series_ids: Iterable[str] = None,
+        refresh: Callable[[str], Optional[str]] = _default_refresh,
+        calendar: ReleaseCalendar = None,
+    ):
+        """
+        Args:
+            series_ids: Series to keep warm (default: collect_prewarm_series())
+            refresh: Callable refreshing one series, returning its last_updated stamp
+            calendar: Release calendar (default: FRED-backed ReleaseCalendar)
+        """
+        self.series_ids = list(series_ids) if series_ids is not None else collect_prewarm_series()
+        self.refresh = refresh
+        self.calendar = calendar or ReleaseCalendar()
+
+        self._last_refresh: dict = {}     # series_id -> time.time() of last refresh
+        self._last_updated: dict = {}     # series_id -> last seen last_updated stamp
+        self._published: dict = {}        # series_id -> release day whose update we've seen
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.refreshes = 0
+        self.release_refreshes = 0
+        self.errors = 0
+
+    def start(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="econstats-prewarm", daemon=True)
+            self._thread.start()
+            print(f"[Prewarm] Started for {len(self.series_ids)} series")
+
+    def stop(self, timeout: float = 5) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def due(self, series_id: str, now: datetime) -> Optional[str]:
+        """
+        Why a series should be refreshed now: 'release', 'slow' or None.
+
+        `now` is timezone-aware (US Eastern is used for release days).
+        """
+        last = self._last_refresh.get(series_id, 0)
+        elapsed = now.timestamp() - last
+        local = now.astimezone(RELEASE_TZ)
+        window_open = RELEASE_CHECK_START <= (local.hour, local.minute) < RELEASE_CHECK_END
+
+        if window_open and self._published.get(series_id) != local.date() \
+                and self.calendar.releases_on(series_id, local.date()):
+            if elapsed >= POLL_SECONDS:
+                return "release"
+            return None
+
+        if elapsed >= SLOW_REFRESH_SECONDS:
+            return "slow"
+        return None
+
+    def run_once(self, now: datetime = None) -> int:
+        """Refresh every series that's due. Returns how many were refreshed."""
+        now = now or datetime.now(RELEASE_TZ)
+        refreshed = 0
+        for series_id in self.series_ids:
+            if self._stop.is_set():
+                break
+            reason = self.due(series_id, now)
+            if reason is None:
+                continue
+            try:
+                stamp = self.refresh(series_id)
+            except Exception as e:
+                self.errors += 1
+                print(f"[Prewarm] {series_id} refresh failed: {e}")
+                stamp = None
+            self._last_refresh[series_id] = now.timestamp()
+            refreshed += 1
+            self.refreshes += 1
+
+            if reason == "release":
+                self.release_refreshes += 1
+                previous = self._last_updated.get(series_id)
+                release_day = now.astimezone(RELEASE_TZ).date()
+                # FRED stamps look like '2026-10-02 07:44:03-05'
+                if stamp and ((previous and stamp != previous) or stamp.startswith(release_day.isoformat())):
+                    # New data is in - stop polling this series for today
+                    self._published[series_id] = release_day
+                    print(f"[Prewarm] {series_id} updated ({stamp})")
+            if stamp:
+                self._last_updated[series_id] = stamp
+
+            self._stop.wait(REFRESH_SPACING_SECONDS)
+        return refreshed
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                self.errors += 1
+                print(f"[Prewarm] Scheduler error: {e}")
+            self._stop.wait(TICK_SECONDS)
+
+    def stats(self) -> dict:
+        return {
+            "series": len(self.series_ids),
+            "running": bool(self._thread and self._thread.is_alive()),
+            "refreshes": self.refreshes,
+            "release_refreshes": self.release_refreshes,
+            "errors": self.errors,
+        }
+
+
+# =============================================================================
+# PROCESS-WIDE INSTANCE
+# =============================================================================
+
+_scheduler: Optional[PrewarmScheduler] = None
+_scheduler_lock = threading.Lock()
+_lock_file = None
+
+
+def _acquire_host_lock() -> bool:
+    """True if this process should run the host's pre-warmer (held until exit)."""
+    global _lock_file
+    if not _HAS_FCNTL:
+        return True
+    try:
+        LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _lock_file = open(LOCK_PATH, "w")
+        fcntl.flock(_lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        if _lock_file is not None:
+            _lock_file.close()
+            _lock_file = None
+        return False
+
+
+def start_prewarm() -> Optional[PrewarmScheduler]:
+    """Start the process-wide pre-warmer once. Returns it, or None if not running here."""
+    global _scheduler
+    if not (PREWARM_ENABLED and FRED_API_KEY):
+        return None
+    with _scheduler_lock:
+        if _scheduler is None:
+            if not _acquire_host_lock():
+                print("[Prewarm] Another worker is pre-warming this host")
+                return None
+            _scheduler = PrewarmScheduler()
+            _scheduler.start()
+        return _scheduler
+
+
+def stop_prewarm() -> None:
+    """Stop the pre-warmer if this process runs it."""
+    if _scheduler is not None:
+        _scheduler.stop()
+
+
+def get_prewarm_stats() -> Optional[dict]:
+    return _scheduler.stats() if _scheduler is not None else None
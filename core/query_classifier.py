@@ -0,0 +1,206 @@
+"""
+Query classifier - every keyword set and pattern list matched in one pass.
+
+Routing asks a query the same kind of question a dozen times: is it about
+valuation, recession, the Fed, markets, another country, which health-check
+entity... Each of those used to lowercase the query again and loop over its
+own keyword list (`any(kw in q for kw in keywords)`) or pattern list.
+
+Here the keyword sets are registered once and compiled into a single regex
+trie. One scan of the query finds every keyword occurrence of every set, and
+the result says which categories matched and with which keywords. Pattern
+lists (regexes) are folded into one alternation per category. Results are
+cached per query, so the is_*_query helpers called during one request share
+a single scan.
+
+Matching semantics are exactly those of the loops they replace: a keyword
+matches when it is a substring of the lowercased query (overlaps included),
+and a pattern category matches when any of its patterns re.search()es the
+lowercased, stripped query.
+
+Usage:
+    from core.query_classifier import register_keywords, register_patterns, classify
+
+    register_keywords('valuation', ['cape', 'shiller', 'p/e', ...])   # at import
+    register_patterns('judgment', JUDGMENT_PATTERNS)
+
+    result = classify(query)
+    result.has('valuation')          # True/False
+    result.matched('valuation')      # frozenset of keywords found
+    result.categories                # every category that matched
+
+    # Standalone matcher for keyword sets that aren't about the raw query
+    matcher = KeywordMatcher({'forecast': FORECAST_KEYWORDS, ...})
+    matcher.categorize(text_lower)   # {'forecast': {'will be'}, ...}
+"""
+
+import re
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .cache import TTLCache
+
+
+def _trie_pattern(node: dict) -> str:
+    """Regex for a character trie; '' marks the end of a keyword. Greedy, so the longest keyword wins."""
+    branches = [re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        body = '(?:' + body + ')?'
+    return body
+
+
+class KeywordMatcher:
+    """
+    Substring search for many named keyword sets at once.
+
+    All keywords go into one trie regex, tried at every position of the text
+    through a lookahead, which yields the longest keyword starting there. The
+    shorter keywords starting at the same position are exactly its prefixes
+    that are keywords too, precomputed per keyword - so every occurrence of
+    every keyword is found in one pass.
+    """
+
+    def __init__(self, keyword_sets: Mapping[str, Iterable[str]]):
+        owners: Dict[str, List[str]] = {}
+        for name, keywords in keyword_sets.items():
+            for kw in keywords:
+                if not kw:
+                    continue
+                owners.setdefault(kw, [])
+                if name not in owners[kw]:
+                    owners[kw].append(name)
+        self._owners = {kw: tuple(names) for kw, names in owners.items()}
+
+        trie: dict = {}
+        for kw in owners:
+            node = trie
+            for ch in kw:
+                node = node.setdefault(ch, {})
+            node[''] = {}
+        self._regex = re.compile('(?=(' + _trie_pattern(trie) + '))') if owners else None
+
+        # keyword -> keywords that are prefixes of it (itself included), shortest first
+        self._prefixes = {
+            kw: tuple(kw[:i] for i in range(1, len(kw) + 1) if kw[:i] in owners)
+            for kw in owners
+        }
+
+    def find(self, text: str) -> List[Tuple[int, str]]:
+        """Every keyword occurrence in text as (start, keyword), in text order."""
+        if self._regex is None:
+            return []
+        found = []
+        for m in self._regex.finditer(text):
+            longest = m.group(1)
+            if longest:
+                start = m.start()
+                found.extend((start, kw) for kw in self._prefixes[longest])
+        return found
+
+    def categorize(self, text: str) -> Dict[str, FrozenSet[str]]:
+        """{set name: keywords of that set found in text} for every set with a match."""
+        hits: Dict[str, set] = {}
+        for _, kw in self.find(text):
+            for name in self._owners[kw]:
+                hits.setdefault(name, set()).add(kw)
+        return {name: frozenset(kws) for name, kws in hits.items()}
+
+
+def compile_patterns(patterns: Sequence[str]) -> re.Pattern:
+    """One regex that search()es true exactly when any of `patterns` would."""
+    return re.compile('|'.join(f'(?:{p})' for p in patterns))
+
+
+class QueryClassification:
+    """What classify() found in one query."""
+
+    __slots__ = ('keywords', 'patterns')
+
+    def __init__(self, keywords: Dict[str, FrozenSet[str]], patterns: FrozenSet[str]):
+        self.keywords = keywords
+        self.patterns = patterns
+
+    @property
+    def categories(self) -> FrozenSet[str]:
+        return frozenset(self.keywords) | self.patterns
+
+    def has(self, name: str) -> bool:
+        return name in self.keywords or name in self.patterns
+
+    def matched(self, name: str) -> FrozenSet[str]:
+        return self.keywords.get(name, frozenset())
+
+    def __repr__(self) -> str:
+        return f"QueryClassification({sorted(self.categories)})"
+
+
+_keyword_sets: Dict[str, Tuple[str, ...]] = {}
+_pattern_sets: Dict[str, re.Pattern] = {}
+_matcher: Optional[KeywordMatcher] = None  # rebuilt on first classify() after a registration
+_lock = threading.Lock()
+_results = TTLCache('query_classifier', max_entries=1024)
+
+
+def register_keywords(name: str, keywords: Iterable[str]) -> None:
+    """Add (or replace) a substring keyword category. Call at import time."""
+    global _matcher
+    with _lock:
+        _keyword_sets[name] = tuple(keywords)
+        _matcher = None
+        _results.clear()
+
+
+def register_patterns(name: str, patterns: Sequence[str]) -> None:
+    """Add (or replace) a regex category; it matches if any pattern is found."""
+    with _lock:
+        _pattern_sets[name] = compile_patterns(patterns)
+        _results.clear()
+
+
+def _get_matcher() -> KeywordMatcher:
+    global _matcher
+    matcher = _matcher
+    if matcher is None:
+        with _lock:
+            if _matcher is None:
+                _matcher = KeywordMatcher(_keyword_sets)
+            matcher = _matcher
+    return matcher
+
+
+def classify(query: str) -> QueryClassification:
+    """Match every registered category against query (cached per lowercased query)."""
+    query_lower = query.lower()
+    result = _results.get(query_lower)
+    if result is None:
+        stripped = query_lower.strip()
+        result = QueryClassification(
+            _get_matcher().categorize(query_lower),
+            frozenset(name for name, regex in list(_pattern_sets.items()) if regex.search(stripped)),
+        )
+        _results.set(query_lower, result)
+    return result
+
+
+# =============================================================================
+# VALUATION - registered here, not in agents.shiller
+# =============================================================================
+# agents.shiller imports pandas and is loaded lazily. The keyword check runs
+# on every /search (CAPE enrichment), so it must not wait for that import.
+
+VALUATION_KEYWORDS = [
+    'cape', 'shiller', 'p/e', 'pe ratio', 'price to earnings',
+    'valuation', 'overvalued', 'undervalued', 'bubble',
+    'expensive', 'cheap', 'fairly valued', 'stretched'
+]
+register_keywords('valuation', VALUATION_KEYWORDS)
+
+
+def is_valuation_query(query: str) -> bool:
+    """
+    Check if a query is about market valuation / CAPE / bubbles.
+    """
+    return classify(query).has('valuation')
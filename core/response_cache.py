@@ -0,0 +1,211 @@
+"""
+Materialized responses - prebuilt /search results for the static query plans.
+
+A query that resolves to one of the static plans in agents/plans_*.json
+always charts the same series, so the expensive part of the answer (data
+fetch, chart formatting, dynamic bullets, the Claude summary and review)
+only changes when one of those series gets new data. This module stores the
+finished payload - charts, summary, suggestions - per plan, keyed by a
+fingerprint of the plan's series in the observation store:
+
+    fingerprint = "UNRATE@2025-09-01/2025-10-03 08:04:01-05;PAYEMS@..."
+
+i.e. each series' latest observation date plus FRED's `last_updated` stamp
+(which also moves on revisions). A stored payload is served only while the
+fingerprint still matches; once the pre-warmer (core/prewarm.py) or a user
+request pulls in a new release, the fingerprint moves and the plan is
+rebuilt. A series that isn't in the store, or whose stored copy is past its
+max age, has no fingerprint, so that plan is simply not served from here.
+
+Payloads persist in SQLite next to the observation store (shared by every
+worker, kept across restarts), with a small in-memory copy in front. Each
+plan also counts how often it is asked for; top_plans() gives the most
+requested ones for background rebuilding.
+
+Usage:
+    from core.response_cache import get_response_cache
+
+    cache = get_response_cache()
+    fp = cache.fingerprint(series_ids)
+    payload = cache.get(plan_key, fp) if fp else None
+    if payload is None:
+        payload = build(...)
+        cache.put(plan_key, cache.fingerprint(series_ids), series_ids, payload)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Sequence
+
+from .cache import TTLCache
+from .observation_store import get_store
+
+RESPONSE_CACHE_PATH = Path(os.environ.get(
+    "ECONSTATS_RESPONSE_CACHE_PATH",
+    Path(__file__).parent.parent / "data" / "responses.db",
+))
+
+# How many of the most-requested plans are kept built in the background
+TOP_PLANS = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    plan_key TEXT PRIMARY KEY,
+    series_ids TEXT NOT NULL,
+    fingerprint TEXT,
+    payload TEXT,
+    built_at REAL,
+    requests INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_responses_requests ON responses(requests DESC);
+"""
+
+
+class ResponseCache:
+    """
+    SQLite-backed store of finished /search payloads, one per static plan.
+
+    Like the observation store, connections are per-thread, the database runs
+    in WAL mode, and any SQLite failure degrades to "not cached".
+    """
+
+    def __init__(self, path: Path = RESPONSE_CACHE_PATH):
+        self.path = Path(path)
+        self._local = threading.local()
+        self._hits = 0
+        self._misses = 0
+        self._builds = 0
+        # plan_key -> (fingerprint, payload)
+        self._memory = TTLCache("response_cache.memory", max_entries=256)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def fingerprint(self, series_ids: Sequence[str]) -> Optional[str]:
+        """
+        Version string for a plan's data, or None if any series isn't servable.
+
+        Built from each series' latest observation date and last_updated stamp
+        in the observation store. None when a series is missing from the store
+        (non-FRED sources, never fetched) or past the store's max age.
+        """
+        if not series_ids:
+            return None
+        store = get_store()
+        parts = []
+        for sid in series_ids:
+            meta = store.get_meta(sid)
+            if not store.is_fresh(meta) or not meta["last_date"]:
+                return None
+            parts.append(f"{sid}@{meta['last_date']}/{meta['last_updated'] or ''}")
+        return ";".join(parts)
+
+    def get(self, plan_key: str, fingerprint: str) -> Optional[dict]:
+        """Return the stored payload for plan_key if it was built from `fingerprint`."""
+        cached = self._memory.get(plan_key)
+        if cached is None:
+            try:
+                row = self._connect().execute(
+                    "SELECT fingerprint, payload FROM responses WHERE plan_key = ?", (plan_key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                print(f"[ResponseCache] read error for '{plan_key}': {e}")
+                row = None
+            if row is not None and row[1]:
+                cached = (row[0], json.loads(row[1]))
+                self._memory.set(plan_key, cached)
+        if cached is not None and cached[0] == fingerprint:
+            self._hits += 1
+            return cached[1]
+        self._misses += 1
+        return None
+
+    def put(self, plan_key: str, fingerprint: Optional[str], series_ids: Sequence[str], payload: dict) -> bool:
+        """
+        Store a freshly built payload. Skipped (returns False) without a fingerprint,
+        since there'd be no way to tell when it goes out of date.
+        """
+        if not fingerprint:
+            return False
+        try:
+            encoded = json.dumps(payload)
+        except (TypeError, ValueError) as e:
+            print(f"[ResponseCache] payload for '{plan_key}' not serializable: {e}")
+            return False
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT INTO responses (plan_key, series_ids, fingerprint, payload, built_at) "
+                    "VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(plan_key) DO UPDATE SET series_ids = excluded.series_ids, "
+                    "fingerprint = excluded.fingerprint, payload = excluded.payload, built_at = excluded.built_at",
+                    (plan_key, json.dumps(list(series_ids)), fingerprint, encoded, time.time()),
+                )
+        except sqlite3.Error as e:
+            print(f"[ResponseCache] write error for '{plan_key}': {e}")
+            return False
+        self._memory.set(plan_key, (fingerprint, payload))
+        self._builds += 1
+        return True
+
+    def record_request(self, plan_key: str, series_ids: Sequence[str]) -> None:
+        """Count one request for plan_key (feeds top_plans())."""
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT INTO responses (plan_key, series_ids, requests) VALUES (?, ?, 1) "
+                    "ON CONFLICT(plan_key) DO UPDATE SET requests = requests + 1",
+                    (plan_key, json.dumps(list(series_ids))),
+                )
+        except sqlite3.Error as e:
+            print(f"[ResponseCache] write error for '{plan_key}': {e}")
+
+    def top_plans(self, limit: int = TOP_PLANS) -> list:
+        """Most requested plans as (plan_key, series_ids, stored_fingerprint), busiest first."""
+        try:
+            rows = self._connect().execute(
+                "SELECT plan_key, series_ids, fingerprint FROM responses "
+                "ORDER BY requests DESC LIMIT ?", (limit,)
+            ).fetchall()
+        except sqlite3.Error as e:
+            print(f"[ResponseCache] read error: {e}")
+            return []
+        return [(key, json.loads(sids), fp) for key, sids, fp in rows]
+
+    def stats(self) -> dict:
+        """Hit/miss/build counters for this process."""
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "builds": self._builds,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Process-wide ResponseCache (lazily created)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache()
+    return _cache
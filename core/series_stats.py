@@ -0,0 +1,270 @@
+"""
+Series statistics - empirical percentiles and window stats from full histories.
+
+Narratives need to say where a reading sits: "4.1% unemployment is in the
+20th percentile of the past 10 years". That used to be estimated: the
+historical context module interpolated linearly between hand-entered lows
+and highs, the data narrator called position-in-range a percentile, and the
+summary prompt looped over the last 52 observations (52 months for a
+monthly series) for its highs and lows.
+
+A SeriesStats is built once from a series' full history - the observation
+store already keeps one per series - and answers those questions from the
+data itself:
+
+- windows: trailing 1, 5 and 10 years (ending at the latest observation),
+  since 1970, and all history; each with count, mean, std, min/max and the
+  dates they occurred
+- percentile(value, window): empirical percentile rank, by binary search
+  over the window's sorted values - O(log n) per lookup
+- zscore(value, window), position(value, window) (0-100 place in min..max)
+- value_on(date): the observation in effect on a date
+
+get_series_stats(series_id) reads the stored history and keeps the result
+until the stored data changes (new observations, revisions or a full
+refresh); it never fetches. IDs ending in _YOY or _CHANGE are computed from
+the stored base series (year-over-year percent change, period-to-period
+difference). For data that isn't a stored series as-is
+(transformed or windowed values), SeriesStats.from_lists() builds the same
+statistics directly.
+
+Usage:
+    from core.series_stats import get_series_stats, SeriesStats
+
+    stats = get_series_stats('UNRATE')
+    if stats:
+        stats.percentile(4.1, '10y')      # 23.5
+        stats.window('5y').max_date       # '2020-04-01'
+        stats.zscore(4.1, 'all')          # -0.9
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from .cache import TTLCache
+from .observation_store import get_store
+from .timeseries import TimeSeries, as_timeseries
+from .transforms import difference, fred_yoy
+
+# Trailing windows, in years, ending at the latest observation
+WINDOW_YEARS = {'1y': 1, '5y': 5, '10y': 10}
+
+# Start of the "long run" window (most narratives quote 50-year averages)
+LONG_RUN_START = '1970-01-01'
+
+_DAYS_PER_YEAR = 365.25
+
+# '<stored id><suffix>' -> transform of the stored series
+DERIVED_SUFFIXES = {
+    '_YOY': fred_yoy,
+    '_CHANGE': difference,
+}
+
+# series_id -> (stored data version, SeriesStats)
+_stats_cache = TTLCache('series_stats', max_entries=512)
+
+
+@dataclass(frozen=True)
+class WindowStats:
+    """Statistics of one window of a series."""
+    start: str
+    end: str
+    count: int
+    mean: float
+    std: float
+    min: float
+    min_date: str
+    max: float
+    max_date: str
+    sorted_values: np.ndarray = field(repr=False, compare=False)
+
+    @classmethod
+    def from_arrays(cls, dates: np.ndarray, values: np.ndarray) -> Optional['WindowStats']:
+        if len(values) == 0:
+            return None
+        lo, hi = int(np.argmin(values)), int(np.argmax(values))
+        return cls(
+            start=str(dates[0]),
+            end=str(dates[-1]),
+            count=len(values),
+            mean=float(values.mean()),
+            std=float(values.std()),
+            min=float(values[lo]),
+            min_date=str(dates[lo]),
+            max=float(values[hi]),
+            max_date=str(dates[hi]),
+            sorted_values=np.sort(values),
+        )
+
+    def percentile(self, value: float) -> float:
+        """Empirical percentile rank of value (0-100); ties count half."""
+        below = np.searchsorted(self.sorted_values, value, side='left')
+        not_above = np.searchsorted(self.sorted_values, value, side='right')
+        return float((below + not_above) / 2 / self.count * 100)
+
+    def zscore(self, value: float) -> Optional[float]:
+        """Standard deviations from the window mean (None for a flat window)."""
+        if self.std == 0:
+            return None
+        return (value - self.mean) / self.std
+
+    def position(self, value: float) -> Optional[float]:
+        """Where value sits between the window's min (0) and max (100); None for a flat window."""
+        if self.max == self.min:
+            return None
+        return (value - self.min) / (self.max - self.min) * 100
+
+    def as_dict(self) -> dict:
+        return {
+            'start': self.start,
+            'end': self.end,
+            'count': self.count,
+            'mean': self.mean,
+            'std': self.std,
+            'min': self.min,
+            'min_date': self.min_date,
+            'max': self.max,
+            'max_date': self.max_date,
+        }
+
+
+class SeriesStats:
+    """Window statistics of one series history (see module docstring)."""
+
+    __slots__ = ('series_id', 'dates', 'values', 'windows')
+
+    def __init__(self, ts: TimeSeries, series_id: str = ''):
+        self.series_id = series_id or ts.series_id
+        mask = ~np.isnan(ts.values)
+        self.dates = ts.dates[mask]
+        self.values = ts.values[mask]
+        self.windows: Dict[str, WindowStats] = {}
+        if not len(self.values):
+            return
+        last = self.dates[-1]
+        for name, years in WINDOW_YEARS.items():
+            start = last - np.timedelta64(int(years * _DAYS_PER_YEAR), 'D')
+            self._add_window(name, np.searchsorted(self.dates, start, side='right'))
+        self._add_window('since_1970', np.searchsorted(self.dates, np.datetime64(LONG_RUN_START)))
+        self._add_window('all', 0)
+
+    def _add_window(self, name: str, lo: int) -> None:
+        window = WindowStats.from_arrays(self.dates[lo:], self.values[lo:])
+        if window is not None:
+            self.windows[name] = window
+
+    @classmethod
+    def from_lists(cls, dates: Sequence, values: Sequence, series_id: str = '') -> 'SeriesStats':
+        return cls(as_timeseries(dates, values, series_id), series_id)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"SeriesStats({self.series_id!r}, {len(self)} obs, to {self.last_date})"
+
+    @property
+    def last_date(self) -> Optional[str]:
+        return str(self.dates[-1]) if len(self.dates) else None
+
+    @property
+    def latest(self) -> Optional[float]:
+        return float(self.values[-1]) if len(self.values) else None
+
+    def matches(self, dates: Sequence, values: Sequence) -> bool:
+        """True if (dates, values) ends on this history's latest observation - i.e. isn't transformed."""
+        if not len(dates) or not len(values) or self.latest is None:
+            return False
+        return str(dates[-1])[:10] == self.last_date and abs(float(values[-1]) - self.latest) < 1e-9
+
+    def covers(self, name: str) -> bool:
+        """True if the history starts before the window does - i.e. the window is complete."""
+        window = self.windows.get(name)
+        return window is not None and window.count < len(self.values)
+
+    def window(self, name: str = 'all') -> Optional[WindowStats]:
+        """One of '1y', '5y', '10y', 'since_1970', 'all' (None if the series has no data there)."""
+        return self.windows.get(name)
+
+    def percentile(self, value: float, window: str = 'all') -> Optional[float]:
+        stats = self.windows.get(window)
+        return stats.percentile(value) if stats else None
+
+    def zscore(self, value: float, window: str = 'all') -> Optional[float]:
+        stats = self.windows.get(window)
+        return stats.zscore(value) if stats else None
+
+    def position(self, value: float, window: str = '5y') -> Optional[float]:
+        stats = self.windows.get(window)
+        return stats.position(value) if stats else None
+
+    def value_on(self, date: str) -> Optional[float]:
+        """The latest observation on or before date."""
+        i = np.searchsorted(self.dates, np.datetime64(date), side='right')
+        return float(self.values[i - 1]) if i else None
+
+    def summary(self, value: Optional[float] = None) -> dict:
+        """Every window's stats, plus value's percentile and z-score in each (default: latest)."""
+        value = self.latest if value is None else value
+        result = {'series_id': self.series_id, 'value': value, 'last_date': self.last_date, 'windows': {}}
+        for name, stats in self.windows.items():
+            entry = stats.as_dict()
+            if value is not None:
+                entry['percentile'] = stats.percentile(value)
+                entry['zscore'] = stats.zscore(value)
+            result['windows'][name] = entry
+        return result
+
+
+def _data_version(meta: dict) -> tuple:
+    # touch() only bumps fetched_at; these change when the observations do
+    return (meta['last_date'], meta['n_obs'], meta['last_updated'], meta['full_fetched_at'])
+
+
+def get_series_stats(series_id: str) -> Optional[SeriesStats]:
+    """
+    Statistics of a stored series' full history, or None if it isn't stored.
+
+    Rebuilt only when the stored observations change; `<ID>_YOY` and
+    `<ID>_CHANGE` are derived from the stored `<ID>`.
+    """
+    base_id, transform = series_id, None
+    for suffix, fn in DERIVED_SUFFIXES.items():
+        if series_id.endswith(suffix):
+            base_id, transform = series_id[:-len(suffix)], fn
+            break
+    store = get_store()
+    meta = store.get_meta(base_id)
+    if meta is None or not meta['n_obs']:
+        return None
+    version = _data_version(meta)
+    cached = _stats_cache.get(series_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    ts = store.get_series(base_id)
+    if ts is None or ts.is_empty:
+        return None
+    if transform is not None:
+        derived = transform(ts)
+        if derived is ts or derived.is_empty:  # too short to transform
+            return None
+        ts = derived
+    stats = SeriesStats(ts, series_id)
+    _stats_cache.set(series_id, (version, stats))
+    return stats
+
+
+def stats_for(series_id: str, dates: Sequence, values: Sequence) -> Optional[SeriesStats]:
+    """
+    Statistics for data about to be shown: the stored full history when the
+    data is that series as-is, else computed from the given values.
+    """
+    stats = get_series_stats(series_id)
+    if stats is not None and stats.matches(dates, values):
+        return stats
+    if not len(values):
+        return None
+    return SeriesStats.from_lists(dates, values, series_id)
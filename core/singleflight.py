@@ -0,0 +1,113 @@
+"""
+Single-flight request coalescing.
+
+When several requests miss a cache at the same moment (everyone asking
+about jobs right after the employment report), each would otherwise issue
+the same upstream call. A SingleFlight group lets the first caller for a
+key do the work while concurrent callers for the same key wait for it and
+share the result (or the exception). Once the call finishes the key is
+released, so later callers go back to the cache as usual.
+
+Usage:
+    from core.singleflight import SingleFlight, AsyncSingleFlight
+
+    _flight = SingleFlight('zillow')
+
+    def fetch_csv(url):
+        cached = _cache.get(url)
+        if cached is None:
+            cached = _flight.do(url, _download_csv, url)
+        return cached
+
+    # Coroutines (FastAPI request path)
+    _aflight = AsyncSingleFlight('fred.async')
+    data = await _aflight.do(series_id, download_async, series_id)
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class _Call:
+    """An in-flight call that followers wait on."""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key across threads."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: dict = {}
+        self._lock = threading.Lock()
+        self.calls = 0    # calls that did the work
+        self.shared = 0   # calls that waited on another caller's result
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run fn(*args, **kwargs) unless a call for `key` is already in flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> dict:
+        return {'name': self.name, 'calls': self.calls, 'shared': self.shared,
+                'in_flight': len(self._calls)}
+
+
+class AsyncSingleFlight:
+    """Coalesces concurrent awaits with the same key on one event loop."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._tasks: dict = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """Await fn(*args, **kwargs) unless a call for `key` is already in flight.
+
+        The shared task is shielded, so one caller being cancelled (e.g. a
+        client disconnect) doesn't cancel the work the others are waiting on.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            self._tasks[key] = task
+            task.add_done_callback(lambda _, key=key: self._tasks.pop(key, None))
+            self.calls += 1
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        return {'name': self.name, 'calls': self.calls, 'shared': self.shared,
+                'in_flight': len(self._tasks)}
@@ -0,0 +1,163 @@
+"""
+Startup profile - per-module import times, and lazy loading of heavy optional modules.
+
+Cold start (deploys, autoscaling - Render waits on /health) is mostly the
+time it takes to import main.py. Most optional agent modules cost a few
+milliseconds, but some pull in heavy dependencies that most requests never
+touch: agents.shiller imports pandas (~0.4 s) to read a single spreadsheet,
+core.unified_catalog builds its catalog at import time.
+
+- import_timer(name) wraps the existing optional-import blocks and records
+  how long each took. Times are cumulative in import order, so a module is
+  charged for the shared dependencies it loads first.
+- LazyModule(name, requires=...) defers a module. Its *_AVAILABLE flag comes
+  from importlib.util.find_spec() on the module and its heavy dependencies,
+  which executes nothing. The module is imported on first use, or earlier by
+  start_warming() in a background thread once the app is serving.
+- print_startup_report() prints the times after the availability banner;
+  get_startup_report() returns them.
+
+Usage:
+    from core.startup import LazyModule, import_timer, print_startup_report, start_warming
+
+    try:
+        with import_timer('agents.fed_sep'):
+            from agents.fed_sep import is_fed_related_query
+        FED_SEP_AVAILABLE = True
+    except Exception as e:
+        FED_SEP_AVAILABLE = False
+
+    shiller = LazyModule('agents.shiller', requires=('pandas',))
+    SHILLER_AVAILABLE = shiller.available
+    get_cape_series = shiller.function('get_cape_series')
+
+    print_startup_report()
+    start_warming()        # once serving: import deferred modules in the background
+"""
+
+import importlib
+import importlib.util
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+# module name -> (seconds, status); status is ok / failed / deferred / missing
+_import_times: Dict[str, Tuple[float, str]] = {}
+_lazy_modules: Dict[str, "LazyModule"] = {}
+_warm_thread: Optional[threading.Thread] = None
+
+
+def _record(name: str, seconds: float, status: str) -> None:
+    # First import wins: reruns (Streamlit re-executes app.py) find modules already loaded
+    if name not in _import_times or _import_times[name][1] == 'deferred':
+        _import_times[name] = (seconds, status)
+
+
+@contextmanager
+def import_timer(name: str) -> Iterator[None]:
+    """Time the imports in the block under `name`; exceptions propagate unchanged."""
+    begin = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        _record(name, time.perf_counter() - begin, 'failed')
+        raise
+    _record(name, time.perf_counter() - begin, 'ok')
+
+
+def _spec_exists(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule:
+    """An optional module imported on first use instead of at startup."""
+
+    def __init__(self, name: str, requires: Tuple[str, ...] = ()):
+        self.name = name
+        self.requires = tuple(requires)
+        self.available = all(_spec_exists(n) for n in (name,) + self.requires)
+        # Streamlit re-executes app.py on every interaction; keep an already-imported module
+        previous = _lazy_modules.get(name)
+        self._module = previous._module if previous is not None else None
+        self._lock = threading.Lock()
+        _lazy_modules[name] = self
+        _record(name, 0.0, 'deferred' if self.available else 'missing')
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def load(self) -> Any:
+        """Import the module (once); raises ImportError if it isn't available."""
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    if not self.available:
+                        raise ImportError(f"{self.name} is not available")
+                    try:
+                        with import_timer(self.name):
+                            module = importlib.import_module(self.name)
+                    except Exception as e:
+                        print(f"[Startup] {self.name} failed to import: {e}")
+                        self.available = False
+                        raise ImportError(f"{self.name} failed to import: {e}") from e
+                    self._module = module
+        return self._module
+
+    def get(self, attr: str) -> Any:
+        """An attribute of the module, importing it if needed."""
+        return getattr(self.load(), attr)
+
+    def function(self, attr: str) -> Callable[..., Any]:
+        """A stand-in for module.attr that imports the module on first call."""
+        def call(*args, **kwargs):
+            return getattr(self.load(), attr)(*args, **kwargs)
+
+        call.__name__ = call.__qualname__ = attr
+        call.__doc__ = f"Calls {self.name}.{attr} (imported on first use)."
+        return call
+
+
+def warm_lazy_modules() -> int:
+    """Import every available lazy module not loaded yet; returns how many were loaded."""
+    loaded = 0
+    for module in list(_lazy_modules.values()):
+        if module.available and not module.loaded:
+            try:
+                module.load()
+                loaded += 1
+            except ImportError:
+                pass
+    return loaded
+
+
+def start_warming() -> None:
+    """Run warm_lazy_modules() in a background thread, once per process."""
+    global _warm_thread
+    if _warm_thread is None:
+        _warm_thread = threading.Thread(target=warm_lazy_modules, name="warm-lazy-modules", daemon=True)
+        _warm_thread.start()
+
+
+def get_startup_report() -> dict:
+    """{'modules': [{module, ms, status}, ...] slowest first, 'total_ms': summed import time}."""
+    rows = sorted(_import_times.items(), key=lambda item: item[1][0], reverse=True)
+    return {
+        'modules': [{'module': name, 'ms': round(seconds * 1000, 1), 'status': status}
+                    for name, (seconds, status) in rows],
+        'total_ms': round(sum(seconds for seconds, _ in _import_times.values()) * 1000, 1),
+    }
+
+
+def print_startup_report(limit: Optional[int] = None) -> None:
+    """Print import times (slowest first) in the startup banner style."""
+    report = get_startup_report()
+    print(f"Import times ({report['total_ms']:.0f} ms total):")
+    for row in report['modules'][:limit]:
+        timing = f"{row['ms']:.1f} ms" if row['status'] in ('ok', 'failed') else row['status']
+        suffix = ' (failed)' if row['status'] == 'failed' else ''
+        print(f"  {row['module']}: {timing}{suffix}")
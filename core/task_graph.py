@@ -0,0 +1,213 @@
+"""
+Task graph - a request's slow stages as named tasks with dependencies.
+
+A novel query in the Streamlit app goes through several multi-second LLM
+stages (query understanding, series selection, relevance and presentation
+validation, narrative, premium analysis) plus data fetches and context
+lookups. Written as straight-line code they run one after another even when
+a stage doesn't need the previous one's output. Here each stage is a task:
+
+- add(name, fn, *args, deps=[...]) starts fn on a shared thread pool as soon
+  as the tasks it depends on have finished; their results are passed to fn
+  first, in deps order, followed by *args.
+- result(name) waits for a task and returns its result (or raises its
+  exception). Tasks can be started before anyone knows whether they'll be
+  needed - `speculative=True` marks them.
+- discard(name) drops a task the request turned out not to need; close()
+  does that for every speculative task never read. A task that hasn't
+  started is cancelled; one already running can't be interrupted, so it
+  finishes in the background and its result is thrown away.
+
+Tasks must not touch Streamlit (`st.*`) - they run outside the script thread.
+
+Usage:
+    from core.task_graph import TaskGraph
+
+    graph = TaskGraph('query')
+    graph.add('understanding', understand_query, query)
+    graph.add('routing_hint', get_routing_recommendation, deps=['understanding'])
+    graph.add('hybrid', hybrid_query_plan, query, speculative=True)
+    ...
+    plan = graph.result('hybrid') if need_hybrid else None
+    graph.close()        # cancels 'hybrid' if it was never read
+"""
+
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Sequence
+
+# Worker threads shared by every request's graph
+MAX_WORKERS = 8
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_MISSING = object()
+
+
+def get_task_executor() -> ThreadPoolExecutor:
+    """Process-wide pool that task graphs run on (created on first use)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='task-graph')
+    return _executor
+
+
+class _Task:
+    __slots__ = ('name', 'fn', 'args', 'kwargs', 'deps', 'speculative', 'future',
+                 'waiting', 'used', 'started', 'finished')
+
+    def __init__(self, name, fn, args, kwargs, deps, speculative):
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.deps = tuple(deps)
+        self.speculative = speculative
+        self.future: Future = Future()
+        self.waiting = len(self.deps)
+        self.used = False
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+
+class TaskGraph:
+    """The tasks of one request (see module docstring)."""
+
+    def __init__(self, label: str = 'request', executor: Optional[ThreadPoolExecutor] = None):
+        self.label = label
+        self.created = time.monotonic()
+        self._executor = executor or get_task_executor()
+        self._tasks: Dict[str, _Task] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def add(self, name: str, fn: Callable[..., Any], *args, deps: Sequence[str] = (),
+            speculative: bool = False, **kwargs) -> None:
+        """Schedule fn(*dep_results, *args, **kwargs) to run once every task in deps has finished."""
+        missing = [d for d in deps if d not in self._tasks]
+        if missing:
+            raise KeyError(f"task '{name}' depends on unknown task(s): {', '.join(missing)}")
+        task = _Task(name, fn, args, kwargs, deps, speculative)
+        with self._lock:
+            if name in self._tasks:
+                raise KeyError(f"task '{name}' already exists")
+            self._tasks[name] = task
+        if not task.deps:
+            self._submit(task)
+            return
+        for dep in task.deps:
+            self._tasks[dep].future.add_done_callback(lambda _f, task=task: self._dep_done(task))
+
+    def _dep_done(self, task: _Task) -> None:
+        with self._lock:
+            task.waiting -= 1
+            ready = task.waiting == 0
+        if ready:
+            self._submit(task)
+
+    def _submit(self, task: _Task) -> None:
+        if task.future.cancelled():
+            return
+        try:
+            self._executor.submit(self._run, task)
+        except RuntimeError as e:
+            # Pool shut down (interpreter exiting)
+            if task.future.set_running_or_notify_cancel():
+                task.future.set_exception(e)
+
+    def _run(self, task: _Task) -> None:
+        if not task.future.set_running_or_notify_cancel():
+            return
+        task.started = time.monotonic()
+        try:
+            dep_results = [self._tasks[d].future.result() for d in task.deps]
+            result = task.fn(*dep_results, *task.args, **task.kwargs)
+        except BaseException as e:
+            task.finished = time.monotonic()
+            task.future.set_exception(e)
+            return
+        task.finished = time.monotonic()
+        task.future.set_result(result)
+
+    def has(self, name: str) -> bool:
+        return name in self._tasks
+
+    def names(self) -> list:
+        """Task names in the order they were added."""
+        return list(self._tasks)
+
+    def done(self, name: str) -> bool:
+        return name in self._tasks and self._tasks[name].future.done()
+
+    def result(self, name: str, timeout: Optional[float] = None, default: Any = _MISSING) -> Any:
+        """
+        Wait for a task and return its result.
+
+        Its exception is re-raised, unless `default` is given - then default
+        is returned on error, timeout or cancellation (the error is logged).
+        """
+        task = self._tasks[name]
+        task.used = True
+        try:
+            return task.future.result(timeout)
+        except (Exception, CancelledError) as e:
+            if default is _MISSING:
+                raise
+            print(f"[TaskGraph] {self.label}.{name} failed: {e!r}")
+            return default
+
+    def future(self, name: str) -> Future:
+        """The task's Future (marks it used), e.g. for concurrent.futures.as_completed()."""
+        task = self._tasks[name]
+        task.used = True
+        return task.future
+
+    def discard(self, name: str) -> None:
+        """The request doesn't need this task after all: cancel it (or ignore its result)."""
+        task = self._tasks.get(name)
+        if task is not None and not task.used:
+            task.future.cancel()
+
+    def close(self) -> dict:
+        """
+        Drop every speculative task that was never read and log the timeline.
+
+        Returns {name: {'ms', 'speculative', 'used', 'state'}}. Safe to call twice.
+        """
+        if self._closed:
+            return {}
+        self._closed = True
+        for task in self._tasks.values():
+            if task.speculative and not task.used:
+                task.future.cancel()
+        timeline = {}
+        for task in self._tasks.values():
+            if task.future.cancelled():
+                state = 'cancelled'
+            elif task.finished is not None:
+                state = 'done'
+            elif task.started is not None:
+                state = 'running'
+            else:
+                state = 'waiting'
+            ms = ((task.finished or time.monotonic()) - task.started) * 1000 if task.started else 0.0
+            timeline[task.name] = {'ms': round(ms, 1), 'speculative': task.speculative,
+                                   'used': task.used, 'state': state}
+        if timeline:
+            parts = [f"{name} {info['ms'] / 1000:.2f}s"
+                     + (' (speculative, unused)' if info['speculative'] and not info['used'] else '')
+                     + ('' if info['state'] == 'done' else f" [{info['state']}]")
+                     for name, info in timeline.items()]
+            total = time.monotonic() - self.created
+            print(f"[TaskGraph] {self.label} {total:.2f}s: " + ', '.join(parts))
+        return timeline
+
+    def __enter__(self) -> "TaskGraph":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
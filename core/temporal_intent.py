@@ -15,6 +15,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional
 
+from .query_classifier import KeywordMatcher, compile_patterns
+
 
 @dataclass
 class TemporalIntent:
@@ -210,6 +212,32 @@ FILTER_PATTERNS = [
     r'\bin\s+the\s+(19[789]0s|20[012]0s)\b(?!\s+(vs|versus|compared))',
 ]
 
+# Compiled once: the pattern lists as single alternations, named periods as one matcher
+_COMPARISON_RE = compile_patterns(COMPARISON_PATTERNS)
+_NAMED_PERIOD_MATCHER = KeywordMatcher({'period': NAMED_PERIODS})
+_NAMED_PERIOD_ORDER = {name: i for i, name in enumerate(NAMED_PERIODS)}
+
+_YEAR_RANGE_RE = re.compile(r'\bfrom\s+(\d{4})\s+to\s+(\d{4})\b')
+_IN_YEAR_RE = re.compile(r'\bin\s+(\d{4})\b')
+_DECADE_RES = [
+    re.compile(r'(?:the\s+)?(19[0-9]0)s'),
+    re.compile(r'(?:the\s+)?(20[0-2]0)s'),
+]
+_YEAR_RES = [
+    re.compile(r'(?:since|from|compared\s+to|vs\.?|versus|like|similar\s+to)\s+(\d{4})'),
+    re.compile(r'(\d{4})\s+levels?'),
+    re.compile(r'in\s+(\d{4})\s+(?:vs|versus|compared)'),
+]
+_LAST_YEAR_RE = re.compile(r'\b(last\s+year|a\s+year\s+ago)\b')
+_CHANGE_RE = re.compile(r'\b(change|changed|difference|delta|moved?|shifted?)\b')
+_PERCENT_RE = re.compile(r'\b(percent|%|growth|rate\s+of\s+change)\b')
+
+
+def _find_named_period(query_lower: str) -> Optional[str]:
+    """First NAMED_PERIODS key (in table order) that appears in the query."""
+    found = {name for _, name in _NAMED_PERIOD_MATCHER.find(query_lower)}
+    return min(found, key=_NAMED_PERIOD_ORDER.__getitem__) if found else None
+
 
 def detect_temporal_intent(query: str) -> TemporalIntent:
     """
@@ -250,39 +278,39 @@ def _detect_comparison_intent(query_lower: str, original_query: str) -> Optional
     - "compared to 2019"
     - "how has X changed since Y"
     """
-    for pattern in COMPARISON_PATTERNS:
-        match = re.search(pattern, query_lower)
-        if match:
-            # Extract the reference period from the match
-            reference_period = _extract_reference_period(query_lower)
-
-            if reference_period:
-                # For comparison, primary is "current" and reference is the historical period
-                # Primary period starts AFTER the reference period ends (to avoid overlap)
-                # Use reference end date + 1 day as start, or a reasonable recent period
-                ref_end = reference_period.get("end")
-                if ref_end:
-                    # Start primary period after reference ends
-                    primary_start = ref_end  # Will get data from dates > ref_end
-                else:
-                    # If reference has no end, use last 2 years
-                    current_year = datetime.now().year
-                    primary_start = f"{current_year - 2}-01-01"
-
-                primary_period = {
-                    "start": primary_start,
-                    "end": None,  # Through present
-                    "label": "Current"
-                }
-
-                return TemporalIntent(
-                    intent_type="compare",
-                    primary_period=primary_period,
-                    reference_period=reference_period,
-                    comparison_type=_detect_comparison_type(query_lower),
-                    original_query=original_query,
-                    explanation=f"Comparing current data to {reference_period.get('label', 'reference period')}."
-                )
+    if not _COMPARISON_RE.search(query_lower):
+        return None
+
+    # Extract the reference period from the query
+    reference_period = _extract_reference_period(query_lower)
+
+    if reference_period:
+        # For comparison, primary is "current" and reference is the historical period
+        # Primary period starts AFTER the reference period ends (to avoid overlap)
+        # Use reference end date + 1 day as start, or a reasonable recent period
+        ref_end = reference_period.get("end")
+        if ref_end:
+            # Start primary period after reference ends
+            primary_start = ref_end  # Will get data from dates > ref_end
+        else:
+            # If reference has no end, use last 2 years
+            current_year = datetime.now().year
+            primary_start = f"{current_year - 2}-01-01"
+
+        primary_period = {
+            "start": primary_start,
+            "end": None,  # Through present
+            "label": "Current"
+        }
+
+        return TemporalIntent(
+            intent_type="compare",
+            primary_period=primary_period,
+            reference_period=reference_period,
+            comparison_type=_detect_comparison_type(query_lower),
+            original_query=original_query,
+            explanation=f"Comparing current data to {reference_period.get('label', 'reference period')}."
+        )
 
     return None
 
@@ -297,7 +325,7 @@ def _detect_filter_intent(query_lower: str, original_query: str) -> Optional[Tem
     - "from 2018 to 2020"
     """
     # Check for year range patterns first
-    year_range_match = re.search(r'\bfrom\s+(\d{4})\s+to\s+(\d{4})\b', query_lower)
+    year_range_match = _YEAR_RANGE_RE.search(query_lower)
     if year_range_match:
         start_year, end_year = year_range_match.groups()
         # Validate and potentially swap if inverted
@@ -312,7 +340,7 @@ def _detect_filter_intent(query_lower: str, original_query: str) -> Optional[Tem
         )
 
     # Check for "in YYYY" pattern
-    year_match = re.search(r'\bin\s+(\d{4})\b', query_lower)
+    year_match = _IN_YEAR_RE.search(query_lower)
     if year_match:
         year = year_match.group(1)
         # Make sure this isn't part of a comparison
@@ -326,18 +354,17 @@ def _detect_filter_intent(query_lower: str, original_query: str) -> Optional[Tem
             )
 
     # Check for named periods (when not in comparison context)
-    for period_name, bounds in NAMED_PERIODS.items():
-        if period_name in query_lower:
-            # Make sure this isn't a comparison pattern
-            is_comparison = any(re.search(p, query_lower) for p in COMPARISON_PATTERNS)
-            if not is_comparison:
-                return TemporalIntent(
-                    intent_type="filter",
-                    filter_start=bounds.get("start"),
-                    filter_end=bounds.get("end"),
-                    original_query=original_query,
-                    explanation=f"Showing data for {bounds.get('label', period_name)}."
-                )
+    period_name = _find_named_period(query_lower)
+    # Make sure this isn't a comparison pattern
+    if period_name and not _COMPARISON_RE.search(query_lower):
+        bounds = NAMED_PERIODS[period_name]
+        return TemporalIntent(
+            intent_type="filter",
+            filter_start=bounds.get("start"),
+            filter_end=bounds.get("end"),
+            original_query=original_query,
+            explanation=f"Showing data for {bounds.get('label', period_name)}."
+        )
 
     return None
 
@@ -349,17 +376,13 @@ def _extract_reference_period(query_lower: str) -> Optional[dict]:
     Returns period bounds dict with start, end, and label.
     """
     # Check named periods first (this includes decades, stagflation era, etc.)
-    for period_name, bounds in NAMED_PERIODS.items():
-        if period_name in query_lower:
-            return bounds.copy()
+    period_name = _find_named_period(query_lower)
+    if period_name:
+        return NAMED_PERIODS[period_name].copy()
 
     # Check for decade references like "the 1970s", "1980s"
-    decade_patterns = [
-        r'(?:the\s+)?(19[0-9]0)s',
-        r'(?:the\s+)?(20[0-2]0)s',
-    ]
-    for pattern in decade_patterns:
-        match = re.search(pattern, query_lower)
+    for pattern in _DECADE_RES:
+        match = pattern.search(query_lower)
         if match:
             decade_start = int(match.group(1))
             return {
@@ -369,14 +392,8 @@ def _extract_reference_period(query_lower: str) -> Optional[dict]:
             }
 
     # Check for specific year references
-    year_patterns = [
-        r'(?:since|from|compared\s+to|vs\.?|versus|like|similar\s+to)\s+(\d{4})',
-        r'(\d{4})\s+levels?',
-        r'in\s+(\d{4})\s+(?:vs|versus|compared)',
-    ]
-
-    for pattern in year_patterns:
-        match = re.search(pattern, query_lower)
+    for pattern in _YEAR_RES:
+        match = pattern.search(query_lower)
         if match:
             year = match.group(1)
             return {
@@ -386,7 +403,7 @@ def _extract_reference_period(query_lower: str) -> Optional[dict]:
             }
 
     # Check for "last year" / "a year ago"
-    if re.search(r'\b(last\s+year|a\s+year\s+ago)\b', query_lower):
+    if _LAST_YEAR_RE.search(query_lower):
         last_year = datetime.now().year - 1
         return {
             "start": f"{last_year}-01-01",
@@ -404,11 +421,11 @@ def _detect_comparison_type(query_lower: str) -> str:
     Returns: "level", "change", or "percent_change"
     """
     # Look for change-related keywords
-    if re.search(r'\b(change|changed|difference|delta|moved?|shifted?)\b', query_lower):
+    if _CHANGE_RE.search(query_lower):
         return "change"
 
     # Look for percentage-related keywords
-    if re.search(r'\b(percent|%|growth|rate\s+of\s+change)\b', query_lower):
+    if _PERCENT_RE.search(query_lower):
         return "percent_change"
 
     # Default to level comparison
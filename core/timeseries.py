@@ -0,0 +1,173 @@
+"""
+TimeSeries - compact in-memory representation of one observation series.
+
+Series used to travel through the app as parallel Python lists of
+'YYYY-MM-DD' strings and floats, and every consumer (YoY, chart building,
+windowing) re-parsed the strings with strptime. A TimeSeries holds the same
+data as two NumPy arrays, parsed once:
+
+- dates:  datetime64[D], sorted ascending
+- values: float64
+- frequency: 'D', 'W', 'M', 'Q' or 'A' (inferred from the date spacing)
+
+Windowing (window(), last_years(), tail()) returns views that share the
+parent's arrays, so trimming a full history to a chart range copies nothing.
+Legacy list consumers get the lists back with to_lists().
+
+Usage:
+    from core.timeseries import TimeSeries, as_timeseries
+
+    ts = TimeSeries.from_lists(dates, values, series_id='UNRATE')
+    recent = ts.last_years(5)
+    dates, values = recent.to_lists()
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+# Median spacing (days) above which a series is treated as the next-coarser
+# frequency. Matches the thresholds the YoY code has always used (weekly
+# below 20 days, monthly up to 60, quarterly beyond).
+_FREQUENCY_BOUNDS = (
+    (300, 'A'),
+    (60, 'Q'),
+    (20, 'M'),
+    (3, 'W'),
+)
+
+# Observations per year for each frequency
+PERIODS_PER_YEAR = {'D': 252, 'W': 52, 'M': 12, 'Q': 4, 'A': 1}
+
+_EMPTY_DATES = np.array([], dtype='datetime64[D]')
+_EMPTY_VALUES = np.array([], dtype=np.float64)
+
+
+def parse_dates(dates) -> np.ndarray:
+    """
+    Parse dates into a datetime64[D] array in one vectorized step.
+
+    Accepts 'YYYY-MM-DD' strings, datetime/date objects, or an existing
+    datetime64 array (returned as a view when already day resolution).
+    """
+    if isinstance(dates, np.ndarray) and dates.dtype == 'datetime64[D]':
+        return dates
+    if len(dates) == 0:
+        return _EMPTY_DATES
+    return np.asarray(dates, dtype='datetime64[D]')
+
+
+def infer_frequency(dates: np.ndarray) -> str:
+    """Infer 'D'/'W'/'M'/'Q'/'A' from the median gap between observations ('' if < 2 points)."""
+    if len(dates) < 2:
+        return ''
+    gap = float(np.median(np.diff(dates[:64]).astype(np.int64)))
+    for bound, freq in _FREQUENCY_BOUNDS:
+        if gap > bound:
+            return freq
+    return 'D'
+
+
+class TimeSeries:
+    """One series as aligned datetime64/float64 arrays plus frequency metadata."""
+
+    __slots__ = ('series_id', 'dates', 'values', 'frequency')
+
+    def __init__(self, dates: np.ndarray, values: np.ndarray, series_id: str = '',
+                 frequency: Optional[str] = None):
+        """
+        Args:
+            dates: datetime64[D] array, sorted ascending
+            values: float64 array, same length as dates
+            series_id: Optional identifier carried along for logging/labels
+            frequency: 'D'/'W'/'M'/'Q'/'A'; inferred from dates if None
+        """
+        if len(dates) != len(values):
+            raise ValueError(f"dates and values differ in length ({len(dates)} vs {len(values)})")
+        self.series_id = series_id
+        self.dates = dates
+        self.values = values
+        self.frequency = infer_frequency(dates) if frequency is None else frequency
+
+    @classmethod
+    def from_lists(cls, dates: Sequence, values: Sequence, series_id: str = '',
+                   frequency: Optional[str] = None) -> 'TimeSeries':
+        """Build from parallel date/value sequences (sorted by date if they aren't already)."""
+        date_arr = parse_dates(dates)
+        value_arr = np.asarray(values, dtype=np.float64)
+        if len(date_arr) > 1 and (np.diff(date_arr) < np.timedelta64(0, 'D')).any():
+            order = np.argsort(date_arr, kind='stable')
+            date_arr, value_arr = date_arr[order], value_arr[order]
+        return cls(date_arr, value_arr, series_id, frequency)
+
+    # --- size / latest -----------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __repr__(self) -> str:
+        span = f"{self.dates[0]}..{self.dates[-1]}" if len(self) else "empty"
+        return f"TimeSeries({self.series_id or '?'}, {len(self)} obs, {self.frequency or '?'}, {span})"
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.dates) == 0
+
+    @property
+    def nbytes(self) -> int:
+        return self.dates.nbytes + self.values.nbytes
+
+    @property
+    def latest_date(self) -> Optional[str]:
+        return str(self.dates[-1]) if len(self.dates) else None
+
+    @property
+    def latest_value(self) -> Optional[float]:
+        return float(self.values[-1]) if len(self.values) else None
+
+    @property
+    def periods_per_year(self) -> int:
+        return PERIODS_PER_YEAR.get(self.frequency, 12)
+
+    # --- windowing (views, no copies) --------------------------------------
+
+    def _view(self, lo: int, hi: int) -> 'TimeSeries':
+        return TimeSeries(self.dates[lo:hi], self.values[lo:hi], self.series_id, self.frequency)
+
+    def window(self, start=None, end=None) -> 'TimeSeries':
+        """Observations with start <= date <= end (either bound optional). Shares memory."""
+        lo = np.searchsorted(self.dates, np.datetime64(start, 'D'), 'left') if start is not None else 0
+        hi = np.searchsorted(self.dates, np.datetime64(end, 'D'), 'right') if end is not None else len(self.dates)
+        return self._view(lo, hi)
+
+    def last_years(self, years: Optional[float]) -> 'TimeSeries':
+        """Trailing window of `years` years ending at the latest observation (None = everything)."""
+        if not years or self.is_empty:
+            return self
+        start = self.dates[-1] - np.timedelta64(int(round(years * 365)), 'D')
+        return self.window(start=start)
+
+    def tail(self, n: int) -> 'TimeSeries':
+        """Last n observations. Shares memory."""
+        return self._view(max(len(self.dates) - n, 0), len(self.dates))
+
+    # --- conversion --------------------------------------------------------
+
+    def date_strings(self) -> list:
+        """Dates as 'YYYY-MM-DD' strings."""
+        return np.datetime_as_string(self.dates, unit='D').tolist()
+
+    def to_lists(self) -> tuple:
+        """(dates, values) as plain lists - the shape JSON and legacy callers expect."""
+        return self.date_strings(), self.values.tolist()
+
+    def with_values(self, dates: np.ndarray, values: np.ndarray) -> 'TimeSeries':
+        """A derived series (e.g. a transform result) keeping this series' id and frequency."""
+        return TimeSeries(dates, values, self.series_id, self.frequency)
+
+
+def as_timeseries(dates, values=None, series_id: str = '') -> TimeSeries:
+    """Accept a TimeSeries or parallel dates/values lists and return a TimeSeries."""
+    if isinstance(dates, TimeSeries):
+        return dates
+    return TimeSeries.from_lists(dates, values if values is not None else [], series_id)
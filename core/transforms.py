@@ -0,0 +1,280 @@
+"""
+Transforms - vectorized series transformations on TimeSeries.
+
+Every transform takes a TimeSeries and returns a new TimeSeries (dates are
+views of the input where possible). Year-ago and other date lookups align on
+the sorted datetime64 index with one searchsorted per lookup, so a weekly
+series since 1967 transforms in well under a millisecond.
+
+- yoy / pct_change / difference: year-over-year and period-over-period change
+- annualized_change: annualized growth over N months (3-month, 6-month)
+- moving_average: trailing N-observation mean
+- rebase: index to 100 (or any base) at a chosen date
+- period_average: calendar-year / quarter / month means
+- fred_yoy: yoy with the warm-up and tolerance picked from the frequency
+- align_nearest: values of one series at another's dates (weekly vs monthly)
+
+The list-based calculate_yoy / calculate_mom / calculate_avg_annual at the
+bottom keep the (dates, values) signatures main.py and app.py have always
+used, on top of these.
+
+Usage:
+    from core.timeseries import TimeSeries
+    from core import transforms
+
+    ts = TimeSeries.from_lists(dates, values, 'ICSA')
+    change = transforms.yoy(ts, tolerance_days=7)
+    smooth = transforms.moving_average(ts, 4)
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from .timeseries import TimeSeries, parse_dates
+
+# Length in months of each period_average() period
+_PERIOD_MONTHS = {'A': 12, 'Q': 3, 'M': 1}
+
+
+def shift_years(dates: np.ndarray, years: int) -> np.ndarray:
+    """
+    Same calendar day `years` years away (Feb 29 -> Feb 28 in non-leap years).
+
+    Month-based like FRED's YoY: Dec 31 2025 maps to Dec 31 2024, not to
+    "365 days earlier".
+    """
+    months = dates.astype('datetime64[M]')
+    target_months = months + np.timedelta64(12 * years, 'M')
+    shifted = target_months.astype('datetime64[D]') + (dates - months.astype('datetime64[D]'))
+    overflow = shifted.astype('datetime64[M]') != target_months
+    shifted[overflow] -= np.timedelta64(1, 'D')
+    return shifted
+
+
+def _nearest_positions(index: np.ndarray, targets: np.ndarray, tolerance_days: int) -> tuple:
+    """
+    Position in `index` of the observation nearest each target date.
+
+    Ties go to the later date. Returns (positions, found) where found marks
+    targets with an observation within `tolerance_days`.
+    """
+    if not len(index):
+        return np.zeros(len(targets), dtype=np.int64), np.zeros(len(targets), dtype=bool)
+    last = len(index) - 1
+    after = np.searchsorted(index, targets, 'left')
+    after_c = np.minimum(after, last)
+    before_c = np.maximum(after - 1, 0)
+
+    gap_after = (index[after_c] - targets).astype(np.int64)
+    gap_before = (targets - index[before_c]).astype(np.int64)
+    gap_after[after > last] = np.iinfo(np.int64).max
+    gap_before[after == 0] = np.iinfo(np.int64).max
+
+    use_before = gap_before < gap_after
+    positions = np.where(use_before, before_c, after_c)
+    found = np.minimum(gap_before, gap_after) <= tolerance_days
+    return positions, found
+
+
+def align_nearest(ts: TimeSeries, dates, tolerance_days: int = 0) -> np.ndarray:
+    """
+    Values of `ts` at the given dates, taking the nearest observation.
+
+    Useful for lining a weekly series (ICSA) up against monthly dates.
+    Dates with no observation within `tolerance_days` get NaN.
+    """
+    targets = parse_dates(dates)
+    positions, found = _nearest_positions(ts.dates, targets, tolerance_days)
+    return np.where(found, ts.values[positions] if len(ts) else np.nan, np.nan)
+
+
+def _nonzero_index(ts: TimeSeries, by_month: bool = False) -> tuple:
+    """Dates/values usable as a change base (zero bases are skipped); last value wins per month."""
+    dates, values = ts.dates, ts.values
+    if by_month:
+        dates = dates.astype('datetime64[M]')
+        if len(dates) > 1:
+            last = np.append(dates[1:] != dates[:-1], True)
+            dates, values = dates[last], values[last]
+    keep = values != 0
+    return dates[keep], values[keep]
+
+
+def yoy(ts: TimeSeries, tolerance_days: int = 0, by_month: bool = False) -> TimeSeries:
+    """
+    Year-over-year percent change.
+
+    Each observation is compared with the same calendar date a year
+    earlier. Observations without a year-ago base are dropped.
+
+    Args:
+        tolerance_days: Also accept the nearest observation within this many
+            days of the year-ago date (7 for weekly series)
+        by_month: Match on calendar month instead of exact date (monthly data
+            stamped on varying days, e.g. Zillow month-ends)
+    """
+    base_dates, base_values = _nonzero_index(ts, by_month)
+    if by_month:
+        targets = ts.dates.astype('datetime64[M]') - np.timedelta64(12, 'M')
+        tolerance_days = 0
+    else:
+        targets = shift_years(ts.dates, -1)
+    positions, found = _nearest_positions(base_dates, targets, tolerance_days)
+    base = base_values[positions[found]]
+    change = ((ts.values[found] - base) / base) * 100
+    return ts.with_values(ts.dates[found], change)
+
+
+def pct_change(ts: TimeSeries, periods: int = 1) -> TimeSeries:
+    """Percent change over `periods` observations (vs |previous|); zero bases are dropped."""
+    if len(ts) <= periods:
+        return ts.with_values(ts.dates[:0], ts.values[:0])
+    prev = ts.values[:-periods]
+    keep = prev != 0
+    change = ((ts.values[periods:][keep] - prev[keep]) / np.abs(prev[keep])) * 100
+    return ts.with_values(ts.dates[periods:][keep], change)
+
+
+def difference(ts: TimeSeries, periods: int = 1) -> TimeSeries:
+    """Change in level over `periods` observations (e.g. monthly payroll gains)."""
+    if len(ts) <= periods:
+        return ts.with_values(ts.dates[:0], ts.values[:0])
+    return ts.with_values(ts.dates[periods:], ts.values[periods:] - ts.values[:-periods])
+
+
+def annualized_change(ts: TimeSeries, months: int = 3) -> TimeSeries:
+    """
+    Annualized percent growth over the trailing `months` months.
+
+    The 3-month and 6-month annualized rates economists quote for CPI/PCE:
+    ((v_t / v_{t-n}) ** (12 / months) - 1) * 100. The lag in observations
+    follows the series frequency (3 months = 1 quarter for quarterly data).
+    """
+    per_year = ts.periods_per_year
+    lag = max(int(round(months * per_year / 12)), 1)
+    if len(ts) <= lag:
+        return ts.with_values(ts.dates[:0], ts.values[:0])
+    prev = ts.values[:-lag]
+    keep = prev > 0
+    ratio = ts.values[lag:][keep] / prev[keep]
+    with np.errstate(invalid='ignore'):
+        change = (np.power(ratio, 12.0 / months) - 1) * 100
+    valid = np.isfinite(change)
+    return ts.with_values(ts.dates[lag:][keep][valid], change[valid])
+
+
+def moving_average(ts: TimeSeries, window: int) -> TimeSeries:
+    """Trailing mean over `window` observations (first window-1 points dropped)."""
+    if window <= 1:
+        return ts
+    if len(ts) < window:
+        return ts.with_values(ts.dates[:0], ts.values[:0])
+    means = np.lib.stride_tricks.sliding_window_view(ts.values, window).mean(axis=1)
+    return ts.with_values(ts.dates[window - 1:], means)
+
+
+def rebase(ts: TimeSeries, base_date=None, base: float = 100.0) -> TimeSeries:
+    """
+    Index the series to `base` at `base_date`.
+
+    Uses the last observation on or before base_date (the first observation
+    if base_date is None or earlier than the series). Returns the series
+    unchanged if the base value is zero.
+    """
+    if ts.is_empty:
+        return ts
+    pos = 0
+    if base_date is not None:
+        pos = max(int(np.searchsorted(ts.dates, np.datetime64(base_date, 'D'), 'right')) - 1, 0)
+    anchor = ts.values[pos]
+    if anchor == 0:
+        return ts
+    return ts.with_values(ts.dates, ts.values / anchor * base)
+
+
+def period_average(ts: TimeSeries, period: str = 'A', stamp: Optional[str] = 'mid') -> TimeSeries:
+    """
+    Mean of the observations in each calendar period.
+
+    Args:
+        period: 'A' (year), 'Q' (quarter) or 'M' (month)
+        stamp: Where to date each average - 'start' of the period, or 'mid'
+               (July 1 for annual averages, the convention our charts use)
+    """
+    span = _PERIOD_MONTHS[period]
+    if ts.is_empty:
+        return ts
+    # Integer period number (months since 1970 // span) - numpy has no quarter unit
+    keys = ts.dates.astype('datetime64[M]').astype(np.int64) // span
+    starts = np.concatenate(([0], np.nonzero(keys[1:] != keys[:-1])[0] + 1))
+    counts = np.diff(np.append(starts, len(keys)))
+    means = np.add.reduceat(ts.values, starts) / counts
+
+    first_months = (keys[starts] * span).astype('datetime64[M]')
+    if stamp == 'mid':
+        dates = (first_months + np.timedelta64(span // 2, 'M')).astype('datetime64[D]')
+        if span == 1:
+            dates = dates + np.timedelta64(14, 'D')
+    else:
+        dates = first_months.astype('datetime64[D]')
+    return TimeSeries(dates, means, ts.series_id, period)
+
+
+# =============================================================================
+# LIST-COMPATIBLE WRAPPERS - the (dates, values) helpers main.py/app.py use
+# =============================================================================
+
+def fred_yoy(ts: TimeSeries) -> TimeSeries:
+    """Year-over-year percent change the way FRED and the charts compute it.
+
+    The warm-up (4 quarters, 12 months or 52 weeks) and the weekly +/-7 day
+    year-ago tolerance are picked from the date spacing. Series too short for
+    a YoY are returned unchanged (the same object).
+    """
+    if len(ts) < 2:
+        return ts
+
+    # Detect frequency by looking at date gaps
+    avg_gap = float(np.diff(ts.dates[:5]).astype(np.int64).mean())
+    if avg_gap > 60:  # Quarterly
+        min_obs = 4
+    elif avg_gap > 20:  # Monthly
+        min_obs = 12
+    else:  # Weekly
+        min_obs = 52
+
+    if len(ts) < min_obs + 1:
+        return ts
+
+    result = yoy(ts, tolerance_days=7 if avg_gap < 20 else 0)
+    return result.window(start=ts.dates[min_obs])
+
+
+def calculate_yoy(dates: list, values: list) -> tuple:
+    """Calculate year-over-year percent change.
+
+    Uses proper month-based comparison (Dec 2025 vs Dec 2024) rather than
+    day-based (365 days back), which is how FRED calculates YoY. Weekly and
+    daily data fall back to the nearest observation within 7 days. Series
+    too short for a YoY are returned unchanged.
+    """
+    ts = TimeSeries.from_lists(dates, values)
+    result = fred_yoy(ts)
+    if result is ts:
+        return dates, values
+    return result.to_lists()
+
+
+def calculate_mom(dates: list, values: list) -> tuple:
+    """Calculate month-over-month (period-over-period) percent change."""
+    if len(dates) < 2:
+        return dates, values
+    return pct_change(TimeSeries.from_lists(dates, values)).to_lists()
+
+
+def calculate_avg_annual(dates: list, values: list) -> tuple:
+    """Calculate average annual values (dated July 1 for plotting)."""
+    if len(dates) == 0:
+        return dates, values
+    return period_average(TimeSeries.from_lists(dates, values), 'A', stamp='mid').to_lists()
@@ -14,14 +14,30 @@ Now with full data source integration:
 
 import os
 import json
-import httpx
+import re
+import asyncio
 import subprocess
-from datetime import datetime, timedelta
+from datetime import datetime
 from fastapi import FastAPI, Request, Form
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
+
+from core.batch_fetch import fetch_batch_async
+from core.cache import TTLCache
+from core.singleflight import SingleFlight, AsyncSingleFlight
+from core.http_client import get_json, aget_json, close_client, close_async_client
+from core.llm_cache import data_fingerprint, get_llm_cache, template_id
+from core.observation_store import read_through, read_through_async
+from core.prewarm import start_prewarm, stop_prewarm
+from core.query_classifier import is_valuation_query
+from core.enrichment import EnrichmentScheduler, Provider, call_with_deadline
+from core.response_cache import get_response_cache
+from core.series_stats import stats_for
+from core.startup import LazyModule, import_timer, print_startup_report, start_warming
+from core.timeseries import TimeSeries
+from core.transforms import calculate_yoy, difference
 
 # Initialize
 app = FastAPI(title="EconStats")
@@ -55,23 +71,27 @@ ALPHAVANTAGE_API_KEY = os.environ.get('ALPHAVANTAGE_API_KEY')
 
 # Alpha Vantage (stocks, forex, P/E ratios)
 try:
-    from agents.alphavantage import get_alphavantage_series, ALPHAVANTAGE_SERIES
+    with import_timer('agents.alphavantage'):
+        from agents.alphavantage import get_alphavantage_series, ALPHAVANTAGE_SERIES
     ALPHAVANTAGE_AVAILABLE = True
 except Exception as e:
     print(f"Alpha Vantage not available: {e}")
     ALPHAVANTAGE_AVAILABLE = False
 
-# Shiller CAPE (valuation/bubble analysis)
-try:
-    from agents.shiller import get_cape_series, get_current_cape, get_bubble_comparison_data, is_valuation_query
-    SHILLER_AVAILABLE = True
-except Exception as e:
-    print(f"Shiller CAPE not available: {e}")
-    SHILLER_AVAILABLE = False
+# Shiller CAPE (valuation/bubble analysis) - imported on first use, it pulls in pandas.
+# The is_valuation_query keyword check lives in core.query_classifier and stays eager.
+SHILLER = LazyModule('agents.shiller', requires=('pandas',))
+SHILLER_AVAILABLE = SHILLER.available
+get_cape_series = SHILLER.function('get_cape_series')
+get_current_cape = SHILLER.function('get_current_cape')
+get_bubble_comparison_data = SHILLER.function('get_bubble_comparison_data')
+if not SHILLER_AVAILABLE:
+    print("Shiller CAPE not available: agents.shiller or pandas not installed")
 
 # Polymarket (prediction markets)
 try:
-    from agents.polymarket import find_relevant_predictions, format_predictions_box
+    with import_timer('agents.polymarket'):
+        from agents.polymarket import find_relevant_predictions, format_predictions_box
     POLYMARKET_AVAILABLE = True
 except Exception as e:
     print(f"Polymarket not available: {e}")
@@ -79,7 +99,8 @@ except Exception as e:
 
 # Recession scorecard
 try:
-    from agents.recession_scorecard import is_recession_query, build_recession_scorecard, format_scorecard_for_display
+    with import_timer('agents.recession_scorecard'):
+        from agents.recession_scorecard import is_recession_query, build_recession_scorecard, format_scorecard_for_display
     RECESSION_SCORECARD_AVAILABLE = True
 except Exception as e:
     print(f"Recession scorecard not available: {e}")
@@ -87,7 +108,8 @@ except Exception as e:
 
 # Zillow (housing data)
 try:
-    from agents.zillow import get_zillow_series, ZILLOW_SERIES
+    with import_timer('agents.zillow'):
+        from agents.zillow import get_zillow_series, ZILLOW_SERIES
     ZILLOW_AVAILABLE = True
 except Exception as e:
     print(f"Zillow not available: {e}")
@@ -95,7 +117,8 @@ except Exception as e:
 
 # EIA (energy data)
 try:
-    from agents.eia import get_eia_series, EIA_SERIES
+    with import_timer('agents.eia'):
+        from agents.eia import get_eia_series, EIA_SERIES
     EIA_AVAILABLE = True
 except Exception as e:
     print(f"EIA not available: {e}")
@@ -103,7 +126,8 @@ except Exception as e:
 
 # DBnomics (international data)
 try:
-    from agents.dbnomics import get_observations_dbnomics, INTERNATIONAL_SERIES, INTERNATIONAL_QUERY_PLANS
+    with import_timer('agents.dbnomics'):
+        from agents.dbnomics import get_observations_dbnomics, INTERNATIONAL_SERIES, INTERNATIONAL_QUERY_PLANS
     DBNOMICS_AVAILABLE = True
 except Exception as e:
     print(f"DBnomics not available: {e}")
@@ -111,7 +135,8 @@ except Exception as e:
 
 # Health check indicators (megacap, labor market, etc.)
 try:
-    from core.health_check_indicators import is_health_check_query, detect_health_check_entity, get_health_check_config
+    with import_timer('core.health_check_indicators'):
+        from core.health_check_indicators import is_health_check_query, detect_health_check_entity, get_health_check_config
     HEALTH_CHECK_AVAILABLE = True
 except Exception as e:
     print(f"Health check not available: {e}")
@@ -123,7 +148,8 @@ except Exception as e:
 
 # Query Understanding - deep semantic analysis of user intent
 try:
-    from agents.query_understanding import understand_query, get_routing_recommendation, validate_series_for_query
+    with import_timer('agents.query_understanding'):
+        from agents.query_understanding import understand_query, get_routing_recommendation, validate_series_for_query
     QUERY_UNDERSTANDING_AVAILABLE = True
 except Exception as e:
     print(f"Query understanding not available: {e}")
@@ -131,7 +157,8 @@ except Exception as e:
 
 # Query Router - handles comparisons and multi-region queries
 try:
-    from agents.query_router import smart_route_query, is_comparison_query, route_comparison_query
+    with import_timer('agents.query_router'):
+        from agents.query_router import smart_route_query, is_comparison_query, route_comparison_query
     QUERY_ROUTER_AVAILABLE = True
 except Exception as e:
     print(f"Query router not available: {e}")
@@ -139,7 +166,8 @@ except Exception as e:
 
 # Series RAG - embedding-based series retrieval
 try:
-    from agents.series_rag import rag_query_plan, retrieve_relevant_series
+    with import_timer('agents.series_rag'):
+        from agents.series_rag import rag_query_plan, retrieve_relevant_series
     RAG_AVAILABLE = True
 except Exception as e:
     print(f"Series RAG not available: {e}")
@@ -147,7 +175,8 @@ except Exception as e:
 
 # Stocks module - market queries
 try:
-    from agents.stocks import find_market_plan, is_market_query, MARKET_SERIES
+    with import_timer('agents.stocks'):
+        from agents.stocks import find_market_plan, is_market_query, MARKET_SERIES
     STOCKS_AVAILABLE = True
 except Exception as e:
     print(f"Stocks module not available: {e}")
@@ -155,7 +184,8 @@ except Exception as e:
 
 # Fed SEP - Federal Reserve projections
 try:
-    from agents.fed_sep import is_fed_related_query, is_sep_query, get_fed_guidance_for_query, get_sep_data, get_current_fed_funds_rate
+    with import_timer('agents.fed_sep'):
+        from agents.fed_sep import is_fed_related_query, is_sep_query, get_fed_guidance_for_query, get_sep_data, get_current_fed_funds_rate
     FED_SEP_AVAILABLE = True
 except Exception as e:
     print(f"Fed SEP not available: {e}")
@@ -163,7 +193,8 @@ except Exception as e:
 
 # Judgment Layer - interpretive queries with web search
 try:
-    from agents.judgment_layer import is_judgment_query, process_judgment_query
+    with import_timer('agents.judgment_layer'):
+        from agents.judgment_layer import is_judgment_query, process_judgment_query
     JUDGMENT_AVAILABLE = True
 except Exception as e:
     print(f"Judgment layer not available: {e}")
@@ -171,7 +202,8 @@ except Exception as e:
 
 # Agent Ensemble - multi-model query planning
 try:
-    from agents.agent_ensemble import call_ensemble_for_app, generate_ensemble_description
+    with import_timer('agents.agent_ensemble'):
+        from agents.agent_ensemble import call_ensemble_for_app, generate_ensemble_description
     ENSEMBLE_AVAILABLE = True
 except Exception as e:
     print(f"Agent ensemble not available: {e}")
@@ -204,6 +236,8 @@ print(f"  STOCKS: {STOCKS_AVAILABLE}")
 print(f"  FED_SEP: {FED_SEP_AVAILABLE}")
 print(f"  JUDGMENT: {JUDGMENT_AVAILABLE}")
 print(f"  ENSEMBLE: {ENSEMBLE_AVAILABLE}")
+print("-" * 60)
+print_startup_report()
 print("=" * 60)
 
 # Load query plans from existing JSON files
@@ -852,24 +886,41 @@ ECONOMIC_EVENTS = [
 
 
 # =============================================================================
-# DYNAMIC AI BULLETS - AI-generated chart insights
+# ASYNC CLAUDE CLIENT - non-blocking LLM calls for the /search request path
 # =============================================================================
 
-_dynamic_bullet_cache = {}
+_async_anthropic = None
 
 
-def generate_dynamic_ai_bullets(series_id: str, dates: list, values: list, info: dict, user_query: str = None) -> list:
-    """Generate dynamic AI-powered bullets using Claude.
+def get_async_anthropic() -> AsyncAnthropic:
+    """Shared AsyncAnthropic client (one connection pool per worker)."""
+    global _async_anthropic
+    if _async_anthropic is None:
+        _async_anthropic = AsyncAnthropic(api_key=ANTHROPIC_API_KEY)
+    return _async_anthropic
 
-    Creates contextual, data-aware bullets that:
-    1. Reference actual current values and trends
-    2. Are tailored to the user's specific question
-    3. Provide timely economic context
-    """
-    if not ANTHROPIC_API_KEY or not values or len(values) < 2:
-        db_info = SERIES_DB.get(series_id, {})
-        return db_info.get('bullets', [])
 
+async def claude_text_async(prompt: str, max_tokens: int = 300) -> str:
+    """Send a single-turn prompt to Claude without blocking the event loop."""
+    response = await get_async_anthropic().messages.create(
+        model="claude-sonnet-4-20250514",
+        max_tokens=max_tokens,
+        messages=[{"role": "user", "content": prompt}]
+    )
+    return response.content[0].text
+
+
+# =============================================================================
+# DYNAMIC AI BULLETS - AI-generated chart insights
+# =============================================================================
+
+_dynamic_bullet_cache = TTLCache('main.dynamic_bullets', max_entries=100)
+_bullet_flight = SingleFlight('main.dynamic_bullets')
+_bullet_flight_async = AsyncSingleFlight('main.dynamic_bullets.async')
+
+
+def _build_bullets_prompt(series_id: str, dates: list, values: list, info: dict, user_query: str = None) -> str:
+    """Build the Claude prompt for dynamic chart bullets."""
     db_info = SERIES_DB.get(series_id, {})
     name = info.get('name', info.get('title', series_id))
     unit = info.get('unit', info.get('units', ''))
@@ -936,6 +987,33 @@ Write 2 bullets that:
 
 Format: Return ONLY a JSON array of strings, like: ["First bullet.", "Second bullet."]"""
 
+    return prompt
+
+
+def _parse_bullets(text: str) -> list | None:
+    """Extract the JSON bullet array from Claude's response."""
+    if '[' in text and ']' in text:
+        start = text.index('[')
+        end = text.rindex(']') + 1
+        bullets = json.loads(text[start:end])
+        if isinstance(bullets, list) and len(bullets) > 0:
+            return bullets[:2]
+    return None
+
+
+def generate_dynamic_ai_bullets(series_id: str, dates: list, values: list, info: dict, user_query: str = None) -> list:
+    """Generate dynamic AI-powered bullets using Claude.
+
+    Creates contextual, data-aware bullets that:
+    1. Reference actual current values and trends
+    2. Are tailored to the user's specific question
+    3. Provide timely economic context
+    """
+    static_bullets = SERIES_DB.get(series_id, {}).get('bullets', [])
+    if not ANTHROPIC_API_KEY or not values or len(values) < 2:
+        return static_bullets
+
+    prompt = _build_bullets_prompt(series_id, dates, values, info, user_query)
     try:
         client = Anthropic(api_key=ANTHROPIC_API_KEY)
         response = client.messages.create(
@@ -943,14 +1021,26 @@ Format: Return ONLY a JSON array of strings, like: ["First bullet.", "Second bul
             max_tokens=300,
             messages=[{"role": "user", "content": prompt}]
         )
-        text = response.content[0].text
-
-        if '[' in text and ']' in text:
-            start = text.index('[')
-            end = text.rindex(']') + 1
-            bullets = json.loads(text[start:end])
-            if isinstance(bullets, list) and len(bullets) > 0:
-                return bullets[:2]
+        bullets = _parse_bullets(response.content[0].text)
+        if bullets:
+            return bullets
+    except Exception as e:
+        print(f"[DynamicBullets] Error: {e}")
+
+    return static_bullets[:2] if static_bullets else []
+
+
+async def generate_dynamic_ai_bullets_async(series_id: str, dates: list, values: list, info: dict, user_query: str = None) -> list:
+    """Async version of generate_dynamic_ai_bullets() for the FastAPI request path."""
+    static_bullets = SERIES_DB.get(series_id, {}).get('bullets', [])
+    if not ANTHROPIC_API_KEY or not values or len(values) < 2:
+        return static_bullets
+
+    prompt = _build_bullets_prompt(series_id, dates, values, info, user_query)
+    try:
+        bullets = _parse_bullets(await claude_text_async(prompt, max_tokens=300))
+        if bullets:
+            return bullets
     except Exception as e:
         print(f"[DynamicBullets] Error: {e}")
 
@@ -965,16 +1055,28 @@ def get_dynamic_bullets(series_id: str, dates: list, values: list, info: dict, u
 
     cache_key = f"{series_id}_{values[-1] if values else 'empty'}_{user_query or ''}"
 
-    if cache_key in _dynamic_bullet_cache:
-        return _dynamic_bullet_cache[cache_key]
+    cached = _dynamic_bullet_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    bullets = generate_dynamic_ai_bullets(series_id, dates, values, info, user_query)
-    _dynamic_bullet_cache[cache_key] = bullets
+    bullets = _bullet_flight.do(cache_key, generate_dynamic_ai_bullets, series_id, dates, values, info, user_query)
+    _dynamic_bullet_cache.set(cache_key, bullets)
 
-    if len(_dynamic_bullet_cache) > 100:
-        keys = list(_dynamic_bullet_cache.keys())
-        for k in keys[:50]:
-            del _dynamic_bullet_cache[k]
+    return bullets
+
+
+async def get_dynamic_bullets_async(series_id: str, dates: list, values: list, info: dict, user_query: str = None) -> list:
+    """Async version of get_dynamic_bullets() (AI enabled). Shares the same cache."""
+    cache_key = f"{series_id}_{values[-1] if values else 'empty'}_{user_query or ''}"
+
+    cached = _dynamic_bullet_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    bullets = await _bullet_flight_async.do(
+        cache_key, generate_dynamic_ai_bullets_async, series_id, dates, values, info, user_query
+    )
+    _dynamic_bullet_cache.set(cache_key, bullets)
 
     return bullets
 
@@ -1058,14 +1160,8 @@ def calculate_derived_series(series_data: dict, formula: str, name: str = "Deriv
 # ECONOMIST REVIEWER - Second-pass AI review of explanations
 # =============================================================================
 
-def call_economist_reviewer(query: str, series_data: list, original_summary: str) -> str:
-    """Call a second Claude agent to review and improve the explanation.
-
-    This agent sees actual data values to explain not just WHAT is happening but WHY.
-    """
-    if not ANTHROPIC_API_KEY or not series_data:
-        return original_summary
-
+def _build_reviewer_prompt(query: str, series_data: list, original_summary: str) -> str | None:
+    """Build the economist-reviewer prompt, or None if there is no data to review."""
     # Build data summary for the reviewer
     data_summary = []
     for series_id, dates, values, info in series_data:
@@ -1103,9 +1199,9 @@ def call_economist_reviewer(query: str, series_data: list, original_summary: str
         data_summary.append(summary)
 
     if not data_summary:
-        return original_summary
+        return None
 
-    prompt = f"""You are reviewing an economic data explanation. Improve it to be clearer and more insightful.
+    return f"""You are reviewing an economic data explanation. Improve it to be clearer and more insightful.
 
 USER'S QUESTION: "{query}"
 
@@ -1124,6 +1220,26 @@ Improve the explanation to:
 
 Return ONLY the improved explanation, no preamble."""
 
+
+def call_economist_reviewer(query: str, series_data: list, original_summary: str) -> str:
+    """Call a second Claude agent to review and improve the explanation.
+
+    This agent sees actual data values to explain not just WHAT is happening but WHY.
+    """
+    if not ANTHROPIC_API_KEY or not series_data:
+        return original_summary
+
+    prompt = _build_reviewer_prompt(query, series_data, original_summary)
+    if not prompt:
+        return original_summary
+
+    # Same question on the same data - reuse the review (core/llm_cache.py)
+    cache_template = template_id('economist_reviewer', original_summary)
+    fingerprint = data_fingerprint(series_data)
+    cached = get_llm_cache().get(cache_template, query, fingerprint)
+    if cached:
+        return cached
+
     try:
         client = Anthropic(api_key=ANTHROPIC_API_KEY)
         response = client.messages.create(
@@ -1133,6 +1249,34 @@ Return ONLY the improved explanation, no preamble."""
         )
         improved = response.content[0].text.strip()
         if len(improved) > 50:  # Sanity check
+            get_llm_cache().put(cache_template, query, fingerprint, improved)
+            return improved
+    except Exception as e:
+        print(f"[EconomistReviewer] Error: {e}")
+
+    return original_summary
+
+
+async def call_economist_reviewer_async(query: str, series_data: list, original_summary: str) -> str:
+    """Async version of call_economist_reviewer() for the FastAPI request path."""
+    if not ANTHROPIC_API_KEY or not series_data:
+        return original_summary
+
+    prompt = _build_reviewer_prompt(query, series_data, original_summary)
+    if not prompt:
+        return original_summary
+
+    cache = get_llm_cache()
+    cache_template = template_id('economist_reviewer', original_summary)
+    fingerprint = data_fingerprint(series_data)
+    cached = await asyncio.to_thread(cache.get, cache_template, query, fingerprint)
+    if cached:
+        return cached
+
+    try:
+        improved = (await claude_text_async(prompt, max_tokens=300)).strip()
+        if len(improved) > 50:  # Sanity check
+            await asyncio.to_thread(cache.put, cache_template, query, fingerprint, improved)
             return improved
     except Exception as e:
         print(f"[EconomistReviewer] Error: {e}")
@@ -1354,9 +1498,7 @@ def search_fred(query: str, limit: int = 10) -> list:
         'sort_order': 'desc',
     }
     try:
-        with httpx.Client(timeout=10) as client:
-            resp = client.get(url, params=params)
-            data = resp.json()
+        data = get_json(url, params=params, timeout=10)
 
         results = []
         for s in data.get('seriess', []):
@@ -1593,8 +1735,20 @@ CRITICAL - display_names: Keep short but precise. Include country for internatio
         return None
 
 
-def get_fred_data(series_id: str, years: int = None) -> tuple:
-    """Fetch data from FRED API."""
+def _fetch_fred_info(series_id: str) -> dict:
+    """Fetch FRED series info (title, units, notes, last_updated). {} on failure."""
+    info_url = "https://api.stlouisfed.org/fred/series"
+    info_params = {'series_id': series_id, 'api_key': FRED_API_KEY, 'file_type': 'json'}
+    try:
+        info_data = get_json(info_url, params=info_params, timeout=10)
+        return info_data.get('seriess', [{}])[0]
+    except Exception as e:
+        print(f"FRED info error for {series_id}: {e}")
+        return {}
+
+
+def _fetch_fred_observations(series_id: str, start: str = None) -> tuple:
+    """Fetch FRED observations from `start` (full history if None) as (dates, values, info)."""
     url = "https://api.stlouisfed.org/fred/series/observations"
     params = {
         'series_id': series_id,
@@ -1602,15 +1756,11 @@ def get_fred_data(series_id: str, years: int = None) -> tuple:
         'file_type': 'json',
         'sort_order': 'asc',
     }
-
-    if years:
-        start = datetime.now() - timedelta(days=years * 365)
-        params['observation_start'] = start.strftime('%Y-%m-%d')
+    if start:
+        params['observation_start'] = start
 
     try:
-        with httpx.Client(timeout=10) as client:
-            resp = client.get(url, params=params)
-            data = resp.json()
+        data = get_json(url, params=params, timeout=10)
 
         observations = data.get('observations', [])
         dates = []
@@ -1620,23 +1770,44 @@ def get_fred_data(series_id: str, years: int = None) -> tuple:
                 dates.append(obs['date'])
                 values.append(float(obs['value']))
 
-        # Get series info
-        info_url = "https://api.stlouisfed.org/fred/series"
-        info_params = {'series_id': series_id, 'api_key': FRED_API_KEY, 'file_type': 'json'}
-        with httpx.Client(timeout=10) as client:
-            info_resp = client.get(info_url, params=info_params)
-            info_data = info_resp.json()
-
-        info = info_data.get('seriess', [{}])[0]
-        db_info = SERIES_DB.get(series_id, {})
-        info['name'] = db_info.get('name', info.get('title', series_id))
-        info['unit'] = db_info.get('unit', info.get('units', ''))
-        # Keep FRED notes for AI context (already in info from API response)
-
-        return dates, values, info
+        return dates, values, {}
     except Exception as e:
         print(f"FRED error for {series_id}: {e}")
+        return [], [], {'error': str(e)}
+
+
+def _download_fred_history(series_id: str) -> tuple:
+    """Download the full observation history and series info for a FRED series."""
+    dates, values, _ = _fetch_fred_observations(series_id)
+    if not dates:
         return [], [], {}
+    return dates, values, _fetch_fred_info(series_id)
+
+
+def get_fred_data(series_id: str, years: int = None) -> tuple:
+    """Fetch data from FRED API.
+
+    Reads through the shared observation store: the full history is downloaded
+    once and every `years` window is served as a slice of it. Stale series are
+    refreshed incrementally (only observations after the last stored date), and
+    skipped entirely when FRED's `last_updated` stamp hasn't moved.
+    """
+    dates, values, info = read_through(
+        series_id,
+        lambda: _download_fred_history(series_id),
+        years=years,
+        fetch_info=lambda: _fetch_fred_info(series_id),
+        fetch_since=lambda since: _fetch_fred_observations(series_id, since),
+    )
+    if not dates:
+        return [], [], {}
+
+    db_info = SERIES_DB.get(series_id, {})
+    info['name'] = db_info.get('name', info.get('title', series_id))
+    info['unit'] = db_info.get('unit', info.get('units', ''))
+    # Keep FRED notes for AI context (already in info from API response)
+
+    return dates, values, info
 
 
 def fetch_series_data(series_id: str, years: int = 5) -> tuple:
@@ -1698,89 +1869,114 @@ def fetch_series_data(series_id: str, years: int = 5) -> tuple:
     return get_fred_data(series_id, years)
 
 
-def calculate_yoy(dates: list, values: list) -> tuple:
-    """Calculate year-over-year percent change.
+# =============================================================================
+# ASYNC DATA FETCHING - used by the /search request path
+# =============================================================================
 
-    Uses proper month-based comparison (Dec 2025 vs Dec 2024) rather than
-    day-based (365 days back), which is how FRED calculates YoY.
-    """
-    if len(dates) < 2:
-        return dates, values
-
-    # Detect frequency by looking at date gaps
-    date_objs = [datetime.strptime(d, '%Y-%m-%d') for d in dates[:min(5, len(dates))]]
-    if len(date_objs) >= 2:
-        avg_gap = sum((date_objs[i+1] - date_objs[i]).days for i in range(len(date_objs)-1)) / (len(date_objs)-1)
-        if avg_gap > 60:  # Quarterly
-            min_obs = 4
-        elif avg_gap > 20:  # Monthly
-            min_obs = 12
-        else:  # Weekly
-            min_obs = 52
-    else:
-        min_obs = 12
+async def _fetch_fred_info_async(series_id: str) -> dict:
+    """Async version of _fetch_fred_info()."""
+    info_url = "https://api.stlouisfed.org/fred/series"
+    info_params = {'series_id': series_id, 'api_key': FRED_API_KEY, 'file_type': 'json'}
+    try:
+        info_data = await aget_json(info_url, params=info_params, timeout=10)
+        return info_data.get('seriess', [{}])[0]
+    except Exception as e:
+        print(f"FRED info error for {series_id}: {e}")
+        return {}
 
-    if len(dates) < min_obs + 1:
-        return dates, values
 
-    date_to_value = dict(zip(dates, values))
-    yoy_dates, yoy_values = [], []
+async def _fetch_fred_observations_async(series_id: str, start: str = None) -> tuple:
+    """Async version of _fetch_fred_observations()."""
+    url = "https://api.stlouisfed.org/fred/series/observations"
+    params = {
+        'series_id': series_id,
+        'api_key': FRED_API_KEY,
+        'file_type': 'json',
+        'sort_order': 'asc',
+    }
+    if start:
+        params['observation_start'] = start
 
-    for i, date_str in enumerate(dates[min_obs:], min_obs):
-        date = datetime.strptime(date_str, '%Y-%m-%d')
+    try:
+        data = await aget_json(url, params=params, timeout=10)
 
-        # Calculate exactly 12 months ago (same month, previous year)
-        # This matches FRED's YoY calculation method
-        try:
-            year_ago = date.replace(year=date.year - 1)
-            year_ago_str = year_ago.strftime('%Y-%m-%d')
-        except ValueError:
-            # Handle Feb 29 -> Feb 28 for non-leap years
-            year_ago = date.replace(year=date.year - 1, day=28)
-            year_ago_str = year_ago.strftime('%Y-%m-%d')
-
-        # Look for exact match first, then try nearby dates (for weekly data)
-        found = False
-        for check_str in [year_ago_str]:
-            if check_str in date_to_value and date_to_value[check_str] != 0:
-                base_value = date_to_value[check_str]
-                yoy = ((values[i] - base_value) / base_value) * 100
-                yoy_dates.append(date_str)
-                yoy_values.append(yoy)
-                found = True
-                break
+        observations = data.get('observations', [])
+        dates = []
+        values = []
+        for obs in observations:
+            if obs['value'] != '.':
+                dates.append(obs['date'])
+                values.append(float(obs['value']))
 
-        # Fallback for weekly data: try nearby dates within 7 days
-        if not found and avg_gap < 20:
-            for offset in range(1, 8):
-                for direction in [1, -1]:
-                    check = (year_ago + timedelta(days=offset * direction)).strftime('%Y-%m-%d')
-                    if check in date_to_value and date_to_value[check] != 0:
-                        base_value = date_to_value[check]
-                        yoy = ((values[i] - base_value) / base_value) * 100
-                        yoy_dates.append(date_str)
-                        yoy_values.append(yoy)
-                        found = True
-                        break
-                if found:
-                    break
+        return dates, values, {}
+    except Exception as e:
+        print(f"FRED error for {series_id}: {e}")
+        return [], [], {'error': str(e)}
 
-    return yoy_dates, yoy_values
 
+async def _download_fred_history_async(series_id: str) -> tuple:
+    """Async version of _download_fred_history(); observations and info are fetched concurrently."""
+    (dates, values, _), info = await asyncio.gather(
+        _fetch_fred_observations_async(series_id),
+        _fetch_fred_info_async(series_id),
+    )
+    if not dates:
+        return [], [], {}
+    return dates, values, info
+
+
+async def get_fred_data_async(series_id: str, years: int = None) -> tuple:
+    """Async version of get_fred_data() - same store, same return shape."""
+    dates, values, info = await read_through_async(
+        series_id,
+        lambda: _download_fred_history_async(series_id),
+        years=years,
+        fetch_info=lambda: _fetch_fred_info_async(series_id),
+        fetch_since=lambda since: _fetch_fred_observations_async(series_id, since),
+    )
+    if not dates:
+        return [], [], {}
 
-def get_ai_summary(query: str, series_data: list, conversation_history: list = None) -> dict:
-    """Get AI-generated summary, chart descriptions, and follow-up suggestions from Claude."""
-    # Build series IDs list for default response
-    series_ids = [sid for sid, dates, values, info in series_data if values]
+    db_info = SERIES_DB.get(series_id, {})
+    info['name'] = db_info.get('name', info.get('title', series_id))
+    info['unit'] = db_info.get('unit', info.get('units', ''))
 
-    default_response = {
+    return dates, values, info
+
+
+async def fetch_series_data_async(series_id: str, years: int = 5) -> tuple:
+    """
+    Async version of fetch_series_data().
+
+    FRED goes through the native async client. The other sources (Alpha
+    Vantage, Shiller, Zillow, EIA, DBnomics) keep their sync agents and run
+    in a worker thread, so they still never block the event loop.
+    """
+    is_fred = not (
+        (series_id.startswith('av_') and ALPHAVANTAGE_AVAILABLE)
+        or (series_id == 'shiller_cape' and SHILLER_AVAILABLE)
+        or (series_id.startswith('zillow_') and ZILLOW_AVAILABLE)
+        or (series_id.startswith('eia_') and EIA_AVAILABLE)
+        or (DBNOMICS_AVAILABLE and series_id in INTERNATIONAL_SERIES)
+    )
+    if is_fred:
+        return await get_fred_data_async(series_id, years)
+    return await asyncio.to_thread(fetch_series_data, series_id, years)
+
+
+def _default_summary_response(series_data: list) -> dict:
+    """Fallback summary used when Claude is unavailable or fails."""
+    series_ids = [sid for sid, dates, values, info in series_data if values]
+    return {
         "summary": "Economic data loaded successfully.",
         "suggestions": ["How is inflation trending?", "What's the unemployment rate?"],
         "chart_descriptions": {sid: "" for sid in series_ids}
     }
 
-    if not ANTHROPIC_API_KEY:
-        return default_response
+
+def _build_summary_prompt(query: str, series_data: list, conversation_history: list = None) -> str:
+    """Build the Claude prompt for the summary, chart descriptions and suggestions."""
+    series_ids = [sid for sid, dates, values, info in series_data if values]
 
     # Build RICH context with analytics for better descriptions
     context_parts = []
@@ -1811,25 +2007,33 @@ def get_ai_summary(query: str, series_data: list, conversation_history: list = N
                     trend = "rising" if three_mo_pct > 0.5 else ("falling" if three_mo_pct < -0.5 else "flat")
                     lines.append(f"  - 3-month trend: {trend} ({three_mo_pct:+.1f}%)")
 
-            # Add 52-week high/low (or available data)
-            lookback = min(52, len(values))
-            if lookback > 12:
-                recent_vals = values[-lookback:]
-                recent_dates = dates[-lookback:]
-                peak_val = max(recent_vals)
-                trough_val = min(recent_vals)
-                peak_idx = recent_vals.index(peak_val)
-                trough_idx = recent_vals.index(trough_val)
-
-                if peak_val != 0:
-                    pct_from_peak = ((latest - peak_val) / abs(peak_val)) * 100
+            # Where the reading sits: 1-year high/low (by date, any frequency),
+            # percentiles and z-score. From the full stored history when these
+            # values are the series as-is, else from the values shown.
+            stats = stats_for(sid, dates, values)
+            one_year = stats.window('1y') if stats else None
+            if one_year and one_year.count > 2:
+                if one_year.max != 0:
+                    pct_from_peak = ((latest - one_year.max) / abs(one_year.max)) * 100
                     if abs(pct_from_peak) > 2:  # Only mention if >2% from peak
-                        lines.append(f"  - 52-week high: {peak_val:.2f} ({recent_dates[peak_idx]}), currently {pct_from_peak:.1f}% from peak")
+                        lines.append(f"  - 1-year high: {one_year.max:.2f} ({one_year.max_date}), currently {pct_from_peak:.1f}% from peak")
 
-                if trough_val != 0:
-                    pct_from_trough = ((latest - trough_val) / abs(trough_val)) * 100
+                if one_year.min != 0:
+                    pct_from_trough = ((latest - one_year.min) / abs(one_year.min)) * 100
                     if pct_from_trough > 2:  # Only mention if notably above trough
-                        lines.append(f"  - 52-week low: {trough_val:.2f} ({recent_dates[trough_idx]}), currently {pct_from_trough:+.1f}% above")
+                        lines.append(f"  - 1-year low: {one_year.min:.2f} ({one_year.min_date}), currently {pct_from_trough:+.1f}% above")
+
+            if stats is not None and stats.covers('5y'):
+                five_year = stats.window('5y')
+                zscore = five_year.zscore(latest)
+                zscore_str = f", z-score {zscore:+.1f}" if zscore is not None else ""
+                lines.append(f"  - 5-year percentile: {five_year.percentile(latest):.0f} "
+                             f"(range {five_year.min:.2f} to {five_year.max:.2f}, avg {five_year.mean:.2f}{zscore_str})")
+
+            if stats is not None and stats.covers('10y'):
+                history = stats.window('all')
+                lines.append(f"  - Percentile since {history.start[:4]}: {history.percentile(latest):.0f} "
+                             f"(low {history.min:.2f} in {history.min_date[:7]}, high {history.max:.2f} in {history.max_date[:7]})")
 
             context_parts.append("\n".join(lines))
 
@@ -1897,6 +2101,26 @@ Guidelines:
 
 Return only valid JSON, no other text."""
 
+    return prompt
+
+
+def _parse_summary_response(text: str, default_response: dict) -> dict:
+    """Parse Claude's JSON summary response, filling gaps from the default."""
+    result = json.loads(text)
+    return {
+        "summary": result.get("summary", default_response["summary"]),
+        "suggestions": result.get("suggestions", default_response["suggestions"])[:2],
+        "chart_descriptions": result.get("chart_descriptions", default_response["chart_descriptions"])
+    }
+
+
+def get_ai_summary(query: str, series_data: list, conversation_history: list = None) -> dict:
+    """Get AI-generated summary, chart descriptions, and follow-up suggestions from Claude."""
+    default_response = _default_summary_response(series_data)
+    if not ANTHROPIC_API_KEY:
+        return default_response
+
+    prompt = _build_summary_prompt(query, series_data, conversation_history)
     try:
         client = Anthropic(api_key=ANTHROPIC_API_KEY)
         response = client.messages.create(
@@ -1904,12 +2128,90 @@ Return only valid JSON, no other text."""
             max_tokens=800,
             messages=[{"role": "user", "content": prompt}]
         )
-        result = json.loads(response.content[0].text)
-        return {
-            "summary": result.get("summary", default_response["summary"]),
-            "suggestions": result.get("suggestions", default_response["suggestions"])[:2],
-            "chart_descriptions": result.get("chart_descriptions", default_response["chart_descriptions"])
-        }
+        return _parse_summary_response(response.content[0].text, default_response)
+    except Exception as e:
+        print(f"Claude error: {e}")
+        return default_response
+
+
+async def get_ai_summary_async(query: str, series_data: list, conversation_history: list = None) -> dict:
+    """Async version of get_ai_summary() for the FastAPI request path."""
+    default_response = _default_summary_response(series_data)
+    if not ANTHROPIC_API_KEY:
+        return default_response
+
+    prompt = _build_summary_prompt(query, series_data, conversation_history)
+    try:
+        text = await claude_text_async(prompt, max_tokens=800)
+        return _parse_summary_response(text, default_response)
+    except Exception as e:
+        print(f"Claude error: {e}")
+        return default_response
+
+
+def _partial_json_string(text: str, key: str) -> str:
+    """Decoded value of a JSON string field in a possibly unfinished JSON document.
+
+    Used to show the summary while Claude is still writing the JSON around
+    it. Stops at the end of the string or at an incomplete escape.
+    """
+    match = re.search(r'"%s"\s*:\s*"' % re.escape(key), text)
+    if not match:
+        return ''
+    out = []
+    i = match.end()
+    while i < len(text):
+        c = text[i]
+        if c == '"':
+            break
+        if c == '\\':
+            if i + 1 >= len(text):
+                break
+            esc = text[i + 1]
+            if esc == 'u':
+                if i + 6 > len(text):
+                    break
+                out.append(chr(int(text[i + 2:i + 6], 16)))
+                i += 6
+                continue
+            out.append(_JSON_ESCAPES.get(esc, esc))
+            i += 2
+            continue
+        out.append(c)
+        i += 1
+    return ''.join(out)
+
+
+_JSON_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f'}
+
+
+async def get_ai_summary_stream(query: str, series_data: list, conversation_history: list = None,
+                                on_summary=None) -> dict:
+    """get_ai_summary_async(), streaming the summary text to `on_summary(delta)` as it arrives.
+
+    Returns the same parsed response; on_summary is an async callback.
+    """
+    default_response = _default_summary_response(series_data)
+    if not ANTHROPIC_API_KEY:
+        return default_response
+
+    prompt = _build_summary_prompt(query, series_data, conversation_history)
+    try:
+        text = ""
+        sent = 0
+        async with get_async_anthropic().messages.stream(
+            model="claude-sonnet-4-20250514",
+            max_tokens=800,
+            messages=[{"role": "user", "content": prompt}]
+        ) as stream:
+            async for chunk in stream.text_stream:
+                text += chunk
+                if on_summary is not None:
+                    partial = _partial_json_string(text, "summary")
+                    if len(partial) > sent:
+                        await on_summary(partial[sent:])
+                        sent = len(partial)
+        return _parse_summary_response(text, default_response)
     except Exception as e:
         print(f"Claude error: {e}")
         return default_response
@@ -1927,7 +2229,7 @@ def get_recessions_in_range(min_date: str, max_date: str) -> list:
     return recessions
 
 
-def format_chart_data(series_data: list, payems_show_level: bool = False, user_query: str = None, use_dynamic_bullets: bool = True) -> list:
+def format_chart_data(series_data: list, payems_show_level: bool = False, user_query: str = None, use_dynamic_bullets: bool = True, bullets_by_series: dict = None) -> list:
     """Format series data for Plotly.js on the frontend.
 
     Args:
@@ -1935,6 +2237,7 @@ def format_chart_data(series_data: list, payems_show_level: bool = False, user_q
         payems_show_level: If True, show PAYEMS as total employment level instead of monthly changes
         user_query: Optional user query for contextual dynamic bullets
         use_dynamic_bullets: If True, generate AI-powered contextual bullets
+        bullets_by_series: Optional pre-generated bullets keyed by series ID (async /search path)
     """
     charts = []
 
@@ -2001,11 +2304,7 @@ def format_chart_data(series_data: list, payems_show_level: bool = False, user_q
 
             # Compute monthly changes for the CHART (not just the headline)
             # This makes the chart show job gains/losses over time
-            chart_values = []
-            chart_dates = []
-            for i in range(1, len(values)):
-                chart_values.append(values[i] - values[i-1])
-                chart_dates.append(dates[i])
+            chart_dates, chart_values = difference(TimeSeries.from_lists(dates, values, sid)).to_lists()
 
         elif sid == 'PAYEMS' and len(values) >= 2:
             # Fallback if not enough data for 3-mo avg
@@ -2019,11 +2318,7 @@ def format_chart_data(series_data: list, payems_show_level: bool = False, user_q
                 yoy_type = 'jobs'
 
             # Compute monthly changes for chart
-            chart_values = []
-            chart_dates = []
-            for i in range(1, len(values)):
-                chart_values.append(values[i] - values[i-1])
-                chart_dates.append(dates[i])
+            chart_dates, chart_values = difference(TimeSeries.from_lists(dates, values, sid)).to_lists()
 
         elif is_already_yoy or is_growth_rate:
             # Already a rate/change - don't show any YoY comparison
@@ -2053,7 +2348,9 @@ def format_chart_data(series_data: list, payems_show_level: bool = False, user_q
         sa = db_info.get('sa', False)
 
         # Generate dynamic AI bullets if enabled, otherwise use static
-        if use_dynamic_bullets and ANTHROPIC_API_KEY:
+        if bullets_by_series and sid in bullets_by_series:
+            bullets = bullets_by_series[sid]
+        elif use_dynamic_bullets and ANTHROPIC_API_KEY:
             bullets = get_dynamic_bullets(sid, dates, values, info, user_query, use_ai=True)
         else:
             bullets = db_info.get('bullets', [])
@@ -2092,6 +2389,471 @@ def format_chart_data(series_data: list, payems_show_level: bool = False, user_q
     return charts
 
 
+# =============================================================================
+# ENRICHMENT BOXES - optional context cards shown above the charts
+# =============================================================================
+# Each builder returns an HTML snippet or None. They don't depend on the
+# query plan or series data, so /search starts them alongside routing.
+
+def build_cape_html(query: str) -> str | None:
+    """Shiller CAPE valuation box for valuation/bubble queries."""
+    if not (SHILLER_AVAILABLE and is_valuation_query(query)):
+        return None
+    try:
+        cape_current = get_current_cape()
+        cape_value = cape_current['current_value']
+        percentile = cape_current['percentile']
+        vs_avg = cape_current['vs_average']['premium_pct']
+        dot_com_peak = cape_current['comparisons'].get('dot_com_peak', 44.2)
+        vs_dot_com = cape_current['comparisons'].get('vs_dot_com_pct', 0)
+
+        color = "#dc2626" if percentile >= 90 else "#f59e0b" if percentile >= 75 else "#3b82f6"
+        status = "Extremely Elevated" if percentile >= 90 else "Elevated" if percentile >= 75 else "Above Average"
+
+        # FastAPI UI style - clean white card matching other boxes
+        vs_avg_color = "text-red-600" if vs_avg >= 50 else "text-amber-600" if vs_avg >= 25 else "text-slate-900"
+        vs_dot_com_color = "text-emerald-600" if vs_dot_com < 0 else "text-red-600"
+        cape_html = f"""
+        <div class="bg-white rounded-2xl border border-slate-200 shadow-sm mb-6 overflow-hidden">
+            <div class="px-6 py-4 border-b border-slate-100">
+                <div class="flex items-center justify-between">
+                    <div>
+                        <h3 class="font-semibold text-slate-900">Shiller CAPE Ratio</h3>
+                        <p class="text-sm text-slate-500">143 years of valuation history</p>
+                    </div>
+                    <span class="px-3 py-1 rounded-full text-xs font-semibold text-white" style="background: {color}">{status}</span>
+                </div>
+            </div>
+            <div class="grid grid-cols-4 gap-4 text-center px-6 py-4">
+                <div><p class="text-xs font-medium text-slate-500 uppercase tracking-wide mb-1">Current</p><p class="text-2xl font-bold text-slate-900">{cape_value:.1f}</p><p class="text-xs text-slate-400">{percentile:.0f}th percentile</p></div>
+                <div><p class="text-xs font-medium text-slate-500 uppercase tracking-wide mb-1">vs Average</p><p class="text-2xl font-bold {vs_avg_color}">+{vs_avg:.0f}%</p><p class="text-xs text-slate-400">Avg: 17</p></div>
+                <div><p class="text-xs font-medium text-slate-500 uppercase tracking-wide mb-1">vs Dot-Com</p><p class="text-2xl font-bold {vs_dot_com_color}">{vs_dot_com:+.0f}%</p><p class="text-xs text-slate-400">Peak: {dot_com_peak:.1f}</p></div>
+                <div><p class="text-xs font-medium text-slate-500 uppercase tracking-wide mb-1">History</p><p class="text-2xl font-bold text-blue-600">143yr</p><p class="text-xs text-slate-400">Since 1881</p></div>
+            </div>
+            <div class="px-6 py-3 bg-slate-50 border-t border-slate-100">
+                <p class="text-sm text-slate-600">{cape_current['interpretation']}</p>
+            </div>
+        </div>
+        """
+        print(f"[CAPE] Current: {cape_value:.1f} ({percentile:.0f}th percentile)")
+        return cape_html
+    except Exception as e:
+        print(f"[CAPE] Error: {e}")
+    return None
+
+
+async def build_recession_html(query: str) -> str | None:
+    """Recession scorecard box for recession queries."""
+    if not (RECESSION_SCORECARD_AVAILABLE and is_recession_query(query)):
+        return None
+    try:
+        # Fetch recession indicators
+        (
+            (sahm_dates, sahm_values, _),
+            (yc_dates, yc_values, _),
+            (claims_dates, claims_values, _),
+            (sent_dates, sent_values, _),
+        ) = await asyncio.gather(
+            get_fred_data_async('SAHMREALTIME', years=2),
+            get_fred_data_async('T10Y2Y', years=2),
+            get_fred_data_async('ICSA', years=2),
+            get_fred_data_async('UMCSENT', years=2),
+        )
+
+        sahm = sahm_values[-1] if sahm_values else None
+        yield_curve = yc_values[-1] if yc_values else None
+        claims = sum(claims_values[-4:]) / 4 if claims_values and len(claims_values) >= 4 else None
+        sentiment = sent_values[-1] if sent_values else None
+
+        scorecard = build_recession_scorecard(
+            sahm_value=sahm, yield_curve_value=yield_curve,
+            sentiment_value=sentiment, claims_value=claims
+        )
+        recession_html = format_scorecard_for_display(scorecard)
+        print(f"[Recession] Scorecard built - overall risk: {scorecard.get('overall_risk', 'unknown')}")
+        return recession_html
+    except Exception as e:
+        print(f"[Recession] Error: {e}")
+    return None
+
+
+def build_polymarket_html(query: str) -> str | None:
+    """Polymarket prediction box for queries with relevant markets."""
+    if not POLYMARKET_AVAILABLE:
+        return None
+    try:
+        predictions = find_relevant_predictions(query)[:3]
+        if predictions:
+            polymarket_html = format_predictions_box(predictions, query)
+            print(f"[Polymarket] Found {len(predictions)} relevant predictions")
+            return polymarket_html
+    except Exception as e:
+        print(f"[Polymarket] Error: {e}")
+    return None
+
+
+def build_fed_sep_html(query: str) -> str | None:
+    """FOMC Summary of Economic Projections box for Fed-related queries."""
+    if not (FED_SEP_AVAILABLE and is_fed_related_query(query)):
+        return None
+    try:
+        fed_data = get_sep_data()
+        fed_rate = get_current_fed_funds_rate()
+
+        if fed_data and fed_rate:
+            current_rate = fed_rate.get('current_rate', 'N/A')
+            rate_decision = fed_rate.get('last_decision', '')
+            projections = fed_data.get('projections', {})
+
+            # Build Fed SEP display box
+            fed_sep_html = f"""
+            <div class="bg-white rounded-2xl border border-slate-200 shadow-sm mb-6 overflow-hidden">
+                <div class="px-6 py-4 border-b border-slate-100">
+                    <div class="flex items-center justify-between">
+                        <div>
+                            <h3 class="font-semibold text-slate-900">Federal Reserve Outlook</h3>
+                            <p class="text-sm text-slate-500">FOMC Summary of Economic Projections</p>
+                        </div>
+                        <span class="px-3 py-1 rounded-full text-xs font-semibold bg-blue-100 text-blue-800">{rate_decision}</span>
+                    </div>
+                </div>
+                <div class="grid grid-cols-4 gap-4 text-center px-6 py-4">
+                    <div>
+                        <p class="text-xs font-medium text-slate-500 uppercase tracking-wide mb-1">Fed Funds Rate</p>
+                        <p class="text-2xl font-bold text-slate-900">{current_rate}</p>
+                        <p class="text-xs text-slate-400">Current Target</p>
+                    </div>
+                    <div>
+                        <p class="text-xs font-medium text-slate-500 uppercase tracking-wide mb-1">GDP Growth</p>
+                        <p class="text-2xl font-bold text-emerald-600">{projections.get('gdp_2024', 'N/A')}</p>
+                        <p class="text-xs text-slate-400">2024 Median</p>
+                    </div>
+                    <div>
+                        <p class="text-xs font-medium text-slate-500 uppercase tracking-wide mb-1">Unemployment</p>
+                        <p class="text-2xl font-bold text-blue-600">{projections.get('unemployment_2024', 'N/A')}</p>
+                        <p class="text-xs text-slate-400">2024 Median</p>
+                    </div>
+                    <div>
+                        <p class="text-xs font-medium text-slate-500 uppercase tracking-wide mb-1">Core PCE</p>
+                        <p class="text-2xl font-bold text-amber-600">{projections.get('core_pce_2024', 'N/A')}</p>
+                        <p class="text-xs text-slate-400">2024 Median</p>
+                    </div>
+                </div>
+                <div class="px-6 py-3 bg-slate-50 border-t border-slate-100">
+                    <p class="text-sm text-slate-600">Source: Federal Reserve FOMC Summary of Economic Projections</p>
+                </div>
+            </div>
+            """
+            print(f"[FedSEP] Added Fed projections box, rate: {current_rate}")
+            return fed_sep_html
+    except Exception as e:
+        print(f"[FedSEP] Error: {e}")
+    return None
+
+
+# Optional extras around an answer, each with its own budget (seconds from
+# request start). A box that misses it is left off the page; see core/enrichment.py.
+ENRICHMENT = EnrichmentScheduler([
+    Provider('fed_sep', build_fed_sep_html, deadline=3.0),
+    Provider('recession', build_recession_html, deadline=4.0),
+    Provider('cape', build_cape_html, deadline=3.0),
+    Provider('polymarket', build_polymarket_html, deadline=3.0),
+])
+
+# The judgment layer (web search + synthesis) can take 30s+ uncached
+JUDGMENT_PROVIDER = Provider('judgment', process_judgment_query if JUDGMENT_AVAILABLE else None, deadline=10.0)
+
+# /search/stream can still show a box that arrives this long after its deadline
+STREAM_ENRICHMENT_GRACE = 10.0
+
+
+async def build_search_response(query: str, series_ids: list, show_yoy, payems_show_level: bool = False,
+                                conversation_history: list = None, agentic_display_names: list = None,
+                                fallback_mode: bool = False, emit=None) -> dict:
+    """Fetch, summarize and format the charts for one routed query.
+
+    Everything /search shows apart from the enrichment boxes: the chart
+    payload, the (judged and reviewed) summary, and follow-up suggestions.
+    Also used to rebuild materialized responses for static plans in the
+    background (see core/response_cache.py).
+
+    `emit`, if given, is an async callback(event, payload) for streaming:
+    'charts' (static-bullet charts as soon as the data is in) and
+    'summary_delta' (summary text as Claude writes it).
+
+    Returns:
+        Dict with 'summary', 'suggestions' and 'charts'
+    """
+    conversation_history = conversation_history or []
+    agentic_display_names = agentic_display_names or []
+    agentic_search = bool(agentic_display_names)
+
+    # Fetch data using unified fetcher (supports av_*, zillow_*, eia_*, etc.)
+    # All series are fetched in one concurrent round, duplicates once
+    batch = await fetch_batch_async(
+        series_ids, fetch_series_data_async,
+        on_error=lambda sid, e: ([], [], {}), label='search',
+    )
+    fetched = [batch[sid] for sid in series_ids]
+    series_data = []
+    for i, (sid, (dates, values, info)) in enumerate(zip(series_ids, fetched)):
+        if dates and values:
+            # Override name with agentic display name if available
+            if agentic_search and i < len(agentic_display_names) and agentic_display_names[i]:
+                info['name'] = agentic_display_names[i]
+
+            # Apply YoY if needed (with type safety guards)
+            db_info = SERIES_DB.get(sid, {})
+            data_type = db_info.get('data_type', 'level')
+
+            # Determine if YoY should be applied
+            apply_yoy = False
+            if isinstance(show_yoy, list) and i < len(show_yoy):
+                apply_yoy = show_yoy[i]
+            elif isinstance(show_yoy, bool):
+                apply_yoy = show_yoy
+            elif db_info.get('show_yoy', False):
+                apply_yoy = True
+
+            # TYPE SAFETY GUARDS - never apply YoY to:
+            # 1. Rates (unemployment rate, interest rates) - already percentages
+            # 2. Spreads (yield curve) - already differences
+            # 3. Growth rates (GDP growth) - already percent changes
+            # 4. Series marked show_absolute_change (employment counts)
+            if data_type in ('rate', 'spread', 'growth_rate'):
+                apply_yoy = False
+            if db_info.get('show_absolute_change', False):
+                apply_yoy = False
+
+            if apply_yoy and len(dates) > 12:
+                dates, values = calculate_yoy(dates, values)
+                # Use custom YoY name/unit if available
+                yoy_name = db_info.get('yoy_name', info.get('name', sid) + ' (YoY %)')
+                yoy_unit = db_info.get('yoy_unit', '% Change YoY')
+                info['name'] = yoy_name
+                info['unit'] = yoy_unit
+                info['is_yoy'] = True
+
+            series_data.append((sid, dates, values, info))
+
+    if emit is not None:
+        await emit('charts', format_chart_data(series_data, payems_show_level=payems_show_level,
+                                               user_query=query, use_dynamic_bullets=False))
+        summary_call = get_ai_summary_stream(query, series_data, conversation_history,
+                                             on_summary=lambda delta: emit('summary_delta', delta))
+    else:
+        summary_call = get_ai_summary_async(query, series_data, conversation_history)
+
+    # Get AI summary and suggestions, generating chart bullets alongside
+    if ANTHROPIC_API_KEY:
+        ai_response, *bullet_lists = await asyncio.gather(
+            summary_call,
+            *(get_dynamic_bullets_async(sid, dates, values, info, query)
+              for sid, dates, values, info in series_data),
+        )
+        bullets_by_series = {sd[0]: bullets for sd, bullets in zip(series_data, bullet_lists)}
+    else:
+        ai_response = await summary_call
+        bullets_by_series = None
+    summary = ai_response["summary"]
+    suggestions = ai_response["suggestions"]
+    chart_descriptions = ai_response.get("chart_descriptions", {})
+
+    # If we fell back to default data, acknowledge we couldn't find specific data
+    if fallback_mode:
+        summary = f"I wasn't able to find data specifically about \"{query}\" in FRED. Here are some key indicators showing the current state of the U.S. economy: {summary}"
+
+    # =================================================================
+    # JUDGMENT LAYER: Add interpretive context for judgment queries
+    # =================================================================
+    if JUDGMENT_AVAILABLE and is_judgment_query(query):
+        # Optional - dropped (and left to finish into its own cache) if it misses its deadline
+        judgment = await call_with_deadline(JUDGMENT_PROVIDER, query, series_data, summary)
+        # (text, was_judgment_query) - a failed synthesis hands back our own summary
+        if judgment and judgment[0] and judgment[0] != summary:
+            # Enhance summary with judgment context
+            summary = judgment[0]
+            print("[Judgment] Enhanced summary with interpretive context")
+
+    # =================================================================
+    # ECONOMIST REVIEWER: Second-pass review for quality
+    # =================================================================
+    if ANTHROPIC_API_KEY and series_data and len(summary) < 500:
+        try:
+            improved_summary = await call_economist_reviewer_async(query, series_data, summary)
+            if improved_summary and improved_summary != summary:
+                summary = improved_summary
+                print(f"[EconomistReviewer] Enhanced summary")
+        except Exception as e:
+            print(f"[EconomistReviewer] Error: {e}")
+
+    # Format for frontend with dynamic AI bullets
+    charts = format_chart_data(series_data, payems_show_level=payems_show_level, user_query=query,
+                               use_dynamic_bullets=True, bullets_by_series=bullets_by_series)
+
+    # Add Claude's descriptions to each chart
+    for chart in charts:
+        chart['description'] = chart_descriptions.get(chart['series_id'], '')
+
+    return {"summary": summary, "suggestions": suggestions, "charts": charts}
+
+
+def static_plan_key(query: str, plan: dict = None) -> str:
+    """Key of the static QUERY_PLANS entry `plan` was routed to by exact match, else None."""
+    if not plan:
+        return None
+    for key in (query.lower().strip(), normalize_query(query)):
+        if QUERY_PLANS.get(key) is plan:
+            return key
+    return None
+
+
+def _parse_history(history: str) -> list:
+    """Conversation history posted back by the results page (JSON list), or []."""
+    if history:
+        try:
+            return json.loads(history)
+        except json.JSONDecodeError:
+            pass
+    return []
+
+
+async def route_search(query: str, conversation_history: list) -> dict:
+    """Temporal filtering, routing and the materialized-response lookup for one query.
+
+    Shared by /search and /search/stream. Returns the routing decision
+    (series_ids, show_yoy, payems_show_level, agentic_display_names,
+    fallback_mode, temporal_filter) plus plan_key and a prebuilt 'response'
+    when the query hit a materialized static plan (else None).
+    """
+    # =================================================================
+    # TEMPORAL FILTERING: Extract date ranges from query
+    # =================================================================
+    temporal_filter = extract_temporal_filter(query)
+    years_override = None
+    if temporal_filter:
+        years_override = temporal_filter.get('years_override')
+        print(f"[Temporal] Detected: {temporal_filter.get('temporal_focus', 'none')} -> years={years_override}")
+
+    # Smart date range based on query content
+    if not years_override:
+        years_override = get_smart_date_range(query, default_years=8)
+
+    # Detect geographic scope (for future regional support)
+    geo_scope = detect_geographic_scope(query)
+    if geo_scope['type'] != 'national':
+        print(f"[Geographic] Detected {geo_scope['type']}: {geo_scope['name']}")
+
+    # =================================================================
+    # ROUTE 1: Health Check Queries (megacap, labor market, etc.)
+    # =================================================================
+    health_check_handled = False
+    plan = None
+    agentic_display_names = []
+    fallback_mode = False
+    if HEALTH_CHECK_AVAILABLE and is_health_check_query(query):
+        entity = detect_health_check_entity(query)
+        if entity:
+            health_config = get_health_check_config(entity)
+            if health_config:
+                series_ids = health_config.primary_series[:4]
+                show_yoy = health_config.show_yoy[:4] if health_config.show_yoy else [False] * len(series_ids)
+                payems_show_level = False
+                health_check_handled = True
+                print(f"[HealthCheck] Routed '{query}' to entity '{entity}' with series {series_ids}")
+
+    # Track if this is a judgment query (needs interpretive context)
+    is_judgment = JUDGMENT_AVAILABLE and is_judgment_query(query)
+    if is_judgment:
+        print(f"[Judgment] Query requires interpretive context: '{query}'")
+
+    # =================================================================
+    # STANDARD ROUTING: Query Plans or Agentic Search
+    # =================================================================
+    # Check if we already have series from health check routing
+    if not health_check_handled:
+        plan = find_query_plan(query)
+
+        if plan:
+            series_ids = plan.get('series', [])[:4]
+            show_yoy = plan.get('show_yoy', False)
+            payems_show_level = plan.get('payems_show_level', False)
+        else:
+            # No pre-defined plan - use Claude to search
+            print(f"No plan found for '{query}', trying agentic search...")
+            agentic_plan = await asyncio.to_thread(get_series_via_claude, query)
+
+            if agentic_plan and agentic_plan.get('series'):
+                series_ids = agentic_plan['series'][:4]
+                agentic_display_names = agentic_plan.get('display_names', [])
+                show_yoy = agentic_plan.get('show_yoy', False)
+                payems_show_level = False
+                print(f"Agentic search found: {series_ids}")
+            else:
+                print("Agentic search failed, using default series")
+                series_ids = ['PAYEMS', 'UNRATE', 'A191RO1Q156NBEA', 'CPIAUCSL']
+                show_yoy = [False, False, False, True]
+                payems_show_level = False
+                fallback_mode = True
+
+    # =================================================================
+    # MATERIALIZED RESPONSES: static plans served from the prebuilt
+    # payload while their series are unchanged (core/response_cache.py)
+    # =================================================================
+    plan_key = None
+    if not (health_check_handled or conversation_history or temporal_filter or is_judgment):
+        plan_key = static_plan_key(query, plan)
+
+    response = None
+    if plan_key:
+        response_cache = get_response_cache()
+        await asyncio.to_thread(response_cache.record_request, plan_key, series_ids)
+        fingerprint = await asyncio.to_thread(response_cache.fingerprint, series_ids)
+        if fingerprint:
+            response = await asyncio.to_thread(response_cache.get, plan_key, fingerprint)
+            if response is not None:
+                print(f"[ResponseCache] Served '{plan_key}' from materialized response")
+
+    return {
+        'series_ids': series_ids,
+        'show_yoy': show_yoy,
+        'payems_show_level': payems_show_level,
+        'agentic_display_names': agentic_display_names,
+        'fallback_mode': fallback_mode,
+        'temporal_filter': temporal_filter,
+        'plan_key': plan_key,
+        'response': response,
+    }
+
+
+async def build_routed_response(query: str, route: dict, conversation_history: list, emit=None) -> dict:
+    """Build (or reuse) the response for a route_search() decision.
+
+    A fresh build of a materialized static plan is stored for next time.
+    `emit` is passed through to build_search_response() for streaming.
+    """
+    if route['response'] is not None:
+        return route['response']
+    series_ids = route['series_ids']
+    response = await build_search_response(
+        query, series_ids, route['show_yoy'], payems_show_level=route['payems_show_level'],
+        conversation_history=conversation_history,
+        agentic_display_names=route['agentic_display_names'],
+        fallback_mode=route['fallback_mode'],
+        emit=emit,
+    )
+    if route['plan_key']:
+        response_cache = get_response_cache()
+        fingerprint = await asyncio.to_thread(response_cache.fingerprint, series_ids)
+        await asyncio.to_thread(response_cache.put, route['plan_key'], fingerprint, series_ids, response)
+    return response
+
+
+def _next_history(conversation_history: list, query: str, summary: str) -> str:
+    """History JSON for the next request (last 5 exchanges)."""
+    return json.dumps((conversation_history + [{"query": query, "summary": summary}])[-5:])
+
+
 # Routes
 
 @app.get("/", response_class=HTMLResponse)
@@ -2114,326 +2876,17 @@ async def search(request: Request, query: str = Form(...), history: str = Form(d
     import traceback
 
     try:
-        # Parse conversation history from JSON
-        conversation_history = []
-        if history:
-            try:
-                conversation_history = json.loads(history)
-            except json.JSONDecodeError:
-                pass
-
-        # =================================================================
-        # TEMPORAL FILTERING: Extract date ranges from query
-        # =================================================================
-        temporal_filter = extract_temporal_filter(query)
-        years_override = None
-        if temporal_filter:
-            years_override = temporal_filter.get('years_override')
-            print(f"[Temporal] Detected: {temporal_filter.get('temporal_focus', 'none')} -> years={years_override}")
-
-        # Smart date range based on query content
-        if not years_override:
-            years_override = get_smart_date_range(query, default_years=8)
-
-        # Detect geographic scope (for future regional support)
-        geo_scope = detect_geographic_scope(query)
-        if geo_scope['type'] != 'national':
-            print(f"[Geographic] Detected {geo_scope['type']}: {geo_scope['name']}")
-
-        # Special data for enhanced responses
-        polymarket_html = None
-        cape_html = None
-        recession_html = None
-
-        # =================================================================
-        # ROUTE 1: Health Check Queries (megacap, labor market, etc.)
-        # =================================================================
-        health_check_handled = False
-        if HEALTH_CHECK_AVAILABLE and is_health_check_query(query):
-            entity = detect_health_check_entity(query)
-            if entity:
-                health_config = get_health_check_config(entity)
-                if health_config:
-                    series_ids = health_config.primary_series[:4]
-                    show_yoy = health_config.show_yoy[:4] if health_config.show_yoy else [False] * len(series_ids)
-                    payems_show_level = False
-                    agentic_search = False
-                    agentic_display_names = []
-                    fallback_mode = False
-                    health_check_handled = True
-                    print(f"[HealthCheck] Routed '{query}' to entity '{entity}' with series {series_ids}")
-
-        # =================================================================
-        # ROUTE 2: Valuation/Bubble Queries (Shiller CAPE)
-        # =================================================================
-        if SHILLER_AVAILABLE and is_valuation_query(query):
-            try:
-                cape_current = get_current_cape()
-                cape_value = cape_current['current_value']
-                percentile = cape_current['percentile']
-                vs_avg = cape_current['vs_average']['premium_pct']
-                dot_com_peak = cape_current['comparisons'].get('dot_com_peak', 44.2)
-                vs_dot_com = cape_current['comparisons'].get('vs_dot_com_pct', 0)
-
-                color = "#dc2626" if percentile >= 90 else "#f59e0b" if percentile >= 75 else "#3b82f6"
-                status = "Extremely Elevated" if percentile >= 90 else "Elevated" if percentile >= 75 else "Above Average"
-
-                # FastAPI UI style - clean white card matching other boxes
-                vs_avg_color = "text-red-600" if vs_avg >= 50 else "text-amber-600" if vs_avg >= 25 else "text-slate-900"
-                vs_dot_com_color = "text-emerald-600" if vs_dot_com < 0 else "text-red-600"
-                cape_html = f"""
-                <div class="bg-white rounded-2xl border border-slate-200 shadow-sm mb-6 overflow-hidden">
-                    <div class="px-6 py-4 border-b border-slate-100">
-                        <div class="flex items-center justify-between">
-                            <div>
-                                <h3 class="font-semibold text-slate-900">Shiller CAPE Ratio</h3>
-                                <p class="text-sm text-slate-500">143 years of valuation history</p>
-                            </div>
-                            <span class="px-3 py-1 rounded-full text-xs font-semibold text-white" style="background: {color}">{status}</span>
-                        </div>
-                    </div>
-                    <div class="grid grid-cols-4 gap-4 text-center px-6 py-4">
-                        <div><p class="text-xs font-medium text-slate-500 uppercase tracking-wide mb-1">Current</p><p class="text-2xl font-bold text-slate-900">{cape_value:.1f}</p><p class="text-xs text-slate-400">{percentile:.0f}th percentile</p></div>
-                        <div><p class="text-xs font-medium text-slate-500 uppercase tracking-wide mb-1">vs Average</p><p class="text-2xl font-bold {vs_avg_color}">+{vs_avg:.0f}%</p><p class="text-xs text-slate-400">Avg: 17</p></div>
-                        <div><p class="text-xs font-medium text-slate-500 uppercase tracking-wide mb-1">vs Dot-Com</p><p class="text-2xl font-bold {vs_dot_com_color}">{vs_dot_com:+.0f}%</p><p class="text-xs text-slate-400">Peak: {dot_com_peak:.1f}</p></div>
-                        <div><p class="text-xs font-medium text-slate-500 uppercase tracking-wide mb-1">History</p><p class="text-2xl font-bold text-blue-600">143yr</p><p class="text-xs text-slate-400">Since 1881</p></div>
-                    </div>
-                    <div class="px-6 py-3 bg-slate-50 border-t border-slate-100">
-                        <p class="text-sm text-slate-600">{cape_current['interpretation']}</p>
-                    </div>
-                </div>
-                """
-                print(f"[CAPE] Current: {cape_value:.1f} ({percentile:.0f}th percentile)")
-            except Exception as e:
-                print(f"[CAPE] Error: {e}")
-
-        # =================================================================
-        # ROUTE 3: Recession Queries (Scorecard)
-        # =================================================================
-        if RECESSION_SCORECARD_AVAILABLE and is_recession_query(query):
-            try:
-                # Fetch recession indicators
-                sahm_dates, sahm_values, _ = get_fred_data('SAHMREALTIME', years=2)
-                yc_dates, yc_values, _ = get_fred_data('T10Y2Y', years=2)
-                claims_dates, claims_values, _ = get_fred_data('ICSA', years=2)
-                sent_dates, sent_values, _ = get_fred_data('UMCSENT', years=2)
-
-                sahm = sahm_values[-1] if sahm_values else None
-                yield_curve = yc_values[-1] if yc_values else None
-                claims = sum(claims_values[-4:]) / 4 if claims_values and len(claims_values) >= 4 else None
-                sentiment = sent_values[-1] if sent_values else None
-
-                scorecard = build_recession_scorecard(
-                    sahm_value=sahm, yield_curve_value=yield_curve,
-                    sentiment_value=sentiment, claims_value=claims
-                )
-                recession_html = format_scorecard_for_display(scorecard)
-                print(f"[Recession] Scorecard built - overall risk: {scorecard.get('overall_risk', 'unknown')}")
-            except Exception as e:
-                print(f"[Recession] Error: {e}")
-
-        # =================================================================
-        # ROUTE 4: Polymarket Predictions
-        # =================================================================
-        if POLYMARKET_AVAILABLE:
-            try:
-                predictions = find_relevant_predictions(query)[:3]
-                if predictions:
-                    polymarket_html = format_predictions_box(predictions, query)
-                    print(f"[Polymarket] Found {len(predictions)} relevant predictions")
-            except Exception as e:
-                print(f"[Polymarket] Error: {e}")
-
-        # =================================================================
-        # ROUTE 5: Fed SEP (Federal Reserve Projections)
-        # =================================================================
-        fed_sep_html = None
-        if FED_SEP_AVAILABLE and is_fed_related_query(query):
-            try:
-                fed_data = get_sep_data()
-                fed_rate = get_current_fed_funds_rate()
-
-                if fed_data and fed_rate:
-                    current_rate = fed_rate.get('current_rate', 'N/A')
-                    rate_decision = fed_rate.get('last_decision', '')
-                    projections = fed_data.get('projections', {})
-
-                    # Build Fed SEP display box
-                    fed_sep_html = f"""
-                    <div class="bg-white rounded-2xl border border-slate-200 shadow-sm mb-6 overflow-hidden">
-                        <div class="px-6 py-4 border-b border-slate-100">
-                            <div class="flex items-center justify-between">
-                                <div>
-                                    <h3 class="font-semibold text-slate-900">Federal Reserve Outlook</h3>
-                                    <p class="text-sm text-slate-500">FOMC Summary of Economic Projections</p>
-                                </div>
-                                <span class="px-3 py-1 rounded-full text-xs font-semibold bg-blue-100 text-blue-800">{rate_decision}</span>
-                            </div>
-                        </div>
-                        <div class="grid grid-cols-4 gap-4 text-center px-6 py-4">
-                            <div>
-                                <p class="text-xs font-medium text-slate-500 uppercase tracking-wide mb-1">Fed Funds Rate</p>
-                                <p class="text-2xl font-bold text-slate-900">{current_rate}</p>
-                                <p class="text-xs text-slate-400">Current Target</p>
-                            </div>
-                            <div>
-                                <p class="text-xs font-medium text-slate-500 uppercase tracking-wide mb-1">GDP Growth</p>
-                                <p class="text-2xl font-bold text-emerald-600">{projections.get('gdp_2024', 'N/A')}</p>
-                                <p class="text-xs text-slate-400">2024 Median</p>
-                            </div>
-                            <div>
-                                <p class="text-xs font-medium text-slate-500 uppercase tracking-wide mb-1">Unemployment</p>
-                                <p class="text-2xl font-bold text-blue-600">{projections.get('unemployment_2024', 'N/A')}</p>
-                                <p class="text-xs text-slate-400">2024 Median</p>
-                            </div>
-                            <div>
-                                <p class="text-xs font-medium text-slate-500 uppercase tracking-wide mb-1">Core PCE</p>
-                                <p class="text-2xl font-bold text-amber-600">{projections.get('core_pce_2024', 'N/A')}</p>
-                                <p class="text-xs text-slate-400">2024 Median</p>
-                            </div>
-                        </div>
-                        <div class="px-6 py-3 bg-slate-50 border-t border-slate-100">
-                            <p class="text-sm text-slate-600">Source: Federal Reserve FOMC Summary of Economic Projections</p>
-                        </div>
-                    </div>
-                    """
-                    print(f"[FedSEP] Added Fed projections box, rate: {current_rate}")
-            except Exception as e:
-                print(f"[FedSEP] Error: {e}")
-
-        # Track if this is a judgment query (needs interpretive context)
-        judgment_context = None
-        if JUDGMENT_AVAILABLE and is_judgment_query(query):
-            print(f"[Judgment] Query requires interpretive context: '{query}'")
-
-        # =================================================================
-        # STANDARD ROUTING: Query Plans or Agentic Search
-        # =================================================================
-        # Check if we already have series from health check routing
-        if not health_check_handled:
-            plan = find_query_plan(query)
-            agentic_search = False
-            agentic_display_names = []
-            fallback_mode = False
-
-            if plan:
-                series_ids = plan.get('series', [])[:4]
-                show_yoy = plan.get('show_yoy', False)
-                payems_show_level = plan.get('payems_show_level', False)
-            else:
-                # No pre-defined plan - use Claude to search
-                print(f"No plan found for '{query}', trying agentic search...")
-                agentic_plan = get_series_via_claude(query)
-
-                if agentic_plan and agentic_plan.get('series'):
-                    series_ids = agentic_plan['series'][:4]
-                    agentic_display_names = agentic_plan.get('display_names', [])
-                    show_yoy = agentic_plan.get('show_yoy', False)
-                    payems_show_level = False
-                    agentic_search = True
-                    print(f"Agentic search found: {series_ids}")
-                else:
-                    print("Agentic search failed, using default series")
-                    series_ids = ['PAYEMS', 'UNRATE', 'A191RO1Q156NBEA', 'CPIAUCSL']
-                    show_yoy = [False, False, False, True]
-                    payems_show_level = False
-                    fallback_mode = True
-
-        # Fetch data using unified fetcher (supports av_*, zillow_*, eia_*, etc.)
-        series_data = []
-        for i, sid in enumerate(series_ids):
-            dates, values, info = fetch_series_data(sid)
-            if dates and values:
-                # Override name with agentic display name if available
-                if agentic_search and i < len(agentic_display_names) and agentic_display_names[i]:
-                    info['name'] = agentic_display_names[i]
+        conversation_history = _parse_history(history)
 
-                # Apply YoY if needed (with type safety guards)
-                db_info = SERIES_DB.get(sid, {})
-                data_type = db_info.get('data_type', 'level')
+        # Enhanced data boxes don't depend on routing - start them now
+        enrichment = ENRICHMENT.start(query)
 
-                # Determine if YoY should be applied
-                apply_yoy = False
-                if isinstance(show_yoy, list) and i < len(show_yoy):
-                    apply_yoy = show_yoy[i]
-                elif isinstance(show_yoy, bool):
-                    apply_yoy = show_yoy
-                elif db_info.get('show_yoy', False):
-                    apply_yoy = True
-
-                # TYPE SAFETY GUARDS - never apply YoY to:
-                # 1. Rates (unemployment rate, interest rates) - already percentages
-                # 2. Spreads (yield curve) - already differences
-                # 3. Growth rates (GDP growth) - already percent changes
-                # 4. Series marked show_absolute_change (employment counts)
-                if data_type in ('rate', 'spread', 'growth_rate'):
-                    apply_yoy = False
-                if db_info.get('show_absolute_change', False):
-                    apply_yoy = False
-
-                if apply_yoy and len(dates) > 12:
-                    dates, values = calculate_yoy(dates, values)
-                    # Use custom YoY name/unit if available
-                    yoy_name = db_info.get('yoy_name', info.get('name', sid) + ' (YoY %)')
-                    yoy_unit = db_info.get('yoy_unit', '% Change YoY')
-                    info['name'] = yoy_name
-                    info['unit'] = yoy_unit
-                    info['is_yoy'] = True
-
-                series_data.append((sid, dates, values, info))
-
-        # Get AI summary and suggestions
-        ai_response = get_ai_summary(query, series_data, conversation_history)
-        summary = ai_response["summary"]
-        suggestions = ai_response["suggestions"]
-        chart_descriptions = ai_response.get("chart_descriptions", {})
-
-        # If we fell back to default data, acknowledge we couldn't find specific data
-        if fallback_mode:
-            summary = f"I wasn't able to find data specifically about \"{query}\" in FRED. Here are some key indicators showing the current state of the U.S. economy: {summary}"
-
-        # =================================================================
-        # JUDGMENT LAYER: Add interpretive context for judgment queries
-        # =================================================================
-        if JUDGMENT_AVAILABLE and is_judgment_query(query):
-            try:
-                # Get the series IDs we're displaying
-                displayed_series = [sd[0] for sd in series_data]
-                judgment_result = process_judgment_query(
-                    query=query,
-                    series_ids=displayed_series,
-                    data_summary=summary
-                )
-                if judgment_result:
-                    # Enhance summary with judgment context
-                    summary = judgment_result
-                    print(f"[Judgment] Enhanced summary with interpretive context")
-            except Exception as e:
-                print(f"[Judgment] Error processing: {e}")
-
-        # =================================================================
-        # ECONOMIST REVIEWER: Second-pass review for quality
-        # =================================================================
-        if ANTHROPIC_API_KEY and series_data and len(summary) < 500:
-            try:
-                improved_summary = call_economist_reviewer(query, series_data, summary)
-                if improved_summary and improved_summary != summary:
-                    summary = improved_summary
-                    print(f"[EconomistReviewer] Enhanced summary")
-            except Exception as e:
-                print(f"[EconomistReviewer] Error: {e}")
-
-        # Format for frontend with dynamic AI bullets
-        charts = format_chart_data(series_data, payems_show_level=payems_show_level, user_query=query, use_dynamic_bullets=True)
-
-        # Add Claude's descriptions to each chart
-        for chart in charts:
-            chart['description'] = chart_descriptions.get(chart['series_id'], '')
-
-        # Update conversation history for next request
-        new_history = conversation_history + [{"query": query, "summary": summary}]
-        # Keep last 5 exchanges
-        new_history = new_history[-5:]
+        route = await route_search(query, conversation_history)
+        response = await build_routed_response(query, route, conversation_history)
+
+        summary = response["summary"]
+        box_htmls = await enrichment.collect()
+        temporal_filter = route['temporal_filter']
 
         # Check if this is an HTMX request
         is_htmx = request.headers.get("HX-Request") == "true"
@@ -2442,14 +2895,14 @@ async def search(request: Request, query: str = Form(...), history: str = Form(d
             "request": request,
             "query": query,
             "summary": summary,
-            "charts": charts,
-            "suggestions": suggestions,
-            "history": json.dumps(new_history),
+            "charts": response["charts"],
+            "suggestions": response["suggestions"],
+            "history": _next_history(conversation_history, query, summary),
             # Enhanced data boxes
-            "polymarket_html": polymarket_html,
-            "cape_html": cape_html,
-            "recession_html": recession_html,
-            "fed_sep_html": fed_sep_html,
+            "polymarket_html": box_htmls['polymarket'],
+            "cape_html": box_htmls['cape'],
+            "recession_html": box_htmls['recession'],
+            "fed_sep_html": box_htmls['fed_sep'],
             # Temporal context
             "temporal_context": temporal_filter.get('explanation') if temporal_filter else None,
         }
@@ -2469,6 +2922,122 @@ async def search(request: Request, query: str = Form(...), history: str = Form(d
         )
 
 
+def _sse(event: str, data: dict) -> str:
+    """One server-sent event frame."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _render_partial(name: str, **context) -> str:
+    """Render a results sub-template to an HTML string (for streamed updates)."""
+    return templates.get_template(f"partials/{name}").render(**context)
+
+
+def _box_frame(name: str, html: str) -> str:
+    """Swap event for a finished data box, or '' if it has nothing to show."""
+    if not html:
+        return ''
+    return _sse("swap", {"target": f"results-box-{name}",
+                         "html": _render_partial("results_box.html", box_html=html)})
+
+
+async def stream_search_events(request: Request, query: str, conversation_history: list):
+    """Server-sent events for /search/stream, in the order the pieces become ready.
+
+    Events (all carry JSON):
+        shell   {html}          page skeleton - query, temporal badge, empty slots
+        swap    {target, html}  replace a slot (charts, summary, a data box, follow-ups)
+        append  {target, text}  append streamed summary text
+        error   {html}
+        done    {}
+    """
+    import traceback
+
+    enrichment = ENRICHMENT.start(query)
+    events: asyncio.Queue = asyncio.Queue()
+    producers = []
+
+    async def emit(event: str, payload):
+        await events.put((event, payload))
+
+    async def build(route: dict):
+        await emit('response', await build_routed_response(query, route, conversation_history, emit=emit))
+
+    async def pump_boxes():
+        # Boxes past their deadline can still land here, up to the grace period
+        async for name, html in enrichment.as_completed(grace=STREAM_ENRICHMENT_GRACE):
+            await emit('box', (name, html))
+
+    try:
+        producers.append(asyncio.ensure_future(pump_boxes()))
+        route = await route_search(query, conversation_history)
+        temporal_filter = route['temporal_filter']
+        yield _sse("shell", {"html": _render_partial(
+            "results.html", query=query, summary=None, charts=[], streaming=True,
+            temporal_context=temporal_filter.get('explanation') if temporal_filter else None,
+        )})
+        producers.append(asyncio.ensure_future(build(route)))
+
+        while True:
+            running = {task for task in producers if not task.done()}
+            if not running and events.empty():
+                break
+            next_event = asyncio.ensure_future(events.get())
+            done, _ = await asyncio.wait({next_event, *running}, return_when=asyncio.FIRST_COMPLETED)
+            if next_event not in done:
+                next_event.cancel()
+                for task in done:
+                    task.result()  # re-raise a failed build
+                continue
+
+            event, payload = next_event.result()
+            if event == 'charts':
+                yield _sse("swap", {"target": "results-charts",
+                                    "html": _render_partial("results_charts.html", charts=payload)})
+            elif event == 'summary_delta':
+                yield _sse("append", {"target": "results-summary-text", "text": payload})
+            elif event == 'box':
+                frame = _box_frame(*payload)
+                if frame:
+                    yield frame
+            elif event == 'response':
+                summary = payload["summary"]
+                yield _sse("swap", {"target": "results-summary",
+                                    "html": _render_partial("results_summary.html", summary=summary)})
+                yield _sse("swap", {"target": "results-charts",
+                                    "html": _render_partial("results_charts.html", charts=payload["charts"])})
+                yield _sse("swap", {"target": "results-followup", "html": _render_partial(
+                    "results_followup.html", suggestions=payload["suggestions"],
+                    history=_next_history(conversation_history, query, summary),
+                )})
+            if await request.is_disconnected():
+                return
+        yield _sse("done", {})
+    except Exception as e:
+        print(f"Search stream error: {e}")
+        print(traceback.format_exc())
+        yield _sse("error", {"html": f"<div class='p-4 text-red-600'>Error: {str(e)}</div>"})
+    finally:
+        # Client went away (or we failed) - don't leave work running for nobody
+        for task in producers:
+            task.cancel()
+        enrichment.cancel()
+
+
+@app.post("/search/stream")
+async def search_stream(request: Request, query: str = Form(...), history: str = Form(default="")):
+    """Streaming /search: charts as soon as the data is in, then the summary as Claude writes it.
+
+    Same routing and payload as /search, sent as server-sent events (see
+    stream_search_events). The results page's script uses this when the
+    browser can read a streamed fetch response, and /search otherwise.
+    """
+    return StreamingResponse(
+        stream_search_events(request, query, _parse_history(history)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/about", response_class=HTMLResponse)
 async def about(request: Request):
     """About page."""
@@ -2481,6 +3050,83 @@ async def health():
     return {"status": "ok"}
 
 
+# How often the most-requested static plans are checked for new data
+MATERIALIZE_INTERVAL_SECONDS = 300
+_materialize_task = None
+
+
+async def refresh_materialized_responses() -> int:
+    """Rebuild the most-requested static plans whose series have new data.
+
+    Returns the number of plans rebuilt.
+    """
+    response_cache = get_response_cache()
+    rebuilt = 0
+    for plan_key, _, stored in await asyncio.to_thread(response_cache.top_plans):
+        plan = QUERY_PLANS.get(plan_key)
+        # Never stored = some series isn't servable from the observation store
+        if not plan or stored is None:
+            continue
+        series_ids = plan.get('series', [])[:4]
+        fingerprint = await asyncio.to_thread(response_cache.fingerprint, series_ids)
+        if fingerprint is None:
+            # Stored copies past max age - top them up (incremental, usually one info call)
+            await fetch_batch_async(series_ids, fetch_series_data_async, label='refresh')
+            fingerprint = await asyncio.to_thread(response_cache.fingerprint, series_ids)
+        if fingerprint is None or fingerprint == stored:
+            continue
+        try:
+            response = await build_search_response(
+                plan_key, series_ids, plan.get('show_yoy', False),
+                payems_show_level=plan.get('payems_show_level', False),
+            )
+        except Exception as e:
+            print(f"[ResponseCache] Rebuild of '{plan_key}' failed: {e}")
+            continue
+        fingerprint = await asyncio.to_thread(response_cache.fingerprint, series_ids)
+        if await asyncio.to_thread(response_cache.put, plan_key, fingerprint, series_ids, response):
+            rebuilt += 1
+            print(f"[ResponseCache] Rebuilt '{plan_key}' for {fingerprint}")
+    return rebuilt
+
+
+async def _materialize_loop():
+    """Background loop behind refresh_materialized_responses()."""
+    while True:
+        try:
+            await refresh_materialized_responses()
+        except Exception as e:
+            print(f"[ResponseCache] Refresh error: {e}")
+        await asyncio.sleep(MATERIALIZE_INTERVAL_SECONDS)
+
+
+@app.on_event("startup")
+async def start_background_prewarm():
+    """Keep popular series fresh around their release times (see core/prewarm.py).
+
+    Also imports the modules deferred at startup (core/startup.py) in the
+    background.
+
+    The worker that runs the pre-warmer also keeps the top static plans'
+    materialized responses rebuilt as those series update.
+    """
+    global _materialize_task
+    # Deferred modules (Shiller/pandas) load in the background instead of on the first request
+    start_warming()
+    if start_prewarm() is not None:
+        _materialize_task = asyncio.create_task(_materialize_loop())
+
+
+@app.on_event("shutdown")
+async def shutdown_http_client():
+    """Stop the pre-warmer and release pooled upstream connections."""
+    if _materialize_task is not None:
+        _materialize_task.cancel()
+    stop_prewarm()
+    close_client()
+    await close_async_client()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
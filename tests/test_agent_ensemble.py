@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the ensemble latency budget (agents.agent_ensemble._race).
+
+Run: python -m pytest tests/test_agent_ensemble.py
+"""
+
+import concurrent.futures
+import os
+import sys
+import threading
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import agents.agent_ensemble as ensemble
+
+
+def _reset(monkeypatch, prior: float, hedge_delay: float):
+    monkeypatch.setattr(ensemble, '_latency', {})
+    monkeypatch.setattr(ensemble, 'DEFAULT_LATENCY_SECONDS', prior)
+    monkeypatch.setattr(ensemble, 'HEDGE_MIN_DELAY', hedge_delay)
+
+
+def _count_waits(monkeypatch) -> list:
+    calls = []
+    real_wait = concurrent.futures.wait
+
+    def counting_wait(*args, **kwargs):
+        calls.append(kwargs.get('timeout'))
+        return real_wait(*args, **kwargs)
+
+    monkeypatch.setattr(concurrent.futures, 'wait', counting_wait)
+    return calls
+
+
+def test_declined_hedge_does_not_busy_loop(monkeypatch):
+    """Hedge due at 0.3s, but only 0.3s of budget left (<= p50): declined once, then sleep."""
+    _reset(monkeypatch, prior=0.3, hedge_delay=0.1)
+    waits = _count_waits(monkeypatch)
+    release = threading.Event()
+    sent = []
+
+    def slow(timeout):
+        sent.append(timeout)
+        release.wait(2)
+        return 'late'
+
+    cpu_before = time.process_time()
+    results = ensemble._race({'claude': slow}, budget=0.6)
+    cpu_used = time.process_time() - cpu_before
+    release.set()
+
+    assert results == {}
+    assert len(sent) == 1  # the hedge was declined, not sent
+    assert len(waits) < 10
+    assert all(timeout is None or timeout >= 0 for timeout in waits)
+    assert cpu_used < 0.3
+
+
+def test_slow_provider_is_hedged_once(monkeypatch):
+    """A provider silent past its hedge time is sent again; the faster copy wins."""
+    _reset(monkeypatch, prior=0.1, hedge_delay=0.1)
+    attempts = []
+
+    def flaky(timeout):
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            time.sleep(1.0)
+            return 'slow copy'
+        return 'hedged copy'
+
+    results = ensemble._race({'gemini': flaky}, budget=2.0)
+    assert results == {'gemini': 'hedged copy'}
+    assert len(attempts) == 2
+    assert ensemble._histogram('gemini').hedge_wins == 1
+
+
+def test_first_answer_used_when_others_cannot_fit(monkeypatch):
+    _reset(monkeypatch, prior=5.0, hedge_delay=5.0)
+
+    def fast(timeout):
+        return 'plan'
+
+    def slow(timeout):
+        time.sleep(0.5)
+        return 'other plan'
+
+    begin = time.monotonic()
+    results = ensemble._race({'claude': fast, 'gemini': slow}, budget=1.0)
+    assert results == {'claude': 'plan'}
+    assert time.monotonic() - begin < 0.4
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for one-round batch fetching (core.batch_fetch).
+
+Run: python -m pytest tests/test_batch_fetch.py
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.batch_fetch import fetch_batch, fetch_batch_async, submit_batch, unique_ids
+
+STORED = {'UNRATE'}
+
+
+def _is_cached(sid):
+    return sid in STORED
+
+
+class Upstream:
+    """fetch_one stand-in recording which thread served each series."""
+
+    def __init__(self, delay: float = 0.2, failing=()):
+        self.delay = delay
+        self.failing = set(failing)
+        self.calls = []
+
+    def __call__(self, sid):
+        self.calls.append((sid, threading.current_thread().name))
+        if sid not in STORED:
+            time.sleep(self.delay)
+        if sid in self.failing:
+            raise RuntimeError(f'{sid} unavailable')
+        return f'data:{sid}'
+
+
+def test_unique_ids_keeps_first_occurrence():
+    assert unique_ids(['PAYEMS', 'UNRATE', '', 'PAYEMS', None, 'ICSA']) == ['PAYEMS', 'UNRATE', 'ICSA']
+
+
+def test_one_round_deduplicated_in_input_order():
+    upstream = Upstream()
+    ids = ['PAYEMS', 'UNRATE', 'ICSA', 'PAYEMS', 'CPIAUCSL', 'GDPC1']
+    begin = time.monotonic()
+    results = fetch_batch(ids, upstream, is_cached=_is_cached)
+    elapsed = time.monotonic() - begin
+
+    assert list(results) == ['PAYEMS', 'UNRATE', 'ICSA', 'CPIAUCSL', 'GDPC1']
+    assert all(value == f'data:{sid}' for sid, value in results.items())
+    assert sorted(sid for sid, _ in upstream.calls) == sorted(results)  # no duplicate fetch
+    assert elapsed < 0.5  # four 0.2s fetches in one round
+
+    # Stored series are served inline, the rest on the pool
+    threads = dict(upstream.calls)
+    assert threads['UNRATE'] == threading.current_thread().name
+    assert threads['PAYEMS'].startswith('batch-fetch')
+
+
+def test_failures_and_timeouts_go_to_on_error():
+    upstream = Upstream(failing={'ICSA'})
+    errors = []
+
+    def on_error(sid, e):
+        errors.append((sid, type(e).__name__))
+        return 'fallback'
+
+    results = fetch_batch(['PAYEMS', 'ICSA', 'UNRATE'], upstream, is_cached=_is_cached, on_error=on_error)
+    assert results == {'PAYEMS': 'data:PAYEMS', 'ICSA': 'fallback', 'UNRATE': 'data:UNRATE'}
+    assert errors == [('ICSA', 'RuntimeError')]
+
+    slow = Upstream(delay=1.0)
+    results = fetch_batch(['PAYEMS', 'UNRATE'], slow, is_cached=_is_cached, timeout=0.1)
+    assert results == {'PAYEMS': None, 'UNRATE': 'data:UNRATE'}
+
+
+def test_submit_batch_returns_futures():
+    futures = submit_batch(['PAYEMS', 'UNRATE', 'PAYEMS'], Upstream(), is_cached=_is_cached)
+    assert list(futures) == ['PAYEMS', 'UNRATE']
+    assert futures['UNRATE'].done()  # stored: already complete
+    assert futures['PAYEMS'].result(timeout=2) == 'data:PAYEMS'
+
+
+def test_cache_check_errors_mean_not_cached():
+    def broken_check(sid):
+        raise OSError('store unavailable')
+
+    upstream = Upstream(delay=0.0)
+    assert fetch_batch(['UNRATE'], upstream, is_cached=broken_check) == {'UNRATE': 'data:UNRATE'}
+    assert upstream.calls[0][1].startswith('batch-fetch')
+
+
+def test_async_batch():
+    calls = []
+
+    async def fetch_one(sid):
+        calls.append(sid)
+        await asyncio.sleep(0.2)
+        if sid == 'ICSA':
+            raise RuntimeError('down')
+        return f'data:{sid}'
+
+    async def main():
+        begin = time.monotonic()
+        results = await fetch_batch_async(['PAYEMS', 'ICSA', 'PAYEMS', 'UNRATE'], fetch_one,
+                                          on_error=lambda sid, e: 'fallback')
+        return results, time.monotonic() - begin
+
+    results, elapsed = asyncio.run(main())
+    assert results == {'PAYEMS': 'data:PAYEMS', 'ICSA': 'fallback', 'UNRATE': 'data:UNRATE'}
+    assert sorted(calls) == ['ICSA', 'PAYEMS', 'UNRATE']
+    assert elapsed < 0.5
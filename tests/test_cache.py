@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the bounded in-memory cache (core.cache.TTLCache).
+
+Run: python -m pytest tests/test_cache.py
+"""
+
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core.cache as cache_module
+from core.cache import TTLCache
+
+
+class Clock:
+    """Stand-in for time.monotonic() that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, 'monotonic', clock)
+    return clock
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    clock = _clock(monkeypatch)
+    cache = TTLCache('test.ttl', ttl=10)
+    cache.set('a', 1)
+    cache.set('b', 2, ttl=30)  # per-entry override
+
+    clock.now += 9.9
+    assert cache.get('a') == 1
+    clock.now += 0.1
+    assert cache.get('a') is None
+    assert 'a' not in cache
+    assert cache.get('b') == 2
+
+    clock.now += 20
+    assert cache.purge_expired() == 1
+    assert len(cache) == 0
+    assert cache.stats()['expirations'] == 2
+
+
+def test_entries_without_ttl_never_expire(monkeypatch):
+    clock = _clock(monkeypatch)
+    cache = TTLCache('test.no_ttl')
+    cache.set('a', 1)
+    clock.now += 10 ** 9
+    assert cache.get('a') == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache('test.lru', max_entries=3)
+    for key in 'abc':
+        cache.set(key, key.upper())
+    assert cache.get('a') == 'A'  # 'a' is now the most recently used
+    cache.set('d', 'D')
+
+    assert 'b' not in cache
+    assert [key for key in 'acd' if key in cache] == ['a', 'c', 'd']
+    assert cache.stats()['evictions'] == 1
+
+
+def test_overwrite_does_not_evict():
+    cache = TTLCache('test.overwrite', max_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.set('a', 3)
+    assert len(cache) == 2
+    assert cache.get('a') == 3 and cache.get('b') == 2
+    assert cache.stats()['evictions'] == 0
+
+
+def test_byte_budget_evicts_oldest():
+    cache = TTLCache('test.bytes', max_bytes=100, sizeof=len)
+    cache.set('a', 'x' * 60)
+    cache.set('b', 'y' * 30)
+    cache.set('c', 'z' * 30)  # 120 bytes > 100: 'a' goes
+
+    assert 'a' not in cache
+    assert cache.stats()['bytes'] == 60
+    cache.pop('b')
+    assert cache.stats()['bytes'] == 30
+
+
+def test_hit_and_miss_counters():
+    cache = TTLCache('test.counters')
+    cache.set('a', 1)
+    cache.get('a')
+    cache.get('missing')
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['hit_rate']) == (1, 1, 0.5)
+    assert any(s['name'] == 'test.counters' for s in cache_module.all_cache_stats())
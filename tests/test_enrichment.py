@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for the enrichment scheduler (core.enrichment).
+
+Run: python -m pytest tests/test_enrichment.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.enrichment import EnrichmentScheduler, Provider, call_with_deadline, get_enrichment_stats
+
+
+def _sync(result, delay: float = 0.0):
+    def fn(query):
+        time.sleep(delay)
+        return f"{result}:{query}"
+    return fn
+
+
+def _async(result, delay: float = 0.0):
+    async def fn(query):
+        await asyncio.sleep(delay)
+        return f"{result}:{query}"
+    return fn
+
+
+def test_results_within_deadline_and_late_ones_dropped():
+    scheduler = EnrichmentScheduler([
+        Provider('test.fast_sync', _sync('a'), deadline=1.0),
+        Provider('test.fast_async', _async('b'), deadline=1.0),
+        Provider('test.slow_async', _async('c', delay=5.0), deadline=0.1),
+    ])
+
+    async def main():
+        begin = time.monotonic()
+        boxes = await scheduler.start('q1').collect()
+        return boxes, time.monotonic() - begin
+
+    boxes, elapsed = asyncio.run(main())
+    assert boxes == {'test.fast_sync': 'a:q1', 'test.fast_async': 'b:q1', 'test.slow_async': None}
+    assert elapsed < 0.5
+    assert get_enrichment_stats()['test.slow_async']['late'] == 1
+
+
+def test_failure_is_nothing_to_show():
+    def broken(query):
+        raise RuntimeError('upstream down')
+
+    result = asyncio.run(call_with_deadline(Provider('test.broken', broken, deadline=1.0), 'q'))
+    assert result is None
+    assert get_enrichment_stats()['test.broken']['errors'] == 1
+
+
+def test_late_sync_result_is_deferred_to_the_next_request():
+    provider = Provider('test.deferred', _sync('late', delay=0.3), deadline=0.05)
+
+    async def main():
+        first = await call_with_deadline(provider, 'Same Query')
+        await asyncio.sleep(0.5)  # the worker thread finishes in the background
+        second = await call_with_deadline(provider, 'same query ')
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first is None
+    assert second == 'late:Same Query'
+    assert get_enrichment_stats()['test.deferred']['deferred_hits'] == 1
+
+
+def test_as_completed_yields_in_finish_order_with_grace():
+    scheduler = EnrichmentScheduler([
+        Provider('test.second', _async('s', delay=0.2), deadline=0.1),  # late, but within grace
+        Provider('test.first', _async('f', delay=0.0), deadline=1.0),
+        Provider('test.never', _async('n', delay=5.0), deadline=0.1),
+    ])
+
+    async def main():
+        run = scheduler.start('q')
+        return [item async for item in run.as_completed(grace=0.3)]
+
+    assert asyncio.run(main()) == [('test.first', 'f:q'), ('test.second', 's:q')]
+
+
+def test_cancel_stops_async_providers():
+    cancelled = []
+
+    async def slow(query):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(query)
+            raise
+
+    async def main():
+        run = EnrichmentScheduler([Provider('test.cancel', slow, deadline=5.0)]).start('q')
+        await asyncio.sleep(0.05)
+        run.cancel()
+        await asyncio.sleep(0.05)
+
+    asyncio.run(main())
+    assert cancelled == ['q']
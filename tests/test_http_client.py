@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared HTTP client (core.http_client).
+
+Run: python -m pytest tests/test_http_client.py
+"""
+
+import asyncio
+import os
+import sys
+from urllib.error import HTTPError, URLError
+
+import httpx
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core.http_client as http_client
+
+FRED_URL = 'https://api.stlouisfed.org/fred/series'
+TEST_URL = 'https://data.example.org/series'  # no rate budget
+
+
+class Clock:
+    """Stand-in for time.monotonic() that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class Upstream:
+    """httpx.MockTransport handler replaying a scripted list of statuses (or errors)."""
+
+    def __init__(self, *script):
+        self.script = list(script)
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        step = self.script.pop(0) if len(self.script) > 1 else self.script[0]
+        if isinstance(step, Exception):
+            raise step
+        return httpx.Response(step, json={'status': step})
+
+
+def _use_upstream(monkeypatch, upstream: Upstream) -> None:
+    monkeypatch.setattr(http_client, 'RETRY_BACKOFF_SECONDS', 0)
+    monkeypatch.setattr(http_client, '_client', httpx.Client(transport=httpx.MockTransport(upstream)))
+
+
+def test_rate_budget_burst_then_paced_waits(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(http_client.time, 'monotonic', clock)
+    budget = http_client.RateBudget(rate=2.0, burst=3)
+
+    assert [budget.reserve() for _ in range(6)] == [0.0, 0.0, 0.0, 0.5, 1.0, 1.5]
+    assert budget.stats()['delayed'] == 3
+    assert budget.stats()['waited_seconds'] == 3.0
+
+    # The bucket refills at `rate` while idle, up to `burst`
+    clock.now += 10
+    assert [budget.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert budget.reserve() == 0.5
+
+
+def test_fred_shares_one_rate_budget():
+    assert http_client._rate_budget(FRED_URL) is http_client._rate_budget(FRED_URL + '/observations')
+    assert http_client._rate_budget(TEST_URL) is None
+    assert 'api.stlouisfed.org' in http_client.get_rate_budget_stats()
+
+
+def test_transient_status_is_retried(monkeypatch):
+    upstream = Upstream(503, 502, 200)
+    _use_upstream(monkeypatch, upstream)
+    assert http_client.get_json(TEST_URL) == {'status': 200}
+    assert upstream.requests == 3
+
+
+def test_client_error_is_not_retried(monkeypatch):
+    upstream = Upstream(404)
+    _use_upstream(monkeypatch, upstream)
+    with pytest.raises(HTTPError) as excinfo:
+        http_client.get_json(TEST_URL)
+    assert excinfo.value.code == 404
+    assert upstream.requests == 1
+
+
+def test_retries_exhausted(monkeypatch):
+    upstream = Upstream(503)
+    _use_upstream(monkeypatch, upstream)
+    with pytest.raises(HTTPError) as excinfo:
+        http_client.get_json(TEST_URL, retries=2)
+    assert excinfo.value.code == 503
+    assert upstream.requests == 3
+
+
+def test_network_error_becomes_urlerror(monkeypatch):
+    upstream = Upstream(httpx.ConnectError('refused'))
+    _use_upstream(monkeypatch, upstream)
+    with pytest.raises(URLError):
+        http_client.get_json(TEST_URL, retries=1)
+    assert upstream.requests == 2
+
+
+def test_async_retry(monkeypatch):
+    upstream = Upstream(httpx.ConnectError('refused'), 504, 200)
+    monkeypatch.setattr(http_client, 'RETRY_BACKOFF_SECONDS', 0)
+    monkeypatch.setattr(http_client, 'get_async_client',
+                        lambda: httpx.AsyncClient(transport=httpx.MockTransport(upstream)))
+    assert asyncio.run(http_client.aget_json(TEST_URL)) == {'status': 200}
+    assert upstream.requests == 3
+
+
+def test_async_client_and_host_slots_are_per_event_loop():
+    async def grab():
+        client = http_client.get_async_client()
+        slot = http_client._async_host_slot(FRED_URL)
+        # Same loop: same objects
+        assert http_client.get_async_client() is client
+        assert http_client._async_host_slot(FRED_URL) is slot
+        async with slot:  # usable on this loop
+            pass
+        return client, slot
+
+    first_client, first_slot = asyncio.run(grab())
+    second_client, second_slot = asyncio.run(grab())
+    assert second_client is not first_client
+    assert second_slot is not first_slot
+
+
+def test_close_async_client_only_closes_the_running_loop():
+    async def open_and_close():
+        client = http_client.get_async_client()
+        await http_client.close_async_client()
+        assert client.is_closed
+        assert http_client.get_async_client() is not client
+        await http_client.close_async_client()
+
+    asyncio.run(open_and_close())
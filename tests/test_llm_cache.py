@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for the LLM result cache (core.llm_cache).
+
+Run: python -m pytest tests/test_llm_cache.py
+"""
+
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.llm_cache import LLMCache, data_fingerprint, normalize_query
+
+# Toy embedding space: unemployment questions point one way, inflation another
+VECTORS = {
+    'is unemployment high': [1.0, 0.0],
+    'is the unemployment rate high': [0.99, 0.05],
+    'how high is unemployment': [0.98, 0.08],
+    'is inflation high': [0.0, 1.0],
+}
+
+
+class FakeEmbedder:
+    def __init__(self):
+        self.single = []
+        self.batches = []
+
+    def embed(self, text):
+        self.single.append(text)
+        return VECTORS.get(text)
+
+    def embed_batch(self, texts):
+        self.batches.append(list(texts))
+        return [VECTORS.get(text) for text in texts]
+
+
+def _cache(tmp_path, embedder: FakeEmbedder) -> LLMCache:
+    return LLMCache(tmp_path / 'llm_cache.db', embed=embedder.embed, embed_batch=embedder.embed_batch)
+
+
+def test_normalize_and_fingerprint():
+    assert normalize_query('  Is Unemployment   HIGH? ') == 'is unemployment high'
+    assert data_fingerprint([('UNRATE', ['2025-08-01', '2025-09-01'], [4.2, 4.3], {})]) == 'UNRATE@2025-09-01=4.3'
+    assert data_fingerprint([{'series_id': 'PAYEMS', 'latest_date': '2025-09-01', 'latest_value': 159000}]) \
+        == 'PAYEMS@2025-09-01=159000'
+
+
+def test_exact_hit_needs_no_embedding(tmp_path):
+    embedder = FakeEmbedder()
+    cache = _cache(tmp_path, embedder)
+    cache.put('understanding', 'Is unemployment high?', '', {'intent': 'level'})
+    assert cache.get('understanding', 'is unemployment high', '') == {'intent': 'level'}
+    assert embedder.single == [] and embedder.batches == []
+
+
+def test_fingerprint_change_invalidates(tmp_path):
+    cache = _cache(tmp_path, FakeEmbedder())
+    cache.put('judgment', 'is unemployment high', 'UNRATE@2025-08-01=4.2', 'old take')
+    assert cache.get('judgment', 'is unemployment high', 'UNRATE@2025-09-01=4.3') is None
+    cache.put('judgment', 'is unemployment high', 'UNRATE@2025-09-01=4.3', 'new take')
+    # The stale row is gone from the database (as another worker sees it)
+    other_worker = _cache(tmp_path, FakeEmbedder())
+    assert other_worker.get('judgment', 'is unemployment high', 'UNRATE@2025-08-01=4.2') is None
+    assert other_worker.get('judgment', 'is unemployment high', 'UNRATE@2025-09-01=4.3') == 'new take'
+
+
+def test_miss_vector_is_stored_by_put(tmp_path):
+    embedder = FakeEmbedder()
+    cache = _cache(tmp_path, embedder)
+    cache.put('understanding', 'is inflation high', '', {'intent': 'inflation'})
+
+    # Miss: the query and the un-embedded candidate go out in one request
+    assert cache.get('understanding', 'is unemployment high', '') is None
+    assert embedder.batches == [['is unemployment high', 'is inflation high']]
+    cache.put('understanding', 'is unemployment high', '', {'intent': 'level'})
+
+    # Both rows now carry embeddings - a paraphrase needs only its own vector
+    assert cache.get('understanding', 'is the unemployment rate high', '') == {'intent': 'level'}
+    assert embedder.single == ['is the unemployment rate high']
+    assert len(embedder.batches) == 1
+    assert cache.stats()['similar_hits'] == 1
+
+
+def test_backfill_is_one_capped_batch(tmp_path, monkeypatch):
+    import core.llm_cache as llm_cache
+    monkeypatch.setattr(llm_cache, 'MAX_BACKFILL', 3)
+    embedder = FakeEmbedder()
+    cache = _cache(tmp_path, embedder)
+    for i in range(5):
+        cache.put('understanding', f'other question {chr(97 + i)}', '', {'i': i})
+
+    assert cache.get('understanding', 'is unemployment high', '') is None
+    assert len(embedder.batches) == 1
+    assert len(embedder.batches[0]) == 1 + 3  # query + capped backfill
+    assert embedder.single == []
+
+
+def test_numbers_must_match(tmp_path):
+    embedder = FakeEmbedder()
+    cache = _cache(tmp_path, embedder)
+    cache.put('understanding', 'gdp in 2020', '', {'year': 2020})
+    assert cache.get('understanding', 'gdp in 2021', '') is None
+    assert embedder.single == [] and embedder.batches == []  # no candidate, no embedding
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for the observation store (core.observation_store).
+
+Run: python -m pytest tests/test_observation_store.py
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.observation_store import ObservationStore, _revision_start
+
+DATES = ['2024-01-01', '2024-02-01', '2024-03-01', '2024-04-01', '2024-05-01', '2024-06-01']
+VALUES = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+
+
+def _store(tmp_path, max_age_seconds: float = 0) -> ObservationStore:
+    """A store in a temp file; max_age 0 makes every read a refresh."""
+    store = ObservationStore(tmp_path / 'observations.db', max_age_seconds=max_age_seconds)
+    assert store.put('TEST', DATES, VALUES, {'last_updated': 'v1'})
+    return store
+
+
+def _full():
+    raise AssertionError('full download not expected')
+
+
+def test_merge_replaces_only_the_revision_window(tmp_path):
+    store = _store(tmp_path, max_age_seconds=3600)
+    # Revised April, withdrawn May, new July; everything before April is untouched
+    assert store.merge('TEST', '2024-04-01', ['2024-04-01', '2024-06-01', '2024-07-01'],
+                       [40.0, 60.0, 70.0], {'last_updated': 'v2'})
+
+    dates, values, info = store.get('TEST')
+    assert dates == ['2024-01-01', '2024-02-01', '2024-03-01', '2024-04-01', '2024-06-01', '2024-07-01']
+    assert values == [1.0, 2.0, 3.0, 40.0, 60.0, 70.0]
+    meta = store.get_meta('TEST')
+    assert meta['last_date'] == '2024-07-01'
+    assert meta['n_obs'] == 6
+    assert meta['last_updated'] == 'v2'
+
+
+def test_merge_refuses_empty_delta(tmp_path):
+    store = _store(tmp_path, max_age_seconds=3600)
+    assert not store.merge('TEST', '2024-03-01', [], [], {'last_updated': 'v2'})
+    assert store.get('TEST')[:2] == (DATES, VALUES)
+
+
+def test_incremental_refresh_fetches_from_revision_start(tmp_path):
+    store = _store(tmp_path)
+    calls = []
+
+    def since(start):
+        calls.append(start)
+        return ['2024-06-01', '2024-07-01'], [6.5, 7.0], {}
+
+    dates, values, _ = store.read_through('TEST', _full, fetch_info=lambda: {'last_updated': 'v2'},
+                                          fetch_since=since)
+    assert calls == ['2024-02-02'] == [_revision_start('2024-06-01')]
+    # Observations before the revision window are kept; the window is the delta
+    assert dates == ['2024-01-01', '2024-02-01', '2024-06-01', '2024-07-01']
+    assert values == [1.0, 2.0, 6.5, 7.0]
+
+
+def test_unchanged_last_updated_skips_download(tmp_path):
+    store = _store(tmp_path)
+
+    def since(start):
+        raise AssertionError('delta not expected')
+
+    dates, _, _ = store.read_through('TEST', _full, fetch_info=lambda: {'last_updated': 'v1'},
+                                     fetch_since=since)
+    assert dates == DATES
+
+
+def test_empty_delta_keeps_stored_history(tmp_path):
+    store = _store(tmp_path)
+    full_calls = []
+
+    def full():
+        full_calls.append(1)
+        return [], [], {'error': 'upstream down'}
+
+    dates, values, _ = store.read_through('TEST', full, fetch_info=lambda: {'last_updated': 'v2'},
+                                          fetch_since=lambda start: ([], [], {}))
+    assert full_calls == [1]  # empty delta falls back to the full download...
+    assert (dates, values) == (DATES, VALUES)  # ...and, that failing, the stale copy
+    assert store.get('TEST')[:2] == (DATES, VALUES)
+
+
+def test_empty_delta_async_keeps_stored_history(tmp_path):
+    store = _store(tmp_path)
+
+    async def info():
+        return {'last_updated': 'v2'}
+
+    async def since(start):
+        return [], [], {}
+
+    async def full():
+        return [], [], {'error': 'upstream down'}
+
+    dates, values, _ = asyncio.run(store.read_through_async('TEST', full, fetch_info=info,
+                                                            fetch_since=since))
+    assert (dates, values) == (DATES, VALUES)
+    assert store.get('TEST')[:2] == (DATES, VALUES)
+
+
+def test_coalesced_waiters_get_their_own_info(tmp_path):
+    store = ObservationStore(tmp_path / 'observations.db')
+    calls = []
+
+    def full():
+        calls.append(1)
+        time.sleep(0.2)  # let every reader join this fetch
+        return list(DATES), list(VALUES), {'title': 'Test series'}
+
+    results = []
+
+    def reader():
+        dates, values, info = store.read_through('TEST', full)
+        info['name'] = threading.current_thread().name  # as main.get_fred_data does
+        results.append(info)
+
+    threads = [threading.Thread(target=reader, name=f'reader-{i}') for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert calls == [1]
+    assert len({id(info) for info in results}) == 4
+    assert sorted(info['name'] for info in results) == [f'reader-{i}' for i in range(4)]
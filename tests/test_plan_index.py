@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for the query plan index (core.plan_index) and app.find_query_plan().
+
+Each PlanIndex lookup is checked against the linear scan it replaced, and
+find_query_plan() against answers recorded from the scan-based version.
+
+Run: python -m pytest tests/test_plan_index.py
+"""
+
+import difflib
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import (PLAN_INDEX, QUERY_PLANS, calculate_word_overlap_score, extract_demographic_group,
+                 find_query_plan)
+
+# query -> plan key returned before the index existed (None = no plan)
+RECORDED_PLANS = [
+    ('unemployment', 'unemployment'),
+    ('Unemployment Rate?', 'unemployment rate'),
+    ('unemploymnt rate', 'savings rate'),
+    ('what is the unemployment rate', 'unemployment rate'),
+    ('how is the job market', 'how is the job market'),
+    ('tight job market', 'labor market'),
+    ('jobless rate', 'jobless rate'),
+    ('black unemployment', 'black unemployment'),
+    ('unemployment for women', 'women unemployment'),
+    ('hispanic unemployment rate', 'hispanic unemployment'),
+    ('youth unemployment', 'youth unemployment'),
+    ('inflation', 'inflation'),
+    ('core inflaton', 'core inflation'),
+    ('are prices rising', 'car prices'),
+    ('gas prices', 'gas prices'),
+    ('rent inflation', 'rent inflation'),
+    ('housing prices', 'housing inflation'),
+    ('home sales', 'home sales'),
+    ('mortgage rates', 'mortgage rates'),
+    ('fed funds', 'fed funds rate'),
+    ('interest rate outlook', 'interest rate outlook'),
+    ('gdp growth', 'gdp growth'),
+    ('economic growth', 'economic growth'),
+    ('recession risk', 'recession risk'),
+    ('is a recession coming', 'is there a recession'),
+    ('consumer spending', 'consumer spending'),
+    ('retail sales', 'retail sales'),
+    ('wages', 'real wages'),
+    ('wage growth for workers', 'is the labor market tight'),
+    ('labor force participation', 'labor force participation'),
+    ('prime age employment', 'prime age employment'),
+    ('job openings', 'job openings'),
+    ('layoffs', 'layoffs'),
+    ('initial claims', 'initial claims'),
+    ('manufacturing', 'manufacturing'),
+    ('industrial production', 'industrial production'),
+    ('trade deficit', 'trade deficit'),
+    ('dollar strength', 'dollar strength'),
+    ('stock market', 'stock market'),
+    ('oil prices', 'oil prices'),
+    ('savings rate', 'savings rate'),
+    ('credit card debt', 'credit card debt'),
+    ('housing starts', 'housing starts'),
+    ('productivity', 'productivity'),
+    ('small business', 'small business'),
+    ('college graduates unemployment', 'unemployment'),
+    ('veterans unemployment', 'veterans employment'),
+    ('how are men doing in the labor market', 'men employment'),
+    ("what's going on with the economy", 'economy'),
+    ('xyzzy plugh', None),
+]
+
+PROBES = ['unemploymnt', 'job market', 'inflaton', 'black women unemployment', 'housng',
+          'gdp', 'interest rates outlook', 'wages and salaries', 'ecnomy', 'x']
+
+
+def _plan_key(plan):
+    if plan is None:
+        return None
+    return next(key for key, candidate in QUERY_PLANS.items() if candidate is plan)
+
+
+@pytest.mark.parametrize('query, expected', RECORDED_PLANS)
+def test_find_query_plan_matches_recorded(query, expected):
+    assert _plan_key(find_query_plan(query)) == expected
+
+
+def test_every_plan_key_finds_itself():
+    for key in QUERY_PLANS:
+        if key == key.lower().strip():
+            assert find_query_plan(key) is QUERY_PLANS[key]
+
+
+def test_demographic_tags_match_extractor():
+    for key in QUERY_PLANS:
+        assert PLAN_INDEX.demographic[key] == extract_demographic_group(key)
+
+
+@pytest.mark.parametrize('cutoff', [0.4, 0.6, 0.8])
+def test_close_match_matches_difflib(cutoff):
+    keys = list(QUERY_PLANS)
+    non_demographic = [k for k in keys if not extract_demographic_group(k)]
+    for word in PROBES:
+        expected = difflib.get_close_matches(word, keys, n=1, cutoff=cutoff)
+        assert PLAN_INDEX.close_match(word, cutoff=cutoff) == (expected[0] if expected else None)
+
+        expected = difflib.get_close_matches(word, non_demographic, n=1, cutoff=cutoff)
+        got = PLAN_INDEX.close_match(word, cutoff=cutoff, include_demographic=False)
+        assert got == (expected[0] if expected else None)
+
+        subset = keys[::7]
+        expected = difflib.get_close_matches(word, subset, n=1, cutoff=cutoff)
+        assert PLAN_INDEX.close_match(word, subset, cutoff=cutoff) == (expected[0] if expected else None)
+
+
+@pytest.mark.parametrize('term', ['job', 'market', 'inflation', 'rate', 'us', 'Fed', 'a'])
+def test_keys_containing_matches_scan(term):
+    assert PLAN_INDEX.keys_containing(term) == [k for k in QUERY_PLANS if term in k]
+    assert PLAN_INDEX.keys_containing(term, lowercase=True) == [k for k in QUERY_PLANS if term in k.lower()]
+
+
+def test_word_overlap_matches_scan():
+    for query in ['job market', 'black unemployment rate', 'what is inflation', 'housing']:
+        words = set(query.split())
+        expected = [(k, calculate_word_overlap_score(words, k)) for k in QUERY_PLANS]
+        expected = [(k, s) for k, s in expected if s > 0.3]
+        got = PLAN_INDEX.word_overlap_scores(words)
+        assert [k for k, _ in got] == [k for k, _ in expected]
+        assert all(s == pytest.approx(e) for (_, s), (_, e) in zip(got, expected))
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests for the one-pass query classifier (core.query_classifier).
+
+Every category must match exactly when the per-module loop it replaced
+(`any(kw in query_lower for kw in KEYWORDS)`, `re.search` over a pattern
+list) would; those loops are the references below.
+
+Run: python -m pytest tests/test_query_classifier.py
+"""
+
+import os
+import random
+import re
+import subprocess
+import sys
+
+import pytest
+
+# Add parent directory to path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core.query_classifier import KeywordMatcher, classify
+from agents import fed_sep, stocks, dbnomics, recession_scorecard, shiller, judgment_layer
+from core import health_check_indicators as health
+
+QUERIES = [
+    "Is unemployment high?", "what is the unemployment rate", "how is the labor market doing?",
+    "how are consumers?", "what about housing", "Is the stock market overvalued?", "CAPE ratio",
+    "will the fed cut rates", "fomc dot plot", "federal reserve policy", "powell speech",
+    "UK inflation vs US", "eurozone gdp", "japan unemployment", "how is china doing", "global economy",
+    "are we in a recession", "soft landing odds", "economic outlook 2026", "gold price",
+    "s&p 500", "treasury yields", "yield curve inversion", "state of small businesses",
+    "should I be worried about inflation", "show me gdp growth", "housing bubble",
+    "are stocks expensive", "defeat", "neural", "eu", "how are megacap tech firms doing?",
+    "hows the job market looking", "", "   ", "FED", "what about wages?", "mortgage rates",
+]
+
+KEYWORD_CATEGORIES = {
+    'fed': (fed_sep.FED_CORE_KEYWORDS + fed_sep.RATE_KEYWORDS + fed_sep.POLICY_KEYWORDS
+            + fed_sep.GUIDANCE_KEYWORDS),
+    'market': stocks.MARKET_QUERY_KEYWORDS,
+    'international': dbnomics.INTERNATIONAL_KEYWORDS,
+    'recession': recession_scorecard.RECESSION_KEYWORDS + recession_scorecard.OUTLOOK_KEYWORDS,
+    'valuation': shiller.VALUATION_KEYWORDS,
+}
+
+PATTERN_CATEGORIES = {
+    'judgment': judgment_layer.JUDGMENT_PATTERNS,
+    'health_check': health.HEALTH_CHECK_PATTERNS,
+}
+
+
+def reference_find(keywords, text: str) -> list:
+    """Every (start, keyword) occurrence by brute force, overlaps included."""
+    found = set()
+    for kw in set(keywords):
+        if not kw:
+            continue
+        start = text.find(kw)
+        while start != -1:
+            found.add((start, kw))
+            start = text.find(kw, start + 1)
+    return sorted(found)
+
+
+def reference_health_entity(query: str):
+    query_lower = query.lower()
+    best_match, best_score = None, 0
+    for entity_key, config in health.HEALTH_CHECK_ENTITIES.items():
+        score = sum(len(kw.split()) for kw in config.keywords if kw in query_lower)
+        if score > best_score:
+            best_score, best_match = score, entity_key
+    if best_score > 0:
+        return best_match
+    stripped = query_lower.strip()
+    if any(re.search(p, stripped) for p in health.HEALTH_CHECK_PATTERNS):
+        return 'economy'
+    return None
+
+
+def test_find_every_occurrence_with_prefixes_and_overlaps():
+    keywords = ['a', 'ab', 'abc', 'b', 'bca', 'aa', 's&p', 'p/e', '.', 'c+']
+    matcher = KeywordMatcher({'test': keywords})
+    for text in ['abcabca', 'aaab', 's&p p/e.', 'c++', 'xyz', '']:
+        assert sorted(matcher.find(text)) == reference_find(keywords, text)
+
+
+def test_find_matches_brute_force_on_random_sets():
+    rng = random.Random(7)
+    alphabet = 'abc d'
+    for _ in range(200):
+        keywords = [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+                    for _ in range(rng.randint(1, 8))]
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+        assert sorted(KeywordMatcher({'k': keywords}).find(text)) == reference_find(keywords, text)
+
+
+def test_categorize_reports_each_set():
+    matcher = KeywordMatcher({'rates': ['rate', 'rate cut'], 'fed': ['fed', 'rate cut'], 'empty': []})
+    assert matcher.categorize('will the fed make a rate cut') == {
+        'rates': frozenset({'rate', 'rate cut'}),
+        'fed': frozenset({'fed', 'rate cut'}),
+    }
+    assert matcher.categorize('nothing here') == {}
+
+
+@pytest.mark.parametrize('category', sorted(KEYWORD_CATEGORIES))
+def test_keyword_categories_match_reference(category):
+    keywords = KEYWORD_CATEGORIES[category]
+    for query in QUERIES:
+        expected = any(kw in query.lower() for kw in keywords)
+        assert classify(query).has(category) == expected, query
+
+
+@pytest.mark.parametrize('category', sorted(PATTERN_CATEGORIES))
+def test_pattern_categories_match_reference(category):
+    patterns = PATTERN_CATEGORIES[category]
+    for query in QUERIES:
+        expected = any(re.search(p, query.lower().strip()) for p in patterns)
+        assert classify(query).has(category) == expected, query
+
+
+def test_public_helpers_match_reference():
+    for query in QUERIES:
+        q = query.lower()
+        assert fed_sep.is_fed_related_query(query) == any(kw in q for kw in KEYWORD_CATEGORIES['fed'])
+        assert stocks.is_market_query(query) == any(kw in q for kw in KEYWORD_CATEGORIES['market'])
+        assert shiller.is_valuation_query(query) == any(kw in q for kw in KEYWORD_CATEGORIES['valuation'])
+        assert health.detect_health_check_entity(query) == reference_health_entity(query), query
+
+
+def test_classification_is_cached_per_lowercased_query():
+    assert classify('Is The Fed Cutting?') is classify('is the fed cutting?')
+
+
+def test_valuation_check_does_not_import_shiller():
+    # The CAPE enrichment asks this on every /search; agents.shiller (pandas) loads lazily
+    code = ("import sys; from core.query_classifier import is_valuation_query; "
+            "assert is_valuation_query('is the market in a bubble'); "
+            "assert 'agents.shiller' not in sys.modules and 'pandas' not in sys.modules")
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True)
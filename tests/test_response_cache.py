@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for materialized /search responses (core.response_cache).
+
+Run: python -m pytest tests/test_response_cache.py
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core.observation_store as observation_store
+from core.response_cache import ResponseCache
+
+DATES = ['2025-07-01', '2025-08-01', '2025-09-01']
+PAYLOAD = {'summary': 'Unemployment is 4.3%.', 'suggestions': [], 'charts': [{'series_id': 'UNRATE'}]}
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = observation_store.ObservationStore(tmp_path / 'observations.db')
+    monkeypatch.setattr(observation_store, '_store', store)
+    store.put('UNRATE', DATES, [4.2, 4.3, 4.3], {'last_updated': '2025-10-03'})
+    store.put('PAYEMS', DATES, [159000.0, 159100.0, 159150.0], {'last_updated': '2025-10-03'})
+    return store
+
+
+def test_fingerprint_tracks_latest_date_and_revision(store, tmp_path):
+    cache = ResponseCache(tmp_path / 'responses.db')
+    assert cache.fingerprint(['UNRATE', 'PAYEMS']) == \
+        'UNRATE@2025-09-01/2025-10-03;PAYEMS@2025-09-01/2025-10-03'
+    assert cache.fingerprint(['UNRATE', 'NOT_STORED']) is None
+    assert cache.fingerprint([]) is None
+
+
+def test_payload_served_only_for_its_fingerprint(store, tmp_path):
+    cache = ResponseCache(tmp_path / 'responses.db')
+    fingerprint = cache.fingerprint(['UNRATE'])
+    assert cache.put('unemployment', fingerprint, ['UNRATE'], PAYLOAD)
+    assert cache.get('unemployment', fingerprint) == PAYLOAD
+
+    # A new release moves the fingerprint: the stored payload is stale
+    store.merge('UNRATE', '2025-09-01', ['2025-09-01', '2025-10-01'], [4.3, 4.4], {'last_updated': '2025-11-07'})
+    new_fingerprint = cache.fingerprint(['UNRATE'])
+    assert new_fingerprint != fingerprint
+    assert cache.get('unemployment', new_fingerprint) is None
+
+    # Persisted for other workers
+    assert ResponseCache(tmp_path / 'responses.db').get('unemployment', fingerprint) == PAYLOAD
+
+
+def test_stale_store_has_no_fingerprint(store, tmp_path):
+    store.max_age_seconds = 0
+    assert ResponseCache(tmp_path / 'responses.db').fingerprint(['UNRATE']) is None
+
+
+def test_put_requires_fingerprint_and_json(tmp_path):
+    cache = ResponseCache(tmp_path / 'responses.db')
+    assert not cache.put('unemployment', None, ['UNRATE'], PAYLOAD)
+    assert not cache.put('unemployment', 'fp', ['UNRATE'], {'bad': object()})
+
+
+def test_top_plans_by_request_count(tmp_path):
+    cache = ResponseCache(tmp_path / 'responses.db')
+    for _ in range(3):
+        cache.record_request('inflation', ['CPIAUCSL'])
+    cache.record_request('unemployment', ['UNRATE'])
+    cache.put('unemployment', 'fp1', ['UNRATE'], PAYLOAD)
+
+    assert cache.top_plans() == [('inflation', ['CPIAUCSL'], None), ('unemployment', ['UNRATE'], 'fp1')]
+    assert cache.top_plans(limit=1) == [('inflation', ['CPIAUCSL'], None)]
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for empirical series statistics (core.series_stats).
+
+Run: python -m pytest tests/test_series_stats.py
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core.observation_store as observation_store
+import core.series_stats as series_stats
+from core.series_stats import SeriesStats, get_series_stats, stats_for
+
+
+def _monthly(n: int, start_year: int = 2000) -> list:
+    return [f"{start_year + i // 12}-{i % 12 + 1:02d}-01" for i in range(n)]
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """A temp observation store behind get_store(), with an empty stats cache."""
+    store = observation_store.ObservationStore(tmp_path / 'observations.db')
+    monkeypatch.setattr(observation_store, '_store', store)
+    series_stats._stats_cache.clear()
+    return store
+
+
+def test_percentile_counts_ties_half():
+    stats = SeriesStats.from_lists(_monthly(5), [1.0, 2.0, 2.0, 2.0, 3.0], 'TEST')
+    window = stats.window('all')
+    assert window.percentile(2.0) == pytest.approx(50.0)  # (1 below + 4 not above) / 2 / 5
+    assert window.percentile(1.0) == pytest.approx(10.0)
+    assert window.percentile(3.0) == pytest.approx(90.0)
+    assert window.percentile(0.5) == 0.0
+    assert window.percentile(9.0) == 100.0
+
+
+def test_flat_history_has_no_zscore_or_position():
+    stats = SeriesStats.from_lists(_monthly(4), [5.0] * 4, 'FLAT')
+    assert stats.percentile(5.0) == pytest.approx(50.0)
+    assert stats.zscore(5.0) is None
+    assert stats.position(5.0, 'all') is None
+
+
+def test_single_observation():
+    stats = SeriesStats.from_lists(['2024-06-01'], [4.1], 'ONE')
+    assert len(stats) == 1
+    assert stats.latest == 4.1 and stats.last_date == '2024-06-01'
+    assert stats.percentile(4.1) == pytest.approx(50.0)
+    assert not stats.covers('1y')  # history doesn't reach back a full year
+
+
+def test_empty_and_nan_values():
+    empty = SeriesStats.from_lists([], [], 'EMPTY')
+    assert len(empty) == 0 and empty.windows == {} and empty.latest is None
+    assert empty.percentile(1.0) is None
+
+    with_gaps = SeriesStats.from_lists(_monthly(4), [1.0, float('nan'), 3.0, float('nan')], 'GAPS')
+    assert len(with_gaps) == 2
+    assert with_gaps.latest == 3.0 and with_gaps.last_date == '2000-03-01'
+
+
+def test_short_history_trailing_windows():
+    stats = SeriesStats.from_lists(_monthly(18, 2020), list(range(18)), 'SHORT')
+    one_year = stats.window('1y')
+    assert one_year.count == 12 and one_year.start == '2020-07-01'
+    assert stats.covers('1y')
+    # 5y and 10y windows hold the whole (short) history and don't claim to cover it
+    assert stats.window('5y').count == 18
+    assert not stats.covers('5y') and not stats.covers('10y')
+    assert 'since_1970' in stats.windows and stats.window('since_1970').count == 18
+
+
+def test_window_stats_and_value_on():
+    values = [3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0]
+    stats = SeriesStats.from_lists(_monthly(8), values, 'TEST')
+    window = stats.window('all')
+    assert window.min == 1.0 and window.min_date == '2000-02-01'  # first occurrence
+    assert window.max == 9.0 and window.max_date == '2000-06-01'
+    assert window.mean == pytest.approx(np.mean(values))
+    assert stats.zscore(9.0) == pytest.approx((9.0 - np.mean(values)) / np.std(values))
+    assert stats.position(5.0, 'all') == pytest.approx(50.0)
+    assert stats.value_on('2000-03-15') == 4.0
+    assert stats.value_on('1999-12-31') is None
+
+
+def test_get_series_stats_reads_the_store_and_derives(store):
+    dates = _monthly(36, 2020)
+    store.put('TESTSERIES', dates, [100.0 + i for i in range(36)], {})
+
+    stats = get_series_stats('TESTSERIES')
+    assert len(stats) == 36 and stats.latest == 135.0
+    assert get_series_stats('TESTSERIES') is stats  # cached until the data changes
+
+    change = get_series_stats('TESTSERIES_CHANGE')
+    assert len(change) == 35 and change.latest == 1.0
+    yoy = get_series_stats('TESTSERIES_YOY')
+    assert yoy.latest == pytest.approx((135.0 / 123.0 - 1) * 100)
+
+    assert get_series_stats('MISSING') is None
+
+
+def test_get_series_stats_rebuilds_after_new_data(store):
+    dates = _monthly(24, 2020)
+    store.put('TESTSERIES', dates, [1.0] * 24, {})
+    before = get_series_stats('TESTSERIES')
+    store.merge('TESTSERIES', '2021-12-01', ['2021-12-01', '2022-01-01'], [1.0, 2.0], {})
+    after = get_series_stats('TESTSERIES')
+    assert after is not before and after.latest == 2.0
+
+
+def test_derived_series_too_short(store):
+    store.put('TESTSHORT', _monthly(6), [1.0] * 6, {})
+    assert get_series_stats('TESTSHORT_YOY') is None
+
+
+def test_stats_for_falls_back_to_given_values(store):
+    dates = _monthly(24, 2020)
+    values = [float(i) for i in range(24)]
+    store.put('TESTSERIES', dates, values, {})
+    stored = get_series_stats('TESTSERIES')
+
+    assert stats_for('TESTSERIES', dates[-6:], values[-6:]) is stored  # a window of the stored series
+    transformed = stats_for('TESTSERIES', dates[-6:], [v * 2 for v in values[-6:]])
+    assert transformed is not stored and len(transformed) == 6
+    assert stats_for('TESTSERIES', [], []) is None
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for single-flight request coalescing (core.singleflight).
+
+Run: python -m pytest tests/test_singleflight.py
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def _run_concurrently(flight: SingleFlight, fn, n: int = 5) -> list:
+    """Call flight.do('key', fn) from n threads; returns each thread's result or exception."""
+    outcomes = [None] * n
+
+    def worker(i):
+        try:
+            outcomes[i] = flight.do('key', fn)
+        except Exception as e:
+            outcomes[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return outcomes
+
+
+def test_concurrent_calls_share_one_result():
+    flight = SingleFlight('test.shared')
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return {'value': 42}
+
+    outcomes = _run_concurrently(flight, fetch)
+    assert calls == [1]
+    assert all(outcome is outcomes[0] for outcome in outcomes)
+    assert (flight.calls, flight.shared) == (1, 4)
+
+
+def test_leader_error_reaches_every_waiter():
+    flight = SingleFlight('test.error')
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        raise ValueError('upstream down')
+
+    outcomes = _run_concurrently(flight, fetch)
+    assert calls == [1]
+    assert all(isinstance(outcome, ValueError) and str(outcome) == 'upstream down'
+               for outcome in outcomes)
+    assert flight.stats()['in_flight'] == 0
+
+
+def test_key_is_released_after_a_failure():
+    flight = SingleFlight('test.release')
+    with pytest.raises(RuntimeError):
+        flight.do('key', lambda: (_ for _ in ()).throw(RuntimeError('first try')))
+    assert flight.do('key', lambda: 'second try') == 'second try'
+    assert flight.calls == 2
+
+
+def test_async_error_reaches_every_waiter():
+    flight = AsyncSingleFlight('test.async_error')
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        raise ValueError('upstream down')
+
+    async def main():
+        return await asyncio.gather(*(flight.do('key', fetch) for _ in range(4)),
+                                    return_exceptions=True)
+
+    outcomes = asyncio.run(main())
+    assert calls == [1]
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+    assert flight.stats()['in_flight'] == 0
+
+
+def test_async_cancelled_waiter_does_not_cancel_the_call():
+    flight = AsyncSingleFlight('test.async_cancel')
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return 'done'
+
+    async def main():
+        first = asyncio.ensure_future(flight.do('key', fetch))
+        second = asyncio.ensure_future(flight.do('key', fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == 'done'
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-request task graph (core.task_graph).
+
+Run: python -m pytest tests/test_task_graph.py
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.task_graph import TaskGraph
+
+
+@pytest.fixture
+def executor():
+    pool = ThreadPoolExecutor(max_workers=4)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+def _sleep_then(value, delay: float = 0.2):
+    def fn(*args):
+        time.sleep(delay)
+        return value
+    return fn
+
+
+def test_dependency_results_are_passed_first(executor):
+    graph = TaskGraph('test', executor)
+    graph.add('understanding', lambda q: {'intent': q}, 'jobs')
+    graph.add('series', lambda u: ['PAYEMS'] if u['intent'] == 'jobs' else [], deps=['understanding'])
+    graph.add('summary', lambda u, s, tone: f"{u['intent']}:{','.join(s)}:{tone}",
+              'calm', deps=['understanding', 'series'])
+    assert graph.result('summary') == 'jobs:PAYEMS:calm'
+    assert graph.names() == ['understanding', 'series', 'summary']
+
+
+def test_independent_tasks_overlap(executor):
+    graph = TaskGraph('test', executor)
+    begin = time.monotonic()
+    for name in ('a', 'b', 'c'):
+        graph.add(name, _sleep_then(name))
+    graph.add('joined', lambda a, b, c: a + b + c, deps=['a', 'b', 'c'])
+    assert graph.result('joined') == 'abc'
+    assert time.monotonic() - begin < 0.5  # three 0.2s stages, run side by side
+
+
+def test_errors_propagate_to_dependents(executor):
+    graph = TaskGraph('test', executor)
+
+    def broken():
+        raise ValueError('no plan')
+
+    graph.add('plan', broken)
+    graph.add('fetch', lambda plan: plan['series'], deps=['plan'])
+    with pytest.raises(ValueError, match='no plan'):
+        graph.result('fetch')
+    assert graph.result('plan', default='fallback') == 'fallback'
+
+
+def test_unused_speculative_task_is_cancelled(executor):
+    gate = threading.Event()
+    graph = TaskGraph('test', executor)
+    graph.add('blocker', lambda: gate.wait(2))
+    graph.add('hybrid', _sleep_then('plan'), deps=['blocker'], speculative=True)
+    graph.add('needed', _sleep_then('needed', 0.0))
+    assert graph.result('needed') == 'needed'
+
+    timeline = graph.close()
+    gate.set()
+    assert timeline['hybrid']['state'] == 'cancelled'
+    assert timeline['hybrid']['speculative'] and not timeline['hybrid']['used']
+    assert timeline['needed']['state'] == 'done'
+    assert graph.close() == {}  # safe to call twice
+
+
+def test_discard_keeps_tasks_already_read(executor):
+    graph = TaskGraph('test', executor)
+    graph.add('read', _sleep_then('value', 0.0))
+    assert graph.result('read') == 'value'
+    graph.discard('read')
+    assert graph.result('read') == 'value'
+    graph.discard('missing')  # no-op
+
+
+def test_unknown_and_duplicate_names(executor):
+    graph = TaskGraph('test', executor)
+    graph.add('a', lambda: 1)
+    with pytest.raises(KeyError):
+        graph.add('a', lambda: 2)
+    with pytest.raises(KeyError):
+        graph.add('b', lambda x: x, deps=['nope'])
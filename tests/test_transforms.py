@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized series transforms (core.transforms).
+
+The list wrappers must return what the loop-based helpers they replaced in
+main.py/app.py returned; those helpers are kept below as references.
+
+Run: python -m pytest tests/test_transforms.py
+"""
+
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import transforms
+from core.timeseries import TimeSeries
+from core.transforms import calculate_avg_annual, calculate_mom, calculate_yoy
+
+
+# =============================================================================
+# REFERENCE IMPLEMENTATIONS (the previous main.py / app.py helpers)
+# =============================================================================
+
+def reference_yoy(dates: list, values: list) -> tuple:
+    if len(dates) < 2:
+        return dates, values
+    date_objs = [datetime.strptime(d, '%Y-%m-%d') for d in dates[:min(5, len(dates))]]
+    avg_gap = sum((date_objs[i + 1] - date_objs[i]).days for i in range(len(date_objs) - 1)) / (len(date_objs) - 1)
+    if avg_gap > 60:
+        min_obs = 4
+    elif avg_gap > 20:
+        min_obs = 12
+    else:
+        min_obs = 52
+    if len(dates) < min_obs + 1:
+        return dates, values
+
+    date_to_value = dict(zip(dates, values))
+    yoy_dates, yoy_values = [], []
+    for i, date_str in enumerate(dates[min_obs:], min_obs):
+        date = datetime.strptime(date_str, '%Y-%m-%d')
+        try:
+            year_ago = date.replace(year=date.year - 1)
+        except ValueError:
+            year_ago = date.replace(year=date.year - 1, day=28)
+        year_ago_str = year_ago.strftime('%Y-%m-%d')
+        if year_ago_str in date_to_value and date_to_value[year_ago_str] != 0:
+            base = date_to_value[year_ago_str]
+            yoy_dates.append(date_str)
+            yoy_values.append((values[i] - base) / base * 100)
+            continue
+        if avg_gap < 20:
+            found = False
+            for offset in range(1, 8):
+                for direction in [1, -1]:
+                    check = (year_ago + timedelta(days=offset * direction)).strftime('%Y-%m-%d')
+                    if check in date_to_value and date_to_value[check] != 0:
+                        base = date_to_value[check]
+                        yoy_dates.append(date_str)
+                        yoy_values.append((values[i] - base) / base * 100)
+                        found = True
+                        break
+                if found:
+                    break
+    return yoy_dates, yoy_values
+
+
+def reference_mom(dates: list, values: list) -> tuple:
+    if len(dates) < 2:
+        return dates, values
+    mom_dates, mom_values = [], []
+    for i in range(1, len(dates)):
+        if values[i - 1] != 0:
+            mom_dates.append(dates[i])
+            mom_values.append((values[i] - values[i - 1]) / abs(values[i - 1]) * 100)
+    return mom_dates, mom_values
+
+
+def reference_avg_annual(dates: list, values: list) -> tuple:
+    if not dates or not values:
+        return dates, values
+    yearly = {}
+    for date_str, value in zip(dates, values):
+        yearly.setdefault(date_str[:4], []).append(value)
+    return ([f"{year}-07-01" for year in sorted(yearly)],
+            [sum(vals) / len(vals) for _, vals in sorted(yearly.items())])
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+def _values(n: int, seed: int, zeros: bool = False) -> list:
+    rng = random.Random(seed)
+    values = [round(100 + rng.uniform(-20, 20), 3) for _ in range(n)]
+    if zeros:
+        for i in rng.sample(range(n), n // 10):
+            values[i] = 0.0
+    return values
+
+
+def _monthly(n: int = 60) -> list:
+    return [f"{2015 + i // 12}-{i % 12 + 1:02d}-01" for i in range(n)]
+
+
+def _quarterly(n: int = 24) -> list:
+    return [f"{2015 + i // 4}-{(i % 4) * 3 + 1:02d}-01" for i in range(n)]
+
+
+def _weekly(n: int = 200, start: str = '2016-01-02', skip_every: int = 0) -> list:
+    day = datetime.strptime(start, '%Y-%m-%d')
+    dates = []
+    for i in range(n):
+        if not (skip_every and i % skip_every == 0):
+            dates.append(day.strftime('%Y-%m-%d'))
+        day += timedelta(days=7)
+    return dates
+
+
+def _daily_leap(n: int = 800) -> list:
+    day = datetime(2019, 1, 1)
+    return [(day + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(n)]
+
+
+CASES = {
+    'monthly': (_monthly(), False),
+    'monthly_with_zeros': (_monthly(), True),
+    'quarterly': (_quarterly(), False),
+    'weekly': (_weekly(), False),
+    'weekly_with_gaps': (_weekly(skip_every=9), False),
+    'daily_across_feb29': (_daily_leap(), False),
+    'too_short': (_monthly(12), False),
+    'single': (_monthly(1), False),
+}
+
+
+def _assert_same(got: tuple, expected: tuple) -> None:
+    assert list(got[0]) == list(expected[0])
+    assert np.allclose(got[1], expected[1], rtol=1e-12, atol=1e-9)
+
+
+@pytest.mark.parametrize('case', sorted(CASES))
+def test_calculate_yoy_matches_reference(case):
+    dates, zeros = CASES[case]
+    values = _values(len(dates), seed=len(case), zeros=zeros)
+    _assert_same(calculate_yoy(dates, values), reference_yoy(dates, values))
+
+
+@pytest.mark.parametrize('case', sorted(CASES))
+def test_calculate_mom_and_avg_annual_match_reference(case):
+    dates, zeros = CASES[case]
+    values = _values(len(dates), seed=len(case), zeros=zeros)
+    _assert_same(calculate_mom(dates, values), reference_mom(dates, values))
+    _assert_same(calculate_avg_annual(dates, values), reference_avg_annual(dates, values))
+
+
+def test_fred_yoy_on_timeseries():
+    dates = _monthly()
+    values = _values(len(dates), seed=1)
+    result = transforms.fred_yoy(TimeSeries.from_lists(dates, values, 'CPIAUCSL'))
+    assert isinstance(result, TimeSeries)
+    _assert_same(result.to_lists(), reference_yoy(dates, values))
+    # Too short: the same object comes back
+    short = TimeSeries.from_lists(dates[:5], values[:5], 'CPIAUCSL')
+    assert transforms.fred_yoy(short) is short
+
+
+def test_shift_years_clamps_feb29():
+    dates = np.array(['2024-02-29', '2025-12-31', '2024-03-01'], dtype='datetime64[D]')
+    shifted = transforms.shift_years(dates, -1)
+    assert [str(d) for d in shifted] == ['2023-02-28', '2024-12-31', '2023-03-01']
+
+
+def test_difference_and_annualized_change():
+    ts = TimeSeries.from_lists(_monthly(7), [100, 101, 102, 103, 104, 105, 106.0], 'TEST')
+    assert list(transforms.difference(ts).values) == [1.0] * 6
+    annualized = transforms.annualized_change(ts, months=3)
+    assert len(annualized) == 4
+    assert annualized.values[0] == pytest.approx(((103 / 100) ** 4 - 1) * 100)